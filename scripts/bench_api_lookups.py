@@ -0,0 +1,199 @@
+"""Benchmark p50/p99 latency of the hot snapshot-backed API endpoints.
+
+Builds a synthetic repo (league history, Elo state, team metadata, and
+player game logs) in a temporary directory, serves it through the FastAPI
+app with an in-process ``TestClient``, and times repeated requests to:
+
+- ``/players/{id}/history`` and ``/players``;
+- ``/teams`` and ``/teams/{abbr}``;
+- ``/compare/teams``.
+
+For ``/players/{id}/history`` the pre-index lookup (filter the whole logs
+frame by ``player_id``, then ``iterrows``) is timed alongside, so the
+index speedup is visible without checking out an older revision.
+
+Run from repo root:
+    uv run python scripts/bench_api_lookups.py
+    uv run python scripts/bench_api_lookups.py --synthetic-seasons 25 --players 2500
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from pathlib import Path
+import tempfile
+import time
+
+from fastapi.testclient import TestClient
+import numpy as np
+import pandas as pd
+
+from gridiron_edge.api.app import create_app
+from gridiron_edge.api.deps import settings_dependency
+from gridiron_edge.api.snapshot import PLAYER_GAME_LOGS_RELPATH
+from gridiron_edge.core.settings import Settings
+from gridiron_edge.datasets.registry import dataset_path
+
+_SHORT = [f"T{i:02d}" for i in range(32)]
+_LONG = [f"Team {i:02d}" for i in range(32)]
+
+
+def _seasons(n_seasons: int) -> list[int]:
+    return list(range(2025 - n_seasons, 2025))
+
+
+def _write_repo(root: Path, n_seasons: int, n_players: int, seed: int = 0) -> None:
+    """Write games, Elo state, team metadata, and player logs under *root*."""
+    rng = np.random.default_rng(seed)
+    games, elo, logs = [], [], []
+    for season in _seasons(n_seasons):
+        year = f"{season}-{season + 1}"
+        for week in range(1, 19):
+            order = rng.permutation(32)
+            for slot in range(16):
+                away, home = _LONG[order[2 * slot]], _LONG[order[2 * slot + 1]]
+                games.append(
+                    {
+                        "GAME_ID": f"{season}_{week:02d}_{slot}",
+                        "YEAR": year,
+                        "WEEK_NUM": week,
+                        "AWAY_TEAM": away,
+                        "HOME_TEAM": home,
+                        "AWAY_SCORE": int(rng.integers(3, 38)),
+                        "HOME_SCORE": int(rng.integers(3, 41)),
+                        "IS_NEUTRAL_SITE": 0,
+                    }
+                )
+            elo.extend(
+                {"NFL_TEAM": team, "NFL_YEAR": year, "NFL_WEEK": week, "ELO": 1500.0}
+                for team in _LONG
+            )
+        ids = np.arange(n_players)
+        for week in range(1, 18):
+            logs.append(
+                pd.DataFrame(
+                    {
+                        "player_id": [f"P{i:05d}" for i in ids],
+                        "player_name": [f"Player {i:05d}" for i in ids],
+                        "position": "WR",
+                        "team": np.array(_SHORT)[ids % 32],
+                        "season": season,
+                        "season_type": "REG",
+                        "week": week,
+                        "is_skill": True,
+                        "opponent_team": np.array(_SHORT)[(ids + week) % 32],
+                        "game_id": f"{season}_{week:02d}",
+                        "is_home": (ids + week) % 2 == 0,
+                        "receiving_yards": rng.gamma(2.0, 20.0, n_players),
+                        "rushing_yards": rng.gamma(1.0, 5.0, n_players),
+                    }
+                )
+            )
+
+    for key, frame in (("games", pd.DataFrame(games)), ("elo_state", pd.DataFrame(elo))):
+        path = dataset_path(root, key)  # type: ignore[arg-type]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frame.to_csv(path, index=False)
+    metadata = pd.DataFrame({"NFL_LONG_NAME": _LONG, "NFL_SHORT_NAME": _SHORT})
+    metadata.to_csv(dataset_path(root, "team_metadata"), index=False)
+    logs_path = root / PLAYER_GAME_LOGS_RELPATH
+    pd.concat(logs, ignore_index=True).to_parquet(logs_path, index=False)
+
+
+def _settings(root: Path) -> Settings:
+    return Settings(
+        repo_root=root,
+        owm_api_key=None,
+        odds_api_key=None,
+        data_raw=root / "data" / "raw",
+        data_cleaned=root / "data" / "cleaned",
+        data_modeling=root / "data" / "modeling",
+        data_output=root / "data" / "output",
+    )
+
+
+def _latency(label: str, fn: Callable[[int], object], requests: int) -> float:
+    """Print p50/p99 over *requests* calls of ``fn(i)`` and return p50 (ms)."""
+    fn(0)
+    samples = np.empty(requests)
+    for i in range(requests):
+        start = time.perf_counter()
+        fn(i)
+        samples[i] = (time.perf_counter() - start) * 1000
+    p50, p99 = np.percentile(samples, [50, 99])
+    print(f"  {label:<34} p50 {p50:8.2f} ms   p99 {p99:8.2f} ms")
+    return float(p50)
+
+
+def _legacy_history(logs: pd.DataFrame, player_id: str, season: int) -> list[dict]:
+    """The pre-index history lookup: whole-frame filter, then ``iterrows``."""
+    rows = logs.loc[logs["player_id"] == player_id, :]
+    rows = rows.loc[rows["season_type"] == "REG", :]
+    rows = rows.loc[rows["season"] == season, :].sort_values("week")
+    return [
+        {"week": int(r["week"]), "value": float(r["receiving_yards"])} for _, r in rows.iterrows()
+    ]
+
+
+def main() -> None:
+    """Time the hot endpoints against a synthetic repo."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic-seasons", type=int, default=10)
+    parser.add_argument("--players", type=int, default=1500)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_repo(root, args.synthetic_seasons, args.players)
+        logs = pd.read_parquet(root / PLAYER_GAME_LOGS_RELPATH)
+        season = _seasons(args.synthetic_seasons)[-1]
+        year = f"{season}-{season + 1}"
+        print(
+            f"{len(logs):,} player-game rows, "
+            f"{args.synthetic_seasons} seasons, {args.requests} requests per endpoint"
+        )
+
+        app = create_app()
+        app.dependency_overrides[settings_dependency] = lambda: _settings(root)
+        with TestClient(app) as client:
+
+            def get(path: str) -> object:
+                response = client.get(path)
+                response.raise_for_status()
+                return response
+
+            def player(i: int) -> str:
+                return f"P{(i * 7919) % args.players:05d}"
+
+            legacy = _latency(
+                "legacy history lookup (no HTTP)",
+                lambda i: _legacy_history(logs, player(i), season),
+                args.requests,
+            )
+            indexed = _latency(
+                "/players/{id}/history",
+                lambda i: get(f"/players/{player(i)}/history?stat=rec_yards"),
+                args.requests,
+            )
+            _latency("/players", lambda i: get(f"/players?season={season}"), args.requests)
+            _latency("/teams", lambda i: get(f"/teams?season={year}"), args.requests)
+            _latency(
+                "/teams/{abbr}",
+                lambda i: get(f"/teams/{_SHORT[i % 32]}?season={year}"),
+                args.requests,
+            )
+            _latency(
+                "/compare/teams",
+                lambda i: get(
+                    f"/compare/teams?team_a={_SHORT[i % 32]}&team_b={_SHORT[(i + 5) % 32]}"
+                    f"&season={year}"
+                ),
+                args.requests,
+            )
+        print(f"History lookup p50: legacy scan {legacy:.2f} ms vs endpoint {indexed:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
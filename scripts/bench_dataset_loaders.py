@@ -0,0 +1,151 @@
+"""Benchmark CSV parsing against the typed Parquet twins of canonical datasets.
+
+For each CSV-backed canonical dataset (games, elo_state, weather_enriched,
+stadiums, team_metadata) times:
+
+- ``pd.read_csv`` of the registered CSV (the previous loader);
+- ``read_table`` from the typed twin, decoded to plain values (what
+  ``loaders.load_csv`` now returns);
+- ``read_table(categorical=True)`` (what ``loaders.load_typed`` returns);
+
+and reports the in-memory size of each frame. Twins are written to a
+temporary copy of the data, so the repository is left untouched.
+
+Run from repo root:
+    uv run python scripts/bench_dataset_loaders.py
+    uv run python scripts/bench_dataset_loaders.py --synthetic-seasons 60
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from pathlib import Path
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from gridiron_edge.datasets.columnar import SCHEMAS, read_table, write_columnar_twin
+from gridiron_edge.datasets.registry import dataset_path
+
+REPO = Path()
+
+
+def _synthetic_games(n_seasons: int, seed: int = 0) -> pd.DataFrame:
+    """League history shaped like the cleaned games CSV (32 teams, 16 games/week)."""
+    rng = np.random.default_rng(seed)
+    teams = np.array([f"Team {i:02d}" for i in range(32)])
+    rows = []
+    for season in range(2024 - n_seasons, 2024):
+        for week in range(1, 19):
+            order = rng.permutation(teams)
+            for slot in range(16):
+                away, home = order[2 * slot], order[2 * slot + 1]
+                rows.append(
+                    {
+                        "GAME_ID": f"{season}_{week:02d}_{slot}",
+                        "WEEK_NUM": week,
+                        "GAME_DAY_OF_WEEK": "Sunday",
+                        "GAME_DATE": f"{season}-10-{(week % 28) + 1:02d}",
+                        "GAMETIME": "13:00:00",
+                        "AWAY_TEAM": away,
+                        "HOME_TEAM": home,
+                        "AWAY_SCORE": int(rng.integers(3, 38)),
+                        "HOME_SCORE": int(rng.integers(3, 41)),
+                        "IS_NEUTRAL_SITE": 0,
+                        "YEAR": f"{season}-{season + 1}",
+                        "STADIUM": f"Stadium {home}",
+                        "ROOF": "outdoors",
+                        "SURFACE": "grass",
+                        "VEGAS_LINE": float(rng.choice([-7.0, -3.5, -3.0, -1.0])),
+                        "OVER_UNDER": float(rng.choice([41.5, 44.0, 47.5])),
+                        "FAVORITED": home,
+                        "DIV_GAME": int(rng.random() < 0.35),
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def _synthetic_elo(games: pd.DataFrame) -> pd.DataFrame:
+    """Elo state table with one row per team, season, and week."""
+    teams = pd.unique(games[["AWAY_TEAM", "HOME_TEAM"]].to_numpy().ravel())
+    weeks = games.loc[:, ["YEAR", "WEEK_NUM"]].drop_duplicates()
+    frame = weeks.merge(pd.DataFrame({"NFL_TEAM": teams}), how="cross")
+    frame = frame.rename(columns={"YEAR": "NFL_YEAR", "WEEK_NUM": "NFL_WEEK"})
+    frame["ELO"] = 1500.0 + np.random.default_rng(1).normal(0, 80, len(frame))
+    return frame.loc[:, ["NFL_TEAM", "NFL_YEAR", "NFL_WEEK", "ELO"]]
+
+
+def _time(label: str, fn: Callable[[], pd.DataFrame], repeats: int) -> tuple[pd.DataFrame, float]:
+    best = float("inf")
+    result = pd.DataFrame()
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    megabytes = result.memory_usage(deep=True).sum() / 2**20
+    print(f"  {label:<22} {best * 1000:8.1f} ms  {megabytes:8.2f} MB in memory")
+    return result, best
+
+
+def _stage(root: Path, synthetic_seasons: int) -> list[str]:
+    """Copy (or synthesize) the CSVs into *root* and return the staged keys."""
+    if synthetic_seasons:
+        games = _synthetic_games(synthetic_seasons)
+        frames = {"games": games, "elo_state": _synthetic_elo(games)}
+        for key, frame in frames.items():
+            path = dataset_path(root, key)  # type: ignore[arg-type]
+            path.parent.mkdir(parents=True, exist_ok=True)
+            frame.to_csv(path, index=False)
+        return list(frames)
+
+    staged = []
+    for key in SCHEMAS:
+        source = dataset_path(REPO.resolve(), key)
+        if source.is_file():
+            target = dataset_path(root, key)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+            staged.append(key)
+    return staged
+
+
+def main() -> None:
+    """Time CSV and typed-twin loads for each staged dataset."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic-seasons", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        keys = _stage(root, args.synthetic_seasons)
+        if not keys:
+            print("No canonical CSVs found; pass --synthetic-seasons N.")
+            return
+
+        for key in keys:
+            result = write_columnar_twin(root, key)  # type: ignore[arg-type]
+            csv_path = result.csv_path
+            print(
+                f"{key}: {result.rows:,} rows, "
+                f"{result.csv_bytes / 2**20:.2f} MB csv, "
+                f"{result.columnar_bytes / 2**20:.2f} MB parquet"
+            )
+            csv, t_csv = _time("read_csv", lambda p=csv_path: pd.read_csv(p), args.repeats)
+            twin, t_twin = _time("twin (plain)", lambda p=csv_path: read_table(p), args.repeats)
+            _, t_typed = _time(
+                "twin (categorical)",
+                lambda p=csv_path: read_table(p, categorical=True),
+                args.repeats,
+            )
+            print(f"  speedup: {t_csv / t_twin:.1f}x plain, {t_csv / t_typed:.1f}x categorical")
+            pd.testing.assert_frame_equal(twin, csv, check_dtype=False)
+        print("Parity: OK")
+
+
+if __name__ == "__main__":
+    main()
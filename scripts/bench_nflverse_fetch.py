@@ -0,0 +1,78 @@
+"""Benchmark per-season nflverse PBP ingestion across worker-pool sizes.
+
+Runs ``fetch_pbp`` into a temporary repo against a synthetic loader that
+sleeps ``--latency`` seconds per season (standing in for the nflverse
+download) and returns a full-width season frame, so the timings cover
+download overlap as well as pruning, hashing, and Parquet writes. A final
+forced refresh with identical content shows the cost of the manifest check
+when nothing has changed.
+
+Run from repo root:
+    uv run python scripts/bench_nflverse_fetch.py
+    uv run python scripts/bench_nflverse_fetch.py --seasons 27 --latency 2.0 --workers 1 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+
+import numpy as np
+from pandas import DataFrame
+
+from gridiron_edge.ingest.nflverse.pbp import _KEEP_COLUMNS, fetch_pbp
+
+_FIRST_SEASON = 1999
+_EXTRA_COLUMNS = 340  # nflverse PBP ships ~370 columns; most are pruned.
+
+
+def _synthetic_season(season: int, plays: int) -> DataFrame:
+    """A PBP-shaped season: every stored column plus pruned filler columns."""
+    rng = np.random.default_rng(season)
+    columns: dict[str, object] = {name: rng.normal(size=plays) for name in _KEEP_COLUMNS}
+    columns["game_id"] = [f"{season}_{i // 150:02d}_AAA_BBB" for i in range(plays)]
+    columns["season"] = season
+    for i in range(_EXTRA_COLUMNS):
+        columns[f"extra_{i}"] = rng.normal(size=plays)
+    return DataFrame(columns)
+
+
+def main() -> None:
+    """Time a cold fetch per pool size, then an unchanged forced refresh."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seasons", type=int, default=12)
+    parser.add_argument("--plays", type=int, default=45_000)
+    parser.add_argument("--latency", type=float, default=1.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    seasons = list(range(_FIRST_SEASON, _FIRST_SEASON + args.seasons))
+    frames = {season: _synthetic_season(season, args.plays) for season in seasons}
+
+    def loader(season: int) -> DataFrame:
+        time.sleep(args.latency)
+        return frames[season]
+
+    print(f"{args.seasons} seasons x {args.plays:,} plays, {args.latency:.1f}s latency per season")
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            start = time.perf_counter()
+            written = fetch_pbp(seasons, repo=repo, loader=loader, max_workers=workers)
+            cold = time.perf_counter() - start
+
+            start = time.perf_counter()
+            rewritten = fetch_pbp(
+                seasons, repo=repo, loader=loader, max_workers=workers, force=True
+            )
+            refresh = time.perf_counter() - start
+        print(
+            f"  workers {workers:>2}   cold {cold:7.2f} s ({len(written)} written)"
+            f"   unchanged refresh {refresh:7.2f} s ({len(rewritten)} rewritten)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Benchmark the columnar The Odds API parser against the row parser.
+
+Times ``parse_the_odds_api_payload`` (nested Python walk plus
+``validate_quote_rows``) against ``parse_the_odds_api_payload_arrow`` (one
+nested Arrow conversion plus vectorized checks) on the same payloads, and
+checks that both return identical frames.
+
+Payloads are either recorded responses - a raw JSON array as returned by the
+provider, or a response-cache entry from ``data/odds/cache/responses/`` - or
+a synthetic full week. For recorded payloads the schedule is derived from the
+events themselves and ``fetched_at`` is set before the first kickoff, so
+every event is parsed.
+
+Run from repo root:
+    uv run python scripts/bench_odds_parser.py
+    uv run python scripts/bench_odds_parser.py --games 16 --books 40
+    uv run python scripts/bench_odds_parser.py --payload data/odds/cache/responses/*.json
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import json
+from pathlib import Path
+import time
+
+import numpy as np
+import pandas as pd
+
+from gridiron_edge.ingest.odds.the_odds_api import parse_the_odds_api_payload
+from gridiron_edge.ingest.odds.the_odds_api_arrow import parse_the_odds_api_payload_arrow
+
+SEASON = "2026-2027"
+WEEK = 1
+_FETCHED_AT = datetime(2026, 9, 9, 12, tzinfo=UTC)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _synthetic_payload(games: int, books: int, seed: int = 0) -> list[dict[str, object]]:
+    """One week of events shaped like a v4 ``/odds`` response (h2h, spreads, totals)."""
+    rng = np.random.default_rng(seed)
+    kickoff = _iso(_FETCHED_AT + timedelta(days=1))
+    updated = _iso(_FETCHED_AT - timedelta(minutes=5))
+    events = []
+    for game in range(games):
+        away, home = f"Away Team {game:02d}", f"Home Team {game:02d}"
+        bookmakers = []
+        for book in range(books):
+            spread = float(rng.integers(-20, 21)) / 2
+            total = float(rng.integers(70, 110)) / 2
+            prices = rng.integers(100, 400, size=4) * rng.choice([-1, 1], size=4)
+            bookmakers.append(
+                {
+                    "key": f"book{book:02d}",
+                    "last_update": updated,
+                    "markets": [
+                        {
+                            "key": "h2h",
+                            "outcomes": [
+                                {"name": away, "price": int(prices[0])},
+                                {"name": home, "price": int(prices[1])},
+                            ],
+                        },
+                        {
+                            "key": "spreads",
+                            "last_update": updated,
+                            "outcomes": [
+                                {"name": away, "price": -110, "point": spread},
+                                {"name": home, "price": -110, "point": -spread},
+                            ],
+                        },
+                        {
+                            "key": "totals",
+                            "last_update": updated,
+                            "outcomes": [
+                                {"name": "Over", "price": int(prices[2]), "point": total},
+                                {"name": "Under", "price": int(prices[3]), "point": total},
+                            ],
+                        },
+                    ],
+                }
+            )
+        events.append(
+            {
+                "id": f"event-{game:02d}",
+                "sport_key": "americanfootball_nfl",
+                "commence_time": kickoff,
+                "away_team": away,
+                "home_team": home,
+                "bookmakers": bookmakers,
+            }
+        )
+    return events
+
+
+def _load_payload(path: Path) -> list[dict[str, object]]:
+    """Read a raw provider response or a response-cache entry."""
+    document = json.loads(path.read_text(encoding="utf-8"))
+    return document["payload"] if isinstance(document, dict) else document
+
+
+def _schedule_for(payload: list[dict[str, object]]) -> pd.DataFrame:
+    """A schedule that matches every NFL event in *payload*."""
+    return pd.DataFrame(
+        {
+            "season": SEASON,
+            "week": WEEK,
+            "game_id": [str(event["id"]) for event in payload],
+            "game_date": [str(event["commence_time"])[:10] for event in payload],
+            "away_team": [event["away_team"] for event in payload],
+            "home_team": [event["home_team"] for event in payload],
+        }
+    ).drop_duplicates(["away_team", "home_team"])
+
+
+def _latency(label: str, fn: Callable[[], pd.DataFrame], repeats: int) -> float:
+    """Print p50/p99 over *repeats* calls of *fn* and return p50 (ms)."""
+    fn()
+    samples = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples[i] = (time.perf_counter() - start) * 1000
+    p50, p99 = np.percentile(samples, [50, 99])
+    print(f"  {label:<10} p50 {p50:8.2f} ms   p99 {p99:8.2f} ms")
+    return float(p50)
+
+
+def _bench(name: str, payload: list[dict[str, object]], repeats: int) -> None:
+    payload = [e for e in payload if e.get("sport_key") == "americanfootball_nfl"]
+    schedule = _schedule_for(payload)
+    first_kickoff = min(pd.Timestamp(str(e["commence_time"])) for e in payload)
+    fetched_at = (first_kickoff - pd.Timedelta(hours=1)).to_pydatetime()
+
+    def row() -> pd.DataFrame:
+        return parse_the_odds_api_payload(
+            payload, schedule, season=SEASON, week=WEEK, fetched_at=fetched_at
+        )
+
+    def arrow() -> pd.DataFrame:
+        return parse_the_odds_api_payload_arrow(
+            payload, schedule, season=SEASON, week=WEEK, fetched_at=fetched_at
+        )
+
+    expected = row()
+    print(f"{name}: {len(payload)} events, {len(expected):,} quotes")
+    t_row = _latency("row", row, repeats)
+    t_arrow = _latency("arrow", arrow, repeats)
+    print(f"  speedup {t_row / t_arrow:.1f}x")
+    pd.testing.assert_frame_equal(arrow(), expected)
+    print("  parity: OK")
+
+
+def main() -> None:
+    """Time both parsers on every payload and verify output parity."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payload", type=Path, nargs="*", default=[])
+    parser.add_argument("--games", type=int, default=16)
+    parser.add_argument("--books", type=int, default=12)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.payload:
+        for path in args.payload:
+            _bench(path.name, _load_payload(path), args.repeats)
+    else:
+        payload = _synthetic_payload(args.games, args.books)
+        _bench(f"synthetic {args.games}x{args.books}", payload, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark the player rolling-feature kernel against the pandas baseline.
+
+Times the previous implementation (groupby shift, then one groupby rolling
+mean + std pass per window) against the single-pass numba kernel in
+``features/player/rolling.py`` on the full cleaned player log history, and
+checks that both produce the same columns.
+
+Run from repo root:
+    uv run python scripts/bench_player_rolling.py
+    uv run python scripts/bench_player_rolling.py --synthetic-players 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import time
+
+import numpy as np
+import pandas as pd
+
+from gridiron_edge.features.player.rolling import (
+    DEFAULT_WINDOWS,
+    ROLLING_STAT_COLS,
+    _compute_rolling,
+)
+
+LOGS_PATH = Path("data/cleaned/player_game_logs.parquet")
+
+
+def _pandas_baseline(df: pd.DataFrame, windows: list[int]) -> pd.DataFrame:
+    """Pre-kernel implementation, kept here only for timing and parity."""
+    group_cols = ["player_id", "season"]
+    df = df.sort_values(["player_id", "season", "week"]).copy()
+    stats = [c for c in ROLLING_STAT_COLS if c in df.columns]
+    shifted = df.groupby(group_cols, sort=False)[stats].shift(1)
+    for window in windows:
+        grouped = shifted.groupby([df[c] for c in group_cols], sort=False)
+        means = grouped.rolling(window=window, min_periods=1).mean()
+        stds = grouped.rolling(window=window, min_periods=1).std()
+        means = means.reset_index(level=[0, 1], drop=True).sort_index()
+        stds = stds.reset_index(level=[0, 1], drop=True).sort_index()
+        for stat in stats:
+            df[f"{stat}_L{window}_mean"] = means[stat]
+            df[f"{stat}_L{window}_std"] = stds[stat]
+    return df
+
+
+def _synthetic_logs(n_players: int, seed: int = 0) -> pd.DataFrame:
+    """Player-season logs shaped like the cleaned parquet (25 seasons x 17 weeks)."""
+    rng = np.random.default_rng(seed)
+    seasons = np.arange(2000, 2025)
+    n_rows = n_players * len(seasons) * 17
+    df = pd.DataFrame(
+        {
+            "player_id": np.repeat([f"00-{i:07d}" for i in range(n_players)], len(seasons) * 17),
+            "season": np.tile(np.repeat(seasons, 17), n_players),
+            "week": np.tile(np.arange(1, 18), n_players * len(seasons)),
+        }
+    )
+    for stat in ROLLING_STAT_COLS:
+        col = rng.normal(50.0, 25.0, n_rows)
+        col[rng.random(n_rows) < 0.3] = np.nan
+        df[stat] = col
+    # Players miss ~20% of weeks, like real logs with byes and injuries.
+    return df.loc[rng.random(n_rows) > 0.2].sample(frac=1.0, random_state=seed)
+
+
+def _time(label: str, fn, repeats: int) -> tuple[pd.DataFrame, float]:
+    best = float("inf")
+    result = pd.DataFrame()
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<18} {best:8.3f}s (best of {repeats})")
+    return result, best
+
+
+def main() -> None:
+    """Time both implementations and verify output parity."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic-players", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.synthetic_players:
+        df = _synthetic_logs(args.synthetic_players)
+    else:
+        df = pd.read_parquet(LOGS_PATH)
+        df = df.loc[df["is_skill"], :]
+    print(f"Rows: {len(df):,}  windows: {DEFAULT_WINDOWS}")
+
+    # Warm the numba cache so compile time is not counted.
+    _compute_rolling(df.head(50), windows=DEFAULT_WINDOWS)
+
+    baseline, t_base = _time("pandas baseline", lambda: _pandas_baseline(df, DEFAULT_WINDOWS), args.repeats)
+    kernel, t_kernel = _time("numba kernel", lambda: _compute_rolling(df, windows=DEFAULT_WINDOWS), args.repeats)
+    print(f"Speedup: {t_base / t_kernel:.1f}x")
+
+    # pandas' sliding-window variance accumulates rounding error on near-constant
+    # windows; the kernel recomputes each window exactly, so allow a tiny atol.
+    pd.testing.assert_frame_equal(kernel, baseline, check_exact=False, rtol=1e-9, atol=1e-6)
+    print("Parity: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark load and predict latency of compiled vs joblib tree artifacts.
+
+Fits the production-shaped win-probability ensembles (isotonic-calibrated
+random forest, plain XGBoost) on synthetic features, saves each through
+``ArtifactStore`` into a temporary repo, and times:
+
+- ``store.load`` + ``predict_proba`` (unpickle, sklearn/xgboost dispatch);
+- ``store.load_predictor`` + ``predict_proba`` (memory-mapped node arrays,
+  one numba kernel).
+
+The maximum absolute probability difference is printed alongside so the
+speedup is never reported for a predictor that disagrees.
+
+Run from repo root:
+    uv run python scripts/bench_tree_inference.py
+    uv run python scripts/bench_tree_inference.py --trees 500 --rows 272
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from pathlib import Path
+import tempfile
+import time
+
+import numpy as np
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import TimeSeriesSplit
+from xgboost import XGBClassifier
+
+from gridiron_edge.models.artifact import ArtifactStore
+from gridiron_edge.models.game_prediction.base import GameModelMetadata
+
+
+def _latency(label: str, fn: Callable[[], object], repeats: int) -> float:
+    """Print p50/p99 over *repeats* calls of *fn* and return p50 (ms)."""
+    fn()
+    samples = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples[i] = (time.perf_counter() - start) * 1000
+    p50, p99 = np.percentile(samples, [50, 99])
+    print(f"  {label:<34} p50 {p50:8.2f} ms   p99 {p99:8.2f} ms")
+    return float(p50)
+
+
+def main() -> None:
+    """Time both inference paths for each supported win-probability model."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trees", type=int, default=300)
+    parser.add_argument("--train-rows", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=16, help="rows per predict call")
+    parser.add_argument("--features", type=int, default=12)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(args.train_rows, args.features))
+    y = (x[:, 0] - 0.5 * x[:, 1] + rng.normal(size=args.train_rows) > 0).astype(int)
+    x_new = rng.normal(size=(args.rows, args.features))
+
+    models = {
+        "random_forest": CalibratedClassifierCV(
+            RandomForestClassifier(n_estimators=args.trees, n_jobs=-1, random_state=42),
+            method="isotonic",
+            cv=TimeSeriesSplit(n_splits=3),
+        ),
+        "xgboost": XGBClassifier(n_estimators=args.trees, max_depth=4, verbosity=0),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ArtifactStore(Path(tmp))
+        for model_type, model in models.items():
+            model.fit(x, y)
+            store.save(
+                metadata=GameModelMetadata(
+                    model_name="win_prob",
+                    model_type=model_type,
+                    task="classification",
+                    trained_at="2026-01-01T00:00:00+00:00",
+                ),
+                model_obj=model,
+            )
+            print(f"{model_type}: {args.trees} trees per fold, {args.rows} rows per call")
+            joblib_ms = _latency(
+                "joblib load + predict_proba",
+                lambda t=model_type: store.load("win_prob", t).predict_proba(x_new),
+                args.repeats,
+            )
+            compiled_ms = _latency(
+                "compiled load + predict_proba",
+                lambda t=model_type: store.load_predictor("win_prob", t).predict_proba(x_new),
+                args.repeats,
+            )
+            diff = np.abs(
+                store.load_predictor("win_prob", model_type).predict_proba(x_new)
+                - model.predict_proba(x_new)
+            ).max()
+            print(f"  speedup {joblib_ms / compiled_ms:.1f}x, max |diff| {diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark the franchise-HFA feature against the per-row filtering baseline.
+
+Times the previous implementation (one boolean filter of the whole home
+history per modeling row) against the cumulative-sum implementation in
+``features/team/venue_hfa.py``, using every game in the cleaned history as a
+target, and checks that both produce identical values.
+
+Run from repo root:
+    uv run python scripts/bench_venue_hfa.py
+    uv run python scripts/bench_venue_hfa.py --synthetic-seasons 60
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import time
+
+import numpy as np
+import pandas as pd
+
+from gridiron_edge.features.team.venue_hfa import (
+    _MIN_HOME_GAMES,
+    _build_home_advantage_history,
+    _canonical_season_numbers,
+    _home_hfa_entering_weeks,
+)
+
+GAMES_PATH = Path("data/cleaned/NFL_wk_by_wk_cleaned.csv")
+
+
+def _baseline(history: pd.DataFrame, targets: pd.DataFrame) -> np.ndarray:
+    """Pre-cumulative implementation, kept here only for timing and parity."""
+    values = []
+    for home_team, season_start, week in zip(
+        targets["HOME_TEAM"], targets["_SEASON_START"], targets["WEEK_NUM"], strict=True
+    ):
+        prior = history.loc[
+            (history["_SEASON_START"] < season_start)
+            | (history["_SEASON_START"].eq(season_start) & history["WEEK_NUM"].lt(week)),
+            :,
+        ]
+        if prior.empty:
+            values.append(0.0)
+            continue
+        team_results = prior.loc[prior["HOME_TEAM"].astype(str).eq(str(home_team)), "_HOME_RESULT"]
+        if len(team_results) < _MIN_HOME_GAMES:
+            values.append(0.0)
+            continue
+        values.append(float(team_results.mean()) - float(prior["_HOME_RESULT"].mean()))
+    return np.asarray(values)
+
+
+def _synthetic_games(n_seasons: int, seed: int = 0) -> pd.DataFrame:
+    """League history shaped like the cleaned games CSV (32 teams, 16 games/week)."""
+    rng = np.random.default_rng(seed)
+    teams = np.array([f"Team {i:02d}" for i in range(32)])
+    rows = []
+    for season in range(2024 - n_seasons, 2024):
+        for week in range(1, 19):
+            order = rng.permutation(teams)
+            for slot in range(16):
+                rows.append(
+                    {
+                        "GAME_ID": f"{season}_{week:02d}_{slot}",
+                        "YEAR": f"{season}-{season + 1}",
+                        "WEEK_NUM": week,
+                        "HOME_TEAM": order[2 * slot],
+                        "AWAY_SCORE": int(rng.integers(3, 38)),
+                        "HOME_SCORE": int(rng.integers(3, 41)),
+                        "IS_NEUTRAL_SITE": int(rng.random() < 0.01),
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def _time(label: str, fn, repeats: int) -> tuple[np.ndarray, float]:
+    best = float("inf")
+    result = np.empty(0)
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<18} {best:8.3f}s (best of {repeats})")
+    return result, best
+
+
+def main() -> None:
+    """Time both implementations and verify output parity."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic-seasons", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    games = _synthetic_games(args.synthetic_seasons) if args.synthetic_seasons else pd.read_csv(GAMES_PATH)
+    history = _build_home_advantage_history(games)
+    targets = games.loc[:, ["HOME_TEAM", "YEAR", "WEEK_NUM"]].copy()
+    targets["_SEASON_START"] = _canonical_season_numbers(targets["YEAR"])
+    targets["WEEK_NUM"] = targets["WEEK_NUM"].astype(int)
+    print(f"History games: {len(history):,}  targets: {len(targets):,}")
+
+    baseline, t_base = _time("per-row filters", lambda: _baseline(history, targets), args.repeats)
+    cumulative, t_cum = _time(
+        "cumulative sums",
+        lambda: _home_hfa_entering_weeks(
+            history,
+            home_teams=targets["HOME_TEAM"],
+            season_starts=targets["_SEASON_START"],
+            weeks=targets["WEEK_NUM"],
+        ),
+        args.repeats,
+    )
+    print(f"Speedup: {t_base / t_cum:.1f}x")
+
+    np.testing.assert_array_equal(cumulative, baseline)
+    print("Parity: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,19 @@
 
 The app is a read-only serialization surface. The factory
 shape lets tests build isolated app instances with stubbed dependencies.
+
+The app lifespan preloads the in-memory data snapshot for the configured
+repo root and runs its background watcher (see `api/snapshot.py`) while the
+server is up. GET responses are cached and tagged with ETags by
+`ResponseCacheMiddleware` (see `api/caching.py`); its counters are served
+at `/cache/stats`.
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -60,13 +69,35 @@ _OPENAPI_TAGS: list[dict[str, str]] = [
 ]
 
 
-def create_app() -> FastAPI:
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Watch the data snapshot for the lifetime of the server.
+
+    Honours a `settings_dependency` override so test apps watch their own
+    repo root.
+    """
+    from gridiron_edge.api.deps import app_settings
+    from gridiron_edge.api.snapshot import snapshot_store
+
+    store = snapshot_store(app_settings(app).repo_root)
+    store.start_watching()
+    try:
+        yield
+    finally:
+        store.stop_watching()
+
+
+def create_app(*, response_cache: bool = True) -> FastAPI:
     """Build a Gridiron Edge API app instance.
 
     Returns a fresh `FastAPI` instance with OpenAPI metadata and CORS
     middleware configured. Routes are not attached here; callers (or
     application startup wires routers via `app.include_router(...)`.
 
+    Args:
+        response_cache: Serve repeated GETs from the response cache. Tests
+            that swap route inputs between identical requests turn it off.
+
     Returns:
         Configured FastAPI app, ready to mount routers on.
     """
@@ -79,8 +110,22 @@ def create_app() -> FastAPI:
             "the backend-gaps backlog that drives field-level placeholders."
         ),
         openapi_tags=_OPENAPI_TAGS,
+        lifespan=_lifespan,
     )
 
+    from gridiron_edge.api.caching import ResponseCache, ResponseCacheMiddleware
+
+    cache = ResponseCache()
+    app.state.response_cache = cache
+    # Added before CORS so CORS stays outermost and also decorates cache hits.
+    if response_cache:
+        app.add_middleware(ResponseCacheMiddleware, cache=cache)
+
+    @app.get("/cache/stats", include_in_schema=False)
+    def cache_stats() -> dict[str, float | int]:
+        """Response-cache hit/miss counters."""
+        return cache.stats.as_dict()
+
     # Permissive CORS for local development. Restrict before non-local exposure
     # once a deployment surface exists.
     app.add_middleware(
@@ -88,6 +133,7 @@ def create_app() -> FastAPI:
         allow_origins=["*"],
         allow_methods=["GET"],
         allow_headers=["*"],
+        expose_headers=["ETag"],
     )
 
     from gridiron_edge.api.routes import (
@@ -0,0 +1,294 @@
+# src/gridiron_edge/api/caching.py
+
+"""HTTP response cache for the read-only API.
+
+Between pipeline runs every GET returns the same bytes, so the rendered
+JSON of each successful response is kept in a bounded LRU keyed by
+``(path, canonical query string, data-snapshot version)``. The snapshot
+version (see ``api/snapshot.py``) changes whenever a served pipeline output
+changes, so a new output naturally misses the cache and old entries age
+out of the LRU. The snapshot read for the key is pinned on the request
+(``request.state.snapshot``), so ``SnapshotDep`` renders the body from the
+same version it is cached under.
+
+Every cacheable response carries a strong ``ETag`` (a digest of the body)
+and a ``Cache-Control`` header; a request whose ``If-None-Match`` lists the
+current ETag gets an empty ``304 Not Modified``. Only ``GET`` requests with
+a ``200`` JSON response are cached, and requests that send
+``Cache-Control: no-store`` bypass the cache.
+
+Hit-rate counters are served at ``GET /cache/stats``. A cached body is
+byte-identical to its first render, including ``_meta.snapshot.age_seconds``,
+which therefore reads as the age at render time.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+import hashlib
+import threading
+from typing import Final
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_MAX_ENTRIES: Final[int] = 512
+DEFAULT_MAX_BYTES: Final[int] = 64 * 2**20
+DEFAULT_CACHE_CONTROL: Final[str] = "no-cache"
+
+# Documentation and metrics routes are never cached.
+_UNCACHED_PREFIXES: Final[tuple[str, ...]] = ("/docs", "/redoc", "/openapi.json", "/cache/")
+
+CacheKey = tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """One rendered response body.
+
+    Attributes:
+        body: Rendered JSON bytes.
+        etag: Strong ETag, quoted.
+        content_type: Original ``content-type`` header value.
+    """
+
+    body: bytes
+    etag: str
+    content_type: str
+
+
+@dataclass
+class CacheStats:
+    """Counters since the cache was created.
+
+    Attributes:
+        hits: Requests answered from the cache (200 or 304).
+        misses: Cacheable requests that were rendered.
+        not_modified: Requests answered with 304, from the cache or not.
+        bypassed: GET requests that skipped the cache.
+        evictions: Entries dropped to respect the size bounds.
+        entries: Entries currently held.
+        bytes: Body bytes currently held.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    bypassed: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of cacheable requests served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the counters plus ``hit_rate`` as a plain dict."""
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class ResponseCache:
+    """Bounded, thread-safe LRU of rendered responses.
+
+    Args:
+        max_entries: Maximum number of cached responses.
+        max_bytes: Maximum total body size.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        """Return the entry for *key*, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def put(self, key: CacheKey, entry: CachedResponse) -> None:
+        """Store *entry*, evicting least-recently-used entries as needed."""
+        if len(entry.body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.stats.bytes -= len(previous.body)
+            self._entries[key] = entry
+            self.stats.bytes += len(entry.body)
+            while len(self._entries) > self.max_entries or self.stats.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.stats.bytes -= len(evicted.body)
+                self.stats.evictions += 1
+            self.stats.entries = len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = 0
+            self.stats.bytes = 0
+
+
+def strong_etag(body: bytes) -> str:
+    """Return a quoted strong ETag for *body*."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header value matches *etag*."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def canonical_query(query_string: bytes) -> str:
+    """Return *query_string* with parameters sorted, so order does not matter."""
+    pairs = parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)
+    return urlencode(sorted(pairs))
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware that serves cached JSON bodies with ETags.
+
+    Args:
+        app: The wrapped ASGI app.
+        cache: The LRU to use. The middleware owns one when omitted.
+        cache_control: ``Cache-Control`` value for cacheable responses.
+            The default ``no-cache`` lets clients store the body but
+            revalidate with ``If-None-Match`` every time.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache: ResponseCache | None = None,
+        cache_control: str = DEFAULT_CACHE_CONTROL,
+    ) -> None:
+        self.app = app
+        self.cache = cache or ResponseCache()
+        self.cache_control = cache_control
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve from the cache or render, store, and tag the response."""
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        path: str = scope["path"]
+        headers = Headers(scope=scope)
+        if path.startswith(_UNCACHED_PREFIXES) or "no-store" in headers.get("cache-control", ""):
+            self.cache.stats.bypassed += 1
+            await self.app(scope, receive, send)
+            return
+
+        key: CacheKey = (path, canonical_query(scope["query_string"]), _pin_snapshot(scope))
+        if_none_match = headers.get("if-none-match")
+        cached = self.cache.get(key)
+        if cached is not None:
+            await self._send_cached(cached, if_none_match, send)
+            return
+
+        await self._render(scope, receive, send, key, if_none_match)
+
+    async def _send_cached(
+        self,
+        cached: CachedResponse,
+        if_none_match: str | None,
+        send: Send,
+    ) -> None:
+        headers = {
+            "etag": cached.etag,
+            "cache-control": self.cache_control,
+            "x-cache": "HIT",
+        }
+        if etag_matches(if_none_match, cached.etag):
+            self.cache.stats.not_modified += 1
+            await _send_response(send, 304, headers, b"")
+            return
+        headers["content-type"] = cached.content_type
+        await _send_response(send, 200, headers, cached.body)
+
+    async def _render(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        key: CacheKey,
+        if_none_match: str | None,
+    ) -> None:
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            headers = MutableHeaders(raw=list(start["headers"]))
+            content_type = headers.get("content-type", "")
+            if start["status"] != 200 or not content_type.startswith("application/json"):
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            entry = CachedResponse(body=body, etag=strong_etag(body), content_type=content_type)
+            self.cache.put(key, entry)
+            headers["etag"] = entry.etag
+            headers["cache-control"] = self.cache_control
+            headers["x-cache"] = "MISS"
+            if etag_matches(if_none_match, entry.etag):
+                self.cache.stats.not_modified += 1
+                del headers["content-type"]
+                del headers["content-length"]
+                await send({**start, "status": 304, "headers": headers.raw})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send({**start, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, capture)
+
+
+async def _send_response(send: Send, status: int, headers: dict[str, str], body: bytes) -> None:
+    raw = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+    if body:
+        raw.append((b"content-length", str(len(body)).encode("latin-1")))
+    await send({"type": "http.response.start", "status": status, "headers": raw})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _pin_snapshot(scope: Scope) -> int:
+    """Pin the current data snapshot on the request and return its version."""
+    from gridiron_edge.api.deps import app_settings
+    from gridiron_edge.api.snapshot import current_snapshot
+
+    app: FastAPI = scope["app"]
+    snapshot = current_snapshot(app_settings(app).repo_root)
+    scope.setdefault("state", {})["snapshot"] = snapshot
+    return snapshot.version
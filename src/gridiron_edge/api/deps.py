@@ -6,7 +6,8 @@ Bridges FastAPI's dependency-injection system to the existing
 `gridiron_edge.datasets.registry.dataset_path()` facilities. Routes
 type their parameters as `SettingsDep` / `DataPathResolverDep` rather
 than importing those facilities directly, which gives us a single seam
-to override in tests.
+to override in tests. `SnapshotDep` resolves the in-memory data snapshot
+for the configured repo root.
 """
 
 from __future__ import annotations
@@ -15,8 +16,9 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Protocol
 
-from fastapi import Depends
+from fastapi import Depends, FastAPI, Request
 
+from gridiron_edge.api.snapshot import DataSnapshot, current_snapshot
 from gridiron_edge.core.settings import Settings, get_settings
 from gridiron_edge.datasets.registry import DatasetKey, dataset_path
 
@@ -41,6 +43,15 @@ def settings_dependency() -> Settings:
 SettingsDep = Annotated[Settings, Depends(settings_dependency)]
 
 
+def app_settings(app: FastAPI) -> Settings:
+    """Resolve `Settings` for *app* outside a request.
+
+    Honours a `settings_dependency` override, so the lifespan and
+    middleware of a test app see the same repo root as its routes.
+    """
+    return app.dependency_overrides.get(settings_dependency, settings_dependency)()
+
+
 class DataPathResolver(Protocol):
     """Resolves dataset keys to absolute filesystem paths.
 
@@ -74,3 +85,18 @@ DataPathResolverDep = Annotated[
     DataPathResolver,
     Depends(data_path_resolver_dependency),
 ]
+
+
+def snapshot_dependency(request: Request, settings: SettingsDep) -> DataSnapshot:
+    """FastAPI dependency that resolves the request's data snapshot.
+
+    Reuses the snapshot the response cache pinned on the request, so the
+    body is rendered from the version it is cached under. Routes pass it
+    to every snapshot-backed loader and stamp their response `_meta` with
+    its version and age.
+    """
+    pinned: DataSnapshot | None = getattr(request.state, "snapshot", None)
+    return pinned if pinned is not None else current_snapshot(settings.repo_root)
+
+
+SnapshotDep = Annotated[DataSnapshot, Depends(snapshot_dependency)]
@@ -0,0 +1,201 @@
+# src/gridiron_edge/api/indexes.py
+
+"""Pre-grouped lookup indexes over the API data snapshot.
+
+Routes used to filter whole frames per request (``df.loc[df["player_id"] ==
+pid]``, ``games.loc[games["YEAR"] == season]``) and then walk the result
+with ``iterrows``. A :class:`GroupIndex` does the grouping once per
+snapshot: it stores a frame as read-only column arrays plus a map from
+each key to the row positions of its group, so a lookup is one dict access
+and a fancy-index per column.
+
+The builders below are registered as derived snapshot entries in
+:mod:`gridiron_edge.api.snapshot`, so each index is built at most once per
+snapshot version and is carried over while its sources are unchanged.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+_NO_ROWS: Final[np.ndarray] = np.empty(0, dtype=np.intp)
+
+# player_game_logs columns kept by the per-player index, beyond stat columns.
+_PLAYER_HISTORY_COLUMNS: Final[tuple[str, ...]] = (
+    "season",
+    "week",
+    "player_name",
+    "opponent_team",
+    "game_id",
+    "is_home",
+)
+_PLAYER_LIST_COLUMNS: Final[tuple[str, ...]] = (
+    "player_id",
+    "player_name",
+    "position",
+    "team",
+    "week",
+)
+
+
+@dataclass(frozen=True)
+class GroupIndex:
+    """Rows of one frame grouped by a key, stored as column arrays.
+
+    Attributes:
+        columns: Read-only array per column, in the frame's sorted order.
+        groups: Row positions (into ``columns``) per key. Keys are the key
+            column's scalars (``int`` seasons, ``str`` teams); multi-column
+            keys are tuples. Rows with a null key are not indexed.
+    """
+
+    columns: Mapping[str, np.ndarray]
+    groups: Mapping[Any, np.ndarray]
+
+    @classmethod
+    def build(
+        cls,
+        df: DataFrame,
+        by: str | list[str],
+        *,
+        order_by: Iterable[str] = (),
+        columns: Iterable[str] | None = None,
+    ) -> GroupIndex:
+        """Group *df* by *by*, keeping rows in *order_by* order within groups.
+
+        Args:
+            df: Source frame. Not modified.
+            by: Key column, or columns for a tuple key.
+            order_by: Columns to stable-sort by before grouping.
+            columns: Columns to keep. Defaults to all; missing ones are skipped.
+
+        Returns:
+            The index.
+        """
+        order = list(order_by)
+        if order and not df.empty:
+            df = df.sort_values(order, kind="stable")
+        keep = list(df.columns) if columns is None else [c for c in columns if c in df.columns]
+        arrays: dict[str, np.ndarray] = {}
+        for name in keep:
+            values = df[name].to_numpy(copy=True)
+            values.flags.writeable = False
+            arrays[str(name)] = values
+        groups = df.groupby(by, sort=False).indices if not df.empty else {}
+        return cls(columns=arrays, groups={key: np.asarray(rows) for key, rows in groups.items()})
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return whether *key* has at least one row."""
+        return key in self.groups
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self.groups)
+
+    def keys(self) -> list[Any]:
+        """Return the indexed keys in sorted order."""
+        return sorted(self.groups)
+
+    def positions(self, key: Hashable) -> np.ndarray:
+        """Return the row positions of *key* (empty if absent)."""
+        return self.groups.get(key, _NO_ROWS)
+
+    def take(self, key: Hashable, columns: Iterable[str] | None = None) -> dict[str, np.ndarray]:
+        """Return the rows of *key* as ``column -> array``.
+
+        Args:
+            key: Group key.
+            columns: Columns to return. Defaults to all.
+        """
+        rows = self.positions(key)
+        names = self.columns if columns is None else columns
+        return {name: self.columns[name][rows] for name in names}
+
+    def frame(self, key: Hashable) -> DataFrame:
+        """Return the rows of *key* as a new DataFrame (empty if absent)."""
+        return DataFrame(self.take(key))
+
+
+def index_games_by_season(games: DataFrame) -> GroupIndex:
+    """Games grouped by ``YEAR``, ordered by week."""
+    return GroupIndex.build(games, "YEAR", order_by=["WEEK_NUM"])
+
+
+def index_games_by_season_week(games: DataFrame) -> GroupIndex:
+    """Games grouped by ``(YEAR, WEEK_NUM)``."""
+    return GroupIndex.build(games, ["YEAR", "WEEK_NUM"])
+
+
+def index_elo_by_season(elo_state: DataFrame) -> GroupIndex:
+    """Elo state grouped by ``NFL_YEAR``, ordered by team then week."""
+    return GroupIndex.build(elo_state, "NFL_YEAR", order_by=["NFL_TEAM", "NFL_WEEK"])
+
+
+def index_cohort_splits_by_team(splits: DataFrame) -> GroupIndex:
+    """Team cohort splits grouped by ``team_abbr``."""
+    return GroupIndex.build(splits, "team_abbr")
+
+
+def elo_trends(elo_state: DataFrame, long_to_short: dict[str, str]) -> DataFrame:
+    """Latest-week Elo delta per team (see ``api.loaders.compute_elo_deltas``)."""
+    from gridiron_edge.api.loaders import compute_elo_deltas
+
+    return compute_elo_deltas(elo_state, long_to_short)
+
+
+def index_player_logs_by_player(logs: DataFrame | None) -> GroupIndex | None:
+    """Regular-season player logs grouped by ``player_id``, in game order.
+
+    Keeps the history columns plus every mapped stat column present.
+    Returns ``None`` when the logs artifact is missing.
+    """
+    if logs is None:
+        return None
+    from gridiron_edge.api.loaders import _PLAYER_STAT_COLUMNS
+
+    regular = _regular_season(logs)
+    return GroupIndex.build(
+        regular,
+        "player_id",
+        order_by=["season", "week"],
+        columns=[*_PLAYER_HISTORY_COLUMNS, *dict.fromkeys(_PLAYER_STAT_COLUMNS.values())],
+    )
+
+
+def index_player_logs_by_season(logs: DataFrame | None) -> GroupIndex | None:
+    """Regular-season skill-player logs grouped by ``season``.
+
+    Rows are ordered by player then week, so each player's last row in a
+    group is their most recent game. Returns ``None`` when the logs artifact
+    is missing.
+    """
+    if logs is None:
+        return None
+    skill = _regular_season(logs)
+    if "is_skill" in skill.columns:
+        skill = skill.loc[skill["is_skill"].astype(bool), :]
+    return GroupIndex.build(
+        skill,
+        "season",
+        order_by=["player_id", "week"],
+        columns=_PLAYER_LIST_COLUMNS,
+    )
+
+
+def _regular_season(logs: DataFrame) -> DataFrame:
+    """Return REG rows of *logs* (all rows if the column is absent)."""
+    if "season_type" not in logs.columns:
+        return logs
+    return logs.loc[logs["season_type"] == "REG", :]
+
+
+def none_if_nan(values: np.ndarray) -> list[float | None]:
+    """Return *values* as Python floats, with ``None`` for NaN."""
+    floats = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+    return [None if np.isnan(v) else float(v) for v in floats]
@@ -9,6 +9,12 @@ domain objects.
 Per D19, every wrapper passes `settings.repo_root` explicitly to the
 underlying loader — the domain-loader fallback to `get_settings()` is
 never used from the API path.
+
+The games, Elo, team metadata, percentile, cohort-split, and player-log
+loaders serve from the in-memory data snapshot (`api/snapshot.py`) rather
+than re-reading files per request. They take the request's snapshot as
+``snapshot=`` so one response never mixes snapshot versions. DataFrame
+loaders return copies, so callers may mutate the result freely.
 """
 
 from __future__ import annotations
@@ -19,13 +25,17 @@ import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from gridiron_edge.api.indexes import GroupIndex, none_if_nan
 from gridiron_edge.core.settings import Settings
 
 if TYPE_CHECKING:
+    from gridiron_edge.api.snapshot import DataSnapshot
     from gridiron_edge.market.recommendations import EdgeResult
+    from gridiron_edge.ratings.elo.matrix import EloMatrix
 
 
 def load_bets_df(settings: Settings, *, status: str | None = None) -> pd.DataFrame:
@@ -173,32 +183,76 @@ def load_evaluation_df(
     )
 
 
-def load_games_df(settings: Settings) -> pd.DataFrame:
-    """Return the cleaned historical games table."""
-    from gridiron_edge.datasets.loaders import load_games
+def _snapshot_value(
+    settings: Settings,
+    name: str,
+    snapshot: DataSnapshot | None,
+) -> Any:  # noqa: ANN401
+    """Return dataset *name* from the request's snapshot (shared, read-only).
+
+    Without a *snapshot* the current one is used; routes pass their
+    ``SnapshotDep`` so every dataset in one response comes from one version.
+    """
+    from gridiron_edge.api.snapshot import current_snapshot
+
+    if snapshot is None:
+        snapshot = current_snapshot(settings.repo_root)
+    return snapshot.get(name)
+
 
-    return load_games(settings.repo_root)
+def load_games_df(settings: Settings, *, snapshot: DataSnapshot | None = None) -> pd.DataFrame:
+    """Return the cleaned historical games table (served from the snapshot)."""
+    return _snapshot_value(settings, "games", snapshot).copy()
 
 
-def load_elo_state_df(settings: Settings) -> pd.DataFrame:
-    """Return the full Elo history (team, season, week, ELO)."""
-    from gridiron_edge.datasets.loaders import load_elo_state
+def load_elo_state_df(settings: Settings, *, snapshot: DataSnapshot | None = None) -> pd.DataFrame:
+    """Return the full Elo history (team, season, week, ELO), from the snapshot."""
+    return _snapshot_value(settings, "elo_state", snapshot).copy()
 
-    return load_elo_state(settings.repo_root)
+
+def load_games_season_df(
+    settings: Settings, season: str, *, snapshot: DataSnapshot | None = None
+) -> pd.DataFrame:
+    """Return one season of the games table, ordered by week (indexed lookup)."""
+    return _snapshot_value(settings, "games_by_season", snapshot).frame(season)
 
 
-def load_team_name_map(settings: Settings) -> dict[str, str]:
+def load_elo_season_df(
+    settings: Settings, season: str, *, snapshot: DataSnapshot | None = None
+) -> pd.DataFrame:
+    """Return one season of the Elo history, by team then week (indexed lookup)."""
+    return _snapshot_value(settings, "elo_by_season", snapshot).frame(season)
+
+
+def load_elo_matrix(
+    settings: Settings, *, snapshot: DataSnapshot | None = None
+) -> EloMatrix | None:
+    """Return the pairwise Elo win-probability matrix, if it has been built."""
+    return _snapshot_value(settings, "elo_matrix", snapshot)
+
+
+def load_elo_trends_df(settings: Settings, *, snapshot: DataSnapshot | None = None) -> pd.DataFrame:
+    """Return the latest-week Elo delta per team, precomputed per snapshot.
+
+    Same frame as ``compute_elo_deltas(load_elo_state_df(...),
+    load_team_name_map(...))``.
+    """
+    return _snapshot_value(settings, "elo_trends", snapshot).copy()
+
+
+def load_team_name_map(
+    settings: Settings, *, snapshot: DataSnapshot | None = None
+) -> dict[str, str]:
     """Return the long → short team name mapping as a dict.
 
     Example: {"Baltimore Ravens": "BAL", "Kansas City Chiefs": "KC", ...}
     """
-    from gridiron_edge.datasets.loaders import load_teams_long_short
+    return dict(_snapshot_value(settings, "team_name_map", snapshot))
 
-    df = load_teams_long_short(settings.repo_root)
-    return dict(zip(df["NFL_LONG_NAME"], df["NFL_SHORT_NAME"], strict=True))
 
-
-def resolve_current_season_week(settings: Settings) -> tuple[str, int]:
+def resolve_current_season_week(
+    settings: Settings, *, snapshot: DataSnapshot | None = None
+) -> tuple[str, int]:
     """Resolve the current (season, week) for default views.
 
     Normally the latest completed game. But when the completed archive
@@ -209,19 +263,15 @@ def resolve_current_season_week(settings: Settings) -> tuple[str, int]:
 
     Returns ("", 0) if games is empty.
     """
-    from gridiron_edge.datasets.loaders import (
-        load_games,
-        load_schedule_upcoming_rich,
-    )
+    from gridiron_edge.datasets.loaders import load_schedule_upcoming_rich
 
-    games = load_games(settings.repo_root)
-    if games.empty:
+    by_week: GroupIndex = _snapshot_value(settings, "games_by_season_week", snapshot)
+    if not len(by_week):
         return ("", 0)
 
-    games_sorted = games.sort_values(["YEAR", "WEEK_NUM"])
-    latest = games_sorted.iloc[-1]
-    latest_season = str(latest["YEAR"])
-    latest_week = int(latest["WEEK_NUM"])
+    latest_key = by_week.keys()[-1]
+    latest_season = str(latest_key[0])
+    latest_week = int(latest_key[1])
 
     # Season complete (SB played) → look forward to the upcoming slate.
     if latest_week >= 22:
@@ -351,6 +401,8 @@ def compute_elo_deltas(
 
 def load_projections_summary_df(
     settings: Settings,
+    *,
+    snapshot: DataSnapshot | None = None,
 ) -> tuple[pd.DataFrame, str | None, int | None]:
     """Load the projections summary CSV, joined with Elo deltas.
 
@@ -390,8 +442,8 @@ def load_projections_summary_df(
             n_simulations = None
 
     # Compute per-team Elo deltas and join.
-    elo_state: DataFrame = load_elo_state_df(settings)
-    long_to_short: dict[str, str] = load_team_name_map(settings)
+    elo_state: DataFrame = load_elo_state_df(settings, snapshot=snapshot)
+    long_to_short: dict[str, str] = load_team_name_map(settings, snapshot=snapshot)
     deltas: DataFrame = compute_elo_deltas(elo_state, long_to_short)
 
     if deltas.empty:
@@ -410,6 +462,8 @@ def load_projections_summary_df(
 
 def load_projection_grid_data(
     settings: Settings,
+    *,
+    snapshot: DataSnapshot | None = None,
 ) -> ProjectionGridData:
     """Load and season-scope the static weekly-grid source artifacts.
 
@@ -456,7 +510,7 @@ def load_projection_grid_data(
 
     if not season:
         try:
-            season, _ = resolve_current_season_week(settings)
+            season, _ = resolve_current_season_week(settings, snapshot=snapshot)
         except FileNotFoundError:
             season = ""
 
@@ -505,7 +559,7 @@ def load_projection_grid_data(
         schedule=schedule,
         # pyrefly: ignore [bad-argument-type]
         games=games,
-        long_to_short=load_team_name_map(settings),
+        long_to_short=load_team_name_map(settings, snapshot=snapshot),
         season=season,
         completed_through_week=completed_through_week,
         schedule_available=schedule_available,
@@ -514,10 +568,13 @@ def load_projection_grid_data(
 
 def load_team_percentiles_df(
     settings: Settings,
+    *,
+    snapshot: DataSnapshot | None = None,
 ) -> pd.DataFrame:
     """Load the latest team percentile artifact.
 
-    Reads the most recent file from ``data/output/rankings/percentiles/``.
+    Serves the most recent file from ``data/output/rankings/percentiles/``
+    out of the in-memory snapshot.
     Returns empty DataFrame if no artifact exists yet (e.g., before the
     first sim run has completed).
 
@@ -525,9 +582,7 @@ def load_team_percentiles_df(
         DataFrame with columns team_abbr, season, week, rating_pct,
         avg_wins_pct, make_playoffs_pct, win_sb_pct.
     """
-    from gridiron_edge.evaluation.percentiles import load_latest_team_percentiles
-
-    return load_latest_team_percentiles(settings.repo_root)
+    return _snapshot_value(settings, "team_percentiles", snapshot).copy()
 
 
 def load_prop_situational_splits(
@@ -598,11 +653,12 @@ def load_player_history(
     stat: str,
     season: int | None = None,
     limit: int | None = None,
+    snapshot: DataSnapshot | None = None,
 ) -> dict | None:
     """Load a player's per-game stat series for one season.
 
-    Reads player_game_logs.parquet, filters to the player + season
-    (regular season only), and projects the one stat column mapped from
+    Uses the snapshot's player_game_logs.parquet frame, filters to the
+    player + season (regular season only), and projects the one stat column mapped from
     the ``stat`` key. Bars are raw per-game values — no cohort filtering.
 
     Args:
@@ -613,6 +669,7 @@ def load_player_history(
         season: Season int (e.g. 2024). Defaults to the player's latest
             season present in the logs.
         limit: If set, return only the last N games (most recent weeks).
+        snapshot: The request's data snapshot; defaults to the current one.
 
     Returns:
         Dict with keys: player_id, player_name, stat, season, rows
@@ -630,43 +687,42 @@ def load_player_history(
     if column is None:
         return None
 
-    logs_path: Path = settings.repo_root / "data" / "cleaned" / "player_game_logs.parquet"
-    if not logs_path.exists():
-        return None
-
-    df: DataFrame = pd.read_parquet(logs_path)
-    player_rows = df.loc[df["player_id"] == player_id, :]
-    if player_rows.empty:
-        return None
-
-    # Regular season only for a clean weekly series.
-    if "season_type" in player_rows.columns:
-        player_rows = player_rows.loc[player_rows["season_type"] == "REG", :]
-    if player_rows.empty:
+    # Regular-season rows pre-grouped by player, in (season, week) order.
+    by_player: GroupIndex | None = _snapshot_value(settings, "player_logs_by_player", snapshot)
+    if by_player is None or player_id not in by_player:
         return None
+    rows_for_player = by_player.positions(player_id)
+    seasons = by_player.columns["season"][rows_for_player]
 
     # Default season = the player's latest season present.
-    resolved_season: int = season if season is not None else int(player_rows["season"].max())
-    season_rows = player_rows.loc[player_rows["season"] == resolved_season, :].sort_values("week")
-    if season_rows.empty:
+    resolved_season: int = season if season is not None else int(seasons.max())
+    season_rows = rows_for_player[seasons == resolved_season]
+    if season_rows.size == 0:
         return None
 
     if limit is not None and limit > 0:
-        season_rows = season_rows.tail(limit)
-
-    player_name = str(season_rows.iloc[0]["player_name"])
-
-    rows: list[dict] = []
-    for _, r in season_rows.iterrows():
-        rows.append(
-            {
-                "week": int(r["week"]),
-                "value": _none_if_nan_float(r[column]),
-                "opponent": str(r["opponent_team"]),
-                "game_id": str(r["game_id"]),
-                "is_home": bool(r["is_home"]),
-            }
+        season_rows = season_rows[-limit:]
+
+    cols = by_player.columns
+    values = none_if_nan(cols[column][season_rows]) if column in cols else [None] * len(season_rows)
+    rows: list[dict] = [
+        {
+            "week": int(week),
+            "value": value,
+            "opponent": str(opponent),
+            "game_id": str(game_id),
+            "is_home": bool(is_home),
+        }
+        for week, value, opponent, game_id, is_home in zip(
+            cols["week"][season_rows],
+            values,
+            cols["opponent_team"][season_rows],
+            cols["game_id"][season_rows],
+            cols["is_home"][season_rows],
+            strict=True,
         )
+    ]
+    player_name = str(cols["player_name"][season_rows[0]])
 
     return {
         "player_id": player_id,
@@ -681,52 +737,53 @@ def load_players_list(
     settings: Settings,
     *,
     season: int | None = None,
+    snapshot: DataSnapshot | None = None,
 ) -> dict | None:
     """Load skill players active in a season, deduped to latest team.
 
-    Reads player_game_logs.parquet, filters to skill positions + REG
+    Uses the snapshot's player_game_logs.parquet frame, filters to skill positions + REG
     season, and takes each player's most-recent game row for their
     current team/position/name. Sorted by name.
 
     Args:
         settings: API settings.
         season: Season int; defaults to the latest present in the logs.
+        snapshot: The request's data snapshot; defaults to the current one.
 
     Returns:
         Dict {season, rows: [{player_id, player_name, position, team}]}.
         None if the logs are missing/empty.
     """
-    logs_path: Path = settings.repo_root / "data" / "cleaned" / "player_game_logs.parquet"
-    if not logs_path.exists():
-        return None
-
-    df: DataFrame = pd.read_parquet(logs_path)
-    if df.empty:
-        return None
-
-    if "season_type" in df.columns:
-        df = df.loc[df["season_type"] == "REG", :]
-    if "is_skill" in df.columns:
-        df = df.loc[df["is_skill"], :]
-    if df.empty:
+    # REG skill-player rows pre-grouped by season, in (player_id, week) order.
+    by_season: GroupIndex | None = _snapshot_value(settings, "player_logs_by_season", snapshot)
+    if by_season is None or not len(by_season):
         return None
 
-    resolved_season: int = season if season is not None else int(df["season"].max())
-    scope = df.loc[df["season"] == resolved_season, :]
-    if scope.empty:
+    resolved_season: int = season if season is not None else int(by_season.keys()[-1])
+    scope = by_season.take(resolved_season)
+    player_ids = scope["player_id"]
+    if player_ids.size == 0:
         return None
 
     # Each player's most-recent game row = current team/position/name.
-    latest = scope.sort_values(["player_id", "week"]).groupby("player_id", group_keys=False).tail(1)
+    latest = np.flatnonzero(np.append(player_ids[1:] != player_ids[:-1], True))
+    names = scope["player_name"][latest]
+    latest = latest[np.argsort(names.astype(str), kind="stable")]
 
     rows: list[dict] = [
         {
-            "player_id": str(r["player_id"]),
-            "player_name": str(r["player_name"]),
-            "position": str(r["position"]),
-            "team": str(r["team"]),
+            "player_id": str(pid),
+            "player_name": str(name),
+            "position": str(position),
+            "team": str(team),
         }
-        for _, r in latest.sort_values("player_name").iterrows()
+        for pid, name, position, team in zip(
+            player_ids[latest],
+            scope["player_name"][latest],
+            scope["position"][latest],
+            scope["team"][latest],
+            strict=True,
+        )
     ]
 
     return {"season": resolved_season, "rows": rows}
@@ -1062,7 +1119,9 @@ def load_opponent_allowed_for_prop(
     return result
 
 
-def load_team_cohort_splits_df(settings: Settings) -> pd.DataFrame:
+def load_team_cohort_splits_df(
+    settings: Settings, *, snapshot: DataSnapshot | None = None
+) -> pd.DataFrame:
     """Load the team cohort splits artifact.
 
     Returns:
@@ -1070,9 +1129,22 @@ def load_team_cohort_splits_df(settings: Settings) -> pd.DataFrame:
         team_cohort_splits.parquet. Empty DataFrame if the artifact
         doesn't exist.
     """
-    from gridiron_edge.evaluation.team_cohort_splits import load_team_cohort_splits
+    return _snapshot_value(settings, "team_cohort_splits", snapshot).copy()
+
+
+def load_team_cohort_splits_for_team(
+    settings: Settings,
+    team_abbr: str,
+    *,
+    snapshot: DataSnapshot | None = None,
+) -> dict[str, dict] | None:
+    """Return one team's formatted cohort splits via the per-team index.
 
-    return load_team_cohort_splits(settings.repo_root)
+    Same result as ``format_team_cohort_splits(load_team_cohort_splits_df(
+    settings), team_abbr)`` without scanning the whole artifact.
+    """
+    by_team: GroupIndex = _snapshot_value(settings, "cohort_splits_by_team", snapshot)
+    return format_team_cohort_splits(by_team.frame(team_abbr), team_abbr)
 
 
 def format_team_cohort_splits(
@@ -1117,7 +1189,7 @@ def format_team_cohort_splits(
     return result
 
 
-def load_team_metadata(settings: Settings) -> pd.DataFrame:
+def load_team_metadata(settings: Settings, *, snapshot: DataSnapshot | None = None) -> pd.DataFrame:
     """Load the unified team metadata CSV via the datasets registry.
 
     Returns:
@@ -1125,21 +1197,18 @@ def load_team_metadata(settings: Settings) -> pd.DataFrame:
         name, conf, div, primary_color, secondary_color. Empty if
         the file does not exist yet.
     """
-    from gridiron_edge.datasets.registry import dataset_path
-
-    path: Path = dataset_path(settings.repo_root, "team_metadata")
-    if not path.exists():
-        return pd.DataFrame()
-    return pd.read_csv(path)
+    return _snapshot_value(settings, "team_metadata", snapshot).copy()
 
 
-def team_metadata_lookup(settings: Settings) -> dict[str, dict]:
+def team_metadata_lookup(
+    settings: Settings, *, snapshot: DataSnapshot | None = None
+) -> dict[str, dict]:
     """Return dict of long_name → metadata dict.
 
     Metadata dict has keys: city, name, conference, division,
     primary_color, secondary_color. All None if team not found.
     """
-    df: DataFrame = load_team_metadata(settings)
+    df: DataFrame = _snapshot_value(settings, "team_metadata", snapshot)
     if df.empty:
         return {}
 
@@ -14,6 +14,7 @@ blocked route references a registered slug.
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -46,15 +47,34 @@ FieldStatus = Annotated[
 ]
 
 
+class SnapshotInfo(BaseModel):
+    """Version and age of the data snapshot a response was served from.
+
+    Attributes:
+        version: Snapshot version; increments each time pipeline outputs
+            change and a new snapshot is swapped in.
+        built_at: UTC time the snapshot was built.
+        age_seconds: Seconds between `built_at` and the response.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    version: int = Field(description="Monotonic snapshot version.")
+    built_at: datetime = Field(description="UTC time the snapshot was built.")
+    age_seconds: float = Field(description="Snapshot age when the response was built.")
+
+
 class ResponseMeta(BaseModel):
     """Optional `_meta` envelope attached to API responses.
 
     `field_status` is keyed on dot-notation field paths within the response
     (e.g., "model.home_win_prob", "injuries", "splits.l4"). Granularity is
-    field-level per D14.
+    field-level per D14. `snapshot` is set only by snapshot-backed routes
+    and is omitted from the wire shape otherwise.
 
-    Builder methods (`with_pending`, `with_blocked`) return new instances
-    rather than mutating in place, consistent with `frozen=True`.
+    Builder methods (`with_pending`, `with_blocked`, `with_snapshot`) return
+    new instances rather than mutating in place, consistent with
+    `frozen=True`.
     """
 
     model_config = ConfigDict(frozen=True, extra="forbid")
@@ -63,11 +83,16 @@ class ResponseMeta(BaseModel):
         default_factory=dict,
         description="Map from field path to status (field-level per D14).",
     )
+    snapshot: SnapshotInfo | None = Field(
+        default=None,
+        description="Data snapshot the response was served from, if any.",
+        exclude_if=lambda snapshot: snapshot is None,
+    )
 
     def with_pending(self, field_path: str) -> ResponseMeta:
         """Return a new `ResponseMeta` with `field_path` marked pending."""
         new_map = {**self.field_status, field_path: "pending"}
-        return ResponseMeta(field_status=new_map)
+        return self.model_copy(update={"field_status": new_map})
 
     def with_blocked(
         self,
@@ -80,7 +105,12 @@ class ResponseMeta(BaseModel):
             **self.field_status,
             field_path: BlockedStatus(blocker=blocker, roadmap=roadmap),
         }
-        return ResponseMeta(field_status=new_map)
+        return self.model_copy(update={"field_status": new_map})
+
+    def with_snapshot(self, version: int, built_at: datetime, age_seconds: float) -> ResponseMeta:
+        """Return a new `ResponseMeta` stamped with the serving snapshot."""
+        info = SnapshotInfo(version=version, built_at=built_at, age_seconds=age_seconds)
+        return self.model_copy(update={"snapshot": info})
 
 
 class Blocker:
@@ -8,14 +8,14 @@ from fastapi import APIRouter, HTTPException, Query
 from pandas import DataFrame
 
 from gridiron_edge.api._prop_id import decode_prop_id, resolve_opponent_from_game_id
-from gridiron_edge.api.deps import SettingsDep
+from gridiron_edge.api.deps import SettingsDep, SnapshotDep
 from gridiron_edge.api.loaders import (
-    format_team_cohort_splits,
-    load_elo_state_df,
-    load_games_df,
+    load_elo_matrix,
+    load_elo_season_df,
+    load_games_season_df,
     load_opponent_allowed_for_prop,
     load_prop,
-    load_team_cohort_splits_df,
+    load_team_cohort_splits_for_team,
     load_team_name_map,
     load_team_percentiles_df,
     resolve_current_season_week,
@@ -28,6 +28,7 @@ from gridiron_edge.api.serializers.compare import (
     serialize_compare_player,
     serialize_compare_teams,
 )
+from gridiron_edge.api.snapshot import stamp_snapshot
 from gridiron_edge.evaluation.champion_resolver import ChampionNotFoundError
 
 router = APIRouter(prefix="/compare", tags=["compare"])
@@ -35,23 +36,24 @@ router = APIRouter(prefix="/compare", tags=["compare"])
 
 def _resolve_scope(
     settings: SettingsDep,
+    snapshot: SnapshotDep,
     season: str | None,
 ) -> tuple[str, int]:
     """Return (season, as_of_week), defaulting to current when needed.
 
-    Lazy: only reads the games CSV when a default is actually needed.
+    Explicit seasons read the per-season games index from the snapshot.
     """
     if season is not None:
-        games = load_games_df(settings)
-        season_games = games.loc[games["YEAR"] == season, "WEEK_NUM"]
-        as_of_week = int(season_games.max()) if not season_games.empty else 0
+        season_games = load_games_season_df(settings, season, snapshot=snapshot)
+        as_of_week = int(season_games["WEEK_NUM"].max()) if not season_games.empty else 0
         return (season, as_of_week)
-    return resolve_current_season_week(settings)
+    return resolve_current_season_week(settings, snapshot=snapshot)
 
 
 @router.get("/teams", response_model=CompareTeamsResponse)
 def compare_teams(
     settings: SettingsDep,
+    snapshot: SnapshotDep,
     team_a: str = Query(
         description="Short-code team abbreviation, e.g. 'KC'.",
     ),
@@ -65,14 +67,15 @@ def compare_teams(
 ) -> CompareTeamsResponse:
     """Return team-vs-team comparison across stats.
 
-    Populated stats: Elo rating, rank, season record.
+    Populated stats: Elo rating, rank, season record, head-to-head Elo
+    win probability.
     Scaffolded stats: off/def decomposition, trend, schedule difficulty,
     playoff probability, cohort splits, per-stat percentile ranks — all
     marked in ``_meta.field_status`` per D14.
 
     Returns 404 if either abbreviation is unknown.
     """
-    long_to_short: dict[str, str] = load_team_name_map(settings)
+    long_to_short: dict[str, str] = load_team_name_map(settings, snapshot=snapshot)
     short_to_long: dict[str, str] = {v: k for k, v in long_to_short.items()}
 
     if team_a.upper() not in short_to_long:
@@ -86,15 +89,12 @@ def compare_teams(
             detail=f"Unknown team abbreviation for team_b: {team_b}",
         )
 
-    elo: DataFrame = load_elo_state_df(settings)
-    games: DataFrame = load_games_df(settings)
-    percentiles: DataFrame = load_team_percentiles_df(settings)
-    cohort_splits_df = load_team_cohort_splits_df(settings)
+    percentiles: DataFrame = load_team_percentiles_df(settings, snapshot=snapshot)
 
     # Build cohort_splits dict for both teams.
     cohort_splits: dict[str, dict] | None = None
-    a_splits = format_team_cohort_splits(cohort_splits_df, team_a.upper())
-    b_splits = format_team_cohort_splits(cohort_splits_df, team_b.upper())
+    a_splits = load_team_cohort_splits_for_team(settings, team_a.upper(), snapshot=snapshot)
+    b_splits = load_team_cohort_splits_for_team(settings, team_b.upper(), snapshot=snapshot)
     if a_splits is not None or b_splits is not None:
         cohort_splits = {}
         if a_splits is not None:
@@ -102,9 +102,11 @@ def compare_teams(
         if b_splits is not None:
             cohort_splits[team_b.upper()] = b_splits
 
-    resolved_season, as_of_week = _resolve_scope(settings, season)
+    resolved_season, as_of_week = _resolve_scope(settings, snapshot, season)
+    elo: DataFrame = load_elo_season_df(settings, resolved_season, snapshot=snapshot)
+    games: DataFrame = load_games_season_df(settings, resolved_season, snapshot=snapshot)
 
-    return serialize_compare_teams(
+    response = serialize_compare_teams(
         elo,
         games,
         long_to_short,
@@ -114,7 +116,9 @@ def compare_teams(
         as_of_week=as_of_week,
         percentiles=percentiles,
         cohort_splits=cohort_splits,
+        elo_matrix=load_elo_matrix(settings, snapshot=snapshot),
     )
+    return stamp_snapshot(response, snapshot)
 
 
 @router.get("/player/{prop_id}", response_model=ComparePlayerResponse)
@@ -6,12 +6,11 @@ from __future__ import annotations
 from fastapi import APIRouter, HTTPException, Query
 from pandas import DataFrame
 
-from gridiron_edge.api.deps import SettingsDep
+from gridiron_edge.api.deps import SettingsDep, SnapshotDep
 from gridiron_edge.api.loaders import (
-    format_team_cohort_splits,
     load_game,
     load_games_for_week,
-    load_team_cohort_splits_df,
+    load_team_cohort_splits_for_team,
     resolve_current_season_week,
 )
 from gridiron_edge.api.schemas.games import GameDetail, GameList
@@ -66,6 +65,7 @@ def list_games(
 @router.get("/{game_id}", response_model=GameDetail)
 def get_game(
     settings: SettingsDep,
+    snapshot: SnapshotDep,
     game_id: str,
 ) -> GameDetail:
     """Return one selected scheduled game regardless of prediction status."""
@@ -76,12 +76,11 @@ def get_game(
             detail=f"Unknown game_id: {game_id}",
         )
 
-    cohort_splits_df = load_team_cohort_splits_df(settings)
     team_comparison: dict[str, dict] | None = None
     away_team = str(row["away_team"])
     home_team = str(row["home_team"])
-    away_splits = format_team_cohort_splits(cohort_splits_df, away_team)
-    home_splits = format_team_cohort_splits(cohort_splits_df, home_team)
+    away_splits = load_team_cohort_splits_for_team(settings, away_team, snapshot=snapshot)
+    home_splits = load_team_cohort_splits_for_team(settings, home_team, snapshot=snapshot)
     if away_splits is not None or home_splits is not None:
         team_comparison = {}
         if away_splits is not None:
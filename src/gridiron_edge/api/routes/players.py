@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Query
 
-from gridiron_edge.api.deps import SettingsDep
+from gridiron_edge.api.deps import SettingsDep, SnapshotDep
 from gridiron_edge.api.loaders import (
     load_player_history,
     load_players_list,
@@ -20,6 +20,7 @@ from gridiron_edge.api.serializers.players import (
     serialize_player_history,
     serialize_players_list,
 )
+from gridiron_edge.api.snapshot import stamp_snapshot
 
 router = APIRouter(prefix="/players", tags=["players"])
 
@@ -27,21 +28,23 @@ router = APIRouter(prefix="/players", tags=["players"])
 @router.get("", response_model=PlayersListResponse)
 def list_players(
     settings: SettingsDep,
+    snapshot: SnapshotDep,
     season: int | None = Query(
         default=None,
         description="Season int (e.g. 2025). Defaults to latest.",
     ),
 ) -> PlayersListResponse:
     """Return skill players active in a season (for the Compare picker)."""
-    payload = load_players_list(settings, season=season)
+    payload = load_players_list(settings, season=season, snapshot=snapshot)
     if payload is None:
-        return PlayersListResponse(items=[], total=0)
-    return serialize_players_list(payload)
+        return stamp_snapshot(PlayersListResponse(items=[], total=0), snapshot)
+    return stamp_snapshot(serialize_players_list(payload), snapshot)
 
 
 @router.get("/{player_id}/history", response_model=PlayerHistoryResponse)
-def get_player_history(
+def get_player_history(  # noqa: PLR0917
     settings: SettingsDep,
+    snapshot: SnapshotDep,
     player_id: str,
     stat: str = Query(
         description="Stat key, e.g. 'rush_yards', 'rec_yards', 'pass_yards'.",
@@ -77,6 +80,7 @@ def get_player_history(
         stat=stat,
         season=season,
         limit=limit,
+        snapshot=snapshot,
     )
     if payload is None:
         raise HTTPException(
@@ -84,4 +88,4 @@ def get_player_history(
             detail=f"No history for player '{player_id}' stat '{stat}'.",
         )
 
-    return serialize_player_history(payload)
+    return stamp_snapshot(serialize_player_history(payload), snapshot)
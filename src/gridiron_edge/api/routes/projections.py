@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Query
 
-from gridiron_edge.api.deps import SettingsDep
+from gridiron_edge.api.deps import SettingsDep, SnapshotDep
 from gridiron_edge.api.loaders import (
     load_projection_grid_data,
     load_projections_summary_df,
@@ -28,15 +28,17 @@ router = APIRouter(prefix="/projections", tags=["projections"])
 @router.get("/grid", response_model=ProjectionGridResponse)
 def get_projection_grid(
     settings: SettingsDep,
+    snapshot: SnapshotDep,
 ) -> ProjectionGridResponse:
     """Return weekly regular-season win probabilities for all teams."""
-    data = load_projection_grid_data(settings)
+    data = load_projection_grid_data(settings, snapshot=snapshot)
     return serialize_projection_grid(data)
 
 
 @router.get("", response_model=ProjectionsList)
 def get_projections(
     settings: SettingsDep,
+    snapshot: SnapshotDep,
     season: str | None = Query(
         default=None,
         description=(
@@ -47,11 +49,11 @@ def get_projections(
     ),
 ) -> ProjectionsList:
     """Return Monte Carlo season and playoff projections for all teams."""
-    df, computed_at, n_simulations = load_projections_summary_df(settings)
-    long_to_short = load_team_name_map(settings)
+    df, computed_at, n_simulations = load_projections_summary_df(settings, snapshot=snapshot)
+    long_to_short = load_team_name_map(settings, snapshot=snapshot)
 
     if season is None:
-        resolved_season, _ = resolve_current_season_week(settings)
+        resolved_season, _ = resolve_current_season_week(settings, snapshot=snapshot)
     else:
         resolved_season = season
 
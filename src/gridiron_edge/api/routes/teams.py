@@ -7,13 +7,12 @@ from __future__ import annotations
 from fastapi import APIRouter, HTTPException, Query
 from pandas import DataFrame
 
-from gridiron_edge.api.deps import SettingsDep
+from gridiron_edge.api.deps import SettingsDep, SnapshotDep
 from gridiron_edge.api.loaders import (
-    compute_elo_deltas,
-    format_team_cohort_splits,
-    load_elo_state_df,
-    load_games_df,
-    load_team_cohort_splits_df,
+    load_elo_season_df,
+    load_elo_trends_df,
+    load_games_season_df,
+    load_team_cohort_splits_for_team,
     load_team_name_map,
     load_team_percentiles_df,
     resolve_current_season_week,
@@ -24,15 +23,15 @@ from gridiron_edge.api.serializers.teams import (
     serialize_team_profile,
     serialize_team_rankings,
 )
+from gridiron_edge.api.snapshot import stamp_snapshot
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
 
 def _resolve_scope(
     settings: SettingsDep,
+    snapshot: SnapshotDep,
     season: str | None,
-    *,
-    elo: DataFrame,
 ) -> tuple[str, int]:
     """Return (season, as_of_week) for the request, defaulting to current.
 
@@ -40,40 +39,36 @@ def _resolve_scope(
     when no completed games exist. A truly unavailable season remains Week 0.
     """
     if season is None:
-        return resolve_current_season_week(settings)
+        return resolve_current_season_week(settings, snapshot=snapshot)
 
-    games: DataFrame = load_games_df(settings)
-    season_games = games.loc[games["YEAR"] == season, "WEEK_NUM"]
+    season_games: DataFrame = load_games_season_df(settings, season, snapshot=snapshot)
     if not season_games.empty:
-        return (season, int(season_games.max()))
+        return (season, int(season_games["WEEK_NUM"].max()))
 
-    season_elo = elo.loc[elo["NFL_YEAR"] == season, "NFL_WEEK"]
-    as_of_week: int = int(season_elo.max()) if not season_elo.empty else 0
+    season_elo: DataFrame = load_elo_season_df(settings, season, snapshot=snapshot)
+    as_of_week: int = int(season_elo["NFL_WEEK"].max()) if not season_elo.empty else 0
     return (season, as_of_week)
 
 
 @router.get("", response_model=TeamRankingsList)
 def list_teams(
     settings: SettingsDep,
+    snapshot: SnapshotDep,
     season: str | None = Query(
         default=None,
         description="Season to rank against, e.g. '2025-2026'. Defaults to current.",
     ),
 ) -> TeamRankingsList:
     """Return power rankings for all teams in the given season."""
-    elo: DataFrame = load_elo_state_df(settings)
-    games: DataFrame = load_games_df(settings)
-    long_to_short: dict[str, str] = load_team_name_map(settings)
-    percentiles: DataFrame = load_team_percentiles_df(settings)
-    trends: DataFrame = compute_elo_deltas(elo, long_to_short)
-    team_metadata = team_metadata_lookup(settings)
-    resolved_season, as_of_week = _resolve_scope(
-        settings,
-        season,
-        elo=elo,
-    )
-
-    return serialize_team_rankings(
+    long_to_short: dict[str, str] = load_team_name_map(settings, snapshot=snapshot)
+    percentiles: DataFrame = load_team_percentiles_df(settings, snapshot=snapshot)
+    trends: DataFrame = load_elo_trends_df(settings, snapshot=snapshot)
+    team_metadata = team_metadata_lookup(settings, snapshot=snapshot)
+    resolved_season, as_of_week = _resolve_scope(settings, snapshot, season)
+    elo: DataFrame = load_elo_season_df(settings, resolved_season, snapshot=snapshot)
+    games: DataFrame = load_games_season_df(settings, resolved_season, snapshot=snapshot)
+
+    response = serialize_team_rankings(
         elo,
         games,
         long_to_short,
@@ -83,11 +78,13 @@ def list_teams(
         trends,
         team_metadata,
     )
+    return stamp_snapshot(response, snapshot)
 
 
 @router.get("/{abbr}", response_model=TeamProfile)
 def get_team(
     settings: SettingsDep,
+    snapshot: SnapshotDep,
     abbr: str,
     season: str | None = Query(
         default=None,
@@ -95,7 +92,7 @@ def get_team(
     ),
 ) -> TeamProfile:
     """Return per-team profile with ratings, record, and history."""
-    long_to_short: dict[str, str] = load_team_name_map(settings)
+    long_to_short: dict[str, str] = load_team_name_map(settings, snapshot=snapshot)
     short_to_long: dict[str, str] = {v: k for k, v in long_to_short.items()}
 
     if abbr.upper() not in short_to_long:
@@ -104,20 +101,15 @@ def get_team(
             detail=f"Unknown team abbreviation: {abbr}",
         )
 
-    elo: DataFrame = load_elo_state_df(settings)
-    games: DataFrame = load_games_df(settings)
-    percentiles: DataFrame = load_team_percentiles_df(settings)
-    trends: DataFrame = compute_elo_deltas(elo, long_to_short)
-    cohort_splits_df: DataFrame = load_team_cohort_splits_df(settings)
-    cohort_splits = format_team_cohort_splits(cohort_splits_df, abbr.upper())
-    team_metadata = team_metadata_lookup(settings)
-    resolved_season, as_of_week = _resolve_scope(
-        settings,
-        season,
-        elo=elo,
-    )
+    percentiles: DataFrame = load_team_percentiles_df(settings, snapshot=snapshot)
+    trends: DataFrame = load_elo_trends_df(settings, snapshot=snapshot)
+    cohort_splits = load_team_cohort_splits_for_team(settings, abbr.upper(), snapshot=snapshot)
+    team_metadata = team_metadata_lookup(settings, snapshot=snapshot)
+    resolved_season, as_of_week = _resolve_scope(settings, snapshot, season)
+    elo: DataFrame = load_elo_season_df(settings, resolved_season, snapshot=snapshot)
+    games: DataFrame = load_games_season_df(settings, resolved_season, snapshot=snapshot)
 
-    return serialize_team_profile(
+    response = serialize_team_profile(
         abbr,
         elo,
         games,
@@ -129,3 +121,4 @@ def get_team(
         team_metadata,
         cohort_splits=cohort_splits,
     )
+    return stamp_snapshot(response, snapshot)
@@ -7,11 +7,17 @@ Per D17, hand-written. Per D18, owns _meta.field_status construction.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from pandas import DataFrame
 
 from gridiron_edge.api.meta import ResponseMeta, Unavailable
 from gridiron_edge.api.schemas.compare import ComparePlayerResponse, CompareTeamsResponse, StatRow
 from gridiron_edge.api.serializers.teams import _compute_record, _latest_ratings
+from gridiron_edge.ratings.elo.core import DEFAULT_ELO_DIVISOR, elo_win_probability
+
+if TYPE_CHECKING:
+    from gridiron_edge.ratings.elo.matrix import EloMatrix
 
 
 def _rating_for_team(
@@ -40,6 +46,43 @@ def _rating_for_team(
     return rating, rank
 
 
+def _win_probabilities(
+    elo_matrix: EloMatrix | None,
+    long_a: str,
+    long_b: str,
+    rating_a: float | None,
+    rating_b: float | None,
+    *,
+    season: str,
+) -> tuple[float | None, float | None]:
+    """Return (P(a beats b), P(b beats a)) at the ratings in scope.
+
+    Looks the pair up in the precomputed Elo matrix only when it was built
+    from the same rating state - same season and divisor, and the same
+    rating for both teams - so a matrix written before the latest week's
+    update is never served. Otherwise evaluates the Elo formula on the two
+    ratings.
+    """
+    if rating_a is None or rating_b is None:
+        return None, None
+    if (
+        elo_matrix is not None
+        and elo_matrix.season == season
+        and elo_matrix.divisor == DEFAULT_ELO_DIVISOR
+    ):
+        try:
+            idx_a, idx_b = elo_matrix.index(long_a), elo_matrix.index(long_b)
+        except KeyError:
+            pass
+        else:
+            if elo_matrix.ratings[idx_a] == rating_a and elo_matrix.ratings[idx_b] == rating_b:
+                return (
+                    float(elo_matrix.probabilities[idx_a, idx_b]),
+                    float(elo_matrix.probabilities[idx_b, idx_a]),
+                )
+    return elo_win_probability(rating_a, rating_b)
+
+
 def _record_string(games: DataFrame, long_name: str) -> str:
     """Format a team's season record as 'W-L-T' string."""
     record = _compute_record(games, long_name)
@@ -81,10 +124,12 @@ def serialize_compare_teams(
     as_of_week: int,
     percentiles: DataFrame,
     cohort_splits: dict[str, dict] | None = None,
+    elo_matrix: EloMatrix | None = None,
 ) -> CompareTeamsResponse:
     """Build the /compare/teams response.
 
-    Populated stats: rating, rank, record.
+    Populated stats: rating, rank, record, win_prob (head-to-head Elo win
+    probability, looked up in *elo_matrix* when it matches the scope).
     Scaffolded stats: off_rating, def_rating, trend, schedule_difficulty,
     playoff_probability, cohort splits, percentile ranks — via field_status.
     """
@@ -101,6 +146,14 @@ def serialize_compare_teams(
 
     rating_a, rank_a = _rating_for_team(elo, long_a, season, as_of_week)
     rating_b, rank_b = _rating_for_team(elo, long_b, season, as_of_week)
+    win_prob_a, win_prob_b = _win_probabilities(
+        elo_matrix,
+        long_a,
+        long_b,
+        rating_a,
+        rating_b,
+        season=season,
+    )
 
     # Precompute percentiles for both teams (all four stats).
     a: str = team_a_short.upper()
@@ -123,6 +176,13 @@ def serialize_compare_teams(
             team_a_value=rank_a,
             team_b_value=rank_b,
         ),
+        StatRow(
+            key="win_prob",
+            label="Head-to-Head Win Probability",
+            unit="pct",
+            team_a_value=win_prob_a,
+            team_b_value=win_prob_b,
+        ),
         StatRow(
             key="record",
             label="Record",
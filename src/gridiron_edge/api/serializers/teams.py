@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 
@@ -88,19 +89,14 @@ def _compute_record(
     if games.empty:
         return TeamRecord()
 
-    away_mask: Series[bool] = games["AWAY_TEAM"] == team_long_name
-    home_mask: Series[bool] = games["HOME_TEAM"] == team_long_name
-    participant_mask: Series[bool] = away_mask | home_mask
+    # Column-wise on NumPy arrays: rankings call this once per team.
+    away_mask: np.ndarray = games["AWAY_TEAM"].to_numpy() == team_long_name
+    home_mask: np.ndarray = games["HOME_TEAM"].to_numpy() == team_long_name
+    participant_mask: np.ndarray = away_mask | home_mask
 
-    away_scores = Series(
-        pd.to_numeric(games["AWAY_SCORE"], errors="coerce"),
-        index=games.index,
-    )
-    home_scores = Series(
-        pd.to_numeric(games["HOME_SCORE"], errors="coerce"),
-        index=games.index,
-    )
-    completed_mask = away_scores.notna() & home_scores.notna()
+    away_scores = pd.to_numeric(games["AWAY_SCORE"], errors="coerce").to_numpy(dtype=float)
+    home_scores = pd.to_numeric(games["HOME_SCORE"], errors="coerce").to_numpy(dtype=float)
+    completed_mask = ~np.isnan(away_scores) & ~np.isnan(home_scores)
 
     away_wins = away_mask & completed_mask & (away_scores > home_scores)
     home_wins = home_mask & completed_mask & (home_scores > away_scores)
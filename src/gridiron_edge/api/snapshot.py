@@ -0,0 +1,486 @@
+# src/gridiron_edge/api/snapshot.py
+
+"""Application-scoped in-memory snapshot of the datasets the API serves.
+
+Team, compare, and player routes used to re-read the games CSV, the Elo
+history, the team metadata, the percentile and cohort-split artifacts, and
+all of ``player_game_logs.parquet`` on every request. A :class:`DataSnapshot`
+holds those datasets in memory, keyed by a fingerprint of their source
+files (path, size, ``mtime_ns``, inode). A :class:`SnapshotStore` owns the
+current snapshot for one repo root:
+
+- Without a watcher (tests, scripts), :meth:`SnapshotStore.current`
+  re-fingerprints (``stat`` only) at most once per ``refresh_interval``
+  and swaps in a new snapshot when a source changed.
+- With a watcher (the API process, started from the app lifespan), a
+  daemon thread polls fingerprints, builds the next snapshot in the
+  background, and swaps the reference atomically. Requests always read a
+  complete snapshot and never block on a reload.
+
+Derived entries (:data:`INDEXES`: pre-grouped lookups from
+:mod:`gridiron_edge.api.indexes`, precomputed Elo trends) are built from
+the loaded sources on first use. Datasets whose fingerprint is unchanged,
+and indexes whose sources are all unchanged, are carried over to the next
+snapshot as-is; only changed sources are re-read.
+
+The snapshot version also tracks the files directly inside
+:data:`SERVED_OUTPUTS`, the pipeline output directories routes read outside
+the snapshot, so it changes whenever a response could change. Other writes
+under ``data/`` (raw downloads, caches, scratch files) leave it alone. The
+HTTP response cache (``api/caching.py``) keys on it and pins one snapshot
+per request, which routes pass to the loaders. Snapshot frames are shared
+between requests and must be treated as read-only; the public loaders in
+:mod:`gridiron_edge.api.loaders` hand out copies where callers may mutate.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+import logging
+from logging import Logger
+import os
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+import pandas as pd
+
+from gridiron_edge.api import indexes
+from gridiron_edge.api.meta import ResponseMeta
+
+if TYPE_CHECKING:
+    from gridiron_edge.api.schemas._base import BaseResponse
+    from gridiron_edge.ratings.elo.matrix import EloMatrix
+
+logger: Logger = logging.getLogger(__name__)
+
+PLAYER_GAME_LOGS_RELPATH: Final[str] = "data/cleaned/player_game_logs.parquet"
+WATCH_INTERVAL_SECONDS: Final[float] = 5.0
+UNWATCHED_REFRESH_SECONDS: Final[float] = 1.0
+
+# One stat per source file: (path, size, mtime_ns, inode), or (path,) if missing.
+Fingerprint = tuple[tuple[Any, ...], ...]
+
+SERVED_OUTPUTS_KEY: Final[str] = "served_outputs"
+SERVED_OUTPUTS: Final[tuple[str, ...]] = (
+    "data/betting",
+    "data/cleaned",
+    "data/odds",
+    "data/output/champions",
+    "data/output/evaluation/evaluation_joined",
+    "data/output/predictions",
+    "data/output/props",
+    "data/output/props/situational_splits",
+    "data/output/rankings",
+    "data/output/rankings/percentiles",
+    "data/output/temp",
+    "data/output/weekly_products",
+)
+"""Directories (relative to the repo root) whose files API routes read."""
+
+
+def _registered(key: str) -> Callable[[Path], list[Path]]:
+    """Return a path lister for a registered CSV dataset and its typed twin."""
+
+    def paths(repo_root: Path) -> list[Path]:
+        from gridiron_edge.datasets.columnar import columnar_path
+        from gridiron_edge.datasets.registry import dataset_path
+
+        csv_path = dataset_path(repo_root, key)  # type: ignore[arg-type]
+        return [csv_path, columnar_path(csv_path)]
+
+    return paths
+
+
+def _percentile_paths(repo_root: Path) -> list[Path]:
+    from gridiron_edge.evaluation.percentiles import PERCENTILES_SUBDIR
+
+    directory = repo_root / PERCENTILES_SUBDIR
+    return [directory, *sorted(directory.glob("percentiles_*.parquet"))]
+
+
+def _cohort_split_paths(repo_root: Path) -> list[Path]:
+    from gridiron_edge.evaluation.team_cohort_splits import TEAM_COHORT_SPLITS_PATH
+
+    return [repo_root / TEAM_COHORT_SPLITS_PATH]
+
+
+def _load_games(repo_root: Path) -> pd.DataFrame:
+    from gridiron_edge.datasets import loaders
+
+    return loaders.load_games(repo_root)
+
+
+def _load_elo_state(repo_root: Path) -> pd.DataFrame:
+    from gridiron_edge.datasets import loaders
+
+    return loaders.load_elo_state(repo_root)
+
+
+def _elo_matrix_paths(repo_root: Path) -> list[Path]:
+    from gridiron_edge.datasets.registry import dataset_path
+
+    return [dataset_path(repo_root, "elo_matrix")]
+
+
+def _load_elo_matrix(repo_root: Path) -> EloMatrix | None:
+    from gridiron_edge.ratings.elo.matrix import load_elo_matrix
+
+    return load_elo_matrix(repo_root)
+
+
+def _load_team_metadata(repo_root: Path) -> pd.DataFrame:
+    from gridiron_edge.datasets.columnar import read_table
+    from gridiron_edge.datasets.registry import dataset_path
+
+    path = dataset_path(repo_root, "team_metadata")
+    if not path.exists():
+        return pd.DataFrame()
+    return read_table(path)
+
+
+def _load_team_name_map(repo_root: Path) -> dict[str, str]:
+    from gridiron_edge.datasets import loaders
+
+    df = loaders.load_teams_long_short(repo_root)
+    return dict(zip(df["NFL_LONG_NAME"], df["NFL_SHORT_NAME"], strict=True))
+
+
+def _load_team_percentiles(repo_root: Path) -> pd.DataFrame:
+    from gridiron_edge.evaluation.percentiles import load_latest_team_percentiles
+
+    return load_latest_team_percentiles(repo_root)
+
+
+def _load_team_cohort_splits(repo_root: Path) -> pd.DataFrame:
+    from gridiron_edge.evaluation.team_cohort_splits import load_team_cohort_splits
+
+    return load_team_cohort_splits(repo_root)
+
+
+def _load_player_game_logs(repo_root: Path) -> pd.DataFrame | None:
+    path = repo_root / PLAYER_GAME_LOGS_RELPATH
+    if not path.exists():
+        return None
+    return pd.read_parquet(path)
+
+
+@dataclass(frozen=True)
+class SnapshotSource:
+    """One dataset held in the snapshot.
+
+    Attributes:
+        paths: Returns the files (and directories) whose stats fingerprint
+            the dataset.
+        load: Reads the dataset from the repo root. Exceptions propagate to
+            the caller and are not cached.
+    """
+
+    paths: Callable[[Path], list[Path]]
+    load: Callable[[Path], Any]
+
+
+SOURCES: Final[Mapping[str, SnapshotSource]] = {
+    "games": SnapshotSource(_registered("games"), _load_games),
+    "elo_state": SnapshotSource(_registered("elo_state"), _load_elo_state),
+    "elo_matrix": SnapshotSource(_elo_matrix_paths, _load_elo_matrix),
+    "team_metadata": SnapshotSource(_registered("team_metadata"), _load_team_metadata),
+    "team_name_map": SnapshotSource(_registered("team_metadata"), _load_team_name_map),
+    "team_percentiles": SnapshotSource(_percentile_paths, _load_team_percentiles),
+    "team_cohort_splits": SnapshotSource(_cohort_split_paths, _load_team_cohort_splits),
+    "player_game_logs": SnapshotSource(
+        lambda repo_root: [repo_root / PLAYER_GAME_LOGS_RELPATH],
+        _load_player_game_logs,
+    ),
+}
+"""Datasets served from the snapshot, by name."""
+
+
+@dataclass(frozen=True)
+class SnapshotIndex:
+    """A value derived from one or more snapshot sources.
+
+    Attributes:
+        sources: Names in :data:`SOURCES` passed positionally to ``build``.
+        build: Builds the derived value from the loaded sources.
+    """
+
+    sources: tuple[str, ...]
+    build: Callable[..., Any]
+
+
+INDEXES: Final[Mapping[str, SnapshotIndex]] = {
+    "games_by_season": SnapshotIndex(("games",), indexes.index_games_by_season),
+    "games_by_season_week": SnapshotIndex(("games",), indexes.index_games_by_season_week),
+    "elo_by_season": SnapshotIndex(("elo_state",), indexes.index_elo_by_season),
+    "elo_trends": SnapshotIndex(("elo_state", "team_name_map"), indexes.elo_trends),
+    "cohort_splits_by_team": SnapshotIndex(
+        ("team_cohort_splits",),
+        indexes.index_cohort_splits_by_team,
+    ),
+    "player_logs_by_player": SnapshotIndex(
+        ("player_game_logs",),
+        indexes.index_player_logs_by_player,
+    ),
+    "player_logs_by_season": SnapshotIndex(
+        ("player_game_logs",),
+        indexes.index_player_logs_by_season,
+    ),
+}
+"""Derived lookups built from snapshot sources, by name."""
+
+
+def fingerprint(paths: list[Path]) -> Fingerprint:
+    """Return a cheap change fingerprint for *paths* (``stat`` only)."""
+    stats: list[tuple[Any, ...]] = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            stats.append((str(path),))
+        else:
+            stats.append((str(path), st.st_size, st.st_mtime_ns, st.st_ino))
+    return tuple(stats)
+
+
+def fingerprint_outputs(repo_root: Path) -> Fingerprint:
+    """Return the stats of the files directly inside :data:`SERVED_OUTPUTS`.
+
+    Directories are not descended into, so caches and scratch space nested
+    below a served directory do not affect the result.
+    """
+    stats: list[tuple[Any, ...]] = []
+    for relpath in SERVED_OUTPUTS:
+        try:
+            entries = sorted(os.scandir(repo_root / relpath), key=lambda entry: entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            stats.append((relpath,))
+            continue
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    st = entry.stat()
+                    stats.append((entry.path, st.st_size, st.st_mtime_ns, st.st_ino))
+            except FileNotFoundError:
+                continue
+    return tuple(stats)
+
+
+def fingerprint_sources(repo_root: Path) -> dict[str, Fingerprint]:
+    """Return the fingerprint of every snapshot source under *repo_root*.
+
+    Includes the served output files under :data:`SERVED_OUTPUTS_KEY`.
+    """
+    fingerprints = {name: fingerprint(source.paths(repo_root)) for name, source in SOURCES.items()}
+    fingerprints[SERVED_OUTPUTS_KEY] = fingerprint_outputs(repo_root)
+    return fingerprints
+
+
+@dataclass
+class DataSnapshot:
+    """Immutable view of the API datasets at one fingerprint.
+
+    Datasets load lazily on first :meth:`get` (or all at once via
+    :meth:`load_all`) and are then shared by every request that holds this
+    snapshot.
+
+    Attributes:
+        repo_root: Repository root the datasets were read from.
+        version: Monotonic version within the owning store, starting at 1.
+        built_at: UTC time the snapshot was created.
+        fingerprints: Source fingerprint per dataset name.
+    """
+
+    repo_root: Path
+    version: int
+    built_at: datetime
+    fingerprints: dict[str, Fingerprint]
+    _values: dict[str, Any] = field(default_factory=dict, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the snapshot was created."""
+        return (datetime.now(UTC) - self.built_at).total_seconds()
+
+    def get(self, name: str) -> Any:  # noqa: ANN401
+        """Return dataset or index *name*, building it on first use.
+
+        Raises:
+            KeyError: If *name* is in neither :data:`SOURCES` nor
+                :data:`INDEXES`.
+        """
+        if name in self._values:
+            return self._values[name]
+        if name not in SOURCES and name not in INDEXES:
+            raise KeyError(name)
+        with self._lock:
+            if name not in self._values:
+                if name in SOURCES:
+                    value = SOURCES[name].load(self.repo_root)
+                else:
+                    index = INDEXES[name]
+                    value = index.build(*(self.get(source) for source in index.sources))
+                self._values[name] = value
+        return self._values[name]
+
+    def load_all(self) -> None:
+        """Load every dataset and index, logging (not raising) failures."""
+        for name in [*SOURCES, *INDEXES]:
+            try:
+                self.get(name)
+            except Exception:
+                logger.warning("Snapshot v%d could not load %s", self.version, name, exc_info=True)
+
+    def loaded(self) -> dict[str, Any]:
+        """Return the datasets loaded so far, by name."""
+        with self._lock:
+            return dict(self._values)
+
+
+class SnapshotStore:
+    """Owner of the current :class:`DataSnapshot` for one repo root.
+
+    Args:
+        repo_root: Absolute path to the repository root.
+        refresh_interval: Minimum seconds between fingerprint checks made
+            by :meth:`current` while no watcher runs.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        *,
+        refresh_interval: float = UNWATCHED_REFRESH_SECONDS,
+    ) -> None:
+        self.repo_root = repo_root
+        self.refresh_interval = refresh_interval
+        self._snapshot = DataSnapshot(
+            repo_root=repo_root,
+            version=1,
+            built_at=datetime.now(UTC),
+            fingerprints=fingerprint_sources(repo_root),
+        )
+        self._refresh_lock = threading.Lock()
+        self._checked_at = time.monotonic()
+        self._stop = threading.Event()
+        self._watcher: threading.Thread | None = None
+
+    @property
+    def watching(self) -> bool:
+        """Whether a background watcher keeps the snapshot fresh."""
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def current(self) -> DataSnapshot:
+        """Return the current snapshot.
+
+        Without a watcher the sources are re-fingerprinted first when the
+        last check is more than ``refresh_interval`` seconds old, so the
+        result lags the files on disk by at most that long.
+        """
+        if not self.watching and time.monotonic() - self._checked_at >= self.refresh_interval:
+            self.refresh()
+        return self._snapshot
+
+    def refresh(self, *, preload: bool = False) -> bool:
+        """Build and swap in a new snapshot if any source changed.
+
+        Unchanged datasets are carried over from the current snapshot. With
+        *preload*, changed datasets are read before the swap so readers
+        never pay the load; otherwise they load lazily on first use.
+
+        Returns:
+            ``True`` if a new snapshot was swapped in.
+        """
+        with self._refresh_lock:
+            previous = self._snapshot
+            fingerprints = fingerprint_sources(self.repo_root)
+            self._checked_at = time.monotonic()
+            if fingerprints == previous.fingerprints:
+                return False
+
+            unchanged = {
+                name for name in SOURCES if fingerprints[name] == previous.fingerprints[name]
+            }
+            carried = {
+                name: value
+                for name, value in previous.loaded().items()
+                if name in unchanged
+                or (name in INDEXES and unchanged.issuperset(INDEXES[name].sources))
+            }
+            snapshot = DataSnapshot(
+                repo_root=self.repo_root,
+                version=previous.version + 1,
+                built_at=datetime.now(UTC),
+                fingerprints=fingerprints,
+                _values=carried,
+            )
+            if preload:
+                started = time.perf_counter()
+                snapshot.load_all()
+                logger.info(
+                    "Built API snapshot v%d in %.2fs (reloaded: %s)",
+                    snapshot.version,
+                    time.perf_counter() - started,
+                    ", ".join(sorted(set(SOURCES) - unchanged)),
+                )
+            self._snapshot = snapshot
+            return True
+
+    def start_watching(self, interval: float = WATCH_INTERVAL_SECONDS) -> None:
+        """Preload the snapshot and start the background watcher thread.
+
+        Args:
+            interval: Seconds between fingerprint checks.
+        """
+        if self.watching:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch,
+            args=(interval,),
+            name=f"api-snapshot-watcher:{self.repo_root.name}",
+            daemon=True,
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the watcher thread; later calls re-fingerprint inline."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+        self._watcher = None
+
+    def _watch(self, interval: float) -> None:
+        self.refresh(preload=True)
+        self._snapshot.load_all()
+        while not self._stop.wait(interval):
+            try:
+                self.refresh(preload=True)
+            except Exception:
+                logger.exception("API snapshot refresh failed; keeping v%d", self._snapshot.version)
+
+
+@lru_cache(maxsize=16)
+def snapshot_store(repo_root: Path) -> SnapshotStore:
+    """Return the process-wide snapshot store for *repo_root*."""
+    return SnapshotStore(repo_root)
+
+
+def current_snapshot(repo_root: Path) -> DataSnapshot:
+    """Return the current snapshot for *repo_root*."""
+    return snapshot_store(repo_root).current()
+
+
+def stamp_snapshot[R: BaseResponse](response: R, snapshot: DataSnapshot) -> R:
+    """Return *response* with `_meta.snapshot` set from *snapshot*."""
+    meta = (response.response_meta or ResponseMeta()).with_snapshot(
+        snapshot.version,
+        snapshot.built_at,
+        snapshot.age_seconds,
+    )
+    return response.model_copy(update={"response_meta": meta})
@@ -280,6 +280,8 @@ def render_composite_summary(summary: CompositeSummary) -> None:
     Args:
         summary: Result of ``run_composite``.
     """
+    from gridiron_edge.core.console import console
+
     typer.echo("")
     divider = "━" * 60
     typer.echo(divider)
@@ -318,6 +320,7 @@ def render_composite_summary(summary: CompositeSummary) -> None:
         for warning in summary.warnings:
             typer.echo(f"    {warning}")
 
+    console.print_stats()
     typer.echo("")
 
 
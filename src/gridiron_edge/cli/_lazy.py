@@ -0,0 +1,95 @@
+# src/gridiron_edge/cli/_lazy.py
+
+"""Lazy subcommand registry for the top-level ``gridiron`` group.
+
+Importing a sub-app module pulls in its whole dependency tree - pandas,
+scikit-learn, XGBoost, matplotlib - even when the user only asked for
+``gridiron --help`` or a different subcommand. :class:`LazyTyperGroup`
+lists registered :class:`LazyCommand` entries by name and help text alone
+and imports a module only when its command is resolved for invocation
+(or for its own ``--help``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import importlib
+from typing import Any, ClassVar
+
+import click
+
+# pyrefly: ignore [missing-import]
+import typer
+from typer.core import TyperGroup
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """A subcommand imported on first use.
+
+    Attributes:
+        name: Command name on the ``gridiron`` group.
+        module: Dotted module path that defines the command.
+        attr: Attribute in *module*: a ``typer.Typer`` sub-app or a command
+            function.
+        help: One-line help shown in ``gridiron --help`` without importing
+            *module*. Must match the command's own first help line.
+    """
+
+    name: str
+    module: str
+    attr: str
+    help: str
+
+    def load(self) -> click.Command:
+        """Import the module and build the click command."""
+        target: Any = getattr(importlib.import_module(self.module), self.attr)
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_group(target)
+        else:
+            single = typer.Typer()
+            single.command(self.name)(target)
+            command = typer.main.get_command(single)
+        command.name = self.name
+        return command
+
+
+class LazyTyperGroup(TyperGroup):
+    """``TyperGroup`` that resolves :attr:`lazy_commands` on demand.
+
+    Subclasses set :attr:`lazy_commands`; eagerly registered commands (e.g.
+    ``@app.command``) keep working and are listed first.
+    """
+
+    lazy_commands: ClassVar[dict[str, LazyCommand]] = {}
+
+    def __init__(self, **attrs: Any) -> None:  # noqa: ANN401
+        super().__init__(**attrs)
+        self._describing: bool = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eager commands, then lazy ones, in registration order."""
+        eager = super().list_commands(ctx)
+        return eager + [name for name in self.lazy_commands if name not in self.commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return *cmd_name*, importing its module unless only rendering help."""
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        lazy = self.lazy_commands.get(cmd_name)
+        if lazy is None:
+            return None
+        if self._describing:
+            return click.Command(cmd_name, help=lazy.help, short_help=lazy.help)
+        command = lazy.load()
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Render help from registry text without importing sub-apps."""
+        self._describing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._describing = False
@@ -0,0 +1,170 @@
+# src/gridiron_edge/cli/debug.py
+"""CLI developer diagnostics.
+
+``gridiron debug import-time`` measures, in fresh interpreters, how long
+the CLI takes to start and how much each subcommand's module adds on top
+of that, broken down by top-level package (``python -X importtime``).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+import subprocess
+import sys
+from typing import Final
+
+import typer
+
+debug_app = typer.Typer(help="Developer diagnostics for the CLI.", no_args_is_help=True)
+
+_CLI_MODULE: Final[str] = "gridiron_edge.cli.main"
+_PHASE_MARKER: Final[str] = "--- gridiron import phase ---"
+
+# Renders top-level help exactly as the ``gridiron`` entry point would.
+HELP_SNIPPET: Final[str] = (
+    "import sys\n"
+    f"from {_CLI_MODULE} import main\n"
+    "sys.argv = ['gridiron', '--help']\n"
+    "try:\n"
+    "    main()\n"
+    "except SystemExit:\n"
+    "    pass\n"
+)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``python -X importtime`` output.
+
+    Attributes:
+        module: Dotted module name.
+        self_us: Time spent in the module body, excluding nested imports.
+        cumulative_us: Time including nested imports.
+        depth: Nesting level (0 = imported directly by the measured code).
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        """Top-level package name (``sklearn`` for ``sklearn.utils``)."""
+        return self.module.split(".", 1)[0]
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Import cost of one measured phase.
+
+    Attributes:
+        label: What was measured (module name or ``"gridiron --help"``).
+        records: Modules first imported during the phase.
+    """
+
+    label: str
+    records: list[ImportRecord] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        """Summed self time of every module imported in the phase."""
+        return sum(r.self_us for r in self.records) / 1000
+
+    @property
+    def packages(self) -> set[str]:
+        """Top-level packages first imported in the phase."""
+        return {r.package for r in self.records}
+
+    def heaviest_packages(self, n: int) -> list[tuple[str, float]]:
+        """Return the *n* packages with the most self time, in ms."""
+        totals: defaultdict[str, int] = defaultdict(int)
+        for record in self.records:
+            totals[record.package] += record.self_us
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        return [(name, us / 1000) for name, us in ranked[:n]]
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Parse ``python -X importtime`` lines; other lines are ignored."""
+    records: list[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=stripped,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return records
+
+
+def profile_code(label: str, code: str, *, after: str = "") -> ImportProfile:
+    """Run *code* in a fresh interpreter and profile its imports.
+
+    Args:
+        label: Name for the returned profile.
+        code: Python source to measure.
+        after: Source run first whose imports are excluded, e.g. the CLI
+            entry module so only a subcommand's extra cost is counted.
+
+    Returns:
+        Records for modules first imported by *code*.
+    """
+    script = f"{after}\nimport sys\nprint({_PHASE_MARKER!r}, file=sys.stderr)\n{code}\n"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    _, _, measured = proc.stderr.partition(_PHASE_MARKER)
+    return ImportProfile(label=label, records=parse_importtime(measured))
+
+
+def profile_help() -> ImportProfile:
+    """Profile ``gridiron --help`` from interpreter start."""
+    return profile_code("gridiron --help", HELP_SNIPPET)
+
+
+def profile_subcommand(module: str) -> ImportProfile:
+    """Profile importing *module* on top of the CLI entry module."""
+    return profile_code(module, f"import {module}", after=f"import {_CLI_MODULE}")
+
+
+@debug_app.command("import-time")
+def import_time_cmd(
+    *,
+    command: list[str] = typer.Option(  # noqa: B008
+        [],
+        "--command",
+        "-c",
+        help="Subcommand to profile (repeatable). Defaults to every subcommand.",
+    ),
+    top: int = typer.Option(3, help="Heaviest packages to list per row."),
+) -> None:
+    """Report CLI startup and per-subcommand import time."""
+    from gridiron_edge.cli.main import _LAZY_COMMANDS
+
+    selected = [c for c in _LAZY_COMMANDS if not command or c.name in command]
+    unknown = sorted(set(command) - {c.name for c in _LAZY_COMMANDS})
+    if unknown:
+        raise typer.BadParameter(f"Unknown subcommand(s): {', '.join(unknown)}")
+
+    rows: list[tuple[str, ImportProfile]] = [("--help", profile_help())]
+    rows.extend((c.name, profile_subcommand(c.module)) for c in selected)
+
+    typer.echo(f"  {'command':<16} {'import ms':>10}  heaviest packages")
+    for name, profile in rows:
+        heaviest = ", ".join(f"{pkg} {ms:.0f}" for pkg, ms in profile.heaviest_packages(top))
+        typer.echo(f"  {name:<16} {profile.total_ms:>10.1f}  {heaviest}")
+    typer.echo("  (subcommand rows exclude the startup cost in the --help row)")
@@ -3,8 +3,13 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import typer
 
+if TYPE_CHECKING:
+    from gridiron_edge.features.profiling import FeatureProfile
+
 features_app = typer.Typer(help="Build feature tables and modeling matrices.", no_args_is_help=True)
 
 
@@ -16,8 +21,21 @@ def builder_model_inputs(
         "--all-years/--no-all-years",
         help="Rebuild all modeling rows vs append new weeks.",
     ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record per-feature time, peak RSS, rows, and dataset loads.",
+    ),
 ) -> None:
-    """Build modeling base and full feature files."""
+    r"""Build modeling base and full feature files.
+
+    With --profile, each feature's timings are written to the feature
+    manifest and printed as a table ranked by wall time.
+
+    \b
+    Example:
+      gridiron features model-inputs --all-years --profile
+    """
     from gridiron_edge.core.console import console, step
     from gridiron_edge.features.pipeline import build_model_inputs
 
@@ -25,6 +43,47 @@ def builder_model_inputs(
     console.header("features model-inputs", subtitle=mode)
 
     with step(f"Build model inputs ({mode})"):
-        build_model_inputs(all_years=all_years)
+        profiles = build_model_inputs(all_years=all_years, profile=profile)
 
     console.summary()
+
+    if profile:
+        _render_profile_table(profiles)
+
+
+def _render_profile_table(profiles: list[FeatureProfile]) -> None:
+    """Render feature profiles ranked by wall time, slowest first."""
+    # pyrefly: ignore [missing-import]
+    from rich.console import Console
+
+    # pyrefly: ignore [missing-import]
+    from rich.table import Table
+
+    console = Console()
+    if not profiles:
+        console.print("No features ran; nothing to profile.")
+        return
+
+    total = sum(profile.seconds for profile in profiles)
+    table = Table(title="Feature profile (ranked by wall time)", header_style="bold cyan")
+    table.add_column("Feature")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Share", justify="right")
+    table.add_column("Peak MB", justify="right")
+    table.add_column("Rows in", justify="right")
+    table.add_column("Rows out", justify="right")
+    table.add_column("Dataset loads")
+
+    for profile in sorted(profiles, key=lambda p: p.seconds, reverse=True):
+        loads = ", ".join(f"{load.dataset} {load.seconds:.2f}s" for load in profile.dataset_loads)
+        table.add_row(
+            profile.name,
+            f"{profile.seconds:.3f}",
+            f"{profile.seconds / total:.0%}" if total else "—",
+            f"{profile.peak_memory_bytes / 2**20:.1f}",
+            f"{profile.rows_in:,}",
+            f"{profile.rows_out:,}",
+            loads or "—",
+        )
+
+    console.print(table)
@@ -125,6 +125,15 @@ def ingest_odds(
         min=0.1,
         help="Provider request timeout in seconds.",
     ),
+    max_age_minutes: int = typer.Option(
+        5,
+        "--max-age",
+        min=0,
+        help=(
+            "Reuse a cached provider response at most this many minutes old "
+            "instead of spending quota; 0 always requests."
+        ),
+    ),
 ) -> None:
     r"""Fetch and persist current NFL featured-market quotes.
 
@@ -136,6 +145,8 @@ def ingest_odds(
     Example:
       gridiron ingest odds --season 2026-2027 --week 1
     """
+    from datetime import timedelta
+
     from gridiron_edge.core.console import console, step
     from gridiron_edge.core.settings import get_settings
     from gridiron_edge.datasets.loaders import load_schedule_upcoming_rich
@@ -155,6 +166,7 @@ def ingest_odds(
             week=week,
             repo=settings.repo_root,
             timeout=timeout,
+            max_age=timedelta(minutes=max_age_minutes) if max_age_minutes else None,
         )
         summary = (
             f"{result.quote_count} quotes, {result.game_count} games, "
@@ -175,6 +187,45 @@ def ingest_odds(
     console.summary()
 
 
+@ingest_app.command("compact-odds")
+def compact_odds(
+    *,
+    season_year: str | None = typer.Option(
+        None,
+        "--season",
+        help="NFL season label like '2026-2027'. If omitted, compacts every season.",
+    ),
+    week: int | None = typer.Option(
+        None,
+        min=1,
+        max=22,
+        help="NFL week number. If omitted, compacts every week.",
+    ),
+) -> None:
+    r"""Fold per-fetch odds segments into one file per weekly partition.
+
+    Collection runs append one segment per fetch; compaction is optional and
+    does not change what the ledger loaders return.
+
+    \b
+    Example:
+      gridiron ingest compact-odds --season 2026-2027 --week 1
+    """
+    from gridiron_edge.core.console import console, step
+    from gridiron_edge.core.settings import get_settings
+    from gridiron_edge.ingest.odds.store import compact_odds_ledger
+
+    console.header("ingest compact-odds")
+    with step("Compact odds ledger") as current_step:
+        paths = compact_odds_ledger(
+            season=season_year,
+            week=week,
+            repo=get_settings().repo_root,
+        )
+        current_step.set_detail(f"{len(paths)} partition(s)")
+    console.summary()
+
+
 @ingest_app.command("weather")
 def ingest_weather(
     season_year: str = typer.Option(..., help="NFL season label like '2025-2026'."),
@@ -307,6 +358,7 @@ def _execute_loaded_odds_plan(
     minimum_credit_reserve: int,
     odds_api_key: str | None,
     timeout: float,
+    max_age_minutes: int,
 ) -> None:
     """Execute one resolved plan through the shared CLI boundary."""
     from datetime import datetime, timedelta
@@ -325,6 +377,7 @@ def _execute_loaded_odds_plan(
         grace_period=timedelta(minutes=grace_minutes),
         minimum_credit_reserve=minimum_credit_reserve,
         timeout=timeout,
+        max_age=timedelta(minutes=max_age_minutes) if max_age_minutes else None,
     )
     typer.echo(f"Execution status: {outcome.status.value}")
 
@@ -382,6 +435,15 @@ def execute_odds_plan(
     ),
     odds_api_key: str | None = typer.Option(None, help="The Odds API key or ODDS_API_KEY."),
     timeout: float = typer.Option(15.0, min=0.1, help="Provider request timeout in seconds."),
+    max_age_minutes: int = typer.Option(
+        5,
+        "--max-age",
+        min=0,
+        help=(
+            "Reuse a cached provider response at most this many minutes old "
+            "instead of spending quota; 0 always requests."
+        ),
+    ),
 ) -> None:
     """Evaluate and execute at most one due poll from a validated plan."""
     from gridiron_edge.core.settings import get_settings
@@ -396,6 +458,7 @@ def execute_odds_plan(
         minimum_credit_reserve=minimum_credit_reserve,
         odds_api_key=odds_api_key,
         timeout=timeout,
+        max_age_minutes=max_age_minutes,
     )
 
 
@@ -411,6 +474,15 @@ def execute_selected_odds_plan(
     ),
     odds_api_key: str | None = typer.Option(None, help="The Odds API key or ODDS_API_KEY."),
     timeout: float = typer.Option(15.0, min=0.1, help="Provider request timeout in seconds."),
+    max_age_minutes: int = typer.Option(
+        5,
+        "--max-age",
+        min=0,
+        help=(
+            "Reuse a cached provider response at most this many minutes old "
+            "instead of spending quota; 0 always requests."
+        ),
+    ),
 ) -> None:
     """Execute at most one due poll from the explicitly selected plan."""
     from gridiron_edge.core.settings import get_settings
@@ -425,4 +497,5 @@ def execute_selected_odds_plan(
         minimum_credit_reserve=minimum_credit_reserve,
         odds_api_key=odds_api_key,
         timeout=timeout,
+        max_age_minutes=max_age_minutes,
     )
@@ -2,41 +2,116 @@
 """Gridiron Edge CLI - main entrypoint.
 
 Assembles the top-level Typer app from sub-module apps and registers
-the run-data-pipeline command. All sub-apps are lazy-loaded via their
-own modules so that --help renders quickly and imports only happen when
-a command is actually invoked.
+the run-data-pipeline command. Sub-apps are listed in ``_LAZY_COMMANDS``
+and imported by :class:`~gridiron_edge.cli._lazy.LazyTyperGroup` only
+when invoked, so ``--help`` renders without loading pandas, scikit-learn,
+XGBoost, or matplotlib. ``gridiron debug import-time`` reports the cost
+of each subcommand's imports.
 """
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, ClassVar, Final
 
 # pyrefly: ignore [missing-import]
 import typer
 
-from gridiron_edge.cli.api import api_app
-from gridiron_edge.cli.betting import betting_app
-from gridiron_edge.cli.edges import edges_app
-from gridiron_edge.cli.evaluate import evaluate_app
-from gridiron_edge.cli.features import features_app
-from gridiron_edge.cli.full_retrain import full_retrain_cmd
-from gridiron_edge.cli.ingest import ingest_app
-from gridiron_edge.cli.models import models_app
-from gridiron_edge.cli.output import output_app
-from gridiron_edge.cli.post_week import post_week_cmd
-from gridiron_edge.cli.props import props_app
-from gridiron_edge.cli.ratings import ratings_app
-from gridiron_edge.cli.sim import sim_app
-from gridiron_edge.cli.stadiums import stadiums_app
-from gridiron_edge.cli.teams import teams_app
-from gridiron_edge.cli.transform import transform_app
-from gridiron_edge.cli.verify import verify_cmd
-from gridiron_edge.cli.verify_week import verify_week_cmd
-from gridiron_edge.cli.weekly_predict import weekly_predict_cmd
+from gridiron_edge.cli._lazy import LazyCommand, LazyTyperGroup
 from gridiron_edge.core.logging import setup_logging
 from gridiron_edge.core.settings import ensure_data_dirs
 from gridiron_edge.datasets.registry import DatasetKey, dataset_path
 
+# Subcommands in ``gridiron --help`` order. Modules are imported only when
+# their command is invoked; ``help`` must match each command's own first
+# help line (enforced by tests/unit/cli/test_lazy.py).
+_LAZY_COMMANDS: Final[tuple[LazyCommand, ...]] = (
+    LazyCommand(
+        "ingest", "gridiron_edge.cli.ingest", "ingest_app", "Ingest raw data from external sources."
+    ),
+    LazyCommand(
+        "transform",
+        "gridiron_edge.cli.transform",
+        "transform_app",
+        "Clean/curate data into canonical datasets.",
+    ),
+    LazyCommand(
+        "features",
+        "gridiron_edge.cli.features",
+        "features_app",
+        "Build feature tables and modeling matrices.",
+    ),
+    LazyCommand(
+        "ratings", "gridiron_edge.cli.ratings", "ratings_app", "Ratings systems (Elo, etc.)"
+    ),
+    LazyCommand("output", "gridiron_edge.cli.output", "output_app", "Write reports and outputs."),
+    LazyCommand(
+        "sim", "gridiron_edge.cli.sim", "sim_app", "Monte Carlo season + playoff simulation."
+    ),
+    LazyCommand(
+        "evaluate",
+        "gridiron_edge.cli.evaluate",
+        "evaluate_app",
+        "Evaluate model predictions against outcomes.",
+    ),
+    LazyCommand(
+        "models",
+        "gridiron_edge.cli.models",
+        "models_app",
+        "Train and manage prediction model artifacts.",
+    ),
+    LazyCommand("edges", "gridiron_edge.cli.edges", "edges_app", "Betting edge analysis."),
+    LazyCommand("bet", "gridiron_edge.cli.betting", "betting_app", "Bet tracking and performance."),
+    LazyCommand("props", "gridiron_edge.cli.props", "props_app", "Player prop projections."),
+    LazyCommand("teams", "gridiron_edge.cli.teams", "teams_app", "Team-level analytics."),
+    LazyCommand(
+        "stadiums",
+        "gridiron_edge.cli.stadiums",
+        "stadiums_app",
+        "Audit, prepare, and apply reviewed stadium metadata updates.",
+    ),
+    LazyCommand(
+        "weekly-predict",
+        "gridiron_edge.cli.weekly_predict",
+        "weekly_predict_cmd",
+        "Generate predictions and edge report for the upcoming week.",
+    ),
+    LazyCommand(
+        "post-week",
+        "gridiron_edge.cli.post_week",
+        "post_week_cmd",
+        "Refresh results and evaluate the exact live forecasts issued before kickoff.",
+    ),
+    LazyCommand(
+        "full-retrain",
+        "gridiron_edge.cli.full_retrain",
+        "full_retrain_cmd",
+        "Heavy full-retrain workflow: all data, all models, all calibrations.",
+    ),
+    LazyCommand(
+        "verify",
+        "gridiron_edge.cli.verify",
+        "verify_cmd",
+        "Verify Python repository health and backend behavior.",
+    ),
+    LazyCommand(
+        "verify-week",
+        "gridiron_edge.cli.verify_week",
+        "verify_week_cmd",
+        "Verify weekly operational readiness without modifying data.",
+    ),
+    LazyCommand("api", "gridiron_edge.cli.api", "api_app", "Run the Gridiron Edge API."),
+    LazyCommand(
+        "debug", "gridiron_edge.cli.debug", "debug_app", "Developer diagnostics for the CLI."
+    ),
+)
+
+
+class _GridironGroup(LazyTyperGroup):
+    lazy_commands: ClassVar[dict[str, LazyCommand]] = {
+        command.name: command for command in _LAZY_COMMANDS
+    }
+
+
 _verbose_state: dict[str, bool] = {"verbose": False}
 
 
@@ -66,28 +141,9 @@ app = typer.Typer(
     help="Gridiron Edge CLI: ingest, transform, features, ratings, output.",
     no_args_is_help=True,
     callback=_cli_startup,
+    cls=_GridironGroup,
 )
 
-app.add_typer(ingest_app, name="ingest")
-app.add_typer(transform_app, name="transform")
-app.add_typer(features_app, name="features")
-app.add_typer(ratings_app, name="ratings")
-app.add_typer(output_app, name="output")
-app.add_typer(sim_app, name="sim")
-app.add_typer(evaluate_app, name="evaluate")
-app.add_typer(models_app, name="models")
-app.add_typer(edges_app, name="edges")
-app.add_typer(betting_app, name="bet")
-app.add_typer(props_app, name="props")
-app.add_typer(teams_app, name="teams")
-app.add_typer(stadiums_app, name="stadiums")
-app.command("weekly-predict")(weekly_predict_cmd)
-app.command("post-week")(post_week_cmd)
-app.command("full-retrain")(full_retrain_cmd)
-app.command("verify")(verify_cmd)
-app.command("verify-week")(verify_week_cmd)
-app.add_typer(api_app, name="api")
-
 
 # ===========================================================================
 # FULL PIPELINE
@@ -102,6 +158,7 @@ ALL_STAGES: list[str] = [
     "clean-upcoming",
     "fetch-weather",
     "build-epa",
+    "build-player-stats",
     "build-elo",
     "build-features",
 ]
@@ -221,10 +278,11 @@ def _run_pipeline_stages(  # noqa: PLR0912, PLR0915
     with step("Clean games", skip=not runs("clean-games")) as s:
         if runs("clean-games"):
             # pyrefly: ignore [missing-module-attribute]
-            from gridiron_edge.transform.clean import clean_nflverse_games
+            from gridiron_edge.transform.clean import clean_nflverse_games_incremental
 
-            path = clean_nflverse_games()
-            s.set_detail(path.name)
+            cleaned = clean_nflverse_games_incremental()
+            changed: str = ", ".join(map(str, sorted(cleaned.changed_seasons))) or "none"
+            s.set_detail(f"{cleaned.path.name} (changed seasons: {changed})")
 
     with step("Fetch upcoming schedule", skip=not runs("fetch-upcoming")) as s:
         if runs("fetch-upcoming"):
@@ -263,9 +321,20 @@ def _run_pipeline_stages(  # noqa: PLR0912, PLR0915
                 fetch_pbp()
             else:
                 fetch_pbp_refresh()
-            aggregate_epa()
+            # Weekly runs re-aggregate only PBP seasons whose content changed.
+            aggregate_epa(only_changed=not all_years)
             s.set_detail("done")
 
+    with step("Build player game logs", skip=not runs("build-player-stats")) as s:
+        if runs("build-player-stats"):
+            from gridiron_edge.ingest.nflverse.player_stats import fetch_player_stats
+            from gridiron_edge.transform.clean.player_stats import clean_player_stats
+
+            written: list[Path] = fetch_player_stats(all_years=all_years)
+            # Weekly runs re-clean only raw seasons whose content changed.
+            path = clean_player_stats(only_changed=not all_years)
+            s.set_detail(f"{path.name} ({len(written)} season file(s) written)")
+
     with step("Fit Elo", skip=not runs("build-elo")) as s:
         if runs("build-elo"):
             # pyrefly: ignore [missing-module-attribute]
@@ -276,8 +345,17 @@ def _run_pipeline_stages(  # noqa: PLR0912, PLR0915
 
     with step("Build model inputs", skip=not runs("build-features")):
         if runs("build-features"):
+            from gridiron_edge.core.settings import get_settings
+            from gridiron_edge.datasets.loaders import load_stadiums
             from gridiron_edge.features.pipeline import build_model_inputs
+            from gridiron_edge.metadata.stadium_sync import refresh_venue_geometry
 
+            # Persist the venue geometry before the travel feature needs it,
+            # so feature builds never resolve time zones themselves.
+            repo_root: Path = get_settings().repo_root
+            refresh_venue_geometry(
+                load_stadiums(repo_root), dataset_path(repo_root, "venue_geometry")
+            )
             build_model_inputs(all_years=all_years)
 
 
@@ -789,6 +789,7 @@ def compute_splits_cmd(
     import pandas as pd
 
     from gridiron_edge.core.settings import get_settings
+    from gridiron_edge.datasets.columnar import read_table
     from gridiron_edge.datasets.loaders import load_teams_long_short
     from gridiron_edge.evaluation.situational_splits import (
         STAT_COLUMN_MAP,
@@ -814,7 +815,7 @@ def compute_splits_cmd(
             raise typer.Exit(code=1)
 
         logs = pd.read_parquet(logs_path)
-        games = pd.read_csv(games_path)
+        games = read_table(games_path)
 
         mapping_df = load_teams_long_short(repo)
         long_to_short = dict(
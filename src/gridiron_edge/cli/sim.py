@@ -67,6 +67,7 @@ def sim_compute_percentiles() -> None:
 
     from gridiron_edge.core.console import console, step
     from gridiron_edge.core.settings import get_settings
+    from gridiron_edge.datasets.columnar import read_table
     from gridiron_edge.datasets.loaders import load_teams_long_short
     from gridiron_edge.evaluation.percentiles import (
         compute_team_percentiles,
@@ -90,7 +91,7 @@ def sim_compute_percentiles() -> None:
             typer.echo("Run `gridiron sim run` first.")
             raise typer.Exit(1)
 
-        elo = pd.read_csv(elo_path)
+        elo = read_table(elo_path)
         proj = pd.read_csv(proj_path)
         mapping_df = load_teams_long_short(repo)
         long_to_short = dict(
@@ -11,15 +11,20 @@ import pandas as pd
 import typer
 
 from gridiron_edge.core.settings import get_settings
+from gridiron_edge.datasets.columnar import refresh_columnar_twin
 from gridiron_edge.datasets.loaders import (
     load_schedule_upcoming_rich,
     load_stadiums,
 )
+from gridiron_edge.datasets.registry import dataset_path
 from gridiron_edge.metadata.stadium_sync import (
     apply_approved_stadium_updates,
     audit_stadium_coverage,
+    build_venue_geometry,
     load_stadium_aliases,
     prepare_stadium_updates,
+    refresh_venue_geometry,
+    write_venue_geometry,
 )
 
 stadiums_app = typer.Typer(
@@ -124,7 +129,11 @@ def apply_stadiums(
         ),
     ],
 ) -> None:
-    """Atomically append approved rows and report remaining coverage."""
+    """Atomically append approved rows and report remaining coverage.
+
+    The venue geometry table is rebuilt when the applied rows change it, so
+    feature builds keep reading the persisted table.
+    """
     repo = get_settings().repo_root
 
     if not updates.is_file():
@@ -140,6 +149,9 @@ def apply_stadiums(
     )
 
     applied_count = len(result) - len(stadiums)
+    if applied_count:
+        refresh_columnar_twin(repo, "stadiums")
+    geometry = refresh_venue_geometry(result, dataset_path(repo, "venue_geometry"))
 
     remaining = audit_stadium_coverage(
         result,
@@ -149,8 +161,29 @@ def apply_stadiums(
 
     typer.echo(f"stadiums apply  {season}")
     typer.echo(f"approved rows applied: {applied_count}")
+    if geometry is not None:
+        typer.echo(f"venue geometry rebuilt: {len(geometry.stadiums)} venues")
     typer.echo("remaining coverage:")
     _render_counts(
         remaining,
         ["ISSUE"],
     )
+
+
+@stadiums_app.command("geometry")
+def build_geometry() -> None:
+    """Precompute the venue geometry table used by the travel feature.
+
+    Resolves each stadium's IANA zone once and stores per-date UTC offsets,
+    franchise-season origins, and the venue distance matrix. ``stadiums
+    apply`` and the pipeline's build-features stage refresh the table when
+    it is stale; this command rebuilds it unconditionally.
+    """
+    repo = get_settings().repo_root
+    geometry = build_venue_geometry(load_stadiums(repo))
+    path = write_venue_geometry(geometry, dataset_path(repo, "venue_geometry"))
+
+    typer.echo("stadiums geometry")
+    typer.echo(f"venues: {len(geometry.stadiums)}  zones: {len(geometry.zones)}")
+    typer.echo(f"franchise-season origins: {len(geometry.origin_teams)}")
+    typer.echo(f"written: {path}")
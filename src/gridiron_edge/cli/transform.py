@@ -76,3 +76,42 @@ def transform_aggregate_epa(
         s.set_detail(str(path))
 
     console.summary()
+
+
+@transform_app.command("migrate-columnar")
+def transform_migrate_columnar() -> None:
+    r"""Write typed Parquet twins for the CSV-backed canonical datasets.
+
+    One-shot migration for games, elo_state, weather_enriched, stadiums, and
+    team_metadata. Each twin sits next to its CSV, stores team and season
+    columns as categoricals, and is read by the dataset loaders while it is
+    at least as new as the CSV. The CSVs stay in place as the editable source
+    and fallback. Rerun after editing a CSV by hand.
+
+    \b
+    Example:
+      gridiron transform migrate-columnar
+    """
+    from gridiron_edge.core.console import console, step
+    from gridiron_edge.core.settings import get_settings
+    from gridiron_edge.datasets.columnar import migrate_columnar
+
+    repo: Path = get_settings().repo_root
+    console.header("transform migrate-columnar")
+
+    with step("Write typed Parquet twins") as s:
+        results = migrate_columnar(repo)
+        written = [result for result in results if result.columnar_path is not None]
+        s.set_detail(f"{len(written)} of {len(results)} datasets")
+
+    for result in results:
+        if result.columnar_path is None:
+            typer.echo(f"{result.key:<18} skipped (no CSV at {result.csv_path})")
+            continue
+        typer.echo(
+            f"{result.key:<18} {result.rows:>8,} rows  "
+            f"{result.csv_bytes / 2**20:7.2f} MB csv -> "
+            f"{result.columnar_bytes / 2**20:7.2f} MB parquet"
+        )
+
+    console.summary()
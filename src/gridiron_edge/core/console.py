@@ -27,7 +27,7 @@ on initialisation and is updated by the CLI when ``--verbose`` is passed.
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from dataclasses import dataclass
 import os
@@ -129,6 +129,7 @@ class Console:
         )
         self._steps: list[StepResult] = []
         self._pipeline_start: float = 0.0
+        self._stats_sources: dict[str, Callable[[], str | None]] = {}
 
     def set_verbose(self, verbose: bool) -> None:
         """Update verbosity (called by the CLI after parsing --verbose flag).
@@ -138,6 +139,25 @@ class Console:
         """
         self.verbose = verbose
 
+    def add_stats_source(self, label: str, source: Callable[[], str | None]) -> None:
+        """Register a counter summary printed at the end of verbose runs.
+
+        Args:
+            label: Line label (e.g. ``"artifact cache"``).
+            source: Returns the line text, or ``None`` when there is nothing
+                to report for this run.
+        """
+        self._stats_sources[label] = source
+
+    def print_stats(self) -> None:
+        """Print registered counter summaries (verbose mode only)."""
+        if not self.verbose:
+            return
+        for label, source in self._stats_sources.items():
+            line = source()
+            if line:
+                print(f"  {_DIM}{label}: {line}{_RESET}")
+
     # ── Structural output ───────────────────────────────────────────────────
 
     def header(self, title: str, *, subtitle: str = "") -> None:
@@ -175,6 +195,7 @@ class Console:
         parts.append(f"{_DIM}{total:.1f}s total{_RESET}")
 
         print("  " + "  ·  ".join(parts))
+        self.print_stats()
         print(f"{_BOLD}{_CYAN}{bar}{_RESET}\n")
 
     # ── Step output ─────────────────────────────────────────────────────────
@@ -0,0 +1,115 @@
+# src/gridiron_edge/core/ratelimit.py
+
+"""Thread-safe token-bucket rate limiting for outbound API clients.
+
+Provider limits are published as calls per minute (or second). A
+:class:`TokenBucket` shared by a pool of worker threads keeps the pool at
+that rate no matter how many requests are in flight: each call takes one
+token, tokens refill continuously, and a ``429 Too Many Requests`` answer
+pauses every worker via :meth:`TokenBucket.pause` for the provider's
+``Retry-After``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import threading
+import time
+from typing import Final
+
+# Slack for float rounding in refill arithmetic; without it a bucket refilled
+# to 0.999... tokens would keep sleeping for ever-smaller deficits.
+_TOKEN_EPSILON: Final[float] = 1e-9
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum tokens held, i.e. the largest burst allowed after
+            an idle period. The bucket starts full.
+        clock: Monotonic time source, in seconds.
+        sleep: Blocking sleep function, in seconds.
+
+    Raises:
+        ValueError: If *rate* or *capacity* is not positive.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(f"rate and capacity must be positive, got {rate} and {capacity}")
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens: float = capacity
+        self._updated: float = clock()
+        self._paused_until: float = 0.0
+
+    @classmethod
+    def per_minute(cls, calls: float, *, burst: float | None = None) -> TokenBucket:
+        """Build a bucket from a calls-per-minute limit.
+
+        Args:
+            calls: Calls allowed per minute.
+            burst: Bucket capacity. Defaults to one second of calls (at
+                least one), so workers start promptly without front-loading
+                the whole minute's budget.
+        """
+        rate = calls / 60.0
+        return cls(rate, burst if burst is not None else max(1.0, rate))
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until *tokens* are available, then take them.
+
+        Returns:
+            Seconds spent waiting.
+
+        Raises:
+            ValueError: If *tokens* exceeds the bucket's capacity, since the
+                bucket could never hold that many.
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._refill()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens + _TOKEN_EPSILON >= tokens:
+                    self._tokens = max(0.0, self._tokens - tokens)
+                    return waited
+                else:
+                    delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for *seconds* and drain the bucket.
+
+        Called when the provider answers ``429``; later pauses extend but
+        never shorten an active one.
+        """
+        with self._lock:
+            now = self._refill()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+
+    def _refill(self) -> float:
+        """Add tokens accrued since the last update; return the current time."""
+        now = self._clock()
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = max(self._updated, now)
+        return now
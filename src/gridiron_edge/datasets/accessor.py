@@ -2,11 +2,15 @@
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from gridiron_edge.datasets import loaders
 
+if TYPE_CHECKING:
+    from gridiron_edge.metadata.stadium_sync import VenueGeometry
+
 
 @dataclass(frozen=True)
 class DatasetAccessor:
@@ -47,6 +51,19 @@ class DatasetAccessor:
         """
         return loaders.load_stadiums(self.repo)
 
+    def venue_geometry(self) -> "VenueGeometry":
+        """Load the precomputed venue geometry table.
+
+        Returns:
+            Venue coordinates, zones, per-date UTC offsets, franchise-season
+            origins, and the venue distance matrix.
+
+        Raises:
+            FileNotFoundError: If the table has not been built with
+                ``gridiron stadiums geometry``.
+        """
+        return loaders.load_venue_geometry(self.repo)
+
     def schedule_upcoming_rich(self) -> pd.DataFrame:
         """Load the rich schedule-complete upcoming-game artifact."""
         return loaders.load_schedule_upcoming_rich(self.repo)
@@ -0,0 +1,328 @@
+# src/gridiron_edge/datasets/columnar.py
+
+"""Typed Parquet twins for the CSV-backed canonical datasets.
+
+The hottest canonical datasets (``games``, ``elo_state``,
+``weather_enriched``, ``stadiums``, ``team_metadata``) are stored as CSV so
+they stay diffable and hand-editable. Every read re-parses the text and
+re-infers dtypes. This module keeps a typed Parquet twin next to each CSV
+(same stem, ``.parquet`` suffix):
+
+- each key has an explicit :class:`TableSchema`; team and season columns are
+  stored as dictionary-encoded categoricals;
+- the twin is always derived from the CSV text, so reading it yields the
+  values a CSV parse would (declared ``float`` columns are always
+  ``float64``, even when a file happens to hold only whole numbers);
+- a twin older than its CSV is ignored, so hand edits and appends to the CSV
+  fall back to the CSV transparently until the twin is refreshed.
+
+``read_table`` is the path-level entry point used by ``loaders.load_csv``
+and by readers that hold a CSV path rather than a dataset key.
+``gridiron transform migrate-columnar`` writes or refreshes every twin.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import logging
+from logging import Logger
+from pathlib import Path
+from typing import Any, Final, Literal
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from .registry import DatasetKey, dataset_path
+
+logger: Logger = logging.getLogger(__name__)
+
+ColumnType = Literal["category", "string", "int", "float"]
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """Explicit column types for one CSV-backed dataset.
+
+    Columns absent from the frame are skipped and undeclared columns keep the
+    dtype inferred from the CSV, so the schema tolerates additive changes.
+
+    Attributes:
+        columns: ``column -> type``. ``int`` columns holding nulls are stored
+            as ``float64``, matching CSV inference.
+    """
+
+    columns: Mapping[str, ColumnType]
+
+    @property
+    def categorical(self) -> tuple[str, ...]:
+        """Columns stored as categoricals."""
+        return tuple(name for name, kind in self.columns.items() if kind == "category")
+
+
+_GAME_COLUMNS: Final[dict[str, ColumnType]] = {
+    "GAME_ID": "string",
+    "YEAR": "category",
+    "WEEK_NUM": "int",
+    "GAME_DATE": "string",
+    "GAME_DAY_OF_WEEK": "category",
+    "GAMETIME": "string",
+    "AWAY_TEAM": "category",
+    "HOME_TEAM": "category",
+    "AWAY_SCORE": "int",
+    "HOME_SCORE": "int",
+    "IS_NEUTRAL_SITE": "int",
+    "STADIUM": "category",
+    "ROOF": "category",
+    "SURFACE": "category",
+    "DIV_GAME": "int",
+    "VEGAS_LINE": "float",
+    "OVER_UNDER": "float",
+    "FAVORITED": "category",
+}
+
+SCHEMAS: Final[dict[DatasetKey, TableSchema]] = {
+    "games": TableSchema(_GAME_COLUMNS),
+    "weather_enriched": TableSchema(
+        {
+            "GAME_ID": "string",
+            "TEMP": "float",
+            "FEELS_LIKE": "float",
+            "PRESSURE": "float",
+            "HUMIDITY": "float",
+            "DEW_POINT": "float",
+            "CLOUDS": "float",
+            "VISIBILITY": "float",
+            "WIND_SPEED": "float",
+            "WIND_DEG": "float",
+            "WEATHER_MAIN": "category",
+            "WEATHER_DESC": "category",
+        }
+    ),
+    "elo_state": TableSchema(
+        {"NFL_TEAM": "category", "NFL_YEAR": "category", "NFL_WEEK": "int", "ELO": "float"}
+    ),
+    "stadiums": TableSchema(
+        {
+            "HOME_TEAM": "category",
+            "YEAR": "category",
+            "STADIUM": "string",
+            "LATITUDE": "float",
+            "LONGITUDE": "float",
+            "ALTITUDE": "float",
+            "ROOF": "category",
+            "SURFACE": "category",
+        }
+    ),
+    "team_metadata": TableSchema(
+        {
+            "NFL_LONG_NAME": "category",
+            "NFL_SHORT_NAME": "category",
+            "conf": "category",
+            "div": "category",
+        }
+    ),
+}
+"""Explicit schema per dataset key that has a typed twin."""
+
+
+@dataclass(frozen=True)
+class MigrationResult:
+    """Outcome of writing one typed twin.
+
+    Attributes:
+        key: Dataset key.
+        csv_path: Source CSV.
+        columnar_path: Written Parquet twin, or ``None`` when the CSV is missing.
+        rows: Rows written.
+        csv_bytes: Size of the CSV on disk.
+        columnar_bytes: Size of the twin on disk.
+    """
+
+    key: DatasetKey
+    csv_path: Path
+    columnar_path: Path | None
+    rows: int = 0
+    csv_bytes: int = 0
+    columnar_bytes: int = 0
+
+
+def columnar_path(csv_path: Path) -> Path:
+    """Return the Parquet twin path for a CSV dataset path."""
+    return csv_path.with_suffix(".parquet")
+
+
+def has_fresh_twin(csv_path: Path) -> bool:
+    """Return whether *csv_path* has a twin at least as new as the CSV.
+
+    A twin without a CSV counts as fresh.
+    """
+    twin = columnar_path(csv_path)
+    if not twin.is_file():
+        return False
+    if not csv_path.is_file():
+        return True
+    return twin.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns
+
+
+def apply_schema(df: DataFrame, schema: TableSchema) -> DataFrame:
+    """Cast the declared columns of *df* to their schema types.
+
+    Args:
+        df: Frame parsed from the CSV.
+        schema: Explicit column types.
+
+    Returns:
+        A copy with declared columns cast.
+
+    Raises:
+        ValueError: If a declared numeric column holds non-numeric values.
+    """
+    out = df.copy()
+    for name, kind in schema.columns.items():
+        if name not in out.columns:
+            continue
+        values = out[name]
+        if kind == "category":
+            out[name] = values.astype("category")
+        elif kind == "string":
+            if values.dtype != object:
+                out[name] = values.astype(str).where(values.notna()).astype(object)
+        else:
+            numeric = pd.to_numeric(values, errors="raise")
+            if kind == "int" and not numeric.isna().any():
+                out[name] = numeric.astype("int64")
+            else:
+                out[name] = numeric.astype("float64")
+    return out
+
+
+def decode_categoricals(df: DataFrame) -> DataFrame:
+    """Return *df* as a CSV parse would: plain values, ``NaN`` for nulls.
+
+    Categorical columns are decoded to their category values and nulls in
+    ``object`` columns (``None`` after a Parquet round trip) become ``NaN``.
+    """
+    out = df.copy()
+    for name, dtype in df.dtypes.items():
+        values = df[name]
+        if isinstance(dtype, pd.CategoricalDtype):
+            plain = dtype.categories.dtype
+            if values.isna().any():
+                plain = np.dtype("float64") if plain.kind in "iuf" else np.dtype(object)
+            # pyrefly: ignore [unsupported-operation]
+            out[name] = values.astype(plain)
+        if out[name].dtype == object and out[name].isna().any():
+            # pyrefly: ignore [unsupported-operation]
+            out[name] = out[name].where(out[name].notna(), np.nan)
+    return out
+
+
+def read_table(
+    csv_path: Path,
+    *,
+    categorical: bool = False,
+    **read_csv_kwargs: Any,  # noqa: ANN401
+) -> DataFrame:
+    """Read a CSV-backed dataset, preferring its fresh typed twin.
+
+    Args:
+        csv_path: Registered CSV path of the dataset.
+        categorical: Keep team and season columns as categoricals. When
+            ``False`` they are decoded to plain values so the frame matches a
+            plain ``read_csv`` of the same file.
+        **read_csv_kwargs: Forwarded to ``pandas.read_csv``. Passing any
+            always reads the CSV, since the twin cannot honour them.
+
+    Returns:
+        The dataset as a DataFrame.
+
+    Raises:
+        FileNotFoundError: If neither the CSV nor a twin exists.
+    """
+    if not read_csv_kwargs and has_fresh_twin(csv_path):
+        df: DataFrame = pd.read_parquet(columnar_path(csv_path))
+        return df if categorical else decode_categoricals(df)
+
+    df = pd.read_csv(csv_path, **read_csv_kwargs)
+    if not categorical:
+        return df
+    schema = _schema_for_path(csv_path)
+    return apply_schema(df, schema) if schema is not None else df
+
+
+def write_columnar_twin(repo_root: Path, key: DatasetKey) -> MigrationResult:
+    """Write the typed twin of one dataset from its CSV.
+
+    The twin is written to a temporary file and renamed into place.
+
+    Args:
+        repo_root: Absolute path to the repository root.
+        key: Dataset key with an entry in :data:`SCHEMAS`.
+
+    Returns:
+        The migration result; ``columnar_path`` is ``None`` when the CSV is
+        missing.
+
+    Raises:
+        KeyError: If *key* has no typed schema.
+    """
+    schema = SCHEMAS[key]
+    csv_path = dataset_path(repo_root, key)
+    if not csv_path.is_file():
+        return MigrationResult(key=key, csv_path=csv_path, columnar_path=None)
+
+    typed = apply_schema(pd.read_csv(csv_path), schema)
+    twin = columnar_path(csv_path)
+    temporary = twin.with_name(f"{twin.name}.tmp")
+    typed.to_parquet(temporary, index=False)
+    temporary.replace(twin)
+    logger.debug("Wrote typed twin %s (%d rows)", twin, len(typed))
+    return MigrationResult(
+        key=key,
+        csv_path=csv_path,
+        columnar_path=twin,
+        rows=len(typed),
+        csv_bytes=csv_path.stat().st_size,
+        columnar_bytes=twin.stat().st_size,
+    )
+
+
+def refresh_columnar_twin(repo_root: Path, key: DatasetKey) -> Path | None:
+    """Rewrite the twin of *key* after a CSV write, if the repo has one.
+
+    Repos that never ran the migration keep reading CSV only.
+
+    Returns:
+        The refreshed twin path, or ``None`` when no twin existed.
+    """
+    if key not in SCHEMAS or not columnar_path(dataset_path(repo_root, key)).is_file():
+        return None
+    return write_columnar_twin(repo_root, key).columnar_path
+
+
+def migrate_columnar(
+    repo_root: Path,
+    keys: tuple[DatasetKey, ...] | None = None,
+) -> list[MigrationResult]:
+    """Write typed twins for every CSV-backed dataset (one-shot migration).
+
+    Args:
+        repo_root: Absolute path to the repository root.
+        keys: Keys to migrate. Defaults to every key in :data:`SCHEMAS`.
+
+    Returns:
+        One result per key, in order.
+    """
+    return [write_columnar_twin(repo_root, key) for key in keys or tuple(SCHEMAS)]
+
+
+def _schema_for_path(csv_path: Path) -> TableSchema | None:
+    """Return the schema whose registered CSV file name matches *csv_path*."""
+    from .registry import DATASETS
+
+    for key, schema in SCHEMAS.items():
+        if Path(DATASETS[key].relpath).name == csv_path.name:
+            return schema
+    return None
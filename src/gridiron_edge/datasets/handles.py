@@ -0,0 +1,310 @@
+# src/gridiron_edge/datasets/handles.py
+
+"""Memory-mapped dataset handles shared across worker processes.
+
+Process-pool jobs that each re-read ``modeling_file.parquet`` or the games
+history hold one private copy per worker. A :class:`SharedDatasets` scope,
+owned by the parent job, materializes each dataset once as an uncompressed
+Arrow IPC file in a scratch directory and hands out :class:`DatasetHandle`
+objects. Handles are small and picklable; a worker calls
+:meth:`DatasetHandle.table`, :meth:`DatasetHandle.to_pandas`, or
+:meth:`DatasetHandle.column` to open the file memory-mapped, so every worker
+reads the same page-cache pages instead of its own copy.
+
+Zero-copy holds for fixed-width columns without nulls: ``column`` returns a
+read-only NumPy view over the mapping and ``to_pandas`` keeps such columns
+as views (``split_blocks=True``). String columns are still decoded into
+Python objects per worker; categoricals stay dictionary-encoded.
+:meth:`SharedDatasets.share_array` stores a 1-D or 2-D NumPy array (a
+feature matrix or target vector) and :meth:`DatasetHandle.array` reopens it
+as a read-only view of the same shape.
+
+The scratch directory lives exactly as long as the scope: it is removed when
+the ``with`` block exits, at interpreter exit if the parent forgets to close
+it, and on the next scope creation if the owning process died without
+cleaning up.
+
+Example::
+
+    with SharedDatasets(repo) as shared:
+        games = shared.materialize("games")
+        with ProcessPoolExecutor() as pool:
+            list(pool.map(work, [games] * n_tasks))
+
+
+    def work(games: DatasetHandle) -> float:
+        return float(games.column("HOME_SCORE").mean())
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from logging import Logger
+import os
+from pathlib import Path
+import re
+import shutil
+import tempfile
+from types import TracebackType
+from typing import Final
+import weakref
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import ipc
+
+from .columnar import read_table
+from .registry import DatasetKey, dataset_path
+
+logger: Logger = logging.getLogger(__name__)
+
+_SCRATCH_PREFIX: Final[str] = "gridiron-datasets-"
+_OWNER_PATTERN: Final[re.Pattern[str]] = re.compile(rf"^{_SCRATCH_PREFIX}(\d+)-")
+
+#: Column holding an array shared with :meth:`SharedDatasets.share_array`.
+_ARRAY_COLUMN: Final[str] = "values"
+
+
+@dataclass(frozen=True)
+class DatasetHandle:
+    """Picklable reference to a dataset materialized as Arrow IPC.
+
+    Attributes:
+        name: Registry key or caller-chosen name of the dataset.
+        path: Arrow IPC file inside the owning scope's scratch directory.
+        rows: Number of rows.
+        columns: Column names in file order.
+    """
+
+    name: str
+    path: Path
+    rows: int
+    columns: tuple[str, ...]
+
+    def table(self, columns: list[str] | None = None) -> pa.Table:
+        """Open the dataset memory-mapped as an Arrow table.
+
+        Args:
+            columns: Subset of columns to select. Defaults to all.
+
+        Returns:
+            A table whose buffers point into the mapped file.
+
+        Raises:
+            FileNotFoundError: If the owning scope has been closed.
+        """
+        with pa.memory_map(str(self.path), "r") as source:
+            table = ipc.open_file(source).read_all()
+        return table.select(columns) if columns is not None else table
+
+    def to_pandas(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """Open the dataset as a DataFrame backed by the mapped file.
+
+        Fixed-width columns without nulls are zero-copy views; the frame is
+        read-only where it shares memory with the mapping.
+
+        Args:
+            columns: Subset of columns to load. Defaults to all.
+        """
+        return self.table(columns).to_pandas(split_blocks=True, self_destruct=False)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return one column as a NumPy array, zero-copy when possible.
+
+        Fixed-width columns without nulls come back as read-only views over
+        the mapping; other columns are converted (and copied). A column
+        stored in several record batches, or none (an empty dataset), is
+        combined into one array first.
+
+        Args:
+            name: Column name.
+        """
+        column = self.table([name]).column(0)
+        chunk = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        zero_copy = pa.types.is_primitive(chunk.type) and chunk.null_count == 0
+        return chunk.to_numpy(zero_copy_only=zero_copy)
+
+    def array(self) -> np.ndarray:
+        """Return an array shared with :meth:`SharedDatasets.share_array`.
+
+        Matrices are stored row-major as fixed-size lists and come back as
+        read-only 2-D views over the mapping when their values have no nulls.
+
+        Raises:
+            ValueError: If the handle does not hold a shared array.
+        """
+        if self.columns != (_ARRAY_COLUMN,):
+            raise ValueError(f"Dataset {self.name!r} is not a shared array")
+        column = self.table().column(0)
+        if not pa.types.is_fixed_size_list(column.type):
+            return self.column(_ARRAY_COLUMN)
+        chunk = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        values = chunk.flatten()
+        zero_copy = pa.types.is_primitive(values.type) and values.null_count == 0
+        return values.to_numpy(zero_copy_only=zero_copy).reshape(-1, column.type.list_size)
+
+
+class SharedDatasets:
+    """Parent-owned scratch scope that materializes datasets for workers.
+
+    Use as a context manager around the process pool. Each dataset is
+    written once per scope; repeated :meth:`materialize` calls return the
+    same handle.
+
+    Args:
+        repo_root: Absolute path to the repository root.
+        scratch_root: Directory that holds scope directories. Defaults to
+            ``$GRIDIRON_SCRATCH_DIR`` or the system temp directory.
+    """
+
+    def __init__(self, repo_root: Path, *, scratch_root: Path | None = None) -> None:
+        root = scratch_root or Path(os.environ.get("GRIDIRON_SCRATCH_DIR") or tempfile.gettempdir())
+        root.mkdir(parents=True, exist_ok=True)
+        _remove_orphaned_scopes(root)
+
+        self.repo_root = repo_root
+        self.directory = Path(tempfile.mkdtemp(prefix=f"{_SCRATCH_PREFIX}{os.getpid()}-", dir=root))
+        self._handles: dict[str, DatasetHandle] = {}
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    def __enter__(self) -> SharedDatasets:
+        """Return the scope."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Remove the scratch directory on exit."""
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the scratch directory has been removed."""
+        return not self._finalizer.alive
+
+    def materialize(self, key: DatasetKey) -> DatasetHandle:
+        """Write a registered dataset to scratch once and return its handle.
+
+        CSV-backed keys are read through ``columnar.read_table``, so a fresh
+        typed twin is used and categoricals are preserved.
+
+        Args:
+            key: A registered ``.csv`` or ``.parquet`` dataset key.
+
+        Returns:
+            The dataset handle.
+
+        Raises:
+            FileNotFoundError: If the dataset does not exist.
+            ValueError: If the key is not a CSV or Parquet file.
+        """
+        if key in self._handles:
+            return self._handles[key]
+        path = dataset_path(self.repo_root, key)
+        if path.suffix == ".csv":
+            df = read_table(path, categorical=True)
+        elif path.suffix == ".parquet":
+            df = pd.read_parquet(path)
+        else:
+            raise ValueError(f"Dataset {key!r} is not a table: {path.name}")
+        return self.share(key, df)
+
+    def share(self, name: str, df: pd.DataFrame) -> DatasetHandle:
+        """Write an in-memory frame to scratch and return its handle.
+
+        Args:
+            name: Handle name, unique within the scope.
+            df: Frame to share. The index is dropped.
+
+        Returns:
+            The dataset handle.
+
+        Raises:
+            RuntimeError: If the scope is closed.
+            ValueError: If *name* is already shared in this scope.
+        """
+        return self._write(name, pa.Table.from_pandas(df, preserve_index=False))
+
+    def share_array(self, name: str, array: np.ndarray) -> DatasetHandle:
+        """Write a 1-D or 2-D array to scratch and return its handle.
+
+        Args:
+            name: Handle name, unique within the scope.
+            array: Vector or matrix to share. Read it back with
+                :meth:`DatasetHandle.array`.
+
+        Returns:
+            The dataset handle.
+
+        Raises:
+            RuntimeError: If the scope is closed.
+            ValueError: If *name* is already shared in this scope, or
+                *array* is not 1-D or a 2-D matrix with at least one column.
+        """
+        values = np.ascontiguousarray(array)
+        if values.ndim == 1:
+            column: pa.Array = pa.array(values)
+        elif values.ndim == 2 and values.shape[1] > 0:
+            column = pa.FixedSizeListArray.from_arrays(pa.array(values.ravel()), values.shape[1])
+        else:
+            raise ValueError(f"Cannot share array {name!r} of shape {values.shape}")
+        return self._write(name, pa.table({_ARRAY_COLUMN: column}))
+
+    def _write(self, name: str, table: pa.Table) -> DatasetHandle:
+        """Write *table* as one Arrow IPC file in the scope and register it."""
+        if self.closed:
+            raise RuntimeError("SharedDatasets scope is closed")
+        if name in self._handles:
+            raise ValueError(f"Dataset {name!r} is already shared in this scope")
+
+        table = table.combine_chunks()
+        path = self.directory / f"{len(self._handles):03d}-{_safe_name(name)}.arrow"
+        with pa.OSFile(str(path), "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        handle = DatasetHandle(
+            name=name,
+            path=path,
+            rows=table.num_rows,
+            columns=tuple(table.column_names),
+        )
+        self._handles[name] = handle
+        logger.debug("Shared %s (%d rows) at %s", name, handle.rows, path)
+        return handle
+
+    def close(self) -> None:
+        """Remove the scratch directory. Open mappings stay valid on POSIX."""
+        self._finalizer()
+
+
+def _safe_name(name: str) -> str:
+    """Return *name* reduced to filename-safe characters."""
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+
+
+def _remove_orphaned_scopes(root: Path) -> None:
+    """Delete scope directories whose owning process no longer exists."""
+    for directory in root.glob(f"{_SCRATCH_PREFIX}*"):
+        match = _OWNER_PATTERN.match(directory.name)
+        if match is None or _pid_alive(int(match.group(1))):
+            continue
+        logger.info("Removing orphaned dataset scratch %s", directory)
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Return whether a process with *pid* exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:  # pragma: no cover - platforms without signal 0
+        return True
+    return True
@@ -1,17 +1,25 @@
 # src/gridiron_edge/datasets/loaders.py
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from pandas import DataFrame
 
+from .columnar import read_table
 from .registry import DatasetKey, dataset_path
 
+if TYPE_CHECKING:
+    from gridiron_edge.metadata.stadium_sync import VenueGeometry
+
 
 def load_csv(repo_root: Path, key: DatasetKey, **read_csv_kwargs: Any) -> pd.DataFrame:
     """Load a registered dataset from disk as a DataFrame.
 
+    CSV-backed canonical datasets with a fresh typed Parquet twin (see
+    ``datasets.columnar``) are read from the twin; the result matches a
+    parse of the CSV.
+
     Args:
         repo_root: Absolute path to the repository root.
         key: A ``DatasetKey`` identifying which dataset to load.
@@ -25,7 +33,27 @@ def load_csv(repo_root: Path, key: DatasetKey, **read_csv_kwargs: Any) -> pd.Dat
         FileNotFoundError: If the resolved CSV path does not exist.
     """
     path: Path = dataset_path(repo_root, key)
-    return pd.read_csv(path, **read_csv_kwargs)
+    return read_table(path, **read_csv_kwargs)
+
+
+def load_typed(repo_root: Path, key: DatasetKey) -> pd.DataFrame:
+    """Load a CSV-backed canonical dataset with its explicit column types.
+
+    Team and season columns come back as categoricals. Reads the typed
+    Parquet twin when fresh and otherwise parses the CSV and applies the
+    same schema.
+
+    Args:
+        repo_root: Absolute path to the repository root.
+        key: A ``DatasetKey`` with a schema in ``datasets.columnar.SCHEMAS``.
+
+    Returns:
+        The typed dataset.
+
+    Raises:
+        FileNotFoundError: If neither the CSV nor its twin exists.
+    """
+    return read_table(dataset_path(repo_root, key), categorical=True)
 
 
 def load_games(repo_root: Path) -> pd.DataFrame:
@@ -49,6 +77,13 @@ def load_stadiums(repo_root: Path) -> pd.DataFrame:
     return load_csv(repo_root, "stadiums")
 
 
+def load_venue_geometry(repo_root: Path) -> "VenueGeometry":
+    """Load the precomputed venue geometry table built from the stadium reference."""
+    from gridiron_edge.metadata.stadium_sync import load_venue_geometry as load_geometry
+
+    return load_geometry(dataset_path(repo_root, "venue_geometry"))
+
+
 def load_moneylines(repo_root: Path) -> pd.DataFrame:
     """Load the historical moneylines dataset."""
     return load_csv(repo_root, "moneylines")
@@ -11,7 +11,9 @@ DatasetKey = Literal[
     "schedule_upcoming_rich",
     "weather_enriched",
     "elo_state",
+    "elo_matrix",
     "stadiums",
+    "venue_geometry",
     "moneylines",
     "team_metadata",
     "epa_by_game",
@@ -28,6 +30,8 @@ DatasetKey = Literal[
     "predictions_csv",
     "elo_rankings_csv",
     "weekly_products",
+    # ---- Materialized evaluation join ----
+    "evaluation_joined",
 ]
 
 
@@ -53,12 +57,14 @@ DATASETS: dict[DatasetKey, DatasetSpec] = {
     "schedule_upcoming_rich": DatasetSpec("data/cleaned/NFL_upcoming_schedule_rich.parquet"),
     "weather_enriched": DatasetSpec("data/cleaned/NFL_wk_by_wk_w_weather.csv"),
     "stadiums": DatasetSpec("data/cleaned/NFL_stadium_reference.csv"),
+    "venue_geometry": DatasetSpec("data/cleaned/NFL_venue_geometry.npz"),
     "moneylines": DatasetSpec("data/cleaned/NFL_historical_moneylines.csv"),
     "team_metadata": DatasetSpec("data/cleaned/NFL_team_metadata.csv"),
     "epa_by_game": DatasetSpec("data/cleaned/epa_by_game.parquet"),
     "player_game_logs": DatasetSpec("data/cleaned/player_game_logs.parquet"),
     # ---- Ratings / state ----
     "elo_state": DatasetSpec("data/cleaned/NFL_Team_Elo.csv"),
+    "elo_matrix": DatasetSpec("data/cleaned/NFL_Team_Elo_matrix.npz"),
     # ---- Derived modeling artifacts ----
     "modeling_base": DatasetSpec("data/modeling/base_modeling_file.parquet"),
     "modeling_full": DatasetSpec("data/modeling/modeling_file.parquet"),
@@ -71,6 +77,8 @@ DATASETS: dict[DatasetKey, DatasetSpec] = {
     "predictions_csv": DatasetSpec("data/output/predictions"),
     "elo_rankings_csv": DatasetSpec("data/output/rankings"),
     "weekly_products": DatasetSpec("data/output/weekly_products"),
+    # ---- Materialized evaluation join (partitioned directory) ----
+    "evaluation_joined": DatasetSpec("data/output/evaluation/evaluation_joined"),
 }
 
 
@@ -8,6 +8,7 @@ import pandas as pd
 
 from gridiron_edge.evaluation.forecast_contracts import WeeklyProductIdentity
 
+from .columnar import refresh_columnar_twin
 from .registry import DatasetKey, dataset_path
 
 
@@ -21,7 +22,8 @@ def write_csv(
 ) -> Path:
     """Write a DataFrame to the registered path for a dataset key.
 
-    Creates any missing parent directories before writing.
+    Creates any missing parent directories before writing. If the dataset
+    already has a typed Parquet twin, the twin is refreshed from the new CSV.
 
     Args:
         repo_root: Absolute path to the repository root.
@@ -38,6 +40,7 @@ def write_csv(
     path: Path = dataset_path(repo_root, key)
     path.parent.mkdir(parents=True, exist_ok=True)
     df.to_csv(path, index=index, **to_csv_kwargs)
+    refresh_columnar_twin(repo_root, key)
     return path
 
 
@@ -47,6 +47,7 @@ import pandas as pd
 from pandas import DataFrame
 
 from gridiron_edge.core.settings import get_settings
+from gridiron_edge.evaluation.joined import refresh_evaluation_joined
 
 logger: Logger = logging.getLogger(__name__)
 
@@ -213,6 +214,7 @@ def write_archive_rows(
         len(normalized_new),
         path,
     )
+    refresh_evaluation_joined(repo)
     return path
 
 
@@ -0,0 +1,261 @@
+# src/gridiron_edge/evaluation/joined.py
+
+"""Materialized ``evaluation_joined`` dataset.
+
+``build_evaluation_df`` joins the whole prediction log to the whole games
+table on every call. This module keeps that join on disk, partitioned by
+model pair and season, so readers load only the slice they filter on:
+
+    data/output/evaluation/evaluation_joined/
+        _manifest.json
+        <model_name>/<model_type>/<season>.parquet
+
+The manifest records the size and mtime of the two inputs (prediction log
+and canonical games table) plus a content digest per partition.
+:func:`refresh_evaluation_joined` is a no-op while the inputs are
+unchanged; otherwise it redoes the (vectorized) join and rewrites only the
+partitions whose rows changed - a newly archived week touches one season of
+one pair, a finished game touches one season of every pair that predicted
+it. :func:`load_evaluation_joined` returns ``None`` for a missing or stale
+store, so callers fall back to the live join and never read stale rows.
+
+The archive writer and the games cleaner refresh the store after each write.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import logging
+from logging import Logger
+from pathlib import Path
+from typing import Final
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from gridiron_edge.core.settings import get_settings
+from gridiron_edge.datasets.registry import dataset_path
+
+logger: Logger = logging.getLogger(__name__)
+
+EVALUATION_COLUMNS: Final[list[str]] = [
+    "game_id",
+    "season",
+    "week",
+    "away_team",
+    "home_team",
+    "away_win_prob",
+    "away_team_won",
+    "model_name",
+    "model_type",
+]
+
+# Partition key, in directory order.
+PARTITION_COLUMNS: Final[list[str]] = ["model_name", "model_type", "season"]
+
+# Row order of the prediction archive, kept by every reader.
+_SORT_COLUMNS: Final[list[str]] = ["season", "week", "game_id", "model_name", "model_type"]
+
+_MANIFEST_NAME: Final[str] = "_manifest.json"
+
+PartitionKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class RefreshResult:
+    """Outcome of one :func:`refresh_evaluation_joined` call.
+
+    Attributes:
+        written: Partitions rewritten because their rows changed.
+        removed: Partitions deleted because they no longer have rows.
+        unchanged: Partitions left as they were.
+        skipped: True when nothing was read - the inputs were unchanged, or
+            there is neither a store nor a prediction log yet.
+    """
+
+    written: list[PartitionKey] = field(default_factory=list)
+    removed: list[PartitionKey] = field(default_factory=list)
+    unchanged: int = 0
+    skipped: bool = False
+
+
+def join_outcomes(log: DataFrame, games: DataFrame) -> DataFrame:
+    """Join prediction-log rows to away-oriented outcomes from *games*.
+
+    Args:
+        log: Prediction archive rows.
+        games: Canonical games table (``GAME_ID``, ``AWAY_SCORE``,
+            ``HOME_SCORE``).
+
+    Returns:
+        Evaluation rows with ``away_team_won`` of 1.0, 0.0, or 0.5 (tie).
+        Unplayed games are dropped.
+    """
+    away = pd.to_numeric(games["AWAY_SCORE"], errors="coerce").to_numpy(dtype=float)
+    home = pd.to_numeric(games["HOME_SCORE"], errors="coerce").to_numpy(dtype=float)
+    scored = ~(np.isnan(away) | np.isnan(home))
+    outcome = np.where(away > home, 1.0, np.where(away == home, 0.5, 0.0))
+    outcomes = pd.Series(
+        outcome[scored],
+        index=games["GAME_ID"].astype(str).to_numpy()[scored],
+    )
+    outcomes = outcomes[~outcomes.index.duplicated(keep="last")]
+
+    joined = log.assign(away_team_won=log["game_id"].astype(str).map(outcomes))
+    joined = joined.dropna(subset=["away_team_won"])
+    joined["away_team_won"] = joined["away_team_won"].astype(float)
+    available = [c for c in EVALUATION_COLUMNS if c in joined.columns]
+    return joined.loc[:, available].reset_index(drop=True)
+
+
+def evaluation_joined_dir(repo: Path | None = None) -> Path:
+    """Return the store directory (not created)."""
+    return dataset_path(repo or get_settings().repo_root, "evaluation_joined")
+
+
+def refresh_evaluation_joined(repo: Path | None = None, *, force: bool = False) -> RefreshResult:
+    """Bring the materialized store up to date with its inputs.
+
+    Args:
+        repo: Repository root. Defaults to ``get_settings().repo_root``.
+        force: Rebuild even if the input fingerprints are unchanged.
+
+    Returns:
+        What was written, removed, and kept.
+    """
+    from gridiron_edge.datasets import loaders
+    from gridiron_edge.evaluation.archive import load_prediction_log
+
+    resolved_repo: Path = repo or get_settings().repo_root
+    directory = evaluation_joined_dir(resolved_repo)
+    manifest = _read_manifest(directory)
+    sources = _source_fingerprints(resolved_repo)
+    if manifest is None and sources["prediction_log"] is None:
+        return RefreshResult(skipped=True)
+    if not force and manifest is not None and manifest["sources"] == sources:
+        return RefreshResult(unchanged=len(manifest["partitions"]), skipped=True)
+
+    log = load_prediction_log(repo=resolved_repo)
+    games_path = dataset_path(resolved_repo, "games")
+    if log.empty or not games_path.exists():
+        joined = DataFrame(columns=EVALUATION_COLUMNS)
+    else:
+        joined = join_outcomes(log, loaders.load_games(resolved_repo))
+
+    previous: dict[str, str] = {} if manifest is None else dict(manifest["partitions"])
+    digests: dict[str, str] = {}
+    written: list[PartitionKey] = []
+    unchanged = 0
+    directory.mkdir(parents=True, exist_ok=True)
+    for key, group in joined.groupby(PARTITION_COLUMNS, sort=True):
+        partition: PartitionKey = (str(key[0]), str(key[1]), str(key[2]))
+        name = "/".join(partition)
+        rows = group.sort_values(_SORT_COLUMNS, kind="stable").reset_index(drop=True)
+        digests[name] = _digest(rows)
+        path = _partition_path(directory, partition)
+        if previous.get(name) == digests[name] and path.exists():
+            unchanged += 1
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rows.to_parquet(path, index=False)
+        written.append(partition)
+
+    removed: list[PartitionKey] = []
+    for name in sorted(set(previous) - set(digests)):
+        model_name, model_type, season = name.split("/")
+        partition = (model_name, model_type, season)
+        _partition_path(directory, partition).unlink(missing_ok=True)
+        removed.append(partition)
+
+    _write_manifest(directory, {"sources": sources, "partitions": digests})
+    logger.info(
+        "evaluation_joined: %d written, %d removed, %d unchanged -> %s",
+        len(written),
+        len(removed),
+        unchanged,
+        directory,
+    )
+    return RefreshResult(written=written, removed=removed, unchanged=unchanged)
+
+
+def load_evaluation_joined(
+    *,
+    model_name: str | None = None,
+    model_type: str | None = None,
+    season: str | None = None,
+    repo: Path | None = None,
+) -> DataFrame | None:
+    """Read the partitions matching the filters from the materialized store.
+
+    Args:
+        model_name: Model purpose filter. ``None`` reads every purpose.
+        model_type: Model algorithm filter. ``None`` reads every algorithm.
+        season: Season filter (e.g. ``"2024-2025"``). ``None`` reads every
+            season.
+        repo: Repository root. Defaults to ``get_settings().repo_root``.
+
+    Returns:
+        Evaluation rows in archive order, or ``None`` when the store is
+        missing or older than its inputs.
+    """
+    resolved_repo: Path = repo or get_settings().repo_root
+    directory = evaluation_joined_dir(resolved_repo)
+    manifest = _read_manifest(directory)
+    if manifest is None or manifest["sources"] != _source_fingerprints(resolved_repo):
+        return None
+
+    wanted = (model_name, model_type, season)
+    paths = [
+        _partition_path(directory, tuple(name.split("/")))  # type: ignore[arg-type]
+        for name in sorted(manifest["partitions"])
+        if all(f is None or f == part for f, part in zip(wanted, name.split("/"), strict=True))
+    ]
+    if not paths:
+        return DataFrame(columns=EVALUATION_COLUMNS)
+    frames = [pd.read_parquet(path) for path in paths]
+    result = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return result.sort_values(_SORT_COLUMNS, kind="stable").reset_index(drop=True)
+
+
+def _partition_path(directory: Path, partition: PartitionKey) -> Path:
+    model_name, model_type, season = partition
+    return directory / model_name / model_type / f"{season}.parquet"
+
+
+def _digest(rows: DataFrame) -> str:
+    """Return a content digest of *rows* (order-sensitive)."""
+    hashed = pd.util.hash_pandas_object(rows, index=False).to_numpy()
+    return f"{len(rows)}:{int(hashed.sum(dtype=np.uint64))}:{int(np.bitwise_xor.reduce(hashed))}"
+
+
+def _source_fingerprints(repo: Path) -> dict[str, list[int] | None]:
+    """Return ``[size, mtime_ns]`` per input, or ``None`` if it is missing."""
+    fingerprints: dict[str, list[int] | None] = {}
+    for key in ("prediction_log", "games"):
+        path = dataset_path(repo, key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            fingerprints[key] = None
+            continue
+        fingerprints[key] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprints
+
+
+def _read_manifest(directory: Path) -> dict | None:
+    path = directory / _MANIFEST_NAME
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.warning("evaluation_joined: unreadable manifest %s; rebuilding", path)
+        return None
+
+
+def _write_manifest(directory: Path, manifest: dict) -> None:
+    tmp = directory / f"{_MANIFEST_NAME}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(directory / _MANIFEST_NAME)
@@ -42,12 +42,12 @@ from typing import Any, Final
 
 import numpy as np
 from numpy import dtype, float64, ndarray, signedinteger
-import pandas as pd
 from pandas import DataFrame, Series
 
 from gridiron_edge.core.settings import get_settings
 from gridiron_edge.datasets import loaders
 from gridiron_edge.evaluation.archive import load_prediction_log
+from gridiron_edge.evaluation.joined import join_outcomes, load_evaluation_joined
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -246,9 +246,12 @@ def build_evaluation_df(
 ) -> DataFrame:
     """Join the prediction archive to game outcomes.
 
-    Loads the prediction log, joins to the canonical games table to obtain
-    outcomes, and returns a clean evaluation DataFrame.  Missing outcomes
-    (upcoming games) are dropped.
+    Reads the matching partitions of the materialized ``evaluation_joined``
+    store when it is current (see ``evaluation/joined.py``), so a filtered
+    call only loads its own model pair and season.  Otherwise loads the
+    prediction log, joins to the canonical games table to obtain outcomes,
+    and returns a clean evaluation DataFrame.  Missing outcomes (upcoming
+    games) are dropped.
 
     Args:
         model_name: Filter to a specific model purpose (e.g. ``"win_prob"``).
@@ -268,6 +271,15 @@ def build_evaluation_df(
     """
     resolved_repo: Path = repo or get_settings().repo_root
 
+    materialized: DataFrame | None = load_evaluation_joined(
+        model_name=model_name,
+        model_type=model_type,
+        season=season,
+        repo=resolved_repo,
+    )
+    if materialized is not None:
+        return materialized
+
     log: DataFrame = load_prediction_log(
         model_name=model_name,
         model_type=model_type,
@@ -280,60 +292,7 @@ def build_evaluation_df(
 
     # Join outcomes from canonical games table
     games: DataFrame = loaders.load_games(resolved_repo)
-
-    # Build an Away-oriented outcome directly from canonical scores.
-    scored_games = games.dropna(
-        subset=[
-            "AWAY_SCORE",
-            "HOME_SCORE",
-        ]
-    ).copy()
-
-    away_scores = pd.to_numeric(
-        scored_games["AWAY_SCORE"],
-        errors="coerce",
-    )
-    home_scores = pd.to_numeric(
-        scored_games["HOME_SCORE"],
-        errors="coerce",
-    )
-
-    scored_games["away_team_won"] = 0.0
-    scored_games.loc[
-        away_scores > home_scores,
-        "away_team_won",
-    ] = 1.0
-    scored_games.loc[
-        away_scores == home_scores,
-        "away_team_won",
-    ] = 0.5
-
-    # pyrefly: ignore [bad-assignment]
-    outcome_map: dict[str, float] = dict(
-        zip(
-            scored_games["GAME_ID"].astype(str),
-            scored_games["away_team_won"].astype(float),
-            strict=True,
-        )
-    )
-
-    log["away_team_won"] = log["game_id"].map(outcome_map)
-    log = log.dropna(subset=["away_team_won"]).copy()
-    log["away_team_won"] = log["away_team_won"].astype(float)
-
-    cols: list[str] = [
-        "game_id",
-        "season",
-        "week",
-        "away_team",
-        "home_team",
-        "away_win_prob",
-        "away_team_won",
-        "model_name",
-        "model_type",
-    ]
-    available: list[str] = [c for c in cols if c in log.columns]
-    return log.loc[:, available].reset_index(drop=True)
+    return join_outcomes(log, games)
 
 
 # ---------------------------------------------------------------------------
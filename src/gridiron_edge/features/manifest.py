@@ -73,7 +73,7 @@ CURRENT_SCHEMA_VERSION: int = 5
 #
 # When this is bumped, the next incremental build will detect the mismatch
 # and force a full rebuild instead of preserving stale rows.
-CURRENT_DATA_VERSION: int = 2
+CURRENT_DATA_VERSION: int = 3
 
 _MANIFEST_FILENAME: str = "modeling_file_manifest.json"
 
@@ -91,6 +91,7 @@ def write_manifest(
     modeling_dir: Path,
     schema_version: int = CURRENT_SCHEMA_VERSION,
     data_version: int = CURRENT_DATA_VERSION,
+    feature_profile: list[dict[str, Any]] | None = None,
 ) -> Path:
     """Write a feature set manifest alongside the modeling file.
 
@@ -111,6 +112,9 @@ def write_manifest(
             would differ from a fresh rebuild. Incremental builds compare
             this against ``CURRENT_DATA_VERSION`` and force a full rebuild
             on mismatch.
+        feature_profile: Optional per-feature profile records from
+            ``FeatureProfiler.to_records()``. Stored under
+            ``feature_profile`` when given.
 
     Returns:
         Absolute path to the written manifest file.
@@ -124,6 +128,8 @@ def write_manifest(
         "all_columns": df.columns.tolist(),
         "row_count": len(df),
     }
+    if feature_profile is not None:
+        manifest["feature_profile"] = feature_profile
 
     path: Path = _manifest_path(modeling_dir)
     path.write_text(json.dumps(manifest, indent=2))
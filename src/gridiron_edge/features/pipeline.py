@@ -18,6 +18,7 @@ from gridiron_edge.features.manifest import (
     read_manifest,
     write_manifest,
 )
+from gridiron_edge.features.profiling import FeatureProfile, FeatureProfiler
 from gridiron_edge.features.registry import FeatureRegistry, run_features, validate_ordering
 
 # Side-effect imports: each module registers its feature class with
@@ -326,7 +327,12 @@ def _modeling_artifact_is_stale(
     return schema_version != CURRENT_SCHEMA_VERSION or data_version != CURRENT_DATA_VERSION
 
 
-def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
+def build_model_inputs(
+    *,
+    all_years: bool,
+    repo: Path | None = None,
+    profile: bool = False,
+) -> list[FeatureProfile]:
     """Build canonical modeling inputs as Parquet artifacts.
 
     Produces one Away/Home-oriented row per completed game.
@@ -334,9 +340,18 @@ def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
     When ``all_years`` is true, performs a full canonical rebuild.
     Otherwise, appends unseen game IDs when the persisted schema and
     data versions match, or performs a full rebuild when they do not.
+
+    When ``profile`` is true, each feature is timed and its peak RSS
+    growth, row counts, and dataset loads are recorded in the manifest
+    under ``feature_profile``.
+
+    Returns:
+        Per-feature profiles in pipeline order; empty when ``profile`` is
+        false or no rows needed features.
     """
     repo = repo or repo_root()
     datasets = DatasetAccessor(repo)
+    profiler: FeatureProfiler | None = FeatureProfiler() if profile else None
 
     games: pd.DataFrame = loaders.load_games(repo)
 
@@ -352,6 +367,7 @@ def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
             df=base_out,
             feature_names=CANONICAL_FEATURES,
             datasets=datasets,
+            profiler=profiler,
         )
         writers.write_parquet(repo, "modeling_base", base_out)
         writers.write_parquet(repo, "modeling_full", full_out)
@@ -360,8 +376,9 @@ def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
             feature_names=list(CANONICAL_FEATURES),
             feature_columns=(canonical_feature_columns()),
             modeling_dir=full_path.parent,
+            feature_profile=None if profiler is None else profiler.to_records(),
         )
-        return
+        return [] if profiler is None else profiler.profiles
 
     # Incremental build: only process unseen GAME_ID rows
     base_existing: pd.DataFrame | None = load_parquet_if_exists(base_path)
@@ -372,6 +389,7 @@ def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
             df=base_out,
             feature_names=CANONICAL_FEATURES,
             datasets=datasets,
+            profiler=profiler,
         )
         writers.write_parquet(
             repo,
@@ -388,8 +406,9 @@ def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
             feature_names=list(CANONICAL_FEATURES),
             feature_columns=(canonical_feature_columns()),
             modeling_dir=full_path.parent,
+            feature_profile=None if profiler is None else profiler.to_records(),
         )
-        return
+        return [] if profiler is None else profiler.profiles
 
     # Check whether the existing modeling file's data_version matches the
     # current code. If not, incremental updates would silently preserve
@@ -411,6 +430,7 @@ def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
             df=base_out,
             feature_names=CANONICAL_FEATURES,
             datasets=datasets,
+            profiler=profiler,
         )
         writers.write_parquet(
             repo,
@@ -427,8 +447,9 @@ def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
             feature_names=list(CANONICAL_FEATURES),
             feature_columns=(canonical_feature_columns()),
             modeling_dir=full_path.parent,
+            feature_profile=None if profiler is None else profiler.to_records(),
         )
-        return
+        return [] if profiler is None else profiler.profiles
 
     existing_game_ids: set = set(base_existing["GAME_ID"].unique().tolist())
     new_mask: pd.Series = ~base_all["GAME_ID"].isin(existing_game_ids)
@@ -446,12 +467,13 @@ def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
                 feature_columns=(canonical_feature_columns()),
                 modeling_dir=full_path.parent,
             )
-        return
+        return []
 
     full_new: pd.DataFrame = run_features(
         df=base_new,
         feature_names=CANONICAL_FEATURES,
         datasets=datasets,
+        profiler=profiler,
     )
 
     base_out = (
@@ -517,4 +539,6 @@ def build_model_inputs(*, all_years: bool, repo: Path | None = None) -> None:
         feature_names=list(CANONICAL_FEATURES),
         feature_columns=(canonical_feature_columns()),
         modeling_dir=full_path.parent,
+        feature_profile=None if profiler is None else profiler.to_records(),
     )
+    return [] if profiler is None else profiler.profiles
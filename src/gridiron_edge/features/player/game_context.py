@@ -38,6 +38,8 @@ from pandas import DataFrame, Series
 from gridiron_edge.core.constants import TEAM_CODE_NORMALIZATION as _TEAM_CODE_MAP
 from gridiron_edge.core.enums import DOME_LIKE_ROOFS
 from gridiron_edge.core.settings import get_settings
+from gridiron_edge.datasets.columnar import read_table
+from gridiron_edge.features.team.rest import days_since_previous_game
 
 logger: Logger = logging.getLogger(__name__)
 
@@ -110,7 +112,7 @@ def _load_games(repo: Path) -> DataFrame:
         msg = f"Cleaned games data not found: {games_path}"
         raise FileNotFoundError(msg)
 
-    df: DataFrame = pd.read_csv(games_path)
+    df: DataFrame = read_table(games_path)
     keep_cols: list[str] = [
         "GAME_ID",
         "VEGAS_LINE",
@@ -215,19 +217,26 @@ def _derive_dome(df: DataFrame) -> DataFrame:
 def _derive_rest_days(df: DataFrame) -> DataFrame:
     """Compute calendar days since the team's previous game.
 
+    Uses the same strictly-earlier ``merge_asof`` as the team rest feature
+    (:func:`~gridiron_edge.features.team.rest.days_since_previous_game`),
+    with the team's game dates taken from the player rows. Every player on
+    a team therefore gets the same rest for a game.
+
     Crosses season boundaries intentionally - a team's first game of a
     new season shows ~200 days rest (meaningful signal for the model).
     Week 1 of the earliest season in the data will be NaN.
     """
-    df["_game_date"] = pd.to_datetime(df["GAME_DATE"])
-    df = df.sort_values(["team", "_game_date"])
-
-    df["_prev_game_date"] = df.groupby("team")["_game_date"].shift(1)
-    # pyrefly: ignore [missing-attribute]
-    df["rest_days"] = (df["_game_date"] - df["_prev_game_date"]).dt.days
+    game_dates = pd.to_datetime(df["GAME_DATE"])
+    df = df.assign(_game_date=game_dates).sort_values(["team", "_game_date"])
+
+    df["rest_days"] = days_since_previous_game(
+        df["team"],
+        df["_game_date"],
+        history_teams=df["team"],
+        history_dates=df["_game_date"],
+    )
 
-    df = df.drop(columns=["_prev_game_date", "_game_date"])
-    return df
+    return df.drop(columns=["_game_date"])
 
 
 def _drop_raw_game_columns(df: DataFrame) -> DataFrame:
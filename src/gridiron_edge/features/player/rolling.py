@@ -10,6 +10,9 @@ for week N reflect only games through week N-1.
 Rolling windows operate on game count (not week number), so bye weeks
 are handled naturally. Windows do NOT cross season boundaries by default.
 
+All windows and stats are computed by one numba kernel over the sorted
+frame, so cost grows with rows, not with windows x stats x aggregations.
+
 Usage::
 
     from gridiron_edge.features.player.rolling import build_player_rolling_features
@@ -24,6 +27,8 @@ from logging import Logger
 from pathlib import Path
 from typing import Final
 
+from numba import njit
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -76,6 +81,63 @@ _RECEIVING_STATS: Final[list[str]] = [
 ROLLING_STAT_COLS: Final[list[str]] = _PASSING_STATS + _RUSHING_STATS + _RECEIVING_STATS
 
 
+@njit(cache=True)
+def _shifted_rolling_kernel(
+    values: np.ndarray,
+    group_ids: np.ndarray,
+    windows: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Shifted rolling mean and sample std for every window and stat column.
+
+    Rows must be sorted so each group is contiguous. Row ``i`` aggregates the
+    non-NaN values of rows ``i - window .. i - 1`` in the same group, which is
+    ``shift(1).rolling(window, min_periods=1)`` evaluated in one pass.
+
+    Args:
+        values: ``(n_rows, n_stats)`` float64 stat matrix.
+        group_ids: ``(n_rows,)`` contiguous group codes; negative means the
+            row has a null group key and gets NaN outputs.
+        windows: ``(n_windows,)`` window sizes.
+
+    Returns:
+        ``(means, stds)``, each shaped ``(n_windows, n_rows, n_stats)``.
+    """
+    n_rows, n_stats = values.shape
+    n_windows = windows.shape[0]
+    means = np.full((n_windows, n_rows, n_stats), np.nan)
+    stds = np.full((n_windows, n_rows, n_stats), np.nan)
+
+    group_start = 0
+    for i in range(n_rows):
+        if i == 0 or group_ids[i] != group_ids[i - 1]:
+            group_start = i
+        if group_ids[i] < 0:
+            continue
+        for w in range(n_windows):
+            lo = max(group_start, i - windows[w])
+            for s in range(n_stats):
+                count = 0
+                total = 0.0
+                for j in range(lo, i):
+                    v = values[j, s]
+                    if not np.isnan(v):
+                        count += 1
+                        total += v
+                if count == 0:
+                    continue
+                mean = total / count
+                means[w, i, s] = mean
+                if count < 2:
+                    continue
+                ssq = 0.0
+                for j in range(lo, i):
+                    v = values[j, s]
+                    if not np.isnan(v):
+                        ssq += (v - mean) * (v - mean)
+                stds[w, i, s] = np.sqrt(ssq / (count - 1))
+    return means, stds
+
+
 def _compute_rolling(
     df: DataFrame,
     *,
@@ -84,6 +146,11 @@ def _compute_rolling(
 ) -> DataFrame:
     """Compute shifted rolling mean and std for each player.
 
+    Sorts once by (player_id, season, week) and evaluates every window and
+    stat in a single pass of :func:`_shifted_rolling_kernel` over contiguous
+    group boundaries, instead of regrouping the frame per window and
+    aggregation.
+
     Args:
         df: Player game logs sorted by (player_id, season, week).
         windows: List of rolling window sizes (e.g. [3, 6]).
@@ -109,35 +176,24 @@ def _compute_rolling(
     if not available_stats:
         return df
 
-    # Shift once: each row's stats become the prior row's values within group.
-    # This produces NaN for the first row of each group (which becomes week 1's
-    # "no prior data" condition after the rolling reduction).
-    shifted = df.groupby(group_cols, sort=False)[available_stats].shift(1)
-
-    # For each window, compute rolling mean and std on the shifted frame.
-    # We group again because rolling needs the group context to reset at
-    # group boundaries.
-    for window in windows:
-        rolled_grouped = shifted.groupby(
-            df[group_cols[0]] if len(group_cols) == 1 else [df[c] for c in group_cols], sort=False
-        )
-
-        means = rolled_grouped.rolling(window=window, min_periods=1).mean()
-        stds = rolled_grouped.rolling(window=window, min_periods=1).std()
-
-        # rolling() adds the group keys as outer index levels. Drop them so
-        # the result aligns with df by position.
-        means = means.reset_index(level=list(range(len(group_cols))), drop=True)
-        stds = stds.reset_index(level=list(range(len(group_cols))), drop=True)
-
-        # Sort to match df's index ordering (rolling can reorder by group)
-        means = means.sort_index()
-        stds = stds.sort_index()
-
-        # Assign all stat columns for this window at once
-        for stat in available_stats:
-            df[f"{stat}_L{window}_mean"] = means[stat]
-            df[f"{stat}_L{window}_std"] = stds[stat]
+    # Groups are contiguous after the sort; null keys get code -1 (NaN output),
+    # matching the groupby default of dropping null keys.
+    group_ids: np.ndarray = df.groupby(group_cols, sort=False).ngroup().to_numpy(dtype=np.int64)
+    values: np.ndarray = np.ascontiguousarray(
+        df[available_stats].to_numpy(dtype=np.float64, na_value=np.nan)
+    )
+    means, stds = _shifted_rolling_kernel(values, group_ids, np.asarray(windows, dtype=np.int64))
+
+    # Column order matches the historical per-window assignment:
+    # {stat}_L{w}_mean, {stat}_L{w}_std for each stat, window by window.
+    blocks: dict[str, np.ndarray] = {}
+    for w_idx, window in enumerate(windows):
+        for s_idx, stat in enumerate(available_stats):
+            blocks[f"{stat}_L{window}_mean"] = means[w_idx, :, s_idx]
+            blocks[f"{stat}_L{window}_std"] = stds[w_idx, :, s_idx]
+
+    rolled = DataFrame(blocks, index=df.index)
+    df = pd.concat([df.drop(columns=list(rolled.columns), errors="ignore"), rolled], axis=1)
 
     n_new_cols: int = len(available_stats) * len(windows) * 2
     logger.info(
@@ -0,0 +1,169 @@
+# src/gridiron_edge/features/profiling.py
+
+"""Per-feature instrumentation for ``run_features``.
+
+A :class:`FeatureProfiler` passed to ``run_features`` records, for every
+feature in order:
+
+- wall time of ``Feature.compute``;
+- peak memory the feature allocated above its starting level;
+- rows in and rows out;
+- every ``DatasetAccessor`` load the feature made, with its load time.
+
+Dataset loads are captured by handing each feature a recording proxy around
+the real accessor, so features themselves need no changes. Profiles are
+written into the feature manifest under ``feature_profile`` and rendered as a
+ranked table by ``gridiron features model-inputs --profile``.
+
+Peak memory comes from ``tracemalloc``: tracing is reset at the start of each
+feature, so every feature reports its own high-water mark rather than the
+process lifetime peak. It covers Python objects and NumPy/pandas buffers;
+memory allocated natively by Arrow or compiled estimators is not traced.
+Tracing slows allocation, which also inflates the recorded wall times.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from gridiron_edge.datasets.accessor import DatasetAccessor
+
+
+@dataclass(frozen=True)
+class DatasetLoad:
+    """One ``DatasetAccessor`` call made by a feature.
+
+    Attributes:
+        dataset: Accessor method name (e.g. ``"games"``).
+        seconds: Wall time of the load.
+        rows: Rows returned, or ``None`` when the load raised.
+    """
+
+    dataset: str
+    seconds: float
+    rows: int | None
+
+
+@dataclass(frozen=True)
+class FeatureProfile:
+    """Timing and memory profile of one feature computation.
+
+    Attributes:
+        name: Registered feature key.
+        seconds: Wall time of ``Feature.compute``, dataset loads included.
+        peak_memory_bytes: Peak traced memory allocated during the feature,
+            above what was allocated when it started.
+        rows_in: Rows of the frame passed to the feature.
+        rows_out: Rows of the frame the feature returned.
+        dataset_loads: Accessor loads made by the feature, in call order.
+    """
+
+    name: str
+    seconds: float
+    peak_memory_bytes: int
+    rows_in: int
+    rows_out: int
+    dataset_loads: tuple[DatasetLoad, ...] = ()
+
+    @property
+    def dataset_seconds(self) -> float:
+        """Total wall time spent in dataset loads."""
+        return sum(load.seconds for load in self.dataset_loads)
+
+    def to_record(self) -> dict[str, Any]:
+        """Return a JSON-serializable record for the feature manifest."""
+        record: dict[str, Any] = asdict(self)
+        record["dataset_loads"] = [asdict(load) for load in self.dataset_loads]
+        return record
+
+
+@dataclass
+class FeatureProfiler:
+    """Collects :class:`FeatureProfile` entries across ``run_features`` calls."""
+
+    profiles: list[FeatureProfile] = field(default_factory=list)
+
+    def run(
+        self,
+        name: str,
+        compute: Callable[..., pd.DataFrame],
+        *,
+        df: pd.DataFrame,
+        datasets: DatasetAccessor,
+    ) -> pd.DataFrame:
+        """Run one feature's ``compute`` and record its profile.
+
+        Args:
+            name: Registered feature key.
+            compute: Bound ``Feature.compute`` method.
+            df: Input frame passed to ``compute``.
+            datasets: Accessor the feature would normally receive.
+
+        Returns:
+            The frame returned by ``compute``.
+        """
+        recorder = _RecordingAccessor(datasets)
+        # Leave tracing running if the caller enabled it for their own use.
+        owns_tracing = not tracemalloc.is_tracing()
+        if owns_tracing:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            traced_before, _ = tracemalloc.get_traced_memory()
+            start = time.perf_counter()
+            out = compute(df=df, datasets=recorder)
+            seconds = time.perf_counter() - start
+            _, traced_peak = tracemalloc.get_traced_memory()
+        finally:
+            if owns_tracing:
+                tracemalloc.stop()
+
+        self.profiles.append(
+            FeatureProfile(
+                name=name,
+                seconds=seconds,
+                peak_memory_bytes=max(traced_peak - traced_before, 0),
+                rows_in=len(df),
+                rows_out=len(out),
+                dataset_loads=tuple(recorder.loads),
+            )
+        )
+        return out
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Return manifest records in pipeline order."""
+        return [profile.to_record() for profile in self.profiles]
+
+
+class _RecordingAccessor:
+    """Proxy around a ``DatasetAccessor`` that times every method call."""
+
+    def __init__(self, inner: DatasetAccessor) -> None:
+        self._inner = inner
+        self.loads: list[DatasetLoad] = []
+
+    def __getattr__(self, attr: str) -> Any:  # noqa: ANN401
+        value = getattr(self._inner, attr)
+        if attr.startswith("_") or not callable(value):
+            return value
+
+        def timed(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            start = time.perf_counter()
+            rows: int | None = None
+            try:
+                result = value(*args, **kwargs)
+                rows = len(result) if hasattr(result, "__len__") else None
+                return result
+            finally:
+                self.loads.append(
+                    DatasetLoad(dataset=attr, seconds=time.perf_counter() - start, rows=rows)
+                )
+
+        return timed
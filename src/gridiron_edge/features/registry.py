@@ -12,6 +12,8 @@ from .base import Feature
 if TYPE_CHECKING:
     from gridiron_edge.datasets.accessor import DatasetAccessor
 
+    from .profiling import FeatureProfiler
+
 
 class FeatureRegistry:
     """Registry mapping feature names to their implementing classes.
@@ -71,6 +73,7 @@ def run_features(
     df: pd.DataFrame,
     feature_names: Sequence[str],
     datasets: DatasetAccessor,
+    profiler: FeatureProfiler | None = None,
 ) -> pd.DataFrame:
     """Apply a sequence of named features to a DataFrame in order.
 
@@ -78,13 +81,19 @@ def run_features(
         df: The input modeling DataFrame.
         feature_names: Ordered list of feature keys to apply.
         datasets: A ``DatasetAccessor``-compatible object passed to each feature.
+        profiler: Optional profiler that records wall time, peak RSS growth,
+            row counts, and dataset loads for each feature.
 
     Returns:
         The DataFrame with all requested features computed and appended.
     """
     out: pd.DataFrame = df
     for name in feature_names:
-        out = FeatureRegistry.get(name)().compute(df=out, datasets=datasets)
+        feature = FeatureRegistry.get(name)()
+        if profiler is None:
+            out = feature.compute(df=out, datasets=datasets)
+        else:
+            out = profiler.run(name, feature.compute, df=out, datasets=datasets)
     return out
 
 
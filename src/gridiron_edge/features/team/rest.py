@@ -12,11 +12,11 @@ All outputs use stable Away/Home identity, and the rest differential is:
 
 from __future__ import annotations
 
-from bisect import bisect_left
 from typing import TYPE_CHECKING, Final
 
+import numpy as np
 import pandas as pd
-from pandas import DataFrame
+from pandas import DataFrame, Series
 
 from gridiron_edge.features.base import FeatureSpec
 from gridiron_edge.features.registry import FeatureRegistry
@@ -52,7 +52,10 @@ _HOME_AWAY_REST_COLUMNS: Final[tuple[str, ...]] = (
     "DAYS_REST_DIFF",
 )
 
-type _RestScalar = str | float | int | pd.Timestamp | None
+_ROW: Final[str] = "_ROW"
+_TEAM: Final[str] = "_TEAM"
+_DATE: Final[str] = "_DATE"
+_PREVIOUS_DATE: Final[str] = "_PREVIOUS_DATE"
 
 
 def _require_home_away_rest_columns(
@@ -67,10 +70,10 @@ def _require_home_away_rest_columns(
         raise ValueError(f"{label} is missing required columns: " + ", ".join(missing))
 
 
-def _completed_team_dates(
+def _completed_team_games(
     games: DataFrame,
-) -> dict[str, list[pd.Timestamp]]:
-    """Build sorted completed-game dates for every team."""
+) -> DataFrame:
+    """Build one ``TEAM``/``_DATE`` row per completed team game."""
     _require_home_away_rest_columns(
         games,
         _HOME_AWAY_REST_HISTORY_COLUMNS,
@@ -133,47 +136,77 @@ def _completed_team_dates(
         # pyrefly: ignore [missing-attribute]
         & team_games["_DATE"].notna()
     )
-    team_games = team_games.loc[
-        valid,
-        :,
-    ].copy()
+    return DataFrame(
+        {
+            "TEAM": team_games.loc[valid, "TEAM"].astype(str).to_numpy(),
+            "_DATE": team_games.loc[valid, "_DATE"].to_numpy(),
+        }
+    )
 
-    return {
-        str(team): sorted(group["_DATE"].tolist())
-        for team, group in team_games.groupby(
-            "TEAM",
-            sort=False,
-        )
-    }
+
+def _target_team_keys(teams: Series) -> Series:
+    """Return stripped target team names, null where missing or blank."""
+    names = teams.astype("string").str.strip()
+    return names.where(names.ne(""))
 
 
-def _days_since_previous_game(
+def days_since_previous_game(
+    teams: Series,
+    dates: Series,
     *,
-    team: str | None,
-    game_date: pd.Timestamp | None,
-    history: dict[str, list[pd.Timestamp]],
-) -> float:
-    """Return days since the latest completed game before the target."""
-    if team is None or game_date is None:
-        return float("nan")
-
-    team_name = team.strip()
-    if not team_name:
-        return float("nan")
-
-    dates = history.get(
-        team_name,
-        [],
+    history_teams: Series,
+    history_dates: Series,
+) -> np.ndarray:
+    """Return days since each team's latest game strictly before each date.
+
+    Runs one ``merge_asof`` keyed by team (``allow_exact_matches=False``)
+    over all targets at once. A game on the target date itself never
+    counts as the previous game.
+
+    Args:
+        teams: Target team keys. Null keys yield ``NaN``.
+        dates: Target game dates as datetimes. ``NaT`` yields ``NaN``.
+        history_teams: Team key of each completed team game.
+        history_dates: Date of each completed team game. Null teams or
+            ``NaT`` dates are ignored.
+
+    Returns:
+        Float days of rest aligned with *teams*, ``NaN`` when the team has
+        no earlier game or the target is invalid.
+    """
+    result = np.full(len(teams), np.nan)
+    targets = DataFrame(
+        {
+            _ROW: np.arange(len(teams)),
+            _TEAM: teams.astype("string").to_numpy(),
+            _DATE: pd.to_datetime(dates).to_numpy(dtype="datetime64[ns]"),
+        }
+    ).dropna(subset=[_TEAM, _DATE])
+    history = (
+        DataFrame(
+            {
+                _TEAM: history_teams.astype("string").to_numpy(),
+                _DATE: pd.to_datetime(history_dates).to_numpy(dtype="datetime64[ns]"),
+            }
+        )
+        .dropna()
+        .drop_duplicates()
     )
-    index = bisect_left(
-        dates,
-        game_date,
+    if targets.empty or history.empty:
+        return result
+
+    history[_PREVIOUS_DATE] = history[_DATE]
+    matched = pd.merge_asof(
+        targets.sort_values(_DATE, kind="stable"),
+        history.sort_values(_DATE, kind="stable"),
+        on=_DATE,
+        by=_TEAM,
+        direction="backward",
+        allow_exact_matches=False,
     )
-    if index == 0:
-        return float("nan")
-
-    previous_date = dates[index - 1]
-    return float((game_date - previous_date).days)
+    rest = pd.to_timedelta(matched[_DATE] - matched[_PREVIOUS_DATE]).dt.days
+    result[matched[_ROW].to_numpy()] = rest.to_numpy(dtype=float, na_value=np.nan)
+    return result
 
 
 def _rest_flag(
@@ -231,7 +264,7 @@ class HomeAwayRestFeature:
             errors="ignore",
         )
 
-        history = _completed_team_dates(datasets.games())
+        history = _completed_team_games(datasets.games())
 
         target_dates = pd.to_datetime(
             source["GAME_DATE"],
@@ -239,33 +272,13 @@ class HomeAwayRestFeature:
             errors="coerce",
         )
 
-        source["AWAY_DAYS_REST"] = [
-            _days_since_previous_game(
-                team=(None if pd.isna(team) else str(team)),
-                game_date=(None if pd.isna(game_date) else game_date),
-                history=history,
-            )
-            for team, game_date in zip(
-                source["AWAY_TEAM"],
-                # pyrefly: ignore [bad-argument-type]
-                target_dates,
-                strict=True,
-            )
-        ]
-
-        source["HOME_DAYS_REST"] = [
-            _days_since_previous_game(
-                team=(None if pd.isna(team) else str(team)),
-                game_date=(None if pd.isna(game_date) else game_date),
-                history=history,
-            )
-            for team, game_date in zip(
-                source["HOME_TEAM"],
-                # pyrefly: ignore [bad-argument-type]
+        for side in ("AWAY", "HOME"):
+            source[f"{side}_DAYS_REST"] = days_since_previous_game(
+                _target_team_keys(source[f"{side}_TEAM"]),
                 target_dates,
-                strict=True,
+                history_teams=history["TEAM"],
+                history_dates=history["_DATE"],
             )
-        ]
 
         source["AWAY_SHORT_WEEK"] = _rest_flag(
             source["AWAY_DAYS_REST"],
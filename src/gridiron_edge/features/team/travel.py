@@ -2,9 +2,11 @@
 
 """Canonical Away/Home travel and game-site features.
 
-Resolves the actual historical or upcoming game venue, attaches the
-designated Away and Home franchise-season origins, and computes each
-side's great-circle travel distance and timezone shift.
+Resolves the actual historical or upcoming game venue, then looks up the
+designated Away and Home franchise-season origins, each side's
+great-circle travel distance, and each side's timezone shift on the game
+date in the precomputed venue geometry table
+(``metadata.stadium_sync.build_venue_geometry``).
 
 All outputs use one canonical game row:
 
@@ -19,19 +21,25 @@ Missing venue or origin coordinates remain explicit null values.
 
 from __future__ import annotations
 
-import math
+import logging
 from typing import TYPE_CHECKING, Final
 
 import numpy as np
 import pandas as pd
-from timezonefinder import TimezoneFinder
 
 from gridiron_edge.features.base import FeatureSpec
 from gridiron_edge.features.registry import FeatureRegistry
+from gridiron_edge.metadata.stadium_sync import (
+    VenueGeometry,
+    build_venue_geometry,
+    stadium_reference_fingerprint,
+)
 
 if TYPE_CHECKING:
     from gridiron_edge.datasets.accessor import DatasetAccessor
 
+logger = logging.getLogger(__name__)
+
 _HOME_AWAY_TRAVEL_INPUT_COLUMNS: Final[tuple[str, ...]] = (
     "GAME_ID",
     "YEAR",
@@ -47,86 +55,7 @@ _HOME_AWAY_TRAVEL_COLUMNS: Final[tuple[str, ...]] = (
     "HOME_TZ_SHIFT",
 )
 
-_SPECIAL_VENUE_HOME_TEAMS: Final[frozenset[str]] = frozenset(
-    {
-        "Alternate",
-        "International",
-    }
-)
-_EARTH_RADIUS_KM: Final[float] = 6371.0
-
-
-def _haversine_km(
-    lat1: np.ndarray,
-    lon1: np.ndarray,
-    lat2: np.ndarray,
-    lon2: np.ndarray,
-) -> np.ndarray:
-    """Return vectorized great-circle distances in kilometers."""
-    phi1 = np.radians(lat1)
-    phi2 = np.radians(lat2)
-    delta_phi = np.radians(lat2 - lat1)
-    delta_lambda = np.radians(lon2 - lon1)
-
-    haversine = (
-        np.sin(delta_phi / 2.0) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2.0) ** 2
-    )
-
-    return 2.0 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(haversine))
-
-
-def _build_tz_cache(
-    latitudes: pd.Series,
-    longitudes: pd.Series,
-    timezone_finder: TimezoneFinder,
-) -> dict[tuple[float, float], int]:
-    """Cache UTC offsets for unique coordinate pairs."""
-    from datetime import UTC, datetime
-    from zoneinfo import ZoneInfo
-
-    cache: dict[
-        tuple[float, float],
-        int,
-    ] = {}
-    when = datetime.now(UTC)
-
-    coordinate_pairs = set(
-        zip(
-            latitudes.round(4),
-            longitudes.round(4),
-            strict=False,
-        )
-    )
-
-    for latitude, longitude in coordinate_pairs:
-        if math.isnan(latitude) or math.isnan(longitude):
-            continue
-
-        timezone_name = timezone_finder.certain_timezone_at(
-            lat=float(latitude),
-            lng=float(longitude),
-        )
-
-        if timezone_name is None:
-            cache[
-                (
-                    latitude,
-                    longitude,
-                )
-            ] = 0
-            continue
-
-        local_time = when.astimezone(ZoneInfo(timezone_name))
-        offset = local_time.utcoffset()
-
-        cache[
-            (
-                latitude,
-                longitude,
-            )
-        ] = int(offset.total_seconds() // 3600) if offset else 0
-
-    return cache
+_NOON_UTC: Final[pd.Timedelta] = pd.Timedelta(hours=12)
 
 
 def _require_home_away_travel_columns(
@@ -207,196 +136,65 @@ def _build_game_venue_lookup(
     )
 
 
-def _unique_coordinate_lookup(
-    rows: pd.DataFrame,
-    *,
-    identity_columns: list[str],
-    label: str,
-) -> pd.DataFrame:
-    """Require one coordinate tuple for each lookup identity."""
-    coordinate_columns = [
-        "LATITUDE",
-        "LONGITUDE",
-        "ALTITUDE",
-    ]
-    lookup = rows.loc[
-        :,
-        [*identity_columns, *coordinate_columns],
-    ].drop_duplicates(ignore_index=True)
-
-    counts = lookup.groupby(identity_columns, dropna=False).size()
-    if counts.gt(1).any():
-        raise ValueError(f"{label} contains conflicting coordinate identities.")
-
-    return lookup.drop_duplicates(
-        subset=identity_columns,
-        keep="first",
-        ignore_index=True,
+def _venue_geometry(
+    datasets: DatasetAccessor,
+    stadiums: pd.DataFrame,
+) -> VenueGeometry:
+    """Return the persisted venue geometry table, rebuilding it when stale.
+
+    The persisted table is used only when it was built from the current
+    stadium reference. ``stadiums apply`` and the build-features pipeline
+    stage keep it current; if it is still missing or stale it is rebuilt in
+    memory as a logged fallback, which loads time-zone polygons.
+    """
+    fingerprint = stadium_reference_fingerprint(stadiums)
+    try:
+        geometry = datasets.venue_geometry()
+    except FileNotFoundError:
+        geometry = None
+
+    if geometry is not None and geometry.fingerprint == fingerprint:
+        return geometry
+
+    logger.warning(
+        "Venue geometry table is %s; building it in memory. "
+        "Run 'gridiron stadiums geometry' to persist it.",
+        "missing" if geometry is None else "stale",
     )
+    return build_venue_geometry(stadiums)
 
 
-def _build_site_lookup(stadiums: pd.DataFrame) -> pd.DataFrame:
-    """Build actual stadium-name to site-coordinate lookup."""
-    required = (
-        "STADIUM",
-        "LATITUDE",
-        "LONGITUDE",
-        "ALTITUDE",
-    )
-    _require_home_away_travel_columns(
-        stadiums,
-        required,
-        label="Stadium reference",
-    )
-
-    rows = stadiums.loc[:, list(required)].copy()
-    rows["STADIUM"] = rows["STADIUM"].astype(str).str.strip()
-    rows = rows.loc[rows["STADIUM"].ne(""), :]
+def _game_instants_ns(frame: pd.DataFrame) -> np.ndarray:
+    """Return each game's noon-UTC instant, falling back to now when undated."""
+    now = pd.Timestamp.now(tz="UTC")
+    if "GAME_DATE" not in frame.columns:
+        return np.full(len(frame), now.value, dtype=np.int64)
 
-    lookup = _unique_coordinate_lookup(
-        rows,
-        identity_columns=["STADIUM"],
-        label="Stadium reference",
-    )
-    return lookup.rename(
-        columns={
-            "STADIUM": "STADIUM_GAME",
-            "LATITUDE": "_SITE_LATITUDE",
-            "LONGITUDE": "_SITE_LONGITUDE",
-            "ALTITUDE": "GAME_SITE_ALTITUDE",
-        }
-    )
+    dates = pd.to_datetime(frame["GAME_DATE"], errors="coerce", utc=True).dt.normalize()
+    instants = (dates + _NOON_UTC).fillna(now)
+    # pyrefly: ignore [missing-attribute]
+    return pd.DatetimeIndex(instants).as_unit("ns").asi8
 
 
-def _build_team_origin_lookup(stadiums: pd.DataFrame) -> pd.DataFrame:
-    """Build franchise-season home-coordinate lookup."""
-    required = (
-        "HOME_TEAM",
-        "YEAR",
-        "LATITUDE",
-        "LONGITUDE",
-        "ALTITUDE",
-    )
-    _require_home_away_travel_columns(
-        stadiums,
-        required,
-        label="Stadium reference",
-    )
-
-    rows = stadiums.loc[:, list(required)].copy()
-    rows["HOME_TEAM"] = rows["HOME_TEAM"].astype(str).str.strip()
-    rows = rows.loc[
-        ~rows["HOME_TEAM"].isin(_SPECIAL_VENUE_HOME_TEAMS),
-        :,
-    ]
-
-    return _unique_coordinate_lookup(
-        rows,
-        identity_columns=["HOME_TEAM", "YEAR"],
-        label="Franchise-season stadium reference",
-    )
-
-
-def _attach_side_origin(
+def _attach_travel_values(
     frame: pd.DataFrame,
-    origins: pd.DataFrame,
-    *,
-    side: str,
+    geometry: VenueGeometry,
 ) -> pd.DataFrame:
-    """Attach one side's franchise-season origin coordinates."""
-    team_column = f"{side}_TEAM"
-    renamed = origins.rename(
-        columns={
-            "HOME_TEAM": team_column,
-            "LATITUDE": f"_{side}_LATITUDE",
-            "LONGITUDE": f"_{side}_LONGITUDE",
-            "ALTITUDE": f"_{side}_HOME_ALTITUDE",
-        }
-    )
-    return frame.merge(
-        renamed,
-        how="left",
-        on=[team_column, "YEAR"],
-        sort=False,
-        validate="many_to_one",
-    )
-
-
-def _attach_travel_values(frame: pd.DataFrame) -> pd.DataFrame:
-    """Calculate Away and Home distance and timezone shift."""
+    """Look up site altitude and each side's distance and timezone shift."""
     result = frame.copy()
-    tz_finder = TimezoneFinder()
-
-    coordinate_series = [
-        result["_AWAY_LATITUDE"],
-        result["_AWAY_LONGITUDE"],
-        result["_HOME_LATITUDE"],
-        result["_HOME_LONGITUDE"],
-        result["_SITE_LATITUDE"],
-        result["_SITE_LONGITUDE"],
-    ]
-    all_lats = pd.concat(
-        [coordinate_series[0], coordinate_series[2], coordinate_series[4]],
-        ignore_index=True,
-    )
-    all_lons = pd.concat(
-        [coordinate_series[1], coordinate_series[3], coordinate_series[5]],
-        ignore_index=True,
-    )
-    tz_cache = _build_tz_cache(all_lats, all_lons, tz_finder)
-
-    for side in ("AWAY", "HOME"):
-        origin_lat = result[f"_{side}_LATITUDE"]
-        origin_lon = result[f"_{side}_LONGITUDE"]
-        site_lat = result["_SITE_LATITUDE"]
-        site_lon = result["_SITE_LONGITUDE"]
-        available = origin_lat.notna() & origin_lon.notna() & site_lat.notna() & site_lon.notna()
-
-        distance_column = f"{side}_KM_TRAVELED"
-        result[distance_column] = float("nan")
-        if available.any():
-            result.loc[available, distance_column] = _haversine_km(
-                origin_lat.loc[available].to_numpy(dtype=float),
-                origin_lon.loc[available].to_numpy(dtype=float),
-                site_lat.loc[available].to_numpy(dtype=float),
-                site_lon.loc[available].to_numpy(dtype=float),
-            )
+    sites = geometry.venue_positions(result["STADIUM_GAME"])
+    instants = _game_instants_ns(result)
+    site_offsets = geometry.utc_offsets(sites, instants)
 
-        shift_values: list[object] = []
-        for origin_latitude, origin_longitude, site_latitude, site_longitude in zip(
-            origin_lat,
-            origin_lon,
-            site_lat,
-            site_lon,
-            strict=True,
-        ):
-            if any(
-                pd.isna(value)
-                for value in (
-                    origin_latitude,
-                    origin_longitude,
-                    site_latitude,
-                    site_longitude,
-                )
-            ):
-                shift_values.append(pd.NA)
-                continue
-
-            origin_key = (
-                round(float(origin_latitude), 4),
-                round(float(origin_longitude), 4),
-            )
-            site_key = (
-                round(float(site_latitude), 4),
-                round(float(site_longitude), 4),
-            )
-            shift_values.append(tz_cache.get(origin_key, 0) - tz_cache.get(site_key, 0))
+    altitude = np.full(len(result), np.nan)
+    altitude[sites >= 0] = geometry.altitude[sites[sites >= 0]]
+    result["GAME_SITE_ALTITUDE"] = altitude
 
-        result[f"{side}_TZ_SHIFT"] = pd.Series(
-            shift_values,
-            index=result.index,
-            dtype="Int64",
-        )
+    for side in ("AWAY", "HOME"):
+        origins = geometry.origin_positions(result[f"{side}_TEAM"], result["YEAR"])
+        result[f"{side}_KM_TRAVELED"] = geometry.distances(origins, sites)
+        shift = geometry.utc_offsets(origins, instants) - site_offsets
+        result[f"{side}_TZ_SHIFT"] = pd.Series(shift, index=result.index).astype("Int64")
 
     return result
 
@@ -438,9 +236,7 @@ class HomeAwayTravelFeature:
             datasets.games(),
             upcoming,
         )
-        stadiums = datasets.stadiums()
-        sites = _build_site_lookup(stadiums)
-        origins = _build_team_origin_lookup(stadiums)
+        geometry = _venue_geometry(datasets, datasets.stadiums())
 
         result = source.merge(
             venues,
@@ -449,24 +245,7 @@ class HomeAwayTravelFeature:
             sort=False,
             validate="many_to_one",
         )
-        result = result.merge(
-            sites,
-            how="left",
-            on="STADIUM_GAME",
-            sort=False,
-            validate="many_to_one",
-        )
-        result = _attach_side_origin(
-            result,
-            origins,
-            side="AWAY",
-        )
-        result = _attach_side_origin(
-            result,
-            origins,
-            side="HOME",
-        )
-        result = _attach_travel_values(result)
+        result = _attach_travel_values(result, geometry)
 
         return (
             result.sort_values(
@@ -150,33 +150,65 @@ def _build_home_advantage_history(games: DataFrame) -> DataFrame:
     )
 
 
-def _home_hfa_entering_week(
-    history: DataFrame,
-    *,
-    home_team: str,
-    season_start: int,
-    week: int,
-) -> float:
-    """Return a leakage-free franchise HFA entering the target week."""
-    prior = history.loc[
-        (history["_SEASON_START"] < season_start)
-        | (history["_SEASON_START"].eq(season_start) & history["WEEK_NUM"].lt(week)),
-        :,
-    ]
+def _week_keys(season_starts: np.ndarray, weeks: np.ndarray) -> np.ndarray:
+    """Return sortable ``season * 100 + week`` keys (NFL weeks are < 100)."""
+    return season_starts.astype(np.int64) * 100 + weeks.astype(np.int64)
 
-    if prior.empty:
-        return 0.0
 
-    team_results = prior.loc[
-        prior["HOME_TEAM"].astype(str).eq(home_team),
-        "_HOME_RESULT",
-    ]
-    if len(team_results) < _MIN_HOME_GAMES:
-        return 0.0
-
-    league_average = float(prior["_HOME_RESULT"].mean())
-    team_average = float(team_results.mean())
-    return team_average - league_average
+def _home_hfa_entering_weeks(
+    history: DataFrame,
+    *,
+    home_teams: Series,
+    season_starts: Series,
+    weeks: Series,
+) -> np.ndarray:
+    """Return leakage-free franchise HFA entering each target week.
+
+    Prior results for a target are every history game in an earlier season
+    or an earlier week of the same season. History is sorted once by week
+    key, and by franchise then week key, so the league and franchise prior
+    counts are binary searches and their sums come from cumulative sums.
+    Franchises with fewer than ``_MIN_HOME_GAMES`` prior home games, or
+    targets with no prior history at all, receive zero.
+    """
+    n_targets = len(home_teams)
+    if history.empty or n_targets == 0:
+        return np.zeros(n_targets)
+
+    target_keys = _week_keys(season_starts.to_numpy(), weeks.to_numpy())
+    history_keys = _week_keys(
+        history["_SEASON_START"].to_numpy(),
+        history["WEEK_NUM"].to_numpy(),
+    )
+    results = history["_HOME_RESULT"].to_numpy(dtype=float)
+
+    # League expanding mean over every prior game.
+    league_order = np.argsort(history_keys, kind="stable")
+    league_keys = history_keys[league_order]
+    league_sums = np.r_[0.0, np.cumsum(results[league_order])]
+    league_counts = np.searchsorted(league_keys, target_keys, side="left")
+
+    # Franchise expanding mean: one contiguous block per home team.
+    team_labels = history["HOME_TEAM"].astype(str)
+    team_codes, team_names = pd.factorize(team_labels, sort=True)
+    team_order = np.lexsort((history_keys, team_codes))
+    block_keys = team_codes[team_order].astype(np.int64) * 1_000_000 + history_keys[team_order]
+    team_sums = np.r_[0.0, np.cumsum(results[team_order])]
+    team_starts = np.searchsorted(team_codes[team_order], np.arange(len(team_names)))
+
+    target_codes = pd.Index(team_names).get_indexer(pd.Index(home_teams.astype(str)))
+    known = target_codes >= 0
+    safe_codes = np.where(known, target_codes, 0).astype(np.int64)
+    block_end = np.searchsorted(block_keys, safe_codes * 1_000_000 + target_keys, side="left")
+    block_start = team_starts[safe_codes]
+    team_counts = np.where(known, block_end - block_start, 0)
+
+    qualified = (league_counts > 0) & (team_counts >= _MIN_HOME_GAMES)
+    values = np.zeros(n_targets)
+    team_means = (team_sums[block_end] - team_sums[block_start])[qualified] / team_counts[qualified]
+    league_means = league_sums[league_counts][qualified] / league_counts[qualified]
+    values[qualified] = team_means - league_means
+    return values
 
 
 @FeatureRegistry.register("home_away_venue_hfa")
@@ -214,23 +246,13 @@ class HomeAwayVenueHFAFeature:
 
         history = _build_home_advantage_history(datasets.games())
 
-        values = [
-            0.0
-            if int(neutral) == 1
-            else _home_hfa_entering_week(
-                history,
-                home_team=str(home_team),
-                season_start=int(season_start),
-                week=int(week),
-            )
-            for home_team, season_start, week, neutral in zip(
-                source["HOME_TEAM"],
-                source["_SEASON_START"],
-                source["WEEK_NUM"],
-                source["IS_NEUTRAL_SITE"],
-                strict=True,
-            )
-        ]
+        values = _home_hfa_entering_weeks(
+            history,
+            home_teams=source["HOME_TEAM"],
+            season_starts=source["_SEASON_START"],
+            weeks=source["WEEK_NUM"],
+        )
+        values[source["IS_NEUTRAL_SITE"].to_numpy() == 1] = 0.0
 
         source[_HOME_AWAY_HFA_OUTPUT] = values
         return source.drop(
@@ -0,0 +1,111 @@
+# src/gridiron_edge/features/upcoming.py
+
+"""Per-run cache of canonical features for an upcoming schedule.
+
+A weekly predict run used to compute ``CANONICAL_FEATURES`` for the same
+week once for the availability check and again inside every selected
+model's ``predict_upcoming``, re-reading the full game, Elo, EPA, and
+weather history each time. An :class:`UpcomingFeatureContext` computes the
+enriched schedule once and hands a copy to every caller in the run.
+
+Frames are keyed by the schedule's content and by the size and mtime of the
+datasets features read through ``DatasetAccessor``, so a context never
+serves features for a different schedule or for inputs that changed while
+it was alive.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+import hashlib
+from pathlib import Path
+from typing import Final
+
+import pandas as pd
+from pandas import DataFrame
+
+from gridiron_edge.datasets.accessor import DatasetAccessor
+from gridiron_edge.datasets.columnar import columnar_path
+from gridiron_edge.datasets.registry import DatasetKey, dataset_path
+from gridiron_edge.features.pipeline import CANONICAL_FEATURES
+from gridiron_edge.features.registry import run_features
+
+# Datasets reachable through DatasetAccessor, i.e. everything a feature reads.
+_FEATURE_INPUTS: Final[tuple[DatasetKey, ...]] = (
+    "games",
+    "elo_state",
+    "stadiums",
+    "venue_geometry",
+    "schedule_upcoming_rich",
+    "epa_by_game",
+    "weather_enriched",
+)
+
+FeatureBuilder = Callable[..., DataFrame]
+
+
+def schedule_digest(schedule: DataFrame) -> str:
+    """Return a digest of *schedule*'s columns, dtypes, index, and values."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(c), str(t)) for c, t in schedule.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(schedule, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def input_fingerprint(repo: Path) -> tuple[tuple[int, int] | None, ...]:
+    """Return ``(size, mtime_ns)`` per feature input and its Parquet twin."""
+    fingerprint: list[tuple[int, int] | None] = []
+    for key in _FEATURE_INPUTS:
+        path = dataset_path(repo, key)
+        for candidate in (path, columnar_path(path)):
+            try:
+                stat = candidate.stat()
+            except FileNotFoundError:
+                fingerprint.append(None)
+                continue
+            fingerprint.append((stat.st_size, stat.st_mtime_ns))
+    return tuple(fingerprint)
+
+
+@dataclass
+class UpcomingFeatureContext:
+    """Canonical upcoming-schedule features shared across one run.
+
+    Attributes:
+        repo: Repository root the features read from.
+        feature_names: Features to apply, in pipeline order.
+        build: ``run_features``-compatible builder.
+        hits: Calls served from the cache.
+        misses: Calls that computed features.
+    """
+
+    repo: Path
+    feature_names: Sequence[str] = field(default_factory=lambda: CANONICAL_FEATURES)
+    build: FeatureBuilder = run_features
+    hits: int = 0
+    misses: int = 0
+    _frames: dict[tuple[str, tuple], DataFrame] = field(default_factory=dict, repr=False)
+
+    def features(self, schedule: DataFrame) -> DataFrame:
+        """Return *schedule* with the canonical features applied.
+
+        Args:
+            schedule: Canonical upcoming schedule. Not modified.
+
+        Returns:
+            A copy of the enriched frame; callers may mutate it freely.
+        """
+        key = (schedule_digest(schedule), input_fingerprint(self.repo))
+        frame = self._frames.get(key)
+        if frame is None:
+            self.misses += 1
+            frame = self.build(
+                df=schedule.copy(),
+                feature_names=self.feature_names,
+                datasets=DatasetAccessor(repo=self.repo),
+            )
+            self._frames[key] = frame
+        else:
+            self.hits += 1
+        return frame.copy()
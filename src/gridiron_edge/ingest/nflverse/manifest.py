@@ -0,0 +1,367 @@
+# src/gridiron_edge/ingest/nflverse/manifest.py
+
+"""Per-season integrity manifests and bounded parallel fetch for nflverse data.
+
+PBP and player stats are stored as one Parquet file per season. Each raw
+directory carries a ``manifest.json`` recording, for every stored season,
+the row count, the column schema, and a content hash of the pruned frame::
+
+    data / raw / pbp / manifest.json
+    {
+        "schema_version": 1,
+        "seasons": {
+            "2024": {
+                "file": "play_by_play_2024.parquet",
+                "rows": 49492,
+                "columns": [["game_id", "object"], ["season", "int32"], ...],
+                "schema_sha256": "...",
+                "content_sha256": "...",
+                "fetched_at": "2025-03-02T10:15:00+00:00",
+            }
+        },
+    }
+
+:func:`fetch_seasons` fetches, prunes, hashes, and writes seasons on a
+bounded thread pool. A season whose content hash matches its manifest entry
+is not rewritten, so a refresh only touches seasons whose data moved.
+
+Derived artifacts record the content hashes they were built from in a
+sidecar next to the artifact (``epa_by_game.sources.json``);
+:func:`changed_seasons` compares the two so ``aggregate_epa`` and
+``clean_player_stats`` can rebuild only the seasons whose raw content
+changed.
+
+The data source is a :data:`SeasonLoader` - any ``season -> DataFrame``
+callable - so tests substitute a local fixture loader for nflreadpy.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+import hashlib
+import json
+import logging
+from logging import Logger
+from pathlib import Path
+from typing import Any, Final, Literal
+
+import pandas as pd
+from pandas import DataFrame
+
+logger: Logger = logging.getLogger(__name__)
+
+MANIFEST_SCHEMA_VERSION: Final[int] = 1
+_MANIFEST_NAME: Final[str] = "manifest.json"
+
+SeasonLoader = Callable[[int], DataFrame]
+"""Return the raw (unpruned) frame for one season; raise if unavailable."""
+
+SeasonStatus = Literal["written", "unchanged", "failed"]
+
+
+@dataclass(frozen=True)
+class SeasonEntry:
+    """Manifest record for one stored season.
+
+    Attributes:
+        file: Parquet file name, relative to the raw directory.
+        rows: Row count of the stored frame.
+        columns: ``(name, dtype)`` pairs in stored column order.
+        schema_sha256: Hash of ``columns``.
+        content_sha256: Hash of the schema and every row's values.
+        fetched_at: ISO-8601 UTC time the season was last fetched.
+    """
+
+    file: str
+    rows: int
+    columns: tuple[tuple[str, str], ...]
+    schema_sha256: str
+    content_sha256: str
+    fetched_at: str
+
+
+@dataclass(frozen=True)
+class SeasonResult:
+    """Outcome of fetching one season.
+
+    Attributes:
+        season: Season year.
+        status: ``"written"`` when the file was (re)written,
+            ``"unchanged"`` when the fetched content matched the manifest,
+            ``"failed"`` when the loader raised.
+        path: The season's Parquet path.
+        entry: Manifest entry for the fetched content; ``None`` on failure.
+    """
+
+    season: int
+    status: SeasonStatus
+    path: Path
+    entry: SeasonEntry | None = None
+
+
+def frame_schema(df: DataFrame) -> tuple[tuple[str, str], ...]:
+    """Return ``(name, dtype)`` pairs for *df* in column order."""
+    return tuple((str(name), str(dtype)) for name, dtype in df.dtypes.items())
+
+
+def _schema_sha256(columns: Sequence[Sequence[str]]) -> str:
+    encoded: bytes = json.dumps([list(pair) for pair in columns]).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def content_sha256(df: DataFrame) -> str:
+    """Return a hash of *df*'s schema and values, independent of its index.
+
+    Two frames hash equal when they have the same columns, dtypes, and row
+    values in the same order - regardless of how they were encoded on disk.
+    """
+    digest = hashlib.sha256(_schema_sha256(frame_schema(df)).encode())
+    row_hashes = pd.util.hash_pandas_object(df, index=False)
+    digest.update(row_hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def describe_season(df: DataFrame, *, file: str) -> SeasonEntry:
+    """Build the manifest entry for a pruned season frame."""
+    columns = frame_schema(df)
+    return SeasonEntry(
+        file=file,
+        rows=len(df),
+        columns=columns,
+        schema_sha256=_schema_sha256(columns),
+        content_sha256=content_sha256(df),
+        fetched_at=datetime.now(UTC).isoformat(timespec="seconds"),
+    )
+
+
+def manifest_path(directory: Path) -> Path:
+    """Return the manifest path for a raw season directory."""
+    return directory / _MANIFEST_NAME
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    """Read a versioned JSON document; ``None`` when missing or unreadable."""
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable %s: %s", path, exc)
+        return None
+    if not isinstance(document, dict) or document.get("schema_version") != (
+        MANIFEST_SCHEMA_VERSION
+    ):
+        logger.warning("Ignoring %s with unknown schema version", path)
+        return None
+    return document
+
+
+def _write_json(path: Path, document: dict[str, Any]) -> None:
+    """Write *document* atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp: Path = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def load_manifest(directory: Path) -> dict[int, SeasonEntry]:
+    """Load a raw directory's manifest as ``{season: entry}``.
+
+    A missing or unreadable manifest loads as empty, so every season is
+    treated as new rather than failing the fetch.
+    """
+    document = _read_json(manifest_path(directory))
+    if document is None:
+        return {}
+    entries: dict[int, SeasonEntry] = {}
+    try:
+        for season, record in document["seasons"].items():
+            entries[int(season)] = SeasonEntry(
+                file=str(record["file"]),
+                rows=int(record["rows"]),
+                columns=tuple((str(name), str(dtype)) for name, dtype in record["columns"]),
+                schema_sha256=str(record["schema_sha256"]),
+                content_sha256=str(record["content_sha256"]),
+                fetched_at=str(record["fetched_at"]),
+            )
+    except (KeyError, TypeError, ValueError) as exc:
+        logger.warning("Ignoring malformed manifest in %s: %s", directory, exc)
+        return {}
+    return entries
+
+
+def write_manifest(directory: Path, entries: Mapping[int, SeasonEntry]) -> Path:
+    """Write ``{season: entry}`` as the directory's manifest and return its path."""
+    path: Path = manifest_path(directory)
+    _write_json(
+        path,
+        {
+            "schema_version": MANIFEST_SCHEMA_VERSION,
+            "seasons": {str(season): asdict(entries[season]) for season in sorted(entries)},
+        },
+    )
+    return path
+
+
+def sources_path(artifact: Path) -> Path:
+    """Return the source-hash sidecar for a derived artifact."""
+    return artifact.with_name(f"{artifact.stem}.sources.json")
+
+
+def load_source_hashes(artifact: Path) -> dict[int, str] | None:
+    """Return the ``{season: content_sha256}`` an artifact was built from.
+
+    Returns:
+        The recorded hashes, or ``None`` when the artifact has no readable
+        record - callers should then rebuild it in full.
+    """
+    document = _read_json(sources_path(artifact))
+    if document is None:
+        return None
+    try:
+        return {int(season): str(digest) for season, digest in document["seasons"].items()}
+    except (AttributeError, KeyError, ValueError) as exc:
+        logger.warning("Ignoring malformed source record for %s: %s", artifact, exc)
+        return None
+
+
+def write_source_hashes(artifact: Path, hashes: Mapping[int, str]) -> None:
+    """Record the ``{season: content_sha256}`` an artifact was built from."""
+    _write_json(
+        sources_path(artifact),
+        {
+            "schema_version": MANIFEST_SCHEMA_VERSION,
+            "seasons": {str(season): hashes[season] for season in sorted(hashes)},
+        },
+    )
+
+
+def changed_seasons(
+    manifest: Mapping[int, SeasonEntry],
+    consumed: Mapping[int, str],
+) -> list[int]:
+    """Return manifest seasons whose content differs from what was consumed.
+
+    Seasons missing from *consumed* count as changed.
+    """
+    return sorted(
+        season for season, entry in manifest.items() if consumed.get(season) != entry.content_sha256
+    )
+
+
+def _write_parquet(df: DataFrame, path: Path) -> None:
+    """Write *df* atomically so readers never see a partial season file."""
+    tmp: Path = path.with_name(f"{path.name}.tmp")
+    df.to_parquet(tmp, index=False)
+    tmp.replace(path)
+
+
+def _fetch_one(
+    season: int,
+    *,
+    loader: SeasonLoader,
+    keep_columns: Sequence[str],
+    path: Path,
+    previous: SeasonEntry | None,
+    label: str,
+) -> SeasonResult:
+    """Fetch, prune, hash, and (if changed) write one season."""
+    logger.info("Fetching %s data for season %d...", label, season)
+    try:
+        df: DataFrame = loader(season)
+    except Exception as exc:  # nflreadpy may raise varied errors (network, parse, schema)
+        logger.warning("Failed to fetch %s for season %d: %s", label, season, exc)
+        return SeasonResult(season=season, status="failed", path=path)
+
+    # Retain only columns that exist in this season's data
+    available: list[str] = [c for c in keep_columns if c in df.columns]
+    missing: list[str] = [c for c in keep_columns if c not in df.columns]
+    if missing:
+        logger.debug("%s %d missing columns: %s", label, season, missing)
+    df = df.loc[:, available].reset_index(drop=True)
+
+    entry: SeasonEntry = describe_season(df, file=path.name)
+    if previous is not None and previous.content_sha256 == entry.content_sha256 and path.exists():
+        logger.info("%s %d unchanged (%d rows) - not rewritten", label, season, entry.rows)
+        return SeasonResult(season=season, status="unchanged", path=path, entry=entry)
+
+    _write_parquet(df, path)
+    size_mb: float = path.stat().st_size / (1024 * 1024)
+    logger.info(
+        "%s %d written to %s (%.1f MB, %d rows)",
+        label,
+        season,
+        path,
+        size_mb,
+        entry.rows,
+    )
+    return SeasonResult(season=season, status="written", path=path, entry=entry)
+
+
+def fetch_seasons(
+    seasons: Sequence[int],
+    *,
+    loader: SeasonLoader,
+    keep_columns: Sequence[str],
+    directory: Path,
+    path_for: Callable[[int], Path],
+    max_workers: int,
+    label: str,
+) -> dict[int, SeasonResult]:
+    """Fetch seasons on a bounded pool and update the directory's manifest.
+
+    Each worker loads one season, prunes it to *keep_columns*, hashes it,
+    and writes its Parquet file unless the content matches the manifest.
+    The manifest is read once and written once, on the calling thread,
+    after every worker finishes - including when one is interrupted.
+    A season that fails to load keeps its previous file and entry.
+
+    Args:
+        seasons: Season years to fetch.
+        loader: Source of raw season frames.
+        keep_columns: Columns to retain, in stored order.
+        directory: Raw directory holding the season files and manifest.
+        path_for: Maps a season to its Parquet path inside *directory*.
+        max_workers: Maximum seasons fetched concurrently.
+        label: Dataset name for log messages (e.g. ``"PBP"``).
+
+    Returns:
+        ``{season: result}`` in season order.
+    """
+    if not seasons:
+        return {}
+
+    manifest: dict[int, SeasonEntry] = load_manifest(directory)
+    results: dict[int, SeasonResult] = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(seasons)))) as pool:
+            futures: dict[Future[SeasonResult], int] = {
+                pool.submit(
+                    _fetch_one,
+                    season,
+                    loader=loader,
+                    keep_columns=keep_columns,
+                    path=path_for(season),
+                    previous=manifest.get(season),
+                    label=label,
+                ): season
+                for season in dict.fromkeys(seasons)
+            }
+            for future in as_completed(futures):
+                result: SeasonResult = future.result()
+                results[result.season] = result
+                if result.entry is not None:
+                    manifest[result.season] = result.entry
+    finally:
+        if any(result.entry is not None for result in results.values()):
+            write_manifest(directory, manifest)
+
+    counts: dict[str, int] = {}
+    for result in results.values():
+        counts[result.status] = counts.get(result.status, 0) + 1
+    logger.info("%s fetch: %s", label, ", ".join(f"{n} {s}" for s, n in sorted(counts.items())))
+    return {season: results[season] for season in sorted(results)}
@@ -11,9 +11,17 @@ Each season's file is written once when complete and never overwritten,
 matching the nflverse games ingest pattern. The current season is
 refreshed weekly during the season.
 
+Seasons are fetched, pruned, and written on a bounded worker pool, and
+``manifest.json`` records each season's row count, schema, and content
+hash (see :mod:`gridiron_edge.ingest.nflverse.manifest`). A refresh whose
+content matches the manifest leaves the file untouched, and
+``aggregate_epa(only_changed=True)`` re-aggregates only seasons whose hash
+moved.
+
 Storage layout::
 
     data/raw/pbp/
+        manifest.json
         play_by_play_1999.parquet
         play_by_play_2000.parquet
         ...
@@ -38,6 +46,7 @@ Key PBP columns used downstream:
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import partial
 import logging
 from logging import Logger
 from pathlib import Path
@@ -47,9 +56,19 @@ import pandas as pd
 from pandas import DataFrame
 
 from gridiron_edge.core.settings import current_nfl_season, get_settings
+from gridiron_edge.ingest.nflverse.manifest import (
+    SeasonEntry,
+    SeasonLoader,
+    fetch_seasons,
+    load_manifest,
+)
 
 logger: Logger = logging.getLogger(__name__)
 
+# Seasons fetched concurrently. Each worker holds one season's full PBP
+# frame (hundreds of MB before pruning), so keep the pool small.
+_MAX_WORKERS: Final[int] = 4
+
 # Columns we actually need - dropping the rest reduces file size ~70%
 # and speeds up downstream reads significantly.
 _KEEP_COLUMNS: Final[list[str]] = [
@@ -120,17 +139,42 @@ def _is_season_complete(season: int) -> bool:
     return now.year > cutoff_year or (now.year == cutoff_year and now.month >= 3)
 
 
+def _load_pbp_season(season: int) -> DataFrame:
+    """Load one season of raw PBP from nflverse."""
+    # pyrefly: ignore [missing-import]
+    import nflreadpy as nfl
+
+    return nfl.load_pbp([season]).to_pandas()
+
+
+def load_pbp_manifest(*, repo: Path | None = None) -> dict[int, SeasonEntry]:
+    """Return the PBP manifest as ``{season: entry}``.
+
+    Args:
+        repo: Repository root.
+
+    Returns:
+        Row count, schema, and content hash per fetched season. Empty if
+        no season has been fetched since manifests were introduced.
+    """
+    resolved_repo: Path = repo or get_settings().repo_root
+    return load_manifest(_pbp_dir(resolved_repo))
+
+
 def fetch_pbp(
     seasons: list[int] | None = None,
     *,
     start_season: int = 1999,
     repo: Path | None = None,
     force: bool = False,
+    loader: SeasonLoader | None = None,
+    max_workers: int = _MAX_WORKERS,
 ) -> list[Path]:
     """Fetch and store PBP data for one or more seasons.
 
     Skips seasons whose Parquet file already exists unless ``force=True``
-    or the season is the current (incomplete) season.
+    or the season is the current (incomplete) season. Fetched seasons whose
+    content hash matches the manifest are not rewritten.
 
     Args:
         seasons: Specific season years to fetch (e.g. ``[2024, 2025]``).
@@ -138,47 +182,38 @@ def fetch_pbp(
         start_season: First season to fetch when ``seasons`` is ``None``.
             Defaults to 1999 (nflverse coverage start).
         repo: Repository root. Defaults to settings repo root.
-        force: If ``True``, re-fetch and overwrite existing files.
+        force: If ``True``, re-fetch existing files (rewriting only those
+            whose content changed).
+        loader: Source of raw season frames. Defaults to nflreadpy.
+        max_workers: Maximum seasons fetched concurrently.
 
     Returns:
         List of Parquet file paths written.
     """
-    # pyrefly: ignore [missing-import]
-    import nflreadpy as nfl
-
     resolved_repo: Path = repo or get_settings().repo_root
     current: int = current_nfl_season()
 
     if seasons is None:
         seasons = list(range(start_season, current + 1))
 
-    written: list[Path] = []
-
+    pending: list[int] = []
     for season in seasons:
         path: Path = _pbp_path(resolved_repo, season)
-        complete: bool = _is_season_complete(season)
-
-        if path.exists() and complete and not force:
+        if path.exists() and _is_season_complete(season) and not force:
             logger.debug("PBP %d already cached - skipping.", season)
             continue
+        pending.append(season)
 
-        logger.info("Fetching PBP data for season %d...", season)
-        try:
-            df = nfl.load_pbp([season]).to_pandas()
-        except Exception as exc:
-            logger.warning("Failed to fetch PBP for season %d: %s", season, exc)
-            continue
-
-        # Keep only the columns we need
-        available: list[str] = [c for c in _KEEP_COLUMNS if c in df.columns]
-        df = df[available].copy()
-
-        df.to_parquet(path, index=False)
-        size_mb: float = path.stat().st_size / (1024 * 1024)
-        logger.info("PBP %d written to %s (%.1f MB)", season, path, size_mb)
-        written.append(path)
-
-    return written
+    results = fetch_seasons(
+        pending,
+        loader=loader or _load_pbp_season,
+        keep_columns=_KEEP_COLUMNS,
+        directory=_pbp_dir(resolved_repo),
+        path_for=partial(_pbp_path, resolved_repo),
+        max_workers=max_workers,
+        label="PBP",
+    )
+    return [result.path for result in results.values() if result.status == "written"]
 
 
 def fetch_pbp_refresh(*, repo: Path | None = None) -> list[Path]:
@@ -192,7 +227,7 @@ def fetch_pbp_refresh(*, repo: Path | None = None) -> list[Path]:
 
     Returns:
         List containing the current season's Parquet path, or empty
-        list if fetch failed.
+        list if fetch failed or the season's content is unchanged.
     """
     current: int = current_nfl_season()
     return fetch_pbp(seasons=[current], repo=repo, force=True)
@@ -7,7 +7,12 @@ player-game-level statistics including passing, rushing, receiving,
 EPA, and usage metrics.
 
 Data is cached as per-season Parquet files at
-``data/raw/player_stats/player_stats_{season}.parquet``.
+``data/raw/player_stats/player_stats_{season}.parquet``, fetched on a
+bounded worker pool. ``manifest.json`` in the same directory records each
+season's row count, schema, and content hash; a re-fetch whose content is
+unchanged leaves the file untouched, and
+``clean_player_stats(only_changed=True)`` rebuilds only seasons whose hash
+moved.
 
 Usage::
 
@@ -19,6 +24,7 @@ Usage::
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 from logging import Logger
 from pathlib import Path
@@ -30,12 +36,21 @@ import pandas as pd
 from pandas import DataFrame
 
 from gridiron_edge.core.settings import get_settings
+from gridiron_edge.ingest.nflverse.manifest import (
+    SeasonEntry,
+    SeasonLoader,
+    fetch_seasons,
+    load_manifest,
+)
 
 logger: Logger = logging.getLogger(__name__)
 
 # First season with reliable nflverse player stats.
 _STATS_RELIABLE_FROM: Final[int] = 1999
 
+# Seasons fetched concurrently.
+_MAX_WORKERS: Final[int] = 4
+
 # Columns to retain from the 115 available in load_player_stats().
 # Covers identity, passing, rushing, receiving, usage, and advanced metrics.
 # Excludes fantasy scoring, headshot URLs, 2pt conversions, and sack fumble
@@ -104,11 +119,31 @@ def _player_stats_path(repo: Path, season: int) -> Path:
     return _player_stats_dir(repo) / f"player_stats_{season}.parquet"
 
 
+def _load_season(season: int) -> DataFrame:
+    """Load one season of raw player stats from nflverse."""
+    return nfl.load_player_stats([season]).to_pandas()
+
+
+def load_player_stats_manifest(*, repo: Path | None = None) -> dict[int, SeasonEntry]:
+    """Return the player stats manifest as ``{season: entry}``.
+
+    Args:
+        repo: Repository root.
+
+    Returns:
+        Row count, schema, and content hash per fetched season.
+    """
+    resolved_repo: Path = repo or get_settings().repo_root
+    return load_manifest(_player_stats_dir(resolved_repo))
+
+
 def fetch_player_stats(
     *,
     all_years: bool = False,
     seasons: list[int] | None = None,
     repo: Path | None = None,
+    loader: SeasonLoader | None = None,
+    max_workers: int = _MAX_WORKERS,
 ) -> list[Path]:
     """Fetch weekly player stats and write per-season Parquet files.
 
@@ -117,9 +152,11 @@ def fetch_player_stats(
             If ``False``, fetch only the current season.
         seasons: Explicit list of seasons to fetch. Overrides ``all_years``.
         repo: Repository root. Defaults to settings.
+        loader: Source of raw season frames. Defaults to nflreadpy.
+        max_workers: Maximum seasons fetched concurrently.
 
     Returns:
-        List of paths to written Parquet files.
+        List of Parquet file paths written.
     """
     resolved_repo: Path = repo or get_settings().repo_root
 
@@ -134,41 +171,25 @@ def fetch_player_stats(
         season_year: int = current_year if pd.Timestamp.now().month >= 6 else current_year - 1
         target_seasons = [season_year]
 
-    written: list[Path] = []
-
+    pending: list[int] = []
     for season in target_seasons:
         path: Path = _player_stats_path(resolved_repo, season)
-
         if path.exists() and not all_years:
             logger.info("Player stats %d already cached at %s", season, path)
-            written.append(path)
             continue
+        pending.append(season)
+
+    results = fetch_seasons(
+        pending,
+        loader=loader or _load_season,
+        keep_columns=_KEEP_COLUMNS,
+        directory=_player_stats_dir(resolved_repo),
+        path_for=partial(_player_stats_path, resolved_repo),
+        max_workers=max_workers,
+        label="Player stats",
+    )
 
-        try:
-            df: DataFrame = nfl.load_player_stats([season]).to_pandas()
-        except Exception:  # nflreadpy may raise varied errors (network, parse, schema)
-            logger.warning("Failed to fetch player stats for season %d", season)
-            continue
-
-        # Retain only columns that exist in this season's data
-        available: list[str] = [c for c in _KEEP_COLUMNS if c in df.columns]
-        missing: list[str] = [c for c in _KEEP_COLUMNS if c not in df.columns]
-        if missing:
-            logger.debug("Player stats %d missing columns: %s", season, missing)
-        df = df.loc[:, available].copy()
-
-        df.to_parquet(path, index=False)
-        size_mb: float = path.stat().st_size / (1024 * 1024)
-        logger.info(
-            "Player stats %d written to %s (%.1f MB, %d rows)",
-            season,
-            path,
-            size_mb,
-            len(df),
-        )
-        written.append(path)
-
-    return written
+    return [result.path for result in results.values() if result.status == "written"]
 
 
 def load_player_stats(
@@ -200,7 +221,7 @@ def load_player_stats(
     if not paths:
         msg: str = (
             f"No player stats found in {stats_dir}. "
-            "Run: gridiron run-data-pipeline --only fetch-player-stats"
+            "Run: gridiron run-data-pipeline --only build-player-stats"
         )
         raise FileNotFoundError(msg)
 
@@ -0,0 +1,357 @@
+"""Local response cache and request coalescing for The Odds API collection.
+
+Every provider request costs quota, yet consecutive collection runs often see
+the same payload: books have not moved, or two jobs for the same week fire
+close together. Three layers keep those runs cheap:
+
+* :class:`RequestCoalescer` lets concurrent callers with the same request key
+  share one in-flight HTTP call inside the process, and
+  :meth:`OddsResponseCache.fetch_shared` extends that across processes: the
+  first collection job claims the request with a file under
+  ``data/odds/cache/claims/`` and overlapping jobs wait for the response it
+  stores instead of requesting again.
+* :class:`OddsResponseCache` stores the last response per endpoint and query
+  parameters (never the API key) under ``data/odds/cache/``, so a caller may
+  reuse a sufficiently fresh response without any request at all.
+* The same cache records which payload hash was last ingested for each
+  season and week, next to the quote rows it parsed to. An identical payload
+  skips parsing and ledger writes, as long as none of the quoted games has
+  kicked off since; after that the parser's pregame filter would produce
+  different rows.
+
+Cache files are plain JSON (parsed quotes: Parquet) written atomically;
+unreadable entries are treated as misses rather than errors.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
+import hashlib
+import json
+import logging
+from logging import Logger
+from pathlib import Path
+import threading
+import time
+from typing import Any, Final
+from uuid import uuid4
+
+import pandas as pd
+from pandas import DataFrame
+import pyarrow as pa
+
+from gridiron_edge.core.settings import get_settings
+
+logger: Logger = logging.getLogger(__name__)
+
+CACHE_SCHEMA_VERSION: Final[int] = 1
+
+# Query parameters that identify the caller rather than the resource; they are
+# excluded from cache keys so secrets never reach disk.
+_CREDENTIAL_PARAMS: Final[frozenset[str]] = frozenset({"apiKey"})
+
+# How often a caller waiting on another process's request checks its claim.
+_CLAIM_POLL_S: Final[float] = 0.05
+
+
+def request_key(url: str, params: Mapping[str, str]) -> str:
+    """Return the cache key for one endpoint and its query parameters."""
+    resource = {name: value for name, value in params.items() if name not in _CREDENTIAL_PARAMS}
+    canonical = json.dumps([url, sorted(resource.items())], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def payload_sha256(payload: object) -> str:
+    """Return a stable content hash of one decoded JSON payload."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class RequestCoalescer[T]:
+    """Share one in-flight call among concurrent callers with the same key.
+
+    The first caller for a key runs the call; callers arriving while it is in
+    flight block and receive the same result (or exception). Once the call
+    finishes the key is released, so later callers start a fresh call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future[T]] = {}
+
+    def run(self, key: Hashable, call: Callable[[], T]) -> T:
+        """Return ``call()``, joining an in-flight call for *key* if one exists."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+        if not leader:
+            return future.result()
+
+        try:
+            result = call()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """One stored provider response.
+
+    Attributes:
+        fetched_at: When the response was received.
+        payload_sha256: Content hash of *payload*.
+        payload: Decoded JSON payload.
+        usage: Provider quota counters received with the response, keyed by
+            ``requests_remaining``, ``requests_used``, and ``request_cost``.
+    """
+
+    fetched_at: datetime
+    payload_sha256: str
+    payload: object
+    usage: dict[str, int | None]
+
+
+@dataclass(frozen=True, slots=True)
+class IngestRecord:
+    """What the last ingestion of one payload into a season-week produced.
+
+    Attributes:
+        payload_sha256: Hash of the ingested payload.
+        schedule_sha256: Hash of the schedule rows it was matched against.
+        valid_until: Earliest commence time among the ingested quotes; the
+            record no longer applies to observations at or after it.
+        quote_count: Quote rows written.
+        game_count: Games covered.
+        sportsbook_count: Sportsbooks covered.
+        ledger_path: Ledger partition written.
+        snapshot_path: Current snapshot written.
+    """
+
+    payload_sha256: str
+    schedule_sha256: str
+    valid_until: datetime
+    quote_count: int
+    game_count: int
+    sportsbook_count: int
+    ledger_path: Path
+    snapshot_path: Path
+
+
+class OddsResponseCache:
+    """File-backed cache of provider responses and ingest records.
+
+    Args:
+        repo: Repository root. Defaults to the configured root.
+    """
+
+    def __init__(self, repo: Path | None = None) -> None:
+        root = repo or get_settings().repo_root
+        self.root: Path = root / "data" / "odds" / "cache"
+
+    def _response_path(self, key: str) -> Path:
+        return self.root / "responses" / f"{key}.json"
+
+    def _ingest_path(self, key: str, *, season: str, week: int) -> Path:
+        return self.root / "ingested" / f"{key}-{season}-week{week:02d}.json"
+
+    def _quotes_path(self, key: str, *, season: str, week: int) -> Path:
+        return self._ingest_path(key, season=season, week=week).with_suffix(".parquet")
+
+    def _claim_path(self, key: str) -> Path:
+        return self.root / "claims" / f"{key}.claim"
+
+    def _response_stamp(self, key: str) -> tuple[int, int] | None:
+        """Identify the stored response file; each store replaces the file."""
+        try:
+            stat = self._response_path(key).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def fetch_shared(
+        self,
+        key: str,
+        fetch: Callable[[], CachedResponse],
+        *,
+        stale_after: float,
+    ) -> tuple[CachedResponse, bool]:
+        """Fetch and store the response for *key* once across processes.
+
+        The caller that creates the claim file runs *fetch*, stores the
+        response, and removes the claim. Callers that find a claim wait for
+        it to go away and take the response its owner stored. If the owner
+        stored nothing (its request failed) a waiter claims and fetches
+        itself, and a claim older than *stale_after* seconds is treated as
+        left behind by a dead process and taken over.
+
+        Args:
+            key: Request key from :func:`request_key`.
+            fetch: Issues the provider request.
+            stale_after: Age in seconds after which a claim is abandoned.
+
+        Returns:
+            The response and whether it was fetched by another caller.
+        """
+        claim = self._claim_path(key)
+        claim.parent.mkdir(parents=True, exist_ok=True)
+        before = self._response_stamp(key)
+        while True:
+            try:
+                claim.touch(exist_ok=False)
+            except FileExistsError:
+                try:
+                    age = time.time() - claim.stat().st_mtime
+                except FileNotFoundError:
+                    age = 0.0
+                if age > stale_after:
+                    logger.warning("Taking over stale odds request claim %s", claim)
+                    claim.unlink(missing_ok=True)
+                    continue
+                time.sleep(_CLAIM_POLL_S)
+                if not claim.exists() and self._response_stamp(key) != before:
+                    shared = self.load_response(key)
+                    if shared is not None:
+                        return shared, True
+                continue
+
+            try:
+                response = fetch()
+                self.store_response(key, response)
+            finally:
+                claim.unlink(missing_ok=True)
+            return response, False
+
+    def load_response(self, key: str) -> CachedResponse | None:
+        """Return the stored response for *key*, if any."""
+        document = _read_json(self._response_path(key))
+        if document is None:
+            return None
+        try:
+            return CachedResponse(
+                fetched_at=datetime.fromisoformat(document["fetched_at"]),
+                payload_sha256=str(document["payload_sha256"]),
+                payload=document["payload"],
+                usage={
+                    str(name): None if value is None else int(value)
+                    for name, value in document["usage"].items()
+                },
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            logger.warning("Ignoring malformed odds response cache entry %s", key)
+            return None
+
+    def store_response(self, key: str, response: CachedResponse) -> Path:
+        """Atomically store *response* as the latest for *key*."""
+        path = self._response_path(key)
+        _write_json(
+            path,
+            {
+                "schema_version": CACHE_SCHEMA_VERSION,
+                "fetched_at": response.fetched_at.isoformat(),
+                "payload_sha256": response.payload_sha256,
+                "usage": response.usage,
+                "payload": response.payload,
+            },
+        )
+        return path
+
+    def load_ingest(self, key: str, *, season: str, week: int) -> IngestRecord | None:
+        """Return the last ingest record for *key* in one season-week, if any."""
+        document = _read_json(self._ingest_path(key, season=season, week=week))
+        if document is None:
+            return None
+        try:
+            return IngestRecord(
+                payload_sha256=str(document["payload_sha256"]),
+                schedule_sha256=str(document["schedule_sha256"]),
+                valid_until=datetime.fromisoformat(document["valid_until"]),
+                quote_count=int(document["quote_count"]),
+                game_count=int(document["game_count"]),
+                sportsbook_count=int(document["sportsbook_count"]),
+                ledger_path=Path(document["ledger_path"]),
+                snapshot_path=Path(document["snapshot_path"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Ignoring malformed odds ingest record %s", key)
+            return None
+
+    def store_ingest(self, key: str, record: IngestRecord, *, season: str, week: int) -> Path:
+        """Atomically store *record* for one season-week."""
+        path = self._ingest_path(key, season=season, week=week)
+        _write_json(
+            path,
+            {
+                "schema_version": CACHE_SCHEMA_VERSION,
+                "payload_sha256": record.payload_sha256,
+                "schedule_sha256": record.schedule_sha256,
+                "valid_until": record.valid_until.isoformat(),
+                "quote_count": record.quote_count,
+                "game_count": record.game_count,
+                "sportsbook_count": record.sportsbook_count,
+                "ledger_path": str(record.ledger_path),
+                "snapshot_path": str(record.snapshot_path),
+            },
+        )
+        return path
+
+    def load_ingested_quotes(self, key: str, *, season: str, week: int) -> DataFrame | None:
+        """Return the quote rows last ingested for *key* in one season-week, if any."""
+        path = self._quotes_path(key, season=season, week=week)
+        try:
+            return pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, pa.ArrowException):
+            logger.warning("Ignoring unreadable odds quote cache file %s", path)
+            return None
+
+    def store_ingested_quotes(
+        self,
+        key: str,
+        quotes: DataFrame,
+        *,
+        season: str,
+        week: int,
+    ) -> Path:
+        """Atomically store the quote rows parsed for one season-week."""
+        path = self._quotes_path(key, season=season, week=week)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{uuid4().hex[:8]}.tmp")
+        quotes.to_parquet(temporary, index=False)
+        temporary.replace(path)
+        return path
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    """Read one cache document; missing or corrupt files are misses."""
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable odds cache file %s", path)
+        return None
+    if not isinstance(document, dict) or document.get("schema_version") != CACHE_SCHEMA_VERSION:
+        return None
+    return document
+
+
+def _write_json(path: Path, document: Mapping[str, object]) -> None:
+    """Write one cache document through a temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{uuid4().hex[:8]}.tmp")
+    temporary.write_text(json.dumps(document, ensure_ascii=False), encoding="utf-8")
+    temporary.replace(path)
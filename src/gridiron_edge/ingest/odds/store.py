@@ -4,14 +4,24 @@ The canonical long-format contract contains one row per provider, sportsbook,
 game, market, side, and local observation. Generic storage owns validation and
 atomic persistence only; provider parsing and canonical game matching belong to
 provider adapters.
+
+Historical observations live in one directory per season-and-week partition.
+The first fetch writes ``observations.parquet``; each later fetch writes one
+immutable file under ``segments/`` instead of rewriting the partition. A small
+``fetch_index.json`` maps every file to the ``fetched_at`` values it holds, so
+an append only reads files that share a fetch timestamp with the new rows when
+checking duplicates and conflicts. Loaders merge the base file and segments at
+read time; :func:`compact_odds_ledger` folds segments back into the base file.
 """
 
 from __future__ import annotations
 
 import datetime
+import json
 import logging
 from logging import Logger
 from pathlib import Path
+from typing import Final
 from uuid import uuid4
 
 import pandas as pd
@@ -102,6 +112,10 @@ _NULLABLE_TEXT_COLUMNS: tuple[str, ...] = (
     "sportsbook",
 )
 
+_PARTITION_BASE_NAME: Final[str] = "observations.parquet"
+_SEGMENT_DIR_NAME: Final[str] = "segments"
+_FETCH_INDEX_NAME: Final[str] = "fetch_index.json"
+
 
 def empty_quote_frame() -> DataFrame:
     """Return an empty frame with the canonical quote column order."""
@@ -267,7 +281,7 @@ def odds_history_partition_path(
         _history_root(repo)
         / f"season={normalized_season}"
         / f"week={week:02d}"
-        / "observations.parquet"
+        / _PARTITION_BASE_NAME
     )
 
 
@@ -282,21 +296,90 @@ def _single_partition_scope(rows: DataFrame) -> tuple[str, int]:
     return str(scope["season"]), int(scope["week"])
 
 
-def _matching_history_paths(
+def _matching_partitions(
     *,
     season: str | None,
     week: int | None,
     repo: Path | None,
 ) -> list[Path]:
-    """Return deterministic matching history partitions."""
+    """Return deterministic matching history partition directories."""
     root = _history_root(repo)
     if season is not None and week is not None:
-        path = odds_history_partition_path(season=season, week=week, repo=repo)
-        return [path] if path.is_file() else []
+        partition = odds_history_partition_path(season=season, week=week, repo=repo).parent
+        return [partition] if partition.is_dir() else []
 
     season_pattern = f"season={season}" if season is not None else "season=*"
     week_pattern = f"week={week:02d}" if week is not None else "week=*"
-    return sorted(root.glob(f"{season_pattern}/{week_pattern}/observations.parquet"))
+    return sorted(path for path in root.glob(f"{season_pattern}/{week_pattern}") if path.is_dir())
+
+
+def _partition_files(partition: Path) -> list[Path]:
+    """Return the base file followed by fetch segments in name order."""
+    base = partition / _PARTITION_BASE_NAME
+    files = [base] if base.is_file() else []
+    return files + sorted((partition / _SEGMENT_DIR_NAME).glob("*.parquet"))
+
+
+def _fetch_keys(fetched_at: Series) -> list[str]:
+    """Return the sorted distinct fetch timestamps of validated rows."""
+    return sorted({pd.Timestamp(value).isoformat() for value in fetched_at.unique()})
+
+
+def _load_fetch_index(partition: Path) -> dict[str, list[str]]:
+    """Return ``file -> fetched_at keys`` for every file in one partition.
+
+    Files missing from the persisted index (for example a segment written
+    before an interrupted index update) are indexed from their
+    ``fetched_at`` column, and entries for deleted files are dropped.
+    """
+    path = partition / _FETCH_INDEX_NAME
+    persisted: dict[str, list[str]] = (
+        json.loads(path.read_text())["files"] if path.is_file() else {}
+    )
+    index: dict[str, list[str]] = {}
+    for file in _partition_files(partition):
+        name = file.relative_to(partition).as_posix()
+        if name in persisted:
+            index[name] = persisted[name]
+        else:
+            index[name] = _fetch_keys(pd.read_parquet(file, columns=["fetched_at"])["fetched_at"])
+    return index
+
+
+def _write_fetch_index(partition: Path, index: dict[str, list[str]]) -> None:
+    """Atomically replace one partition's fetch index."""
+    path = partition / _FETCH_INDEX_NAME
+    temporary = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        temporary.write_text(json.dumps({"files": index}, indent=2, sort_keys=True) + "\n")
+        temporary.replace(path)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+def _read_partition_files(
+    files: list[Path],
+    *,
+    filters: list[tuple[str, str, object]] | None = None,
+) -> DataFrame:
+    """Read, validate, and deduplicate rows from one or more ledger files."""
+    frames = [pd.read_parquet(file, filters=filters) for file in files]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return empty_quote_frame()
+    rows = validate_quote_rows(pd.concat(frames, ignore_index=True))
+    # An interrupted compaction can leave a segment beside a base file that
+    # already contains it; identical observations collapse here.
+    return rows.drop_duplicates(
+        subset=list(OBSERVATION_IDENTITY_COLUMNS),
+        keep="last",
+    ).reset_index(drop=True)
+
+
+def _segment_path(partition: Path, rows: DataFrame) -> Path:
+    """Return a unique, chronologically sortable segment path for one fetch."""
+    first_fetch = pd.Timestamp(rows["fetched_at"].min()).strftime("%Y%m%dT%H%M%S%fZ")
+    return partition / _SEGMENT_DIR_NAME / f"fetch-{first_fetch}-{uuid4().hex[:8]}.parquet"
 
 
 def _atomic_write_parquet(rows: DataFrame, path: Path) -> None:
@@ -350,25 +433,91 @@ def append_to_odds_ledger(
     *,
     repo: Path | None = None,
 ) -> Path:
-    """Append normalized observations to one atomic weekly partition."""
+    """Append normalized observations to one weekly partition.
+
+    Only files indexed under the same ``fetched_at`` values as the new rows
+    are read: rows already recorded are skipped and a changed value for an
+    existing fetch identity is rejected. New rows become the partition base
+    file on the first fetch and an immutable segment afterwards.
+
+    Returns:
+        The file holding the appended rows, or the partition base path when
+        every row was already recorded.
+    """
     normalized = validate_quote_rows(quotes)
     season, week = _single_partition_scope(normalized)
-    path = odds_history_partition_path(season=season, week=week, repo=repo)
-
-    if path.exists():
-        existing = validate_quote_rows(pd.read_parquet(path))
-        existing_scope = _single_partition_scope(existing)
-        if existing_scope != (season, week):
+    normalized = _canonicalize_observations(normalized)
+    base = odds_history_partition_path(season=season, week=week, repo=repo)
+    partition = base.parent
+    index = _load_fetch_index(partition)
+
+    new_keys = set(_fetch_keys(normalized["fetched_at"]))
+    overlapping = [partition / name for name, keys in index.items() if new_keys & set(keys)]
+    existing = _read_partition_files(overlapping) if overlapping else empty_quote_frame()
+    if not existing.empty:
+        if _single_partition_scope(existing) != (season, week):
             raise ValueError("Existing quote partition contains an invalid scope.")
+        existing = existing.loc[existing["fetched_at"].isin(normalized["fetched_at"]), :]
         combined = pd.concat([existing, normalized], ignore_index=True)
-    else:
-        combined = normalized
+        duplicated = combined.duplicated(subset=list(OBSERVATION_IDENTITY_COLUMNS), keep="first")
+        _validate_observation_conflicts(combined.loc[~duplicated, :])
+        is_new = ~duplicated.iloc[len(existing) :].to_numpy()
+        normalized = normalized.loc[is_new, :].reset_index(drop=True)
 
-    output = _canonicalize_observations(validate_quote_rows(combined))
-    path.parent.mkdir(parents=True, exist_ok=True)
-    _atomic_write_parquet(output, path)
-    logger.info("Odds observation partition: %d rows -> %s", len(output), path)
-    return path
+    if normalized.empty:
+        logger.info("Odds observation partition: no new rows for %s", partition)
+        return base
+
+    target = _segment_path(partition, normalized) if index else base
+    target.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write_parquet(normalized, target)
+    index[target.relative_to(partition).as_posix()] = _fetch_keys(normalized["fetched_at"])
+    _write_fetch_index(partition, index)
+    logger.info("Odds observation partition: %d new rows -> %s", len(normalized), target)
+    return target
+
+
+def _compact_partition(partition: Path) -> Path:
+    """Fold one partition's segments into its base file."""
+    base = partition / _PARTITION_BASE_NAME
+    files = _partition_files(partition)
+    segments = [file for file in files if file != base]
+    if not segments:
+        return base
+
+    rows = _canonicalize_observations(_read_partition_files(files))
+    _atomic_write_parquet(rows, base)
+    _write_fetch_index(partition, {_PARTITION_BASE_NAME: _fetch_keys(rows["fetched_at"])})
+    for segment in segments:
+        segment.unlink(missing_ok=True)
+    logger.info(
+        "Compacted odds partition: %d segments, %d rows -> %s",
+        len(segments),
+        len(rows),
+        base,
+    )
+    return base
+
+
+def compact_odds_ledger(
+    *,
+    season: str | None = None,
+    week: int | None = None,
+    repo: Path | None = None,
+) -> list[Path]:
+    """Rewrite matching partitions as a single base file each.
+
+    Compaction is safe to interrupt: the base file is replaced atomically
+    before segments are removed, and loaders collapse any observation that
+    survives in both.
+
+    Returns:
+        The base file path of every matching partition.
+    """
+    return [
+        _compact_partition(partition)
+        for partition in _matching_partitions(season=season, week=week, repo=repo)
+    ]
 
 
 def write_current_odds_snapshot(
@@ -409,12 +558,29 @@ def load_odds_ledger(
     repo: Path | None = None,
 ) -> DataFrame:
     """Load partitioned quote history with optional provider-aware filters."""
-    paths = _matching_history_paths(season=season, week=week, repo=repo)
-    if not paths:
+    partitions = _matching_partitions(season=season, week=week, repo=repo)
+    if not partitions:
         return empty_quote_frame()
 
-    frames = [validate_quote_rows(pd.read_parquet(path)) for path in paths]
-    rows = validate_quote_rows(pd.concat(frames, ignore_index=True))
+    # Provider, sportsbook, and market filters are pushed into each file read
+    # so segments are merged only for the rows a caller asked for.
+    filters: list[tuple[str, str, object]] | None = [
+        (column, "==", value)
+        for column, value in (
+            ("provider", provider),
+            ("sportsbook", sportsbook),
+            ("market", market),
+        )
+        if value is not None
+    ] or None
+    frames = [
+        _read_partition_files(_partition_files(partition), filters=filters)
+        for partition in partitions
+    ]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return empty_quote_frame()
+    rows = pd.concat(frames, ignore_index=True)
     for column, value in (
         ("provider", provider),
         ("sportsbook", sportsbook),
@@ -5,14 +5,24 @@ from __future__ import annotations
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+import hashlib
 import math
 from pathlib import Path
+import threading
 from typing import Final
 
 import pandas as pd
 from pandas import DataFrame
 import requests
 
+from gridiron_edge.ingest.odds.cache import (
+    CachedResponse,
+    IngestRecord,
+    OddsResponseCache,
+    RequestCoalescer,
+    payload_sha256,
+    request_key,
+)
 from gridiron_edge.ingest.odds.store import (
     QUOTE_COLUMNS,
     append_to_odds_ledger,
@@ -91,21 +101,26 @@ def _normalize_team(value: object, *, label: str) -> str:
     return " ".join(_text(value, label=label).casefold().split())
 
 
-def _schedule_lookup(
-    schedule: DataFrame,
-    *,
-    season: str,
-    week: int,
-) -> dict[tuple[str, str], Mapping[object, object]]:
-    """Index one canonical weekly schedule by normalized away/home names."""
+def _scoped_schedule(schedule: DataFrame, *, season: str, week: int) -> DataFrame:
+    """Return the canonical schedule rows for one season-week."""
     missing = sorted(set(_REQUIRED_SCHEDULE_COLUMNS) - set(schedule.columns))
     if missing:
         raise ValueError("Rich schedule is missing required columns: " + ", ".join(missing))
 
-    scoped = schedule.loc[
+    return schedule.loc[
         (schedule["season"].astype(str) == season) & (schedule["week"] == week),
         :,
     ]
+
+
+def _schedule_lookup(
+    schedule: DataFrame,
+    *,
+    season: str,
+    week: int,
+) -> dict[tuple[str, str], Mapping[object, object]]:
+    """Index one canonical weekly schedule by normalized away/home names."""
+    scoped = _scoped_schedule(schedule, season=season, week=week)
     lookup: dict[tuple[str, str], Mapping[object, object]] = {}
     for row in scoped.to_dict(orient="records"):
         key = (
@@ -259,6 +274,10 @@ class OddsApiResponse:
     usage: OddsApiUsage
 
 
+# Concurrent collection jobs for the same request share one provider call.
+_REQUEST_COALESCER: RequestCoalescer[OddsApiResponse] = RequestCoalescer()
+
+
 def _optional_header_int(headers: Mapping[str, str], name: str) -> int | None:
     """Parse one optional nonnegative integer response header."""
     value = headers.get(name)
@@ -273,27 +292,51 @@ def _optional_header_int(headers: Mapping[str, str], name: str) -> int | None:
     return parsed
 
 
+def _odds_request(api_key: str) -> tuple[str, dict[str, str]]:
+    """Return the current-odds endpoint URL and query parameters."""
+    url = f"{THE_ODDS_API_BASE_URL}/sports/{THE_ODDS_API_SPORT_KEY}/odds"
+    params = {
+        "apiKey": api_key,
+        "regions": THE_ODDS_API_REGIONS,
+        "markets": THE_ODDS_API_MARKETS,
+        "oddsFormat": "american",
+        "dateFormat": "iso",
+    }
+    return url, params
+
+
 def fetch_the_odds_api_payload(
     *,
     api_key: str,
     session: requests.Session | None = None,
     timeout: float = 15.0,
 ) -> OddsApiResponse:
-    """Fetch current NFL featured-market odds from The Odds API v4."""
+    """Fetch current NFL featured-market odds from The Odds API v4.
+
+    Overlapping calls for the same request within the process share a single
+    HTTP call and receive the same response.
+    """
     if not api_key.strip():
         raise ValueError("api_key must not be empty.")
     if timeout <= 0:
         raise ValueError("timeout must be positive.")
 
     client = session or requests.Session()
-    url = f"{THE_ODDS_API_BASE_URL}/sports/{THE_ODDS_API_SPORT_KEY}/odds"
-    params = {
-        "apiKey": api_key,
-        "regions": THE_ODDS_API_REGIONS,
-        "markets": THE_ODDS_API_MARKETS,
-        "oddsFormat": "american",
-        "dateFormat": "iso",
-    }
+    url, params = _odds_request(api_key)
+    return _REQUEST_COALESCER.run(
+        (url, tuple(sorted(params.items()))),
+        lambda: _get_the_odds_api_payload(client, url, params, timeout=timeout),
+    )
+
+
+def _get_the_odds_api_payload(
+    client: requests.Session,
+    url: str,
+    params: dict[str, str],
+    *,
+    timeout: float,
+) -> OddsApiResponse:
+    """Issue one provider request and validate its payload and quota headers."""
     try:
         response = client.get(url, params=params, timeout=timeout)
         response.raise_for_status()
@@ -331,7 +374,15 @@ class OddsIngestPartialPersistenceError(OddsIngestError):
 
 @dataclass(frozen=True, slots=True)
 class OddsIngestResult:
-    """Summary of one successful current-market ingestion."""
+    """Summary of one successful current-market ingestion.
+
+    ``unchanged`` marks a payload identical to the one last ingested for the
+    season-week. The payload was then not parsed and only the current
+    snapshot was rewritten (to advance its ``fetched_at``); the counts and
+    ledger path describe that earlier ingestion. ``cache_hit`` marks a run
+    served from the local response cache, or from another process's
+    in-flight request, without a provider request of its own.
+    """
 
     quote_count: int
     game_count: int
@@ -339,6 +390,47 @@ class OddsIngestResult:
     ledger_path: Path
     snapshot_path: Path
     usage: OddsApiUsage
+    unchanged: bool = False
+    cache_hit: bool = False
+
+
+# Serializes the unchanged-payload check with the artifact writes it guards, so
+# coalesced callers ingest a shared payload once.
+_INGEST_LOCK = threading.Lock()
+
+
+def _schedule_sha256(schedule: DataFrame, *, season: str, week: int) -> str:
+    """Hash the schedule rows a payload is matched against."""
+    scoped = _scoped_schedule(schedule, season=season, week=week)
+    rows = scoped.loc[:, list(_REQUIRED_SCHEDULE_COLUMNS)].astype(str)
+    hashed = pd.util.hash_pandas_object(rows, index=False).to_numpy()
+    return hashlib.sha256(hashed.tobytes()).hexdigest()
+
+
+def _cached_usage(cached: CachedResponse) -> OddsApiUsage:
+    """Return the stored quota counters for a response reused without a request."""
+    return OddsApiUsage(
+        requests_remaining=cached.usage.get("requests_remaining"),
+        requests_used=cached.usage.get("requests_used"),
+        request_cost=0,
+    )
+
+
+def _is_unchanged(
+    record: IngestRecord,
+    *,
+    digest: str,
+    schedule_digest: str,
+    observed_at: datetime,
+) -> bool:
+    """Return whether *record* still describes ingesting this payload now."""
+    return (
+        record.payload_sha256 == digest
+        and record.schedule_sha256 == schedule_digest
+        and observed_at < record.valid_until
+        and record.ledger_path.exists()
+        and record.snapshot_path.exists()
+    )
 
 
 def ingest_the_odds_api_current(
@@ -351,48 +443,148 @@ def ingest_the_odds_api_current(
     session: requests.Session | None = None,
     timeout: float = 15.0,
     fetched_at: datetime | None = None,
+    max_age: timedelta | None = None,
 ) -> OddsIngestResult:
     """Fetch, parse, and atomically persist current pregame NFL quotes.
 
     Request, JSON, payload, and matching failures happen before either quote
     artifact is written. Partial canonical schedule coverage is allowed; a pull
     with no usable matched quote rows is rejected.
+
+    Every response is stored in the local :class:`OddsResponseCache`. With
+    ``max_age`` set, a cached response at most that old is reused instead of
+    requesting the provider; its quotes carry the cached fetch time. A
+    request already in flight in another process for the same odds is
+    waited for and its response reused the same way. A
+    payload identical to the last one ingested for the season-week, against
+    the same schedule and before any of its games kicks off, is neither parsed
+    nor appended to the ledger again: the quote rows stored with the ingest
+    record are re-stamped and written as the current snapshot, so its
+    ``fetched_at`` records the newer confirmation of those prices.
     """
+    # Deferred: the columnar parser builds on this module's row-level helpers.
+    from gridiron_edge.ingest.odds.the_odds_api_arrow import parse_the_odds_api_payload_arrow
+
     observed_at = fetched_at or datetime.now(UTC)
-    response = fetch_the_odds_api_payload(
-        api_key=api_key,
-        session=session,
-        timeout=timeout,
+    if not api_key.strip():
+        raise ValueError("api_key must not be empty.")
+    cache = OddsResponseCache(repo)
+    key = request_key(*_odds_request(api_key))
+
+    cached = cache.load_response(key) if max_age is not None else None
+    cache_hit = (
+        cached is not None
+        and max_age is not None
+        and timedelta(0) <= observed_at - cached.fetched_at <= max_age
     )
+    if cached is None or not cache_hit:
+
+        def fetch() -> CachedResponse:
+            fetched = fetch_the_odds_api_payload(api_key=api_key, session=session, timeout=timeout)
+            return CachedResponse(
+                fetched_at=observed_at,
+                payload_sha256=payload_sha256(fetched.payload),
+                payload=fetched.payload,
+                usage={
+                    "requests_remaining": fetched.usage.requests_remaining,
+                    "requests_used": fetched.usage.requests_used,
+                    "request_cost": fetched.usage.request_cost,
+                },
+            )
+
+        # A collection job in another process may already be requesting the
+        # same odds; wait for its response rather than spending quota twice.
+        cached, cache_hit = cache.fetch_shared(key, fetch, stale_after=2 * timeout)
+    response = OddsApiResponse(
+        payload=_objects(cached.payload, label="cached payload"),
+        usage=_cached_usage(cached)
+        if cache_hit
+        else OddsApiUsage(
+            requests_remaining=cached.usage.get("requests_remaining"),
+            requests_used=cached.usage.get("requests_used"),
+            request_cost=cached.usage.get("request_cost"),
+        ),
+    )
+    digest = cached.payload_sha256
+    prices_at = cached.fetched_at
     if not response.payload:
         raise OddsIngestError("The Odds API returned no events; quote artifacts were not updated.")
 
-    quotes = parse_the_odds_api_payload(
-        response.payload,
-        schedule,
-        season=season,
-        week=week,
-        fetched_at=observed_at,
-    )
-    if quotes.empty:
-        raise OddsIngestError(
-            "The Odds API returned no usable matched pregame quotes; "
-            "quote artifacts were not updated."
+    schedule_digest = _schedule_sha256(schedule, season=season, week=week)
+    with _INGEST_LOCK:
+        record = cache.load_ingest(key, season=season, week=week)
+        ingested = (
+            cache.load_ingested_quotes(key, season=season, week=week)
+            if record is not None
+            and _is_unchanged(
+                record,
+                digest=digest,
+                schedule_digest=schedule_digest,
+                observed_at=observed_at,
+            )
+            else None
         )
+        if record is not None and ingested is not None:
+            # Same prices: the ledger already holds them, but the snapshot must
+            # still advance its fetched_at or the market reads as stale. No game
+            # has kicked off since, so re-stamping the stored rows matches what
+            # parsing the payload again would produce.
+            quotes = ingested.assign(fetched_at=_utc_timestamp(prices_at, label="fetched_at"))
+            return OddsIngestResult(
+                quote_count=record.quote_count,
+                game_count=record.game_count,
+                sportsbook_count=record.sportsbook_count,
+                ledger_path=record.ledger_path,
+                snapshot_path=write_current_odds_snapshot(quotes, repo=repo),
+                usage=response.usage,
+                unchanged=True,
+                cache_hit=cache_hit,
+            )
 
-    ledger_path = append_to_odds_ledger(quotes, repo=repo)
-    try:
-        snapshot_path = write_current_odds_snapshot(quotes, repo=repo)
-    except Exception as exc:
-        raise OddsIngestPartialPersistenceError(
-            "Quote observations were persisted to the historical ledger, "
-            "but the current snapshot was not replaced."
-        ) from exc
-    return OddsIngestResult(
-        quote_count=len(quotes),
-        game_count=int(quotes["game_id"].nunique()),
-        sportsbook_count=int(quotes["sportsbook"].nunique()),
-        ledger_path=ledger_path,
-        snapshot_path=snapshot_path,
-        usage=response.usage,
-    )
+        quotes = parse_the_odds_api_payload_arrow(
+            response.payload,
+            schedule,
+            season=season,
+            week=week,
+            fetched_at=prices_at,
+        )
+        if quotes.empty:
+            raise OddsIngestError(
+                "The Odds API returned no usable matched pregame quotes; "
+                "quote artifacts were not updated."
+            )
+
+        ledger_path = append_to_odds_ledger(quotes, repo=repo)
+        try:
+            snapshot_path = write_current_odds_snapshot(quotes, repo=repo)
+        except Exception as exc:
+            raise OddsIngestPartialPersistenceError(
+                "Quote observations were persisted to the historical ledger, "
+                "but the current snapshot was not replaced."
+            ) from exc
+        result = OddsIngestResult(
+            quote_count=len(quotes),
+            game_count=int(quotes["game_id"].nunique()),
+            sportsbook_count=int(quotes["sportsbook"].nunique()),
+            ledger_path=ledger_path,
+            snapshot_path=snapshot_path,
+            usage=response.usage,
+            cache_hit=cache_hit,
+        )
+        cache.store_ingested_quotes(key, quotes, season=season, week=week)
+        cache.store_ingest(
+            key,
+            IngestRecord(
+                payload_sha256=digest,
+                schedule_sha256=schedule_digest,
+                valid_until=quotes["commence_time"].min().to_pydatetime(),
+                quote_count=result.quote_count,
+                game_count=result.game_count,
+                sportsbook_count=result.sportsbook_count,
+                ledger_path=ledger_path,
+                snapshot_path=snapshot_path,
+            ),
+            season=season,
+            week=week,
+        )
+    return result
@@ -0,0 +1,451 @@
+"""Columnar parser for The Odds API v4 NFL payloads.
+
+:func:`~gridiron_edge.ingest.odds.the_odds_api.parse_the_odds_api_payload`
+walks the nested event, bookmaker, market, and outcome objects in Python,
+validating every scalar on the way, and then re-validates the row frame
+through :func:`~gridiron_edge.ingest.odds.store.validate_quote_rows`.
+:func:`parse_the_odds_api_payload_arrow` instead converts the whole payload to
+one nested Arrow array (type inference and conversion run in C++), flattens
+each level with its list offsets, and applies the same rules as vectorized
+checks, producing the normalized quote frame directly.
+
+The fast path only accepts what it can prove valid. When any check fails,
+including payload shapes Arrow cannot type (mixed value types, non-ASCII
+names whose case folding differs from lowercasing, unusual timestamp
+spellings), the payload is handed to the row parser, which either accepts it
+or raises its usual, specific :class:`OddsPayloadError`. Both parsers accept
+exactly the same payloads and return equal frames.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Final, cast
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+import pyarrow as pa
+import pyarrow.compute as pyarrow_compute
+
+from gridiron_edge.ingest.odds.store import QUOTE_COLUMNS, validate_quote_rows
+from gridiron_edge.ingest.odds.the_odds_api import (
+    THE_ODDS_API_PROVIDER,
+    THE_ODDS_API_SPORT_KEY,
+    _schedule_lookup,
+    _utc_timestamp,
+    parse_the_odds_api_payload,
+)
+
+# pyarrow.compute registers its kernels at import time, so type checkers see
+# none of them; treat the module as dynamic.
+pc: Any = pyarrow_compute
+
+# Provider market keys in code order; ``_CANONICAL_MARKETS[i]`` is the quote
+# market for ``_PROVIDER_MARKETS[i]``.
+_PROVIDER_MARKETS: Final[tuple[str, ...]] = ("h2h", "spreads", "totals")
+_CANONICAL_MARKETS: Final[np.ndarray] = np.array(["moneyline", "spread", "total"], dtype=object)
+_MONEYLINE: Final[int] = 0
+_TOTAL: Final[int] = 2
+
+# ASCII characters ``str.split()`` and ``str.strip()`` treat as whitespace.
+_WHITESPACE: Final[str] = " \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f"
+_WHITESPACE_RUN: Final[str] = r"[ \t\n\x0b\x0c\r\x1c-\x1f]+"
+
+# ISO 8601 spellings accepted without consulting the row parser: an explicit
+# UTC designator is required, matching the row parser's tz-aware UTC rule.
+_UTC_ISO_PATTERN: Final[str] = (
+    r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d{1,9})?)?(Z|[+-]00:?00)$"
+)
+
+_SCHEDULE_TEXT_COLUMNS: Final[tuple[str, ...]] = ("game_id", "game_date", "away_team", "home_team")
+
+
+class _UnprovenPayloadError(Exception):
+    """Raised when the columnar checks cannot prove a payload valid."""
+
+
+def _require(condition: bool) -> None:
+    if not condition:
+        raise _UnprovenPayloadError
+
+
+def _field(values: pa.StructArray, name: str) -> pa.Array:
+    """Return one struct child, or all nulls when no object has the key."""
+    index = values.type.get_field_index(name)
+    if index < 0:
+        return pa.nulls(len(values))
+    return values.field(index)
+
+
+def _events(payload: object) -> pa.StructArray | None:
+    """Convert the payload to one struct per event; ``None`` when empty."""
+    _require(isinstance(payload, list))
+    if not payload:
+        return None
+    try:
+        events = pa.array(payload)
+    except (pa.ArrowException, OverflowError, TypeError, ValueError) as exc:
+        raise _UnprovenPayloadError from exc
+    _require(pa.types.is_struct(events.type) and events.null_count == 0)
+    return events
+
+
+def _children(lists: pa.ListArray) -> tuple[pa.StructArray, np.ndarray, np.ndarray] | None:
+    """Flatten one list-of-objects column; ``None`` when there are no children.
+
+    Returns:
+        The child objects and, per child, the index of its parent row and
+        its position within the parent's list.
+    """
+    _require(lists.null_count == 0)
+    if len(lists) == 0:
+        return None
+    _require(pa.types.is_list(lists.type))
+    flat = pc.list_flatten(lists)
+    if len(flat) == 0:
+        return None
+    _require(pa.types.is_struct(flat.type) and flat.null_count == 0)
+    parents = pc.list_parent_indices(lists).to_numpy()
+    offsets = lists.offsets.to_numpy()
+    positions = np.arange(len(flat)) + offsets[0] - offsets[parents]
+    return flat, parents, positions
+
+
+def _text(values: pa.Array) -> pa.Array:
+    """Return stripped, required, nonempty ASCII text."""
+    _require(pa.types.is_string(values.type) and values.null_count == 0)
+    _require(pc.all(pc.string_is_ascii(values)).as_py())
+    stripped = pc.utf8_trim(values, characters=_WHITESPACE)
+    _require(not pc.any(pc.equal(pc.binary_length(stripped), 0)).as_py())
+    return stripped
+
+
+def _names(values: pa.Array) -> pa.Array:
+    """Return case-folded, whitespace-collapsed names for exact matching."""
+    lowered = pc.utf8_lower(_text(values))
+    return pc.replace_substring_regex(lowered, _WHITESPACE_RUN, " ")
+
+
+def _timestamps(values: pa.Array) -> np.ndarray:
+    """Parse required timezone-aware UTC ISO 8601 timestamps.
+
+    Returns:
+        Naive ``datetime64[ns]`` values in UTC.
+    """
+    _require(pa.types.is_string(values.type) and values.null_count == 0)
+    if len(values) == 0:
+        return np.array([], dtype="datetime64[ns]")
+    _require(pc.all(pc.match_substring_regex(values, _UTC_ISO_PATTERN)).as_py())
+    parsed = pd.to_datetime(
+        values.to_numpy(zero_copy_only=False),
+        format="ISO8601",
+        utc=True,
+        errors="coerce",
+    )
+    _require(not parsed.isna().any())
+    return parsed.tz_convert(None).as_unit("ns").to_numpy()
+
+
+def _utc(values: np.ndarray) -> pd.DatetimeIndex:
+    """Localize naive UTC ``datetime64[ns]`` values."""
+    return pd.DatetimeIndex(values).tz_localize("UTC")
+
+
+def _mask(values: pa.Array) -> np.ndarray:
+    """Return an Arrow boolean array as a NumPy mask."""
+    return values.to_numpy(zero_copy_only=False).astype(bool)
+
+
+def _numbers(values: pa.Array) -> np.ndarray:
+    """Return required finite numeric values as float64."""
+    _require(
+        len(values) == 0 or pa.types.is_integer(values.type) or pa.types.is_floating(values.type)
+    )
+    _require(values.null_count == 0)
+    numbers = values.to_numpy(zero_copy_only=False).astype(float)
+    _require(bool(np.isfinite(numbers).all()))
+    return numbers
+
+
+def _schedule_columns(
+    rows: list[Mapping[object, object]],
+) -> dict[str, np.ndarray]:
+    """Return per-event schedule values, requiring what quote validation does."""
+    columns: dict[str, np.ndarray] = {}
+    for column in _SCHEDULE_TEXT_COLUMNS:
+        values = np.empty(len(rows), dtype=object)
+        values[:] = [row[column] for row in rows]
+        _require(not any(pd.isna(value) or not str(value).strip() for value in values))
+        columns[column] = values
+    for column in ("game_id", "away_team", "home_team"):
+        columns[column] = columns[column].astype(str).astype(object)
+    return columns
+
+
+def parse_the_odds_api_payload_arrow(
+    payload: object,
+    schedule: DataFrame,
+    *,
+    season: str,
+    week: int,
+    fetched_at: datetime,
+) -> DataFrame:
+    """Parse supported pregame NFL odds through Arrow columns.
+
+    Same contract, filtering, and result as
+    :func:`~gridiron_edge.ingest.odds.the_odds_api.parse_the_odds_api_payload`;
+    payloads the vectorized checks cannot prove valid, or whose values Arrow
+    cannot convert (integers outside int64, for example), are parsed by that
+    function instead.
+    """
+    if not season.strip():
+        raise ValueError("season must not be empty.")
+    if week < 1:
+        raise ValueError("week must be at least 1.")
+    observed_at = _utc_timestamp(fetched_at, label="fetched_at")
+
+    try:
+        events = _events(payload)
+        schedule_by_teams = _schedule_lookup(schedule, season=season, week=week)
+        return _parse_events(
+            cast(list[Any], payload),
+            events,
+            schedule_by_teams,
+            season=season,
+            week=week,
+            observed_at=observed_at,
+        )
+    except (_UnprovenPayloadError, OverflowError, pa.ArrowException):
+        return parse_the_odds_api_payload(
+            payload,
+            schedule,
+            season=season,
+            week=week,
+            fetched_at=fetched_at,
+        )
+
+
+def _empty_quotes() -> DataFrame:
+    return validate_quote_rows(DataFrame([], columns=list(QUOTE_COLUMNS)))
+
+
+@dataclass(frozen=True)
+class _MatchedEvents:
+    """Pregame NFL events matched to the schedule, one row per event."""
+
+    events: pa.StructArray
+    positions: np.ndarray
+    ids: pa.Array
+    commence: np.ndarray
+    away_keys: pa.Array
+    home_keys: pa.Array
+    schedule: dict[str, np.ndarray]
+
+
+@dataclass(frozen=True)
+class _SupportedMarkets:
+    """Supported markets of matched events, one row per market."""
+
+    markets: pa.StructArray
+    positions: np.ndarray
+    codes: np.ndarray
+    books: np.ndarray
+    sportsbooks: pa.Array
+    book_events: np.ndarray
+    book_positions: np.ndarray
+    updated_at: np.ndarray
+
+
+def _matched_events(
+    events: pa.StructArray,
+    schedule_by_teams: dict[tuple[str, str], Mapping[object, object]],
+    *,
+    observed_at: pd.Timestamp,
+) -> _MatchedEvents | None:
+    """Keep NFL, then pregame, then schedule-matched events.
+
+    Each rule is checked only on the events the row parser checks it on.
+    """
+    sport_keys = _field(events, "sport_key")
+    if not pa.types.is_string(sport_keys.type):
+        return None
+    nfl = pc.fill_null(pc.equal(sport_keys, THE_ODDS_API_SPORT_KEY), False)
+    events = events.filter(nfl)
+    positions = np.flatnonzero(_mask(nfl))
+    ids = _text(_field(events, "id"))
+    commence = _timestamps(_field(events, "commence_time"))
+    pregame = pa.array(commence > observed_at.tz_convert(None).as_unit("ns").to_datetime64())
+    events = events.filter(pregame)
+
+    away_keys = _names(_field(events, "away_team"))
+    home_keys = _names(_field(events, "home_team"))
+    rows = [
+        schedule_by_teams.get(key)
+        for key in zip(away_keys.to_pylist(), home_keys.to_pylist(), strict=True)
+    ]
+    matched = np.array([row is not None for row in rows], dtype=bool)
+    if not matched.any():
+        return None
+    keep = pa.array(matched)
+    return _MatchedEvents(
+        events=events.filter(keep),
+        positions=positions[_mask(pregame)][matched],
+        ids=ids.filter(pregame).filter(keep),
+        commence=commence[_mask(pregame)][matched],
+        away_keys=away_keys.filter(keep),
+        home_keys=home_keys.filter(keep),
+        schedule=_schedule_columns([row for row in rows if row is not None]),
+    )
+
+
+def _supported_markets(events: pa.StructArray) -> _SupportedMarkets | None:
+    """Flatten bookmakers and their supported markets.
+
+    Every bookmaker needs a key and update time; unsupported market keys are
+    skipped before any other market check.
+    """
+    flattened = _children(_field(events, "bookmakers"))
+    if flattened is None:
+        return None
+    books, book_events, book_positions = flattened
+    sportsbooks = _text(_field(books, "key"))
+    book_updated = _timestamps(_field(books, "last_update"))
+
+    flattened = _children(_field(books, "markets"))
+    if flattened is None:
+        return None
+    markets, market_books, market_positions = flattened
+    keys = _field(markets, "key")
+    if not pa.types.is_string(keys.type):
+        return None
+    codes = pc.index_in(keys, value_set=pa.array(_PROVIDER_MARKETS))
+    supported = _mask(codes.is_valid())
+    if not supported.any():
+        return None
+    markets = markets.filter(pa.array(supported))
+    market_books = market_books[supported]
+
+    updated_at = book_updated[market_books]
+    overrides = _field(markets, "last_update")
+    has_override = _mask(overrides.is_valid())
+    if has_override.any():
+        updated_at[has_override] = _timestamps(overrides.filter(pa.array(has_override)))
+    return _SupportedMarkets(
+        markets=markets,
+        positions=market_positions[supported],
+        codes=codes.drop_null().to_numpy().astype(int),
+        books=market_books,
+        sportsbooks=sportsbooks,
+        book_events=book_events,
+        book_positions=book_positions,
+        updated_at=updated_at,
+    )
+
+
+def _sides(
+    names: pa.Array,
+    codes: np.ndarray,
+    events: np.ndarray,
+    matched: _MatchedEvents,
+) -> np.ndarray:
+    """Map outcome names to canonical sides; every outcome must resolve."""
+    event_index = pa.array(events)
+    team_market = codes != _TOTAL
+    sides = np.full(len(codes), None, dtype=object)
+    sides[~team_market & _mask(pc.equal(names, "over"))] = "over"
+    sides[~team_market & _mask(pc.equal(names, "under"))] = "under"
+    sides[team_market & _mask(pc.equal(names, matched.home_keys.take(event_index)))] = "home"
+    sides[team_market & _mask(pc.equal(names, matched.away_keys.take(event_index)))] = "away"
+    _require(not pd.isna(sides).any())
+    return sides
+
+
+def _require_not_booleans(
+    payload: list[Any],
+    values: np.ndarray,
+    locations: np.ndarray,
+    *,
+    key: str,
+) -> None:
+    """Rule out JSON booleans among numeric outcome values.
+
+    Arrow converts ``true``/``false`` to 1/0 in numeric columns, so only those
+    two values are ambiguous; each is looked up in the source object.
+    """
+    for row in np.flatnonzero((values == 0) | (values == 1)):
+        event, book, market, outcome = locations[:, row]
+        bookmaker = payload[event]["bookmakers"][book]
+        value = bookmaker["markets"][market]["outcomes"][outcome][key]
+        _require(not isinstance(value, bool))
+
+
+def _parse_events(
+    payload: list[Any],
+    events: pa.StructArray | None,
+    schedule_by_teams: dict[tuple[str, str], Mapping[object, object]],
+    *,
+    season: str,
+    week: int,
+    observed_at: pd.Timestamp,
+) -> DataFrame:
+    """Flatten and validate the payload level by level into quote rows."""
+    matched = (
+        None
+        if events is None
+        else _matched_events(events, schedule_by_teams, observed_at=observed_at)
+    )
+    markets = None if matched is None else _supported_markets(matched.events)
+    flattened = None if markets is None else _children(_field(markets.markets, "outcomes"))
+    if matched is None or markets is None or flattened is None:
+        return _empty_quotes()
+
+    outcomes, outcome_markets, outcome_positions = flattened
+    codes = markets.codes[outcome_markets]
+    books = markets.books[outcome_markets]
+    events_index = markets.book_events[books]
+    locations = np.stack(
+        [
+            matched.positions[events_index],
+            markets.book_positions[books],
+            markets.positions[outcome_markets],
+            outcome_positions,
+        ]
+    )
+
+    names = _names(_field(outcomes, "name"))
+    odds = _numbers(_field(outcomes, "price"))
+    _require(bool((odds != 0).all()))
+    _require_not_booleans(payload, odds, locations, key="price")
+
+    needs_line = codes != _MONEYLINE
+    line = np.full(len(codes), np.nan)
+    if needs_line.any():
+        line[needs_line] = _numbers(_field(outcomes, "point").filter(pa.array(needs_line)))
+        _require_not_booleans(payload, line[needs_line], locations[:, needs_line], key="point")
+
+    count = len(codes)
+    return DataFrame(
+        {
+            "fetched_at": pd.DatetimeIndex([observed_at] * count).as_unit("ns"),
+            "provider": np.full(count, THE_ODDS_API_PROVIDER, dtype=object),
+            "provider_event_id": matched.ids.to_numpy(zero_copy_only=False)[events_index],
+            "sportsbook": markets.sportsbooks.to_numpy(zero_copy_only=False)[books],
+            "sportsbook_updated_at": _utc(markets.updated_at[outcome_markets]),
+            "commence_time": _utc(matched.commence[events_index]),
+            "is_live": np.zeros(count, dtype=bool),
+            "season": np.full(count, season, dtype=object),
+            "week": np.full(count, week, dtype=np.int64),
+            "game_id": matched.schedule["game_id"][events_index],
+            "game_date": matched.schedule["game_date"][events_index].tolist(),
+            "away_team": matched.schedule["away_team"][events_index],
+            "home_team": matched.schedule["home_team"][events_index],
+            "market": _CANONICAL_MARKETS[codes],
+            "side": _sides(names, codes, events_index, matched),
+            "odds": odds,
+            "line": line,
+        },
+        columns=list(QUOTE_COLUMNS),
+    )
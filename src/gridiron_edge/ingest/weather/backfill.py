@@ -22,11 +22,18 @@ Rate limiting:
     A full historical backfill (~7,000 games since 1999) therefore takes
     approximately 7 days of daily runs.  The --season-year flag lets you
     target specific seasons to spread the load.
-    Within a single run, a 0.1s sleep between calls keeps well within
-    the per-minute rate limit.
+    Within a run, a bounded pool of worker threads shares one token bucket
+    (``core.ratelimit.TokenBucket``) set from the provider's per-minute
+    limit, so request latency overlaps instead of serialising.  A ``429``
+    pauses every worker for the ``Retry-After`` interval and the game is
+    retried.
 
 Output:
-    Appends new rows to data/cleaned/weather_enriched.csv.
+    Fetched rows are checkpointed in batches as Parquet parts under
+    data/cleaned/weather_backfill_checkpoint/.  At the end of a run (and at
+    the start of the next one, after an interruption) the parts are
+    appended to the weather_enriched CSV once and removed, so an
+    interrupted run resumes exactly where it stopped without refetching.
     Columns match the existing weekly-ingest schema:
         GAME_ID, TEMP, FEELS_LIKE, PRESSURE, HUMIDITY, DEW_POINT,
         CLOUDS, VISIBILITY, WIND_SPEED, WIND_DEG, WEATHER_MAIN,
@@ -37,11 +44,11 @@ Output:
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 import logging
 from logging import Logger
 from pathlib import Path
-import time
 from typing import Any, Final, Literal
 
 import numpy as np
@@ -66,20 +73,34 @@ import timezonefinder
 from tqdm import tqdm
 from urllib3.util.retry import Retry
 
+from gridiron_edge.core.ratelimit import TokenBucket
 from gridiron_edge.core.settings import get_settings
+from gridiron_edge.datasets import loaders
+from gridiron_edge.datasets.columnar import refresh_columnar_twin
 from gridiron_edge.datasets.registry import dataset_path
 from gridiron_edge.metrics.travel.geo import to_decimal_degrees
 
 logger: Logger = logging.getLogger(__name__)
 
-# Seconds to sleep between API calls - keeps well within OWM rate limits
-_CALL_SLEEP_S: Final[float] = 0.15
+#: Per-minute call limit OWM publishes for the base plan.  Pass
+#: ``calls_per_minute`` to match a higher subscription tier.
+OWM_CALLS_PER_MINUTE: Final[int] = 60
+
+# Concurrent requests in flight; the token bucket, not the pool, sets the rate
+_MAX_WORKERS: Final[int] = 8
+
+# Fetched rows per checkpoint part
+_CHECKPOINT_EVERY: Final[int] = 50
+
+# Attempts per game when OWM answers 429, and the pause used when the
+# response carries no Retry-After header (doubled per attempt)
+_MAX_ATTEMPTS: Final[int] = 4
+_RATE_LIMIT_BACKOFF_S: Final[float] = 1.0
 
 # OWM One Call 3.0 timemachine endpoint
-_OWM_URL: Final[str] = (
-    "https://api.openweathermap.org/data/3.0/onecall/timemachine"
-    "?lat={lat}&lon={lon}&dt={dt}&appid={appid}"
-)
+_OWM_URL: Final[str] = "https://api.openweathermap.org/data/3.0/onecall/timemachine"
+
+_CHECKPOINT_DIRNAME: Final[str] = "weather_backfill_checkpoint"
 
 # Columns written to weather_enriched.csv
 _OUTPUT_COLS: Final[list[str]] = [
@@ -131,15 +152,17 @@ def backfill_weather(
     owm_api_key: str,
     repo: Path | None = None,
     dry_run: bool = False,
-    call_sleep: float = _CALL_SLEEP_S,
     max_calls: int | None = None,
+    calls_per_minute: float = OWM_CALLS_PER_MINUTE,
+    max_workers: int = _MAX_WORKERS,
 ) -> tuple[int, int]:
     """Fetch weather for all historical games not already in the archive.
 
     Loads the canonical games file, resolves stadium coordinates, identifies
-    which GAME_IDs are already in weather_enriched.csv, and fetches the
-    remainder from OWM.  Safe to run multiple times - already-fetched games
-    are skipped automatically so this only fetches genuinely missing data.
+    which GAME_IDs are already in weather_enriched.csv (or checkpointed by an
+    interrupted run), and fetches the remainder from OWM.  Safe to run
+    multiple times - already-fetched games are skipped automatically so this
+    only fetches genuinely missing data.
 
     Args:
         season_year: If provided, only backfill games from this season
@@ -148,11 +171,13 @@ def backfill_weather(
         repo: Repository root.  Defaults to settings repo root.
         dry_run: If True, log what would be fetched but make no API calls
             and write nothing to disk.
-        call_sleep: Seconds to sleep between API calls (default 0.15).
-        max_calls: If provided, stop after this many API calls.  Use this
+        max_calls: If provided, stop after this many games.  Use this
             to stay within the OWM daily limit (1,000 for the base
             subscription).  The run stops cleanly and logs how many games
             remain for the next run.  None means no limit.
+        calls_per_minute: Provider rate limit shared by all workers
+            (default: the OWM base-plan limit).
+        max_workers: Maximum concurrent requests.
 
     Returns:
         Tuple of (n_fetched, n_failed) counts.
@@ -160,12 +185,13 @@ def backfill_weather(
     resolved_repo: Path = repo or get_settings().repo_root
     weather_path: Path = dataset_path(resolved_repo, "weather_enriched")
     failed_path: Path = resolved_repo / "data" / "cleaned" / "weather_backfill_failed.csv"
+    checkpoint_dir: Path = weather_path.parent / _CHECKPOINT_DIRNAME
 
     # ── Load games + stadium coordinates ──────────────────────────────────
-    games_df: DataFrame = pd.read_csv(dataset_path(resolved_repo, "games"))
+    games_df: DataFrame = loaders.load_games(resolved_repo)
     games_df["GAME_DATE"] = pd.to_datetime(games_df["GAME_DATE"], errors="coerce")
 
-    stadiums_df: DataFrame = pd.read_csv(dataset_path(resolved_repo, "stadiums"))
+    stadiums_df: DataFrame = loaders.load_stadiums(resolved_repo)
 
     # Only games with both canonical final scores are complete.
     completed: DataFrame = _completed_games(games_df)
@@ -198,7 +224,15 @@ def backfill_weather(
     work = work.loc[work["LATITUDE"].notna(), :].copy()
 
     # ── Identify already-fetched GAME_IDs ─────────────────────────────────
-    already_fetched: set[str] = _load_existing_game_ids(weather_path)
+    # Rows checkpointed by an interrupted run count as fetched; outside a
+    # dry run they are committed to the weather file before anything else.
+    checkpointed: DataFrame = _read_checkpoint(checkpoint_dir)
+    if not dry_run and not checkpointed.empty:
+        recovered: int = _commit_checkpoint(checkpoint_dir, weather_path)
+        logger.info("Recovered %d checkpointed rows from an interrupted run", recovered)
+    already_fetched: set[str] = _load_existing_game_ids(weather_path) | set(
+        checkpointed["GAME_ID"].astype(str)
+    )
     pending: DataFrame = work.loc[~work["GAME_ID"].isin(already_fetched), :].copy()
 
     logger.info(
@@ -225,6 +259,8 @@ def backfill_weather(
 
     if pending.empty:
         logger.info("Nothing to fetch - all games already have weather data.")
+        if not checkpointed.empty:
+            refresh_columnar_twin(resolved_repo, "weather_enriched")
         return 0, 0
 
     # Apply daily call cap - truncate pending to the first N games
@@ -237,55 +273,75 @@ def backfill_weather(
         pending = pending.head(max_calls).copy()
 
     # ── Set up HTTP session with retry logic ──────────────────────────────
+    # 429s are handled by the shared token bucket, not urllib3 (which would
+    # otherwise honour Retry-After itself), so every worker backs off
+    # together instead of each sleeping on its own.
     sess = requests.Session()
-    retry = Retry(connect=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503])
+    retry = Retry(
+        connect=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503],
+        respect_retry_after_header=False,
+    )
     # pyrefly: ignore [bad-argument-type]
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=max_workers)
     sess.mount("https://", adapter)
     sess.mount("http://", adapter)
     tfinder = timezonefinder.TimezoneFinder()
 
-    return _run_fetch_loop(
+    counts: tuple[int, int] = _run_fetch_pool(
         pending=pending,
         owm_api_key=owm_api_key,
         session=sess,
         tf=tfinder,
-        weather_path=weather_path,
+        limiter=TokenBucket.per_minute(calls_per_minute),
+        max_workers=max_workers,
+        checkpoint_dir=checkpoint_dir,
         failed_path=failed_path,
-        call_sleep=call_sleep,
     )
+    _commit_checkpoint(checkpoint_dir, weather_path)
+    refresh_columnar_twin(resolved_repo, "weather_enriched")
+    return counts
 
 
-def _run_fetch_loop(
+def _run_fetch_pool(
     *,
     pending: DataFrame,
     owm_api_key: str,
     session: requests.Session,
     tf: timezonefinder.TimezoneFinder,
-    weather_path: Path,
+    limiter: TokenBucket,
+    max_workers: int,
+    checkpoint_dir: Path,
     failed_path: Path,
-    call_sleep: float,
+    checkpoint_every: int = _CHECKPOINT_EVERY,
 ) -> tuple[int, int]:
-    """Execute the fetch loop over pending games and flush results to disk.
+    """Fetch pending games concurrently and checkpoint results in batches.
 
-    Separated from ``backfill_weather`` to keep the main function within
-    statement-count limits.
+    Kickoff timestamps are resolved up front on the calling thread
+    (``TimezoneFinder`` is not thread-safe); workers only make HTTP calls,
+    each taking a token from *limiter* first.  Completed rows are written
+    as checkpoint parts every *checkpoint_every* games and once more on
+    the way out, including on interruption, so no fetched row is lost.
 
     Args:
         pending: DataFrame of games to fetch, with GAME_ID, YEAR,
             GAME_DATE, GAMETIME, LATITUDE, LONGITUDE, STADIUM columns.
         owm_api_key: OWM API key.
-        session: Requests session with retry logic.
+        session: Requests session shared by the workers.
         tf: TimezoneFinder instance.
-        weather_path: Path to weather_enriched.csv.
+        limiter: Token bucket enforcing the provider rate limit.
+        max_workers: Maximum concurrent requests.
+        checkpoint_dir: Directory receiving checkpoint parts.
         failed_path: Path to failure log CSV.
-        call_sleep: Seconds to sleep between API calls.
+        checkpoint_every: Fetched rows per checkpoint part.
 
     Returns:
         Tuple of (n_fetched, n_failed).
     """
     fetched_rows: list[dict] = []
     failed_rows: list[dict] = []
+    n_fetched: int = 0
 
     # Extract typed columns up front so Pyrefly can resolve concrete types.
     # itertuples() returns a union of all pandas scalar types per field,
@@ -308,8 +364,16 @@ def _run_fetch_loop(
     # pyrefly: ignore [bad-assignment]
     stadiums: list[str] = pending["STADIUM"].astype(str).tolist()
 
-    bar: tqdm[int] = tqdm(
-        range(len(pending)),
+    def failure(i: int) -> dict:
+        """Build the failure-log record for pending row *i*."""
+        return {
+            "GAME_ID": game_ids[i],
+            "YEAR": years[i],
+            "GAME_DATE": str(game_dates[i]),
+            "STADIUM": stadiums[i],
+        }
+
+    bar = tqdm(
         total=len(pending),
         desc="  weather backfill",
         unit="game",
@@ -317,49 +381,60 @@ def _run_fetch_loop(
         colour="cyan",
     )
 
-    for i in bar:
-        game_id: str = game_ids[i]
-        game_date: datetime = game_dates[i]
-        gametime: str = gametimes[i]
-        latitude: float = latitudes[i]
-        longitude: float = longitudes[i]
-        year: str = years[i]
-        stadium: str = stadiums[i]
-
-        bar.set_postfix(season=year, game=game_id[-10:], refresh=False)
-
-        result: dict | None = _fetch_one_game(
-            game_id=game_id,
-            game_date=game_date,
-            gametime=gametime,
-            latitude=latitude,
-            longitude=longitude,
-            owm_api_key=owm_api_key,
-            session=session,
-            tf=tf,
-        )
-
-        if result is not None:
-            fetched_rows.append(result)
-        else:
-            failed_rows.append(
-                {
-                    "GAME_ID": game_id,
-                    "YEAR": year,
-                    "GAME_DATE": str(game_date),
-                    "STADIUM": stadium,
-                }
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures: dict[Future[dict | None], int] = {}
+        for i in range(len(pending)):
+            location: tuple[float, float, int] | None = _kickoff_location(
+                game_id=game_ids[i],
+                game_date=game_dates[i],
+                gametime=gametimes[i],
+                latitude=latitudes[i],
+                longitude=longitudes[i],
+                tf=tf,
             )
-
-        time.sleep(call_sleep)
-
-        # Flush every 50 games so progress survives interruption
-        if len(fetched_rows) >= 50:
-            _append_to_weather_file(fetched_rows, weather_path)
-            fetched_rows = []
-
-    if fetched_rows:
-        _append_to_weather_file(fetched_rows, weather_path)
+            if location is None:
+                failed_rows.append(failure(i))
+                bar.update(1)
+                continue
+            lat, lon, utc_ts = location
+            future = pool.submit(
+                _fetch_one_game,
+                game_id=game_ids[i],
+                latitude=lat,
+                longitude=lon,
+                utc_ts=utc_ts,
+                owm_api_key=owm_api_key,
+                session=session,
+                limiter=limiter,
+            )
+            futures[future] = i
+
+        try:
+            for future in as_completed(futures):
+                i = futures[future]
+                result: dict | None = future.result()
+                bar.update(1)
+                bar.set_postfix(season=years[i], game=game_ids[i][-10:], refresh=False)
+
+                if result is None:
+                    failed_rows.append(failure(i))
+                    continue
+                fetched_rows.append(result)
+                n_fetched += 1
+
+                # Checkpoint in batches so progress survives interruption
+                if len(fetched_rows) >= checkpoint_every:
+                    _write_checkpoint_part(fetched_rows, checkpoint_dir)
+                    fetched_rows = []
+        finally:
+            # On interruption, drop queued games and keep what completed.
+            # Calls still in flight are not checkpointed; those games are
+            # simply fetched again by the next run.
+            for future in futures:
+                future.cancel()
+            if fetched_rows:
+                _write_checkpoint_part(fetched_rows, checkpoint_dir)
+            bar.close()
 
     if failed_rows:
         _append_to_failed_file(failed_rows, failed_path)
@@ -369,7 +444,6 @@ def _run_fetch_loop(
             failed_path,
         )
 
-    n_fetched: int = len(pending) - len(failed_rows)
     logger.info("Weather backfill complete: %d fetched, %d failed", n_fetched, len(failed_rows))
     return n_fetched, len(failed_rows)
 
@@ -379,32 +453,27 @@ def _run_fetch_loop(
 # ---------------------------------------------------------------------------
 
 
-def _fetch_one_game(
+def _kickoff_location(
     *,
     game_id: str,
     game_date: datetime,
     gametime: str,
     latitude: float,
     longitude: float,
-    owm_api_key: str,
-    session: requests.Session,
     tf: timezonefinder.TimezoneFinder,
-) -> dict | None:
-    """Fetch weather for a single game from the OWM timemachine endpoint.
+) -> tuple[float, float, int] | None:
+    """Resolve request coordinates and the kickoff UTC Unix timestamp.
 
     Args:
-        game_id: Canonical GAME_ID string (e.g. ``"2024_01_KC_LV"``).
+        game_id: Canonical GAME_ID string, for logging.
         game_date: Game date as a datetime object.
         gametime: Kickoff time in HH:MM:SS format (24-hour).
         latitude: Stadium latitude in decimal degrees.
         longitude: Stadium longitude in decimal degrees.
-        owm_api_key: OpenWeatherMap API key.
-        session: Shared requests.Session with retry logic.
         tf: TimezoneFinder instance (reused across calls for efficiency).
 
     Returns:
-        Dict with OWM weather fields keyed by column name, or None if the
-        API call fails or the response is malformed.
+        ``(lat, lon, utc_ts)``, or None if the kickoff cannot be resolved.
     """
     try:
         lat: float = to_decimal_degrees(latitude)
@@ -419,31 +488,72 @@ def _fetch_one_game(
         date_str: str = game_date.strftime("%Y-%m-%d")
         naive: datetime = datetime.strptime(f"{date_str} {gametime}", "%Y-%m-%d %H:%M:%S")
         local_dt: datetime = local_tz.localize(naive, is_dst=None)
-        utc_ts: int = int(local_dt.astimezone(pytz.utc).timestamp())
+        return lat, lon, int(local_dt.astimezone(pytz.utc).timestamp())
+    except Exception as e:
+        logger.warning("Cannot resolve kickoff time for game %s: %s", game_id, e)
+        return None
 
-        # OWM One Call 3.0 timemachine request
-        url: str = _OWM_URL.format(lat=lat, lon=lon, dt=utc_ts, appid=owm_api_key)
-        resp: Response = session.get(url, timeout=15)
-        resp.raise_for_status()
-        owm: dict = resp.json()
 
-        data: dict = owm["data"][0]
-        weather_block: dict = data.get("weather", [{}])[0]
+def _fetch_one_game(
+    *,
+    game_id: str,
+    latitude: float,
+    longitude: float,
+    utc_ts: int,
+    owm_api_key: str,
+    session: requests.Session,
+    limiter: TokenBucket,
+) -> dict | None:
+    """Fetch weather for a single game from the OWM timemachine endpoint.
 
-        return {
-            "GAME_ID": game_id,
-            "TEMP": data.get("temp"),
-            "FEELS_LIKE": data.get("feels_like"),
-            "PRESSURE": data.get("pressure"),
-            "HUMIDITY": data.get("humidity"),
-            "DEW_POINT": data.get("dew_point"),
-            "CLOUDS": data.get("clouds"),
-            "VISIBILITY": data.get("visibility"),
-            "WIND_SPEED": data.get("wind_speed"),
-            "WIND_DEG": data.get("wind_deg"),
-            "WEATHER_MAIN": weather_block.get("main"),
-            "WEATHER_DESC": weather_block.get("description"),
-        }
+    Runs on a worker thread.  Every attempt takes a token from *limiter*;
+    a ``429`` pauses the shared limiter for the ``Retry-After`` interval
+    and the game is retried, up to ``_MAX_ATTEMPTS`` attempts.
+
+    Args:
+        game_id: Canonical GAME_ID string (e.g. ``"2024_01_KC_LV"``).
+        latitude: Stadium latitude in decimal degrees.
+        longitude: Stadium longitude in decimal degrees.
+        utc_ts: Kickoff as a UTC Unix timestamp.
+        owm_api_key: OpenWeatherMap API key.
+        session: Shared requests.Session with retry logic.
+        limiter: Token bucket shared by all workers.
+
+    Returns:
+        Dict with OWM weather fields keyed by column name, or None if the
+        API call fails or the response is malformed.
+    """
+    params: dict[str, Any] = {"lat": latitude, "lon": longitude, "dt": utc_ts, "appid": owm_api_key}
+    try:
+        for attempt in range(_MAX_ATTEMPTS):
+            limiter.acquire()
+            resp: Response = session.get(_OWM_URL, params=params, timeout=15)
+            if resp.status_code == 429:
+                limiter.pause(_retry_after_seconds(resp, attempt))
+                continue
+            resp.raise_for_status()
+            owm: dict = resp.json()
+
+            data: dict = owm["data"][0]
+            weather_block: dict = data.get("weather", [{}])[0]
+
+            return {
+                "GAME_ID": game_id,
+                "TEMP": data.get("temp"),
+                "FEELS_LIKE": data.get("feels_like"),
+                "PRESSURE": data.get("pressure"),
+                "HUMIDITY": data.get("humidity"),
+                "DEW_POINT": data.get("dew_point"),
+                "CLOUDS": data.get("clouds"),
+                "VISIBILITY": data.get("visibility"),
+                "WIND_SPEED": data.get("wind_speed"),
+                "WIND_DEG": data.get("wind_deg"),
+                "WEATHER_MAIN": weather_block.get("main"),
+                "WEATHER_DESC": weather_block.get("description"),
+            }
+
+        logger.warning("Rate limited on %d attempts for game %s - skipping", _MAX_ATTEMPTS, game_id)
+        return None
 
     except requests.HTTPError as e:
         status: Literal["unknown"] | int = (
@@ -459,6 +569,20 @@ def _fetch_one_game(
         return None
 
 
+def _retry_after_seconds(resp: Response, attempt: int) -> float:
+    """Return the server's ``Retry-After`` seconds, or exponential backoff."""
+    header: str | None = resp.headers.get("Retry-After")
+    try:
+        return max(0.0, float(header)) if header is not None else _backoff(attempt)
+    except ValueError:
+        return _backoff(attempt)
+
+
+def _backoff(attempt: int) -> float:
+    """Pause before retry *attempt* when the server gives no ``Retry-After``."""
+    return _RATE_LIMIT_BACKOFF_S * 2**attempt
+
+
 # ---------------------------------------------------------------------------
 # File I/O helpers
 # ---------------------------------------------------------------------------
@@ -475,6 +599,61 @@ def _load_existing_game_ids(weather_path: Path) -> set[str]:
         return set()
 
 
+def _checkpoint_parts(checkpoint_dir: Path) -> list[Path]:
+    """Return committed checkpoint parts in write order."""
+    if not checkpoint_dir.is_dir():
+        return []
+    return sorted(checkpoint_dir.glob("part-*.parquet"))
+
+
+def _write_checkpoint_part(rows: list[dict], checkpoint_dir: Path) -> Path:
+    """Write one batch of fetched rows as the next checkpoint part.
+
+    The part is written to a temporary file and renamed into place, so a
+    part on disk is always complete.
+    """
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    parts: list[Path] = _checkpoint_parts(checkpoint_dir)
+    index: int = int(parts[-1].stem.removeprefix("part-")) + 1 if parts else 0
+    path: Path = checkpoint_dir / f"part-{index:05d}.parquet"
+    temporary: Path = path.with_name(f"{path.name}.tmp")
+    pd.DataFrame(rows).reindex(columns=_OUTPUT_COLS).to_parquet(temporary, index=False)
+    temporary.replace(path)
+    logger.debug("Checkpointed %d rows to %s", len(rows), path)
+    return path
+
+
+def _read_checkpoint(checkpoint_dir: Path) -> DataFrame:
+    """Return every checkpointed row (empty, with output columns, if none)."""
+    parts: list[Path] = _checkpoint_parts(checkpoint_dir)
+    if not parts:
+        return pd.DataFrame(columns=_OUTPUT_COLS)
+    return pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
+
+
+def _commit_checkpoint(checkpoint_dir: Path, weather_path: Path) -> int:
+    """Append checkpointed rows to the weather file and remove the parts.
+
+    Rows whose GAME_ID is already in the weather file are dropped first,
+    so committing again after a crash between the append and the cleanup
+    is harmless.
+
+    Returns:
+        Rows appended.
+    """
+    parts: list[Path] = _checkpoint_parts(checkpoint_dir)
+    if not parts:
+        return 0
+    rows: DataFrame = _read_checkpoint(checkpoint_dir)
+    rows = rows.loc[~rows["GAME_ID"].isin(_load_existing_game_ids(weather_path)), :]
+    rows = rows.drop_duplicates(subset=["GAME_ID"], keep="last")
+    if not rows.empty:
+        _append_to_weather_file(rows.to_dict("records"), weather_path)
+    for part in parts:
+        part.unlink()
+    return len(rows)
+
+
 def _append_to_weather_file(rows: list[dict], path: Path) -> None:
     """Append fetched weather rows to the weather_enriched CSV.
 
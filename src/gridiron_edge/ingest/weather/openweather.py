@@ -37,6 +37,8 @@ from tqdm import tqdm
 from urllib3.util.retry import Retry
 
 from gridiron_edge.core.settings import get_settings
+from gridiron_edge.datasets import loaders
+from gridiron_edge.datasets.columnar import refresh_columnar_twin
 from gridiron_edge.datasets.registry import dataset_path
 from gridiron_edge.metrics.travel.geo import to_decimal_degrees
 
@@ -156,11 +158,11 @@ def fetch_weather(*, season_year: str, owm_api_key: str, repo: Path | None = Non
     """
     resolved_repo: Path = repo or get_settings().repo_root
 
-    df: DataFrame = pd.read_csv(dataset_path(resolved_repo, "games"))
+    df: DataFrame = loaders.load_games(resolved_repo)
     df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"])
     df.sort_values(["GAME_DATE", "GAMETIME", "GAME_ID"], ascending=True, inplace=True)
 
-    df_stadium: DataFrame = pd.read_csv(dataset_path(resolved_repo, "stadiums"))
+    df_stadium: DataFrame = loaders.load_stadiums(resolved_repo)
 
     temp_df = df.loc[:, ["GAME_ID", "GAME_DATE", "GAMETIME", "YEAR", "STADIUM"]].copy()
     temp_df = temp_df.merge(
@@ -226,5 +228,6 @@ def fetch_weather(*, season_year: str, owm_api_key: str, repo: Path | None = Non
         ["GAME_DATE", "GAMETIME", "YEAR", "STADIUM", "LATITUDE", "LONGITUDE"],
         axis=1,
     ).to_csv(weather_path, mode="a", index=False, header=False)
+    refresh_columnar_twin(resolved_repo, "weather_enriched")
 
     logger.info("Weather data appended to %s", weather_path)
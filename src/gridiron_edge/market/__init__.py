@@ -50,6 +50,8 @@ from .history_boundaries import QuoteBoundaryStatus as QuoteBoundaryStatus
 from .history_boundaries import QuoteHistoryBoundary as QuoteHistoryBoundary
 from .history_boundaries import SelectedQuoteObservation as SelectedQuoteObservation
 from .history_boundaries import select_quote_history_boundaries as select_quote_history_boundaries
+from .history_index import QuoteHistoryIndex as QuoteHistoryIndex
+from .history_index import build_quote_history_index as build_quote_history_index
 from .kelly import kelly_fraction as kelly_fraction
 from .kelly import kelly_stake as kelly_stake
 from .odds_math import NoVigMethod as NoVigMethod
@@ -12,11 +12,12 @@ from datetime import datetime, timedelta
 from enum import StrEnum
 from typing import TypedDict
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 
-from gridiron_edge.ingest.odds.store import validate_quote_rows
 from gridiron_edge.market.history_boundaries import SelectedQuoteObservation
+from gridiron_edge.market.history_index import build_quote_history_index
 
 _REQUIRED_BET_COLUMNS: tuple[str, ...] = (
     "bet_id",
@@ -94,17 +95,41 @@ def match_bet_references(
     bets: DataFrame,
     observations: DataFrame,
 ) -> tuple[BetReferenceMatch, ...]:
-    """Match immutable bet references to exact quote observations."""
+    """Match immutable bet references to exact quote observations.
+
+    Every referenced bet is resolved in one exact join against a
+    :class:`QuoteHistoryIndex` on identity code and ``fetched_at``.
+    """
     bet_rows = _validate_bets(bets)
-    quote_rows = validate_quote_rows(observations)
+    quote_index = build_quote_history_index(observations)
     if bet_rows.empty:
         return ()
 
-    matches = [
-        _match_bet(row, quote_rows)
-        for _, row in bet_rows.sort_values("bet_id", kind="stable").iterrows()
-    ]
-    return tuple(matches)
+    ordered = bet_rows.sort_values("bet_id", kind="stable").reset_index(drop=True)
+    manual = ordered.loc[:, list(_REFERENCE_COLUMNS)].isna().all(axis=1).to_numpy()
+    keys = DataFrame(
+        {
+            "provider": ordered["reference_provider"],
+            "provider_event_id": ordered["reference_provider_event_id"],
+            "sportsbook": ordered["reference_sportsbook"],
+            "game_id": ordered["game_id"],
+            "market": ordered["market_type"],
+            "side": ordered["side"],
+        }
+    )
+    codes = np.where(manual, -1, quote_index.codes_for(keys))
+    fetched_at = ordered["reference_market_fetched_at"].mask(manual)
+    first, counts = quote_index.exact_matches(codes, fetched_at)
+
+    return tuple(
+        _match_bet(
+            row,
+            manual=bool(manual[position]),
+            candidate=(quote_index.rows.iloc[first[position]] if counts[position] == 1 else None),
+            candidate_count=int(counts[position]),
+        )
+        for position, (_, row) in enumerate(ordered.iterrows())
+    )
 
 
 def _validate_bets(bets: DataFrame) -> DataFrame:
@@ -155,14 +180,20 @@ def _validate_bet_reference(row: Series, *, index: object) -> None:
         _nullable_utc_datetime(row[column])
 
 
-def _match_bet(row: Series, observations: DataFrame) -> BetReferenceMatch:
-    """Resolve one validated bet against canonical observations."""
+def _match_bet(
+    row: Series,
+    *,
+    manual: bool,
+    candidate: Series | None,
+    candidate_count: int,
+) -> BetReferenceMatch:
+    """Resolve one validated bet from its exact-join candidates."""
     bet_id = str(row["bet_id"])
     game_id = str(row["game_id"])
     market = str(row["market_type"])
     side = str(row["side"])
 
-    if all(_is_missing(row[column]) for column in _REFERENCE_COLUMNS):
+    if manual:
         return BetReferenceMatch(
             bet_id=bet_id,
             status=BetReferenceMatchStatus.MANUAL_BET,
@@ -184,17 +215,6 @@ def _match_bet(row: Series, observations: DataFrame) -> BetReferenceMatch:
     assert provider is not None
     assert fetched_at is not None
 
-    candidates = observations.loc[
-        observations["provider"].eq(provider)
-        & _nullable_identity_mask(observations["provider_event_id"], provider_event_id)
-        & _nullable_identity_mask(observations["sportsbook"], sportsbook)
-        & observations["game_id"].eq(game_id)
-        & observations["market"].eq(market)
-        & observations["side"].eq(side)
-        & observations["fetched_at"].eq(pd.Timestamp(fetched_at)),
-        :,
-    ]
-
     base: _BetReferenceIdentity = {
         "bet_id": bet_id,
         "provider": provider,
@@ -205,14 +225,14 @@ def _match_bet(row: Series, observations: DataFrame) -> BetReferenceMatch:
         "side": side,
         "reference_fetched_at": fetched_at,
     }
-    if candidates.empty:
+    if candidate_count == 0:
         return BetReferenceMatch(
             status=BetReferenceMatchStatus.OBSERVATION_NOT_FOUND,
             matched_observation=None,
             mismatched_fields=(),
             **base,
         )
-    if len(candidates) > 1:
+    if candidate_count > 1 or candidate is None:
         return BetReferenceMatch(
             status=BetReferenceMatchStatus.AMBIGUOUS_OBSERVATION,
             matched_observation=None,
@@ -220,7 +240,6 @@ def _match_bet(row: Series, observations: DataFrame) -> BetReferenceMatch:
             **base,
         )
 
-    candidate: Series = candidates.iloc[0]
     mismatched = _mismatched_reference_terms(row, candidate)
     if mismatched:
         return BetReferenceMatch(
@@ -267,11 +286,6 @@ def _mismatched_reference_terms(
     return tuple(field for field, expected, actual in comparisons if expected != actual)
 
 
-def _nullable_identity_mask(values: Series, expected: str | None) -> Series:
-    """Return exact null-aware identity equality."""
-    return values.isna() if expected is None else values.eq(expected)
-
-
 def _selected_observation(row: Series) -> SelectedQuoteObservation:
     """Convert one canonical quote row to immutable matched evidence."""
     fetched_at = _nullable_utc_datetime(row["fetched_at"])
@@ -100,9 +100,14 @@ def execute_due_collection(
     grace_period: timedelta = timedelta(minutes=15),
     minimum_credit_reserve: int = 30,
     timeout: float = 15.0,
+    max_age: timedelta | None = None,
     session: requests.Session | None = None,
 ) -> CollectionDueResult | CollectionExecutionResult:
-    """Execute at most one due poll through the established ingest boundary."""
+    """Execute at most one due poll through the established ingest boundary.
+
+    ``max_age`` is forwarded to the ingest so a provider response cached at
+    most that long ago is reused instead of spending quota again.
+    """
     if minimum_credit_reserve < 0:
         raise ValueError("minimum_credit_reserve must not be negative.")
     evaluated_at = _require_utc(evaluated_at, label="evaluated_at")
@@ -165,6 +170,7 @@ def execute_due_collection(
             session=session,
             timeout=timeout,
             fetched_at=evaluated_at,
+            max_age=max_age,
         )
     except (
         OddsIngestPartialPersistenceError,
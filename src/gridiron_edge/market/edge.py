@@ -4,7 +4,8 @@
 Pure scalar functions - no I/O, no pandas, no data dependencies.  Every
 function operates on values already produced by other parts of the
 pipeline and returns the edge / EV / Kelly information needed to make a
-betting decision.
+betting decision.  The ``*_array`` variants apply the identical math
+elementwise to NumPy arrays for the columnar edge report.
 
 The module is a **pure-math leaf** following the same pattern as
 ``odds_math.py`` and ``kelly.py``.  It imports only from within the
@@ -23,6 +24,12 @@ Core functions:
     total_cover_prob        P(over hits the market total)
     total_edge              Best +EV total side (or None)
     classify_edge_strength  EV -> "strong" / "moderate" / "lean" / "no_edge"
+
+Array functions:
+    expected_value_array          Elementwise expected_value
+    spread_cover_prob_array       Elementwise spread_cover_prob
+    total_cover_prob_array        Elementwise total_cover_prob
+    classify_edge_strength_array  Elementwise classify_edge_strength
 """
 
 from __future__ import annotations
@@ -30,12 +37,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Final, Literal
 
+import numpy as np
+
 # pyrefly: ignore [missing-import]
 from scipy.stats import norm
 
 from gridiron_edge.market.kelly import kelly_fraction
 from gridiron_edge.market.odds_math import (
     american_to_decimal,
+    american_to_decimal_array,
     no_vig,
 )
 
@@ -466,6 +476,69 @@ def classify_edge_strength(ev: float) -> EdgeStrength:
     return "no_edge"
 
 
+# ---------------------------------------------------------------------------
+# Array API
+# ---------------------------------------------------------------------------
+
+
+def expected_value_array(model_prob: np.ndarray, american_odds: np.ndarray) -> np.ndarray:
+    """Elementwise :func:`expected_value` over aligned arrays.
+
+    Raises:
+    ------
+    ValueError
+        If any *model_prob* is not in (0, 1) or any *american_odds* is zero.
+    """
+    model_prob = np.asarray(model_prob, dtype=float)
+    _validate_prob_array(model_prob)
+    dec: np.ndarray = american_to_decimal_array(american_odds)
+    return model_prob * dec - 1.0
+
+
+def spread_cover_prob_array(
+    model_spread: np.ndarray,
+    market_spread: np.ndarray,
+    margin_std: float,
+) -> np.ndarray:
+    """Elementwise :func:`spread_cover_prob` (P(home covers)).
+
+    Raises:
+    ------
+    ValueError
+        If *margin_std* is not positive.
+    """
+    if margin_std <= 0:
+        raise ValueError(f"margin_std must be > 0, got {margin_std}")
+    return norm.cdf((np.asarray(market_spread) - np.asarray(model_spread)) / margin_std)
+
+
+def total_cover_prob_array(
+    model_total: np.ndarray,
+    market_total: np.ndarray,
+    total_std: float,
+) -> np.ndarray:
+    """Elementwise :func:`total_cover_prob` (P(over)).
+
+    Raises:
+    ------
+    ValueError
+        If *total_std* is not positive.
+    """
+    if total_std <= 0:
+        raise ValueError(f"total_std must be > 0, got {total_std}")
+    return norm.cdf((np.asarray(model_total) - np.asarray(market_total)) / total_std)
+
+
+def classify_edge_strength_array(ev: np.ndarray) -> np.ndarray:
+    """Elementwise :func:`classify_edge_strength`; returns an object array of tiers."""
+    ev = np.asarray(ev, dtype=float)
+    return np.select(
+        [ev >= _STRONG_THRESHOLD, ev >= _MODERATE_THRESHOLD, ev > 0.0],
+        ["strong", "moderate", "lean"],
+        default="no_edge",
+    ).astype(object)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -475,3 +548,10 @@ def _validate_prob(p: float) -> None:
     """Raise ``ValueError`` if *p* is not strictly between 0 and 1."""
     if not (0.0 < p < 1.0):
         raise ValueError(f"Probability must be in (0, 1), got {p}")
+
+
+def _validate_prob_array(p: np.ndarray) -> None:
+    """Raise ``ValueError`` naming the first element not strictly in (0, 1)."""
+    bad: np.ndarray = ~((p > 0.0) & (p < 1.0))
+    if bad.any():
+        raise ValueError(f"Probability must be in (0, 1), got {p[bad][0]}")
@@ -11,14 +11,14 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 
-from gridiron_edge.ingest.odds.store import (
-    OBSERVATION_SORT_COLUMNS,
-    validate_quote_rows,
+from gridiron_edge.market.history_index import (
+    IDENTITY_CODE_COLUMN,
+    build_quote_history_index,
 )
-from gridiron_edge.market.history_coverage import HISTORY_IDENTITY_COLUMNS
 
 
 class QuoteBoundaryStatus(StrEnum):
@@ -63,73 +63,67 @@ class QuoteHistoryBoundary:
 def select_quote_history_boundaries(
     observations: DataFrame,
 ) -> tuple[QuoteHistoryBoundary, ...]:
-    """Select observed boundaries without interpreting market movement."""
-    rows = validate_quote_rows(observations)
+    """Select observed boundaries without interpreting market movement.
+
+    Boundaries come from one :class:`QuoteHistoryIndex`: the earliest
+    observation is the first row of each identity slice and the latest
+    eligible pregame observation is one strict, live-excluding as-of join at
+    each identity's kickoff.
+    """
+    index = build_quote_history_index(observations)
+    rows = index.rows
     if rows.empty:
         return ()
 
-    ordered = rows.sort_values(
-        list(OBSERVATION_SORT_COLUMNS),
-        kind="stable",
-        na_position="first",
-    ).reset_index(drop=True)
-    boundaries = [
-        _select_identity_boundary(group)
-        for _, group in ordered.groupby(
-            list(HISTORY_IDENTITY_COLUMNS),
-            dropna=False,
-            sort=True,
-        )
-    ]
-    return tuple(boundaries)
-
-
-def _select_identity_boundary(group: DataFrame) -> QuoteHistoryBoundary:
-    """Select boundaries for one already grouped historical identity."""
-    ordered = group.sort_values(
-        list(OBSERVATION_SORT_COLUMNS),
-        kind="stable",
-        na_position="first",
-    ).reset_index(drop=True)
-    first: Series = ordered.iloc[0]
-    kickoff_values = ordered["commence_time"].dropna().drop_duplicates()
+    by_identity = rows.groupby(IDENTITY_CODE_COLUMN, sort=True)
+    kickoff_counts = by_identity["commence_time"].nunique().to_numpy()
+    kickoffs = by_identity["commence_time"].first()
+    fetch_counts = by_identity["fetched_at"].nunique().to_numpy()
+
+    single_kickoff = np.flatnonzero(kickoff_counts == 1)
+    latest = np.full(len(index.starts), -1, dtype=np.int64)
+    latest[single_kickoff] = index.latest_positions(
+        single_kickoff,
+        kickoffs.iloc[single_kickoff],
+        strict=True,
+        exclude_live=True,
+    )
 
-    status: QuoteBoundaryStatus
-    latest: SelectedQuoteObservation | None
-    if kickoff_values.empty:
-        status = QuoteBoundaryStatus.KICKOFF_UNAVAILABLE
-        latest = None
-    elif len(kickoff_values) > 1:
-        status = QuoteBoundaryStatus.KICKOFF_CONFLICT
-        latest = None
-    else:
-        kickoff = kickoff_values.iloc[0]
-        eligible = ordered.loc[
-            ordered["is_live"].eq(False) & ordered["fetched_at"].lt(kickoff),
-            :,
-        ]
-        if eligible.empty:
+    boundaries: list[QuoteHistoryBoundary] = []
+    for code, start in enumerate(index.starts):
+        first: Series = rows.iloc[start]
+        status: QuoteBoundaryStatus
+        if kickoff_counts[code] == 0:
+            status = QuoteBoundaryStatus.KICKOFF_UNAVAILABLE
+        elif kickoff_counts[code] > 1:
+            status = QuoteBoundaryStatus.KICKOFF_CONFLICT
+        elif latest[code] < 0:
             status = QuoteBoundaryStatus.NO_ELIGIBLE_PREGAME_OBSERVATION
-            latest = None
         else:
             status = QuoteBoundaryStatus.AVAILABLE
-            latest = _selected_observation(eligible.iloc[-1])
-
-    distinct_fetch_count = int(ordered["fetched_at"].nunique())
-    return QuoteHistoryBoundary(
-        status=status,
-        provider=str(first["provider"]),
-        provider_event_id=_nullable_text(first["provider_event_id"]),
-        sportsbook=_nullable_text(first["sportsbook"]),
-        game_id=str(first["game_id"]),
-        market=str(first["market"]),
-        side=str(first["side"]),
-        observation_count=len(ordered),
-        distinct_fetch_count=distinct_fetch_count,
-        repeated_observation_evidence_available=distinct_fetch_count > 1,
-        earliest_observed=_selected_observation(first),
-        latest_eligible_pregame=latest,
-    )
+
+        distinct_fetch_count = int(fetch_counts[code])
+        boundaries.append(
+            QuoteHistoryBoundary(
+                status=status,
+                provider=str(first["provider"]),
+                provider_event_id=_nullable_text(first["provider_event_id"]),
+                sportsbook=_nullable_text(first["sportsbook"]),
+                game_id=str(first["game_id"]),
+                market=str(first["market"]),
+                side=str(first["side"]),
+                observation_count=int(index.stops[code] - start),
+                distinct_fetch_count=distinct_fetch_count,
+                repeated_observation_evidence_available=distinct_fetch_count > 1,
+                earliest_observed=_selected_observation(first),
+                latest_eligible_pregame=(
+                    _selected_observation(rows.iloc[latest[code]])
+                    if status is QuoteBoundaryStatus.AVAILABLE
+                    else None
+                ),
+            )
+        )
+    return tuple(boundaries)
 
 
 def _selected_observation(row: Series) -> SelectedQuoteObservation:
@@ -0,0 +1,258 @@
+"""Sorted as-of index over canonical quote history.
+
+Observations are validated and sorted once: by exact historical identity
+(provider, event, sportsbook, game, market, side) and then by the canonical
+observation order. Every identity therefore owns one contiguous slice whose
+``fetched_at`` values are nondecreasing, so the first and last observation are
+direct lookups and "latest observation at or before T" is a binary search
+inside the slice. Batch questions for many identities run as one
+``merge_asof`` or one exact join keyed by an integer identity code.
+
+The index answers lookup questions only. It does not decide which observation
+counts as an opening, closing, or reference quote.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Final
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+
+from gridiron_edge.ingest.odds.store import (
+    OBSERVATION_SORT_COLUMNS,
+    validate_quote_rows,
+)
+from gridiron_edge.market.history_coverage import HISTORY_IDENTITY_COLUMNS
+
+IDENTITY_CODE_COLUMN: Final[str] = "_identity"
+"""Integer identity code column carried by :attr:`QuoteHistoryIndex.rows`."""
+
+_POSITION_COLUMN: Final[str] = "_position"
+_QUERY_COLUMN: Final[str] = "_query"
+_QUERY_TIME_COLUMN: Final[str] = "_at"
+
+HistoryIdentity = tuple[str | None, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteHistoryIndex:
+    """Validated quote observations sorted for identity and as-of lookups.
+
+    Attributes:
+        rows: Validated observations in index order with a positional
+            ``RangeIndex`` and an :data:`IDENTITY_CODE_COLUMN` column.
+        identities: One row per identity in code order, holding the
+            identity columns.
+        starts: First row position of each identity.
+        stops: One past the last row position of each identity.
+        codes: ``identity tuple -> code`` with ``None`` for null fields.
+        fetched_ns: ``rows["fetched_at"]`` as UTC epoch nanoseconds.
+    """
+
+    rows: DataFrame
+    identities: DataFrame
+    starts: np.ndarray
+    stops: np.ndarray
+    codes: dict[HistoryIdentity, int]
+    fetched_ns: np.ndarray
+
+    def code_for(self, identity: HistoryIdentity) -> int | None:
+        """Return the code of one identity tuple, or ``None`` when unseen."""
+        return self.codes.get(identity)
+
+    def codes_for(self, keys: DataFrame) -> np.ndarray:
+        """Return identity codes for key rows, ``-1`` where unseen.
+
+        Args:
+            keys: Frame with the history identity columns.
+        """
+        return np.fromiter(
+            (
+                self.codes.get(identity, -1)
+                for identity in _identity_tuples(keys.loc[:, list(HISTORY_IDENTITY_COLUMNS)])
+            ),
+            dtype=np.int64,
+            count=len(keys),
+        )
+
+    def latest_at_or_before(
+        self,
+        code: int,
+        when: datetime | pd.Timestamp,
+        *,
+        strict: bool = False,
+    ) -> int | None:
+        """Return the row position of the latest observation at or before *when*.
+
+        Ties on ``fetched_at`` resolve to the last row in canonical order.
+        With ``strict=True`` only observations strictly before *when* count.
+        """
+        start, stop = int(self.starts[code]), int(self.stops[code])
+        side = "left" if strict else "right"
+        offset = int(np.searchsorted(self.fetched_ns[start:stop], _epoch_ns(when), side=side))
+        return start + offset - 1 if offset else None
+
+    def latest_positions(
+        self,
+        codes: np.ndarray,
+        times: Series,
+        *,
+        strict: bool = False,
+        exclude_live: bool = False,
+    ) -> np.ndarray:
+        """Batch :meth:`latest_at_or_before` with one ``merge_asof``.
+
+        Args:
+            codes: Identity code per query (``-1`` never matches).
+            times: UTC query timestamps aligned with *codes*.
+            strict: Require ``fetched_at`` strictly before the query time.
+            exclude_live: Ignore observations flagged ``is_live``.
+
+        Returns:
+            Row position per query, ``-1`` when no observation qualifies.
+        """
+        result = np.full(len(codes), -1, dtype=np.int64)
+        if not len(codes) or self.rows.empty:
+            return result
+
+        candidates = self.rows.loc[:, [IDENTITY_CODE_COLUMN, "fetched_at"]]
+        if exclude_live:
+            candidates = candidates.loc[~self.rows["is_live"].to_numpy(), :]
+        right = (
+            candidates.assign(**{_POSITION_COLUMN: candidates.index.to_numpy()})
+            .assign(fetched_at=_as_utc_ns(candidates["fetched_at"]))
+            .sort_values("fetched_at", kind="stable")
+        )
+        left = DataFrame(
+            {
+                _QUERY_COLUMN: np.arange(len(codes)),
+                IDENTITY_CODE_COLUMN: np.asarray(codes, dtype=np.int64),
+                _QUERY_TIME_COLUMN: _as_utc_ns(Series(times).reset_index(drop=True)),
+            }
+        ).sort_values(_QUERY_TIME_COLUMN, kind="stable")
+        joined = pd.merge_asof(
+            left,
+            right,
+            left_on=_QUERY_TIME_COLUMN,
+            right_on="fetched_at",
+            by=IDENTITY_CODE_COLUMN,
+            direction="backward",
+            allow_exact_matches=not strict,
+        )
+        matched = joined[_POSITION_COLUMN].notna().to_numpy()
+        result[joined.loc[matched, _QUERY_COLUMN].to_numpy()] = joined.loc[
+            matched, _POSITION_COLUMN
+        ].to_numpy(dtype=np.int64)
+        return result
+
+    def exact_matches(
+        self,
+        codes: np.ndarray,
+        times: Series,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(first position, match count)`` per exact identity and fetch.
+
+        Args:
+            codes: Identity code per query (``-1`` never matches).
+            times: UTC ``fetched_at`` per query, aligned with *codes*.
+
+        Returns:
+            First matching row position (``-1`` when none) and the number of
+            matching rows, per query.
+        """
+        first = np.full(len(codes), -1, dtype=np.int64)
+        counts = np.zeros(len(codes), dtype=np.int64)
+        if not len(codes) or self.rows.empty:
+            return first, counts
+
+        left = DataFrame(
+            {
+                _QUERY_COLUMN: np.arange(len(codes)),
+                IDENTITY_CODE_COLUMN: np.asarray(codes, dtype=np.int64),
+                "fetched_at": _as_utc_ns(Series(times).reset_index(drop=True)),
+            }
+        )
+        right = DataFrame(
+            {
+                IDENTITY_CODE_COLUMN: self.rows[IDENTITY_CODE_COLUMN].to_numpy(),
+                "fetched_at": _as_utc_ns(self.rows["fetched_at"]),
+                _POSITION_COLUMN: np.arange(len(self.rows)),
+            }
+        )
+        joined = left.merge(right, on=[IDENTITY_CODE_COLUMN, "fetched_at"], how="inner")
+        grouped = joined.groupby(_QUERY_COLUMN, sort=False)[_POSITION_COLUMN]
+        matched_first = grouped.min()
+        matched_counts = grouped.size()
+        first[matched_first.index.to_numpy()] = matched_first.to_numpy()
+        counts[matched_counts.index.to_numpy()] = matched_counts.to_numpy()
+        return first, counts
+
+
+def build_quote_history_index(observations: DataFrame) -> QuoteHistoryIndex:
+    """Validate observations once and sort them into a :class:`QuoteHistoryIndex`.
+
+    Identity codes follow the same ordering as grouping by the history
+    identity columns with ``sort=True, dropna=False``.
+    """
+    validated = validate_quote_rows(observations)
+    ordered = validated.sort_values(
+        list(OBSERVATION_SORT_COLUMNS),
+        kind="stable",
+        na_position="first",
+    ).reset_index(drop=True)
+    if ordered.empty:
+        ordered[IDENTITY_CODE_COLUMN] = pd.Series(dtype=np.int64)
+        empty = np.zeros(0, dtype=np.int64)
+        return QuoteHistoryIndex(
+            rows=ordered,
+            identities=ordered.loc[:, list(HISTORY_IDENTITY_COLUMNS)],
+            starts=empty,
+            stops=empty,
+            codes={},
+            fetched_ns=empty,
+        )
+
+    ordered[IDENTITY_CODE_COLUMN] = ordered.groupby(
+        list(HISTORY_IDENTITY_COLUMNS),
+        dropna=False,
+        sort=True,
+    ).ngroup()
+    rows = ordered.sort_values(IDENTITY_CODE_COLUMN, kind="stable").reset_index(drop=True)
+
+    code_values = rows[IDENTITY_CODE_COLUMN].to_numpy()
+    starts = np.flatnonzero(np.r_[True, code_values[1:] != code_values[:-1]])
+    stops = np.r_[starts[1:], len(rows)]
+    identities = rows.loc[starts, list(HISTORY_IDENTITY_COLUMNS)].reset_index(drop=True)
+    return QuoteHistoryIndex(
+        rows=rows,
+        identities=identities,
+        starts=starts,
+        stops=stops,
+        codes={identity: code for code, identity in enumerate(_identity_tuples(identities))},
+        # pyrefly: ignore [missing-attribute]
+        fetched_ns=pd.DatetimeIndex(_as_utc_ns(rows["fetched_at"])).asi8,
+    )
+
+
+def _identity_tuples(keys: DataFrame) -> list[HistoryIdentity]:
+    """Return null-normalized identity tuples for each key row."""
+    present = keys.notna().to_numpy()
+    values = keys.astype(object).to_numpy()
+    return [
+        tuple(str(value) if ok else None for value, ok in zip(row, mask, strict=True))
+        for row, mask in zip(values, present, strict=True)
+    ]
+
+
+def _as_utc_ns(values: Series) -> Series:
+    """Return timestamps as ``datetime64[ns, UTC]`` for exact joins."""
+    return pd.to_datetime(values, utc=True).astype("datetime64[ns, UTC]")
+
+
+def _epoch_ns(when: datetime | pd.Timestamp) -> np.int64:
+    """Return one UTC timestamp as epoch nanoseconds."""
+    return np.int64(pd.Timestamp(when).as_unit("ns").value)
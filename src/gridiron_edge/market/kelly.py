@@ -6,7 +6,12 @@ No data dependencies.  Uses :func:`american_to_decimal` from
 
 from __future__ import annotations
 
-from gridiron_edge.market.odds_math import american_to_decimal
+import numpy as np
+
+from gridiron_edge.market.odds_math import (
+    american_to_decimal,
+    american_to_decimal_array,
+)
 
 # ── Public API ────────────────────────────────────────────────────────────────
 
@@ -39,6 +44,23 @@ def kelly_fraction(model_prob: float, american_odds: int) -> float:
     return max(f, 0.0)
 
 
+def kelly_fraction_array(model_prob: np.ndarray, american_odds: np.ndarray) -> np.ndarray:
+    """Elementwise :func:`kelly_fraction` over aligned probability and odds arrays.
+
+    Raises:
+    ------
+    ValueError
+        If any *model_prob* is not in (0, 1) or any *american_odds* is zero.
+    """
+    model_prob = np.asarray(model_prob, dtype=float)
+    _validate_prob_array(model_prob)
+    dec: np.ndarray = american_to_decimal_array(american_odds)
+    b: np.ndarray = dec - 1.0
+    q: np.ndarray = 1.0 - model_prob
+    f: np.ndarray = (b * model_prob - q) / b
+    return np.maximum(f, 0.0)
+
+
 def kelly_stake(
     model_prob: float,
     american_odds: int,
@@ -88,3 +110,10 @@ def _validate_prob(p: float) -> None:
     """Raise ``ValueError`` if *p* is not strictly between 0 and 1."""
     if not (0.0 < p < 1.0):
         raise ValueError(f"Probability must be in (0, 1), got {p}")
+
+
+def _validate_prob_array(p: np.ndarray) -> None:
+    """Raise ``ValueError`` naming the first element not strictly in (0, 1)."""
+    bad: np.ndarray = ~((p > 0.0) & (p < 1.0))
+    if bad.any():
+        raise ValueError(f"Probability must be in (0, 1), got {p[bad][0]}")
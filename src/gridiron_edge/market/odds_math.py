@@ -1,13 +1,16 @@
 """Pure odds-conversion and market-math functions.
 
 No data dependencies.  Every function in this module is a leaf that operates on
-scalar values and returns scalar values.
+scalar values and returns scalar values, except the ``*_array`` variants, which
+apply the identical arithmetic elementwise to NumPy arrays for columnar callers.
 """
 
 from __future__ import annotations
 
 from typing import Literal
 
+import numpy as np
+
 NoVigMethod = Literal["power", "additive"]
 
 
@@ -94,6 +97,35 @@ def decimal_to_american(dec: float) -> int:
     return round(-100.0 / (dec - 1.0))
 
 
+def american_to_decimal_array(odds: np.ndarray) -> np.ndarray:
+    """Elementwise :func:`american_to_decimal` over an array of American odds.
+
+    Raises:
+    ------
+    ValueError
+        If any element of *odds* is zero.
+    """
+    odds = np.asarray(odds, dtype=np.int64)
+    if (odds == 0).any():
+        raise ValueError("American odds of zero are undefined.")
+    # Zeros are rejected above, so both branches are safe to evaluate.
+    return np.where(odds > 0, 1.0 + odds / 100.0, 1.0 + 100.0 / np.abs(odds))
+
+
+def american_to_implied_prob_array(odds: np.ndarray) -> np.ndarray:
+    """Elementwise :func:`american_to_implied_prob` over an array of American odds.
+
+    Raises:
+    ------
+    ValueError
+        If any element of *odds* is zero.
+    """
+    odds = np.asarray(odds, dtype=np.int64)
+    if (odds == 0).any():
+        raise ValueError("American odds of zero are undefined.")
+    return np.where(odds > 0, 100.0 / (odds + 100.0), np.abs(odds) / (np.abs(odds) + 100.0))
+
+
 # ── Market-level helpers ───────────────────────────────────────────────────────
 
 
@@ -150,6 +182,29 @@ def no_vig(
     return _power_devig(raw_a, raw_b)
 
 
+def no_vig_array(
+    odds_a: np.ndarray,
+    odds_b: np.ndarray,
+    *,
+    method: NoVigMethod = "power",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Elementwise :func:`no_vig` over paired arrays of American odds.
+
+    Returns:
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Fair probabilities per element, identical to the scalar function.
+    """
+    raw_a: np.ndarray = american_to_implied_prob_array(odds_a)
+    raw_b: np.ndarray = american_to_implied_prob_array(odds_b)
+
+    if method == "additive":
+        total: np.ndarray = raw_a + raw_b
+        return raw_a / total, raw_b / total
+
+    return _power_devig_array(raw_a, raw_b)
+
+
 # ── Internal helpers ───────────────────────────────────────────────────────────
 
 
@@ -204,3 +259,40 @@ def _power_devig(
             hi: float = mid
 
     return raw_a**mid, raw_b**mid
+
+
+def _power_devig_array(
+    raw_a: np.ndarray,
+    raw_b: np.ndarray,
+    *,
+    tol: float = 1e-12,
+    max_iter: int = 200,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`_power_devig`.
+
+    Runs the same bisection for every element in lockstep. Elements freeze
+    at the iteration where the scalar loop would ``break``, so each output
+    matches the scalar result exactly.
+    """
+    total: np.ndarray = raw_a + raw_b
+    fair: np.ndarray = np.abs(total - 1.0) < tol
+
+    over: np.ndarray = total > 1.0
+    lo: np.ndarray = np.where(over, 1.0, 0.001)
+    hi: np.ndarray = np.where(over, 1000.0, 1.0)
+    mid: np.ndarray = np.ones_like(total)
+    active: np.ndarray = ~fair
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        mid = np.where(active, (lo + hi) / 2.0, mid)
+        s: np.ndarray = raw_a**mid + raw_b**mid
+        active = active & ~(np.abs(s - 1.0) < tol)
+        lo = np.where(active & (s > 1.0), mid, lo)
+        hi = np.where(active & ~(s > 1.0), mid, hi)
+
+    return (
+        np.where(fair, raw_a, raw_a**mid),
+        np.where(fair, raw_b, raw_b**mid),
+    )
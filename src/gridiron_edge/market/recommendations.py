@@ -22,6 +22,7 @@ Public API:
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
@@ -35,15 +36,20 @@ from gridiron_edge.market.edge import (
     MoneylineEdge,
     SpreadEdge,
     TotalEdge,
-    classify_edge_strength,
+    classify_edge_strength_array,
+    expected_value_array,
     moneyline_edge,
+    spread_cover_prob_array,
     spread_edge,
+    total_cover_prob_array,
     total_edge,
 )
 from gridiron_edge.market.edge_diagnostics import (
     EdgeDiagnostics,
     evaluate_edge_diagnostics,
 )
+from gridiron_edge.market.kelly import kelly_fraction_array
+from gridiron_edge.market.odds_math import no_vig_array
 
 logger: Logger = logging.getLogger(__name__)
 
@@ -80,6 +86,16 @@ _REPORT_COLUMNS: list[str] = [
     "kelly_stake",
 ]
 
+# Report column -> joined column for optional provenance fields.
+_OPTIONAL_BASE_COLUMNS: dict[str, str] = {
+    "provider": "provider",
+    "provider_event_id": "provider_event_id",
+    "sportsbook": "sportsbook",
+    "market_fetched_at": "fetched_at",
+    "sportsbook_updated_at": "sportsbook_updated_at",
+    "commence_time": "commence_time",
+}
+
 
 @dataclass(frozen=True, slots=True)
 class EdgeResult:
@@ -573,82 +589,56 @@ def build_edge_report(
     if joined.empty:
         return pd.DataFrame(columns=_REPORT_COLUMNS)
 
-    report_rows: list[dict] = []
-
-    for _, row in joined.iterrows():
-        model_name: str = str(row.get("model_name", ""))
-        model_type: str = str(row.get("model_type", ""))
-        model_key: str = f"{model_name}_{model_type}"
-
-        game_base: dict = {
-            "provider": _optional_row_value(row, "provider"),
-            "provider_event_id": _optional_row_value(row, "provider_event_id"),
-            "sportsbook": _optional_row_value(row, "sportsbook"),
-            "market_fetched_at": _optional_row_value(row, "fetched_at"),
-            "sportsbook_updated_at": _optional_row_value(
-                row,
-                "sportsbook_updated_at",
-            ),
-            "commence_time": _optional_row_value(row, "commence_time"),
-            "game_id": row.get("game_id", ""),
-            "game_date": row.get("game_date", ""),
-            "season": row.get("season", ""),
-            "week": row.get("week", ""),
-            "away_team": row.get("away_team", ""),
-            "home_team": row.get("home_team", ""),
-            "model_key": model_key,
-            "confidence_tier": row.get("confidence_tier", ""),
-        }
-
-        edges: list[MoneylineEdge | SpreadEdge | TotalEdge] = compute_game_edges(
-            row,
-            margin_std=margin_std,
-            total_std=total_std,
+    market_frames: list[DataFrame] = [
+        frame
+        for frame in (
+            _moneyline_edge_columns(joined),
+            _spread_edge_columns(joined, margin_std),
+            _total_edge_columns(joined, total_std),
         )
-
-        for edge in edges:
-            edge_row: dict = {**game_base}
-
-            if isinstance(edge, MoneylineEdge):
-                edge_row["market_type"] = "moneyline"
-                edge_row["side"] = edge.side
-                edge_row["model_value"] = edge.model_prob
-                edge_row["market_value"] = edge.market_prob
-                edge_row["point_edge"] = float("nan")
-                edge_row["cover_prob"] = float("nan")
-            elif isinstance(edge, SpreadEdge):
-                edge_row["market_type"] = "spread"
-                edge_row["side"] = edge.side
-                edge_row["model_value"] = edge.model_spread
-                edge_row["market_value"] = edge.market_spread
-                edge_row["point_edge"] = edge.point_edge
-                edge_row["cover_prob"] = edge.cover_prob
-            elif isinstance(edge, TotalEdge):
-                edge_row["market_type"] = "total"
-                edge_row["side"] = edge.side
-                edge_row["model_value"] = edge.model_total
-                edge_row["market_value"] = edge.market_total
-                edge_row["point_edge"] = edge.point_edge
-                edge_row["cover_prob"] = edge.cover_prob
-
-            edge_row["american_odds"] = edge.odds
-            edge_row["ev"] = edge.ev
-            edge_row["edge_strength"] = classify_edge_strength(edge.ev)
-            edge_row["kelly_frac"] = edge.kelly_frac
-
-            if bankroll is None:
-                edge_row["kelly_stake"] = None
-            else:
-                max_stake: float = bankroll * kelly_multiplier
-                raw_stake: float = bankroll * kelly_multiplier * edge.kelly_frac
-                edge_row["kelly_stake"] = min(raw_stake, max_stake)
-
-            report_rows.append(edge_row)
-
-    if not report_rows:
+        if not frame.empty
+    ]
+    if not market_frames:
         return pd.DataFrame(columns=_REPORT_COLUMNS)
 
-    return pd.DataFrame(report_rows, columns=_REPORT_COLUMNS)
+    # One row per game x market, ordered by game row then ML / spread / total,
+    # matching the per-row builder this replaced.
+    edges: DataFrame = pd.concat(market_frames, ignore_index=True)
+    order: np.ndarray = np.lexsort((edges["_market_order"].to_numpy(), edges["_row"].to_numpy()))
+    edges = edges.iloc[order].reset_index(drop=True)
+    source: DataFrame = joined.iloc[edges["_row"].to_numpy()].reset_index(drop=True)
+
+    report: dict[str, object] = {
+        column: _optional_column_values(source, source_column)
+        for column, source_column in _OPTIONAL_BASE_COLUMNS.items()
+    }
+    for column in ("game_id", "game_date", "season", "week", "away_team", "home_team"):
+        report[column] = _column_values(source, column)
+    report["model_key"] = (
+        source.get("model_name", pd.Series("", index=source.index)).astype(str)
+        + "_"
+        + source.get("model_type", pd.Series("", index=source.index)).astype(str)
+    ).to_numpy(dtype=object)
+    report["confidence_tier"] = _column_values(source, "confidence_tier")
+
+    for column in ("market_type", "side", "model_value", "market_value", "american_odds"):
+        report[column] = edges[column].to_numpy()
+    report["point_edge"] = edges["point_edge"].to_numpy()
+    report["cover_prob"] = edges["cover_prob"].to_numpy()
+    ev: np.ndarray = edges["ev"].to_numpy(dtype=float)
+    kelly_frac: np.ndarray = edges["kelly_frac"].to_numpy(dtype=float)
+    report["ev"] = ev
+    report["edge_strength"] = classify_edge_strength_array(ev)
+    report["kelly_frac"] = kelly_frac
+
+    if bankroll is None:
+        report["kelly_stake"] = np.full(len(edges), None, dtype=object)
+    else:
+        max_stake: float = bankroll * kelly_multiplier
+        report["kelly_stake"] = np.minimum(bankroll * kelly_multiplier * kelly_frac, max_stake)
+
+    # Round-trip through object so column dtypes match a list-of-dicts build.
+    return pd.DataFrame(report, columns=_REPORT_COLUMNS).astype(object).infer_objects()
 
 
 # ---------------------------------------------------------------------------
@@ -753,14 +743,209 @@ def build_edge_result(
 # ---------------------------------------------------------------------------
 
 
-def _optional_row_value(row: pd.Series, column: str) -> object:
-    """Return one optional row value as null when absent or missing."""
-    if column not in row.index:
-        return None
-    value = row[column]
-    if value is None or pd.isna(value):
-        return None
-    return value
+def _present(frame: DataFrame, *columns: str) -> np.ndarray:
+    """Return a mask of rows where every *column* exists and is non-null."""
+    mask: np.ndarray = np.ones(len(frame), dtype=bool)
+    for column in columns:
+        if column not in frame.columns:
+            return np.zeros(len(frame), dtype=bool)
+        mask &= frame[column].notna().to_numpy()
+    return mask
+
+
+def _odds(frame: DataFrame, column: str) -> np.ndarray:
+    """Return American odds truncated to integers, as ``int(value)`` would."""
+    return np.trunc(frame[column].to_numpy(dtype=float)).astype(np.int64)
+
+
+def _pick_sides(
+    ev_a: np.ndarray,
+    ev_b: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(take_a, take_b)`` masks using the scalar edge tie-break."""
+    take_a: np.ndarray = (ev_a > 0) & (ev_a >= ev_b)
+    take_b: np.ndarray = ~take_a & (ev_b > 0)
+    return take_a, take_b
+
+
+def _side_frame(
+    rows: np.ndarray,
+    take_a: np.ndarray,
+    *,
+    market_type: str,
+    market_order: int,
+    sides: tuple[str, str],
+    model_value: np.ndarray,
+    market_value: np.ndarray,
+    odds: tuple[np.ndarray, np.ndarray],
+    probs: tuple[np.ndarray, np.ndarray],
+    evs: tuple[np.ndarray, np.ndarray],
+    point_edge: np.ndarray,
+    cover_prob: tuple[np.ndarray, np.ndarray] | None,
+) -> DataFrame:
+    """Assemble one market's chosen-side edges (inputs already filtered to +EV)."""
+    chosen_odds: np.ndarray = np.where(take_a, odds[0], odds[1])
+    chosen_prob: np.ndarray = np.where(take_a, probs[0], probs[1])
+    return DataFrame(
+        {
+            "_row": rows,
+            "_market_order": market_order,
+            "market_type": market_type,
+            "side": np.where(take_a, sides[0], sides[1]).astype(object),
+            "model_value": model_value,
+            "market_value": market_value,
+            "american_odds": chosen_odds,
+            "point_edge": point_edge,
+            "cover_prob": (
+                np.full(len(rows), np.nan)
+                if cover_prob is None
+                else np.where(take_a, cover_prob[0], cover_prob[1])
+            ),
+            "ev": np.where(take_a, evs[0], evs[1]),
+            "kelly_frac": kelly_fraction_array(chosen_prob, chosen_odds),
+        }
+    )
+
+
+def _moneyline_edge_columns(joined: DataFrame) -> DataFrame:
+    """Vectorized :func:`moneyline_edge` over every priced game row."""
+    priced: np.ndarray = _present(joined, "ml_home", "ml_away")
+    has_home: np.ndarray = _present(joined, "home_win_prob")
+    has_away: np.ndarray = _present(joined, "away_win_prob")
+    rows: np.ndarray = np.flatnonzero(priced & (has_home | has_away))
+    if rows.size == 0:
+        return DataFrame()
+
+    subset: DataFrame = joined.iloc[rows]
+    home_prob: np.ndarray = (
+        subset["home_win_prob"].to_numpy(dtype=float)
+        if "home_win_prob" in subset.columns
+        else np.full(rows.size, np.nan)
+    )
+    if "away_win_prob" in subset.columns:
+        home_prob = np.where(
+            has_home[rows],
+            home_prob,
+            1.0 - subset["away_win_prob"].to_numpy(dtype=float),
+        )
+    away_prob: np.ndarray = 1.0 - home_prob
+
+    ml_home: np.ndarray = _odds(subset, "ml_home")
+    ml_away: np.ndarray = _odds(subset, "ml_away")
+    fair_home, fair_away = no_vig_array(ml_home, ml_away)
+    ev_home: np.ndarray = expected_value_array(home_prob, ml_home)
+    ev_away: np.ndarray = expected_value_array(away_prob, ml_away)
+
+    take_home, take_away = _pick_sides(ev_home, ev_away)
+    keep: np.ndarray = take_home | take_away
+    home = take_home[keep]
+    return _side_frame(
+        rows[keep],
+        home,
+        market_type="moneyline",
+        market_order=0,
+        sides=("home", "away"),
+        model_value=np.where(home, home_prob[keep], away_prob[keep]),
+        market_value=np.where(home, fair_home[keep], fair_away[keep]),
+        odds=(ml_home[keep], ml_away[keep]),
+        probs=(home_prob[keep], away_prob[keep]),
+        evs=(ev_home[keep], ev_away[keep]),
+        point_edge=np.full(int(keep.sum()), np.nan),
+        cover_prob=None,
+    )
+
+
+def _line_edge_columns(
+    joined: DataFrame,
+    *,
+    market_type: str,
+    market_order: int,
+    sides: tuple[str, str],
+    model_column: str,
+    line_column: str,
+    odds_columns: tuple[str, str],
+    first_side_prob: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> DataFrame:
+    """Vectorized :func:`spread_edge` / :func:`total_edge` over priced rows."""
+    rows: np.ndarray = np.flatnonzero(_present(joined, line_column, *odds_columns, model_column))
+    if rows.size == 0:
+        return DataFrame()
+
+    subset: DataFrame = joined.iloc[rows]
+    model: np.ndarray = subset[model_column].to_numpy(dtype=float)
+    line: np.ndarray = subset[line_column].to_numpy(dtype=float)
+    odds_a: np.ndarray = _odds(subset, odds_columns[0])
+    odds_b: np.ndarray = _odds(subset, odds_columns[1])
+
+    prob_a: np.ndarray = first_side_prob(model, line)
+    prob_b: np.ndarray = 1.0 - prob_a
+    ev_a: np.ndarray = expected_value_array(prob_a, odds_a)
+    ev_b: np.ndarray = expected_value_array(prob_b, odds_b)
+
+    take_a, take_b = _pick_sides(ev_a, ev_b)
+    keep: np.ndarray = take_a | take_b
+    return _side_frame(
+        rows[keep],
+        take_a[keep],
+        market_type=market_type,
+        market_order=market_order,
+        sides=sides,
+        model_value=model[keep],
+        market_value=line[keep],
+        odds=(odds_a[keep], odds_b[keep]),
+        probs=(prob_a[keep], prob_b[keep]),
+        evs=(ev_a[keep], ev_b[keep]),
+        point_edge=np.abs(model[keep] - line[keep]),
+        cover_prob=(prob_a[keep], prob_b[keep]),
+    )
+
+
+def _spread_edge_columns(joined: DataFrame, margin_std: float | None) -> DataFrame:
+    """Spread edges for every priced row, or nothing when ``margin_std`` is unset."""
+    if margin_std is None:
+        return DataFrame()
+    return _line_edge_columns(
+        joined,
+        market_type="spread",
+        market_order=1,
+        sides=("home", "away"),
+        model_column="model_spread",
+        line_column="spread_line_home",
+        odds_columns=("spread_odds_home", "spread_odds_away"),
+        first_side_prob=lambda model, line: spread_cover_prob_array(model, line, margin_std),
+    )
+
+
+def _total_edge_columns(joined: DataFrame, total_std: float | None) -> DataFrame:
+    """Total edges for every priced row, or nothing when ``total_std`` is unset."""
+    if total_std is None:
+        return DataFrame()
+    return _line_edge_columns(
+        joined,
+        market_type="total",
+        market_order=2,
+        sides=("over", "under"),
+        model_column="model_total",
+        line_column="total_line",
+        odds_columns=("over_odds", "under_odds"),
+        first_side_prob=lambda model, line: total_cover_prob_array(model, line, total_std),
+    )
+
+
+def _optional_column_values(frame: DataFrame, column: str) -> np.ndarray:
+    """Return *column* as objects with missing values as ``None``."""
+    if column not in frame.columns:
+        return np.full(len(frame), None, dtype=object)
+    values: np.ndarray = frame[column].to_numpy(dtype=object)
+    values[pd.isna(values)] = None
+    return values
+
+
+def _column_values(frame: DataFrame, column: str) -> np.ndarray:
+    """Return *column* as objects, or ``""`` for every row when absent."""
+    if column not in frame.columns:
+        return np.full(len(frame), "", dtype=object)
+    return frame[column].to_numpy(dtype=object)
 
 
 def _has(row: pd.Series, col: str) -> bool:
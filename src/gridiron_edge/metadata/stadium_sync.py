@@ -1,13 +1,25 @@
-"""Reviewed synchronization for season-scoped stadium metadata."""
+"""Reviewed synchronization for season-scoped stadium metadata.
+
+Besides the reviewed CSV workflow, this module precomputes the venue
+geometry table consumed by the travel feature. The table holds every
+stadium's coordinates, altitude, and IANA zone. It also holds per-date UTC
+offsets for each zone, franchise-season origins, and a venue-by-venue
+great-circle distance matrix, so feature builds are pure array lookups and
+never load time-zone polygons.
+"""
 
 from __future__ import annotations
 
 from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import hashlib
 from pathlib import Path
 from typing import Any, Final
 
+import numpy as np
 import pandas as pd
-from pandas import DataFrame
+from pandas import DataFrame, Series
 
 _STADIUM_COLUMNS: Final[tuple[str, ...]] = (
     "HOME_TEAM",
@@ -38,6 +50,15 @@ _SPECIAL_HOME_TEAMS: Final[frozenset[str]] = frozenset({"Alternate", "Internatio
 _REVIEW_STATUSES: Final[frozenset[str]] = frozenset(
     {"proposed", "approved", "rejected", "unresolved"}
 )
+_GEOMETRY_SOURCE_COLUMNS: Final[tuple[str, ...]] = (
+    "HOME_TEAM",
+    "YEAR",
+    "STADIUM",
+    "LATITUDE",
+    "LONGITUDE",
+    "ALTITUDE",
+)
+_EARTH_RADIUS_KM: Final[float] = 6371.0
 
 
 def _require_columns(frame: DataFrame, required: tuple[str, ...], *, label: str) -> None:
@@ -472,3 +493,298 @@ def apply_approved_stadium_updates(
     combined.to_csv(temporary, index=False)
     temporary.replace(path)
     return combined
+
+
+@dataclass(frozen=True)
+class VenueGeometry:
+    """Precomputed venue coordinates, zones, offsets, and distances.
+
+    Venue positions index every per-venue array and both axes of
+    ``distance_km``. Zone offsets are stored as change points: for zone
+    ``z`` the rows ``offset_starts[z]:offset_starts[z + 1]`` of
+    ``offset_from_ns`` / ``offset_hours`` list each UTC instant from which
+    a whole-hour offset applies.
+
+    Attributes:
+        fingerprint: Digest of the stadium reference columns the table was
+            built from. A mismatch means the table is stale.
+        stadiums: Venue names in venue-position order.
+        latitude: Venue latitudes (``NaN`` when unknown).
+        longitude: Venue longitudes (``NaN`` when unknown).
+        altitude: Venue altitudes (``NaN`` when unknown).
+        zone: Zone position per venue; ``-1`` when no zone resolved.
+        zones: IANA zone names in zone-position order.
+        offset_starts: Per-zone start rows into the offset arrays, plus
+            a final end row.
+        offset_from_ns: UTC epoch nanoseconds from which each offset
+            applies, ascending within each zone.
+        offset_hours: Whole-hour UTC offsets, floored as in
+            ``offset.total_seconds() // 3600``.
+        origin_teams: Franchise names of franchise-season origins.
+        origin_years: Season labels of franchise-season origins.
+        origin_venue: Venue position of each franchise-season origin.
+        distance_km: Great-circle distance between every venue pair.
+    """
+
+    fingerprint: str
+    stadiums: np.ndarray
+    latitude: np.ndarray
+    longitude: np.ndarray
+    altitude: np.ndarray
+    zone: np.ndarray
+    zones: np.ndarray
+    offset_starts: np.ndarray
+    offset_from_ns: np.ndarray
+    offset_hours: np.ndarray
+    origin_teams: np.ndarray
+    origin_years: np.ndarray
+    origin_venue: np.ndarray
+    distance_km: np.ndarray
+
+    def venue_positions(self, stadiums: Series) -> np.ndarray:
+        """Return venue positions for stadium names, ``-1`` where unknown."""
+        names = stadiums.fillna("").astype(str).str.strip()
+        return pd.Index(self.stadiums).get_indexer(pd.Index(names))
+
+    def origin_positions(self, teams: Series, years: Series) -> np.ndarray:
+        """Return origin venue positions per franchise season, ``-1`` where unknown."""
+        keys = pd.MultiIndex.from_arrays(
+            [
+                teams.fillna("").astype(str).str.strip().to_numpy(),
+                years.fillna("").astype(str).str.strip().to_numpy(),
+            ]
+        )
+        origins = pd.MultiIndex.from_arrays([self.origin_teams, self.origin_years])
+        found = origins.get_indexer(keys)
+        return np.where(found >= 0, self.origin_venue[found], -1)
+
+    def distances(self, origins: np.ndarray, sites: np.ndarray) -> np.ndarray:
+        """Return origin-to-site distances, ``NaN`` where either venue is unknown."""
+        known = (origins >= 0) & (sites >= 0)
+        result = np.full(len(origins), np.nan)
+        result[known] = self.distance_km[origins[known], sites[known]]
+        return result
+
+    def utc_offsets(self, venues: np.ndarray, at_ns: np.ndarray) -> np.ndarray:
+        """Return each venue's UTC offset in hours at the matching instant.
+
+        Venues without coordinates or position yield ``NaN``. Venues with
+        coordinates but no resolvable zone yield ``0``.
+        """
+        result = np.full(len(venues), np.nan)
+        known = venues >= 0
+        located = np.zeros(len(venues), dtype=bool)
+        located[known] = ~(
+            np.isnan(self.latitude[venues[known]]) | np.isnan(self.longitude[venues[known]])
+        )
+        result[located] = 0.0
+
+        zones = np.full(len(venues), -1)
+        zones[located] = self.zone[venues[located]]
+        for code in np.unique(zones[zones >= 0]):
+            rows = np.flatnonzero(zones == code)
+            start, stop = self.offset_starts[code], self.offset_starts[code + 1]
+            change = np.searchsorted(self.offset_from_ns[start:stop], at_ns[rows], side="right")
+            result[rows] = self.offset_hours[start + np.maximum(change - 1, 0)]
+        return result
+
+
+def stadium_reference_fingerprint(stadiums: DataFrame) -> str:
+    """Return a digest of the stadium columns that determine venue geometry."""
+    _require_columns(stadiums, _GEOMETRY_SOURCE_COLUMNS, label="Stadium reference")
+    payload = stadiums.loc[:, list(_GEOMETRY_SOURCE_COLUMNS)].to_csv(index=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _unique_coordinates(
+    rows: DataFrame,
+    *,
+    identity_columns: list[str],
+    label: str,
+) -> DataFrame:
+    """Require one coordinate tuple per identity and keep its first row."""
+    coordinates = rows.loc[
+        :,
+        [*identity_columns, "LATITUDE", "LONGITUDE", "ALTITUDE"],
+    ].drop_duplicates(ignore_index=True)
+    if coordinates.groupby(identity_columns, dropna=False).size().gt(1).any():
+        raise ValueError(f"{label} contains conflicting coordinate identities.")
+    return rows.drop_duplicates(subset=identity_columns, keep="first", ignore_index=True)
+
+
+def _haversine_km(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> np.ndarray:
+    """Return vectorized great-circle distances in kilometers."""
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    delta_phi = np.radians(lat2 - lat1)
+    delta_lambda = np.radians(lon2 - lon1)
+
+    haversine = (
+        np.sin(delta_phi / 2.0) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2.0) ** 2
+    )
+
+    return 2.0 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(haversine))
+
+
+def _resolve_zones(latitude: np.ndarray, longitude: np.ndarray) -> list[str | None]:
+    """Resolve the IANA zone of each coordinate pair with TimezoneFinder."""
+    from timezonefinder import TimezoneFinder
+
+    finder = TimezoneFinder()
+    zones: list[str | None] = []
+    for lat, lon in zip(latitude, longitude, strict=True):
+        if np.isnan(lat) or np.isnan(lon):
+            zones.append(None)
+            continue
+        zones.append(finder.certain_timezone_at(lat=round(float(lat), 4), lng=round(float(lon), 4)))
+    return zones
+
+
+def _zone_offset_changes(
+    zone: str, first_year: int, last_year: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(from_ns, hours)`` change points of one zone's daily noon-UTC offset."""
+    days = pd.date_range(
+        f"{first_year}-01-01 12:00",
+        f"{last_year + 1}-01-01 12:00",
+        freq="D",
+        tz="UTC",
+    )
+    local = days.tz_convert(zone).tz_localize(None)
+    seconds = (local - days.tz_localize(None)).total_seconds().to_numpy()
+    hours = np.floor_divide(seconds, 3600).astype(np.int64)
+    changes = np.flatnonzero(np.r_[True, hours[1:] != hours[:-1]])
+    # pyrefly: ignore [missing-attribute]
+    return days.asi8[changes], hours[changes]
+
+
+def build_venue_geometry(
+    stadiums: DataFrame,
+    *,
+    through_year: int | None = None,
+) -> VenueGeometry:
+    """Precompute the venue geometry table from the stadium reference.
+
+    Args:
+        stadiums: Stadium reference with ``HOME_TEAM``, ``YEAR``,
+            ``STADIUM``, ``LATITUDE``, ``LONGITUDE``, and ``ALTITUDE``.
+        through_year: Last calendar year covered by zone offsets. Defaults
+            to the later of the last reference season's end and next year.
+
+    Returns:
+        The venue geometry table.
+
+    Raises:
+        ValueError: If a stadium name or franchise season maps to more than
+            one coordinate tuple.
+    """
+    fingerprint = stadium_reference_fingerprint(stadiums)
+    rows = stadiums.loc[:, list(_GEOMETRY_SOURCE_COLUMNS)].copy()
+    rows["HOME_TEAM"] = rows["HOME_TEAM"].fillna("").astype(str).str.strip()
+    rows["YEAR"] = rows["YEAR"].fillna("").astype(str).str.strip()
+    rows["STADIUM"] = rows["STADIUM"].fillna("").astype(str).str.strip()
+    for column in ("LATITUDE", "LONGITUDE", "ALTITUDE"):
+        rows[column] = pd.to_numeric(rows[column], errors="coerce")
+
+    venues = _unique_coordinates(
+        rows.loc[rows["STADIUM"].ne(""), :],
+        identity_columns=["STADIUM"],
+        label="Stadium reference",
+    )
+    origins = _unique_coordinates(
+        rows.loc[~rows["HOME_TEAM"].isin(_SPECIAL_HOME_TEAMS) & rows["STADIUM"].ne(""), :],
+        identity_columns=["HOME_TEAM", "YEAR"],
+        label="Franchise-season stadium reference",
+    )
+
+    latitude = venues["LATITUDE"].to_numpy(dtype=float)
+    longitude = venues["LONGITUDE"].to_numpy(dtype=float)
+
+    resolved = _resolve_zones(latitude, longitude)
+    zones = sorted({zone for zone in resolved if zone is not None})
+    zone_codes = {zone: code for code, zone in enumerate(zones)}
+
+    season_starts = pd.to_numeric(rows["YEAR"].str.split("-").str[0], errors="coerce").dropna()
+    first_year = int(season_starts.min()) if len(season_starts) else datetime.now(UTC).year
+    last_year = max(
+        int(season_starts.max()) + 1 if len(season_starts) else first_year,
+        through_year if through_year is not None else datetime.now(UTC).year + 1,
+    )
+    changes = [_zone_offset_changes(zone, first_year, last_year) for zone in zones]
+
+    return VenueGeometry(
+        fingerprint=fingerprint,
+        stadiums=venues["STADIUM"].to_numpy(dtype=str),
+        latitude=latitude,
+        longitude=longitude,
+        altitude=venues["ALTITUDE"].to_numpy(dtype=float),
+        zone=np.array(
+            [-1 if zone is None else zone_codes.get(zone, -1) for zone in resolved],
+            dtype=np.int64,
+        ),
+        zones=np.array(zones, dtype=str),
+        offset_starts=np.cumsum([0, *(len(hours) for _, hours in changes)], dtype=np.int64),
+        offset_from_ns=np.concatenate([np.zeros(0, dtype=np.int64), *(ns for ns, _ in changes)]),
+        offset_hours=np.concatenate([np.zeros(0, dtype=np.int64), *(h for _, h in changes)]),
+        origin_teams=origins["HOME_TEAM"].to_numpy(dtype=str),
+        origin_years=origins["YEAR"].to_numpy(dtype=str),
+        origin_venue=pd.Index(venues["STADIUM"]).get_indexer(pd.Index(origins["STADIUM"])),
+        distance_km=_haversine_km(
+            latitude[:, None],
+            longitude[:, None],
+            latitude[None, :],
+            longitude[None, :],
+        ),
+    )
+
+
+def write_venue_geometry(geometry: VenueGeometry, path: Path) -> Path:
+    """Atomically write a venue geometry table as an uncompressed ``.npz``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.tmp.npz")
+    arrays = {name: getattr(geometry, name) for name in VenueGeometry.__dataclass_fields__}
+    arrays["fingerprint"] = np.array(geometry.fingerprint)
+    np.savez(temporary, **arrays)
+    temporary.replace(path)
+    return path
+
+
+def refresh_venue_geometry(stadiums: DataFrame, path: Path) -> VenueGeometry | None:
+    """Rebuild and write the venue geometry table unless it is current.
+
+    The table at *path* is current when it was built from *stadiums*. A
+    missing or unreadable table is rebuilt.
+
+    Args:
+        stadiums: Current stadium reference.
+        path: Registered ``venue_geometry`` path.
+
+    Returns:
+        The table written, or ``None`` when the persisted table was current.
+    """
+    try:
+        current = load_venue_geometry(path).fingerprint == stadium_reference_fingerprint(stadiums)
+    except (OSError, KeyError, ValueError):
+        current = False
+    if current:
+        return None
+    geometry = build_venue_geometry(stadiums)
+    write_venue_geometry(geometry, path)
+    return geometry
+
+
+def load_venue_geometry(path: Path) -> VenueGeometry:
+    """Load a venue geometry table written by :func:`write_venue_geometry`.
+
+    Raises:
+        FileNotFoundError: If the table has not been built.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in VenueGeometry.__dataclass_fields__}
+    arrays["fingerprint"] = str(arrays["fingerprint"])
+    return VenueGeometry(**arrays)
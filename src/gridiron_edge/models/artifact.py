@@ -16,6 +16,7 @@ Directory layout::
                 metadata.json
             xgboost/
                 model.joblib
+                compiled/        # flattened node arrays, see models.compiled
                 metadata.json
             logistic/
                 model.joblib
@@ -34,6 +35,15 @@ Directory layout::
 Artifacts are immutable once written. A new training run replaces the
 existing artifact for that (model_name, model_type) pair.
 
+Loaded models, scalers, and predictors are kept in a process-wide LRU
+(:func:`artifact_cache`) so one ``weekly-predict`` run unpickles each
+artifact once. Entries are keyed by (model_name, model_type, file, metadata
+fingerprint) - the size and mtime of ``metadata.json`` and of the loaded
+file - and :meth:`ArtifactStore.save` evicts the pair it overwrites.
+Joblib files are opened with ``mmap_mode="r"``, so their numpy buffers are
+mapped read-only rather than copied; ``save`` therefore replaces files
+rather than rewriting them, leaving objects already loaded intact.
+
 Field naming convention:
     - ``model_name``: purpose (``"win_prob"``, ``"total"``, ``"qb_pass_yards"``)
     - ``model_type``: algorithm (``"random_forest"``, ``"xgboost"``, ``"logistic"``,
@@ -67,24 +77,34 @@ Typical usage::
 
     # Load
     model = store.load("win_prob", "random_forest")
+    predictor = store.load_predictor("win_prob", "random_forest")  # compiled if available
     meta = store.read_metadata("win_prob", "random_forest")  # → GameModelMetadata
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
 import json
 import logging
 from pathlib import Path
+import shutil
+import threading
+import time
 from typing import Any
 
+from gridiron_edge.core.console import console
+
 logger = logging.getLogger(__name__)
 
 _METADATA_FILENAME = "metadata.json"
 _MODEL_FILENAME = "model.joblib"
 _SCALER_FILENAME = "scaler.joblib"
+_COMPILED_DIRNAME = "compiled"
 _MODELS_DIR = Path("data") / "models"
 _CURRENT_METADATA_SCHEMA_VERSION = 3
+_CACHE_MAX_ENTRIES = 32
 
 
 @dataclass(kw_only=True)
@@ -169,6 +189,140 @@ def _read_metadata_subclass(
     return metadata_class(**data)
 
 
+# (models root, model_name, model_type, filename) + metadata/file fingerprint.
+_CacheKey = tuple[str, str, str, str, tuple[tuple[int, int] | None, ...]]
+
+
+@dataclass
+class ArtifactCacheStats:
+    """Counters for :class:`ArtifactCache`.
+
+    Attributes:
+        hits: Loads served from memory.
+        misses: Loads that read the artifact from disk.
+        evictions: Entries dropped by the LRU bound.
+        invalidations: Entries dropped because their artifact was saved over.
+        load_seconds: Wall-clock time spent reading artifacts on misses.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    load_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of loads served from memory (0.0 before any load)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def describe(self) -> str:
+        """Return a one-line summary for verbose console output."""
+        return (
+            f"{self.hits} hits / {self.misses} loads ({self.hit_rate:.0%} hit rate), "
+            f"{self.load_seconds:.2f}s loading"
+        )
+
+
+class ArtifactCache:
+    """Thread-safe LRU of loaded artifact objects.
+
+    Cached objects are shared between callers; they are used for
+    prediction only and must not be refitted in place.
+    """
+
+    def __init__(self, max_entries: int = _CACHE_MAX_ENTRIES) -> None:
+        self.max_entries: int = max_entries
+        self.stats: ArtifactCacheStats = ArtifactCacheStats()
+        self._entries: OrderedDict[_CacheKey, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached objects."""
+        return len(self._entries)
+
+    def get_or_load(self, key: _CacheKey, loader: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """Return the cached object for *key*, calling *loader* on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return self._entries[key]
+
+        start = time.perf_counter()
+        obj = loader()
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.stats.misses += 1
+            self.stats.load_seconds += elapsed
+            # Older fingerprints of the same file can never be hit again.
+            for stale in [k for k in self._entries if k[:4] == key[:4]]:
+                del self._entries[stale]
+            self._entries[key] = obj
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return obj
+
+    def invalidate(self, root: Path, model_name: str, model_type: str) -> int:
+        """Drop every entry for one artifact pair; return how many."""
+        prefix = (str(root), model_name, model_type)
+        with self._lock:
+            stale = [k for k in self._entries if k[:3] == prefix]
+            for key in stale:
+                del self._entries[key]
+            self.stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = ArtifactCacheStats()
+
+
+_ARTIFACT_CACHE = ArtifactCache()
+
+
+def _dump_atomic(joblib: Any, obj: object, path: Path) -> None:  # noqa: ANN401
+    """Serialise *obj* to a sibling temp file and swap it into place.
+
+    Loaded artifacts memory-map their file, so it must never be rewritten
+    in place: replacing the path leaves existing mappings on the old file.
+    """
+    tmp: Path = path.with_name(f"{path.name}.tmp")
+    joblib.dump(obj, tmp)
+    tmp.replace(path)
+
+
+def _cache_summary() -> str | None:
+    stats = _ARTIFACT_CACHE.stats
+    return stats.describe() if stats.hits or stats.misses else None
+
+
+console.add_stats_source("artifact cache", _cache_summary)
+
+
+def artifact_cache() -> ArtifactCache:
+    """Return the process-wide artifact cache."""
+    return _ARTIFACT_CACHE
+
+
+def _fingerprint(*paths: Path) -> tuple[tuple[int, int] | None, ...]:
+    """Return ``(size, mtime_ns)`` per path, ``None`` for missing files."""
+    stats: list[tuple[int, int] | None] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stats.append(None)
+            continue
+        stats.append((stat.st_size, stat.st_mtime_ns))
+    return tuple(stats)
+
+
 class ArtifactStore:
     """Filesystem store for trained model artifacts and metadata.
 
@@ -271,14 +425,17 @@ class ArtifactStore:
             ) from e
 
         directory.mkdir(parents=True, exist_ok=True)
-        joblib.dump(model_obj, model_path)
+        _dump_atomic(joblib, model_obj, model_path)
+        if filename == _MODEL_FILENAME:
+            self._write_compiled(directory, model_obj, model_path)
 
         if scaler is not None:
             scaler_path: Path = directory / scaler_filename
-            joblib.dump(scaler, scaler_path)
+            _dump_atomic(joblib, scaler, scaler_path)
             logger.debug("Scaler written to %s", scaler_path)
 
         self.save_metadata(metadata)
+        _ARTIFACT_CACHE.invalidate(self._root, metadata.model_name, metadata.model_type)
 
         logger.info(
             "Artifact saved: %s (%.1f KB)",
@@ -294,7 +451,7 @@ class ArtifactStore:
         *,
         filename: str = _MODEL_FILENAME,
     ) -> Any:  # noqa: ANN401
-        """Load a serialised model object."""
+        """Load a serialised model object (cached, memory-mapped)."""
         path: Path = self.artifact_dir(model_name, model_type) / filename
         if not path.exists():
             raise FileNotFoundError(
@@ -306,7 +463,67 @@ class ArtifactStore:
         except ImportError as e:
             raise ImportError("joblib is required to load model artifacts.") from e
 
-        return joblib.load(path)
+        return self._cached(
+            model_name, model_type, filename, lambda: joblib.load(path, mmap_mode="r")
+        )
+
+    def load_predictor(self, model_name: str, model_type: str) -> Any:  # noqa: ANN401
+        """Load the fastest available predictor for an artifact.
+
+        Returns the memory-mapped :class:`~gridiron_edge.models.compiled.CompiledEnsemble`
+        when a current compiled copy sits next to ``model.joblib``, and the
+        unpickled model otherwise. Both expose ``predict`` and (for
+        classifiers) ``predict_proba`` with identical outputs.
+
+        Raises:
+            FileNotFoundError: If no model artifact exists for this pair.
+        """
+        from gridiron_edge.models.compiled import CompiledEnsemble
+
+        directory: Path = self.artifact_dir(model_name, model_type)
+        model_path: Path = directory / _MODEL_FILENAME
+        compiled_dir: Path = directory / _COMPILED_DIRNAME
+        if model_path.exists() and compiled_dir.exists():
+            compiled = self._cached(
+                model_name,
+                model_type,
+                _COMPILED_DIRNAME,
+                lambda: CompiledEnsemble.load(compiled_dir, source=model_path),
+            )
+            if compiled is not None:
+                return compiled
+        return self.load(model_name, model_type)
+
+    def compile(self, model_name: str, model_type: str) -> bool:
+        """Write the compiled copy for an existing artifact.
+
+        Artifacts saved before compilation existed keep working through
+        :meth:`load_predictor`; this backfills their compiled copy.
+
+        Returns:
+            Whether the model was a supported tree ensemble.
+
+        Raises:
+            FileNotFoundError: If no model artifact exists for this pair.
+        """
+        directory: Path = self.artifact_dir(model_name, model_type)
+        model_obj = self.load(model_name, model_type)
+        return self._write_compiled(directory, model_obj, directory / _MODEL_FILENAME)
+
+    def _write_compiled(self, directory: Path, model_obj: object, model_path: Path) -> bool:
+        """Compile *model_obj* next to *model_path*, or drop a stale copy."""
+        from gridiron_edge.models.compiled import compile_ensemble
+
+        compiled_dir: Path = directory / _COMPILED_DIRNAME
+        compiled = compile_ensemble(model_obj)
+        if compiled is None:
+            shutil.rmtree(compiled_dir, ignore_errors=True)
+            return False
+        compiled.save(compiled_dir, source=model_path)
+        logger.debug(
+            "Compiled %d trees (%d nodes) to %s", compiled.n_trees, compiled.n_nodes, compiled_dir
+        )
+        return True
 
     def load_scaler(
         self,
@@ -328,7 +545,30 @@ class ArtifactStore:
         except ImportError as e:
             raise ImportError("joblib is required to load scaler artifacts.") from e
 
-        return joblib.load(path)
+        return self._cached(
+            model_name, model_type, filename, lambda: joblib.load(path, mmap_mode="r")
+        )
+
+    def _cached(
+        self,
+        model_name: str,
+        model_type: str,
+        filename: str,
+        loader: Callable[[], Any],
+    ) -> Any:  # noqa: ANN401
+        """Serve one artifact file through the process-wide cache."""
+        directory: Path = self.artifact_dir(model_name, model_type)
+        target: Path = directory / filename
+        if target.is_dir():
+            target = target / "ensemble.json"
+        key: _CacheKey = (
+            str(self._root),
+            model_name,
+            model_type,
+            filename,
+            _fingerprint(directory / _METADATA_FILENAME, target),
+        )
+        return _ARTIFACT_CACHE.get_or_load(key, loader)
 
     def list_trained(self) -> list[BaseModelMetadata]:
         """Return metadata for all trained artifacts in the store.
@@ -0,0 +1,544 @@
+# src/gridiron_edge/models/compiled.py
+
+"""Compiled tree-ensemble inference.
+
+Random-forest and XGBoost artifacts are pickled object graphs: loading one
+rebuilds every tree as a Python object, and predicting walks them through
+sklearn's or xgboost's per-estimator dispatch. :func:`compile_ensemble`
+flattens a fitted ensemble into one set of contiguous node arrays that a
+single numba kernel evaluates for a whole batch of rows.
+
+Supported estimators:
+
+- ``RandomForestClassifier`` (binary) and ``RandomForestRegressor``
+- ``XGBClassifier`` (``binary:logistic``) and ``XGBRegressor``
+  (``reg:squarederror``) on the ``gbtree`` booster
+- ``CalibratedClassifierCV`` over either classifier, with isotonic or
+  sigmoid calibrators
+
+Anything else (logistic models, pipelines, multiclass targets) compiles to
+``None`` and keeps using the joblib artifact.
+
+On disk a compiled ensemble is one ``.npy`` file per node array plus an
+``ensemble.json`` spec, written next to ``model.joblib`` by
+:meth:`~gridiron_edge.models.artifact.ArtifactStore.save`. Arrays are
+opened with ``np.load(mmap_mode="r")``, so loading costs a few page
+mappings instead of an unpickle.
+
+Split semantics follow each library exactly: inputs are cast to float32,
+sklearn sends ``x <= threshold`` left, xgboost sends ``x < threshold``
+left, and NaN follows the node's recorded missing-value direction.
+Predictions agree with the source estimator to float rounding.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import json
+import logging
+from pathlib import Path
+import shutil
+from typing import Any, Final
+
+from numba import njit
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+COMPILED_FORMAT_VERSION: Final[int] = 1
+
+_SPEC_FILENAME: Final[str] = "ensemble.json"
+_ARRAY_NAMES: Final[tuple[str, ...]] = (
+    "feature",
+    "threshold",
+    "left",
+    "right",
+    "missing_left",
+    "value",
+    "roots",
+)
+
+# Flattened single tree: (feature, threshold, left, right, missing_left, value).
+_Tree = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+@dataclass(frozen=True)
+class EnsembleMember:
+    """One independently summed group of trees.
+
+    A plain forest or booster is a single member. A calibrated classifier
+    has one member per calibration fold; their probabilities are averaged.
+
+    Attributes:
+        tree_start: Index of the member's first tree in ``roots``.
+        tree_stop: One past the member's last tree.
+        link: ``"mean"`` (forest average), ``"identity"`` (boosted
+            regression), or ``"logistic"`` (boosted classification).
+        base: Margin added before the link (xgboost ``base_score``).
+        calibrator: ``None``, ``{"method": "isotonic", "x": [...], "y":
+            [...]}``, or ``{"method": "sigmoid", "a": ..., "b": ...}``.
+    """
+
+    tree_start: int
+    tree_stop: int
+    link: str
+    base: float = 0.0
+    calibrator: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class CompiledEnsemble:
+    """Tree ensemble flattened into contiguous node arrays.
+
+    Node indices in ``left`` / ``right`` / ``roots`` are global across all
+    trees. Leaves have ``feature == -1`` and carry their output in
+    ``value`` (class-1 probability for forest classifiers, raw leaf weight
+    for xgboost).
+
+    Attributes:
+        task: ``"classification"`` or ``"regression"``.
+        strict: ``True`` for xgboost (``x < t`` goes left), ``False`` for
+            sklearn (``x <= t``).
+        n_features: Expected input width.
+        members: Tree groups evaluated and combined per row.
+        classes: Class labels for classifiers, in ``predict_proba`` order.
+        feature: ``int32`` split feature per node; ``-1`` marks a leaf.
+        threshold: ``float64`` split threshold per node.
+        left: ``int32`` left child per node.
+        right: ``int32`` right child per node.
+        missing_left: ``bool`` NaN direction per node.
+        value: ``float64`` leaf output per node.
+        roots: ``int32`` root node per tree.
+    """
+
+    task: str
+    strict: bool
+    n_features: int
+    members: tuple[EnsembleMember, ...]
+    classes: list[Any] = field(default_factory=list)
+    feature: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32), repr=False)
+    threshold: np.ndarray = field(default_factory=lambda: np.empty(0), repr=False)
+    left: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32), repr=False)
+    right: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32), repr=False)
+    missing_left: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool), repr=False)
+    value: np.ndarray = field(default_factory=lambda: np.empty(0), repr=False)
+    roots: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32), repr=False)
+
+    @property
+    def n_nodes(self) -> int:
+        """Total node count across all trees."""
+        return int(self.feature.shape[0])
+
+    @property
+    def n_trees(self) -> int:
+        """Total tree count across all members."""
+        return int(self.roots.shape[0])
+
+    def predict_proba(self, x: Any) -> np.ndarray:  # noqa: ANN401
+        """Return ``(n_rows, 2)`` class probabilities, like sklearn.
+
+        Raises:
+            ValueError: If the ensemble is a regressor or *x* has the wrong
+                number of columns.
+        """
+        if self.task != "classification":
+            raise ValueError("predict_proba is only available for classification ensembles.")
+        positive = self._combine(x)
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, x: Any) -> np.ndarray:  # noqa: ANN401
+        """Return regression outputs, or class labels for classifiers."""
+        combined = self._combine(x)
+        if self.task == "classification":
+            return np.asarray(self.classes)[(combined > 0.5).astype(np.intp)]
+        return combined
+
+    def save(self, directory: Path, *, source: Path | None = None) -> Path:
+        """Write the node arrays and spec to *directory*, replacing it.
+
+        Args:
+            directory: Target directory; any previous contents are removed.
+            source: Artifact the ensemble was compiled from. Its size and
+                mtime are recorded so :meth:`load` can reject a stale copy.
+
+        Returns:
+            The written directory.
+        """
+        staging = directory.with_name(f".{directory.name}.tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        for name in _ARRAY_NAMES:
+            np.save(staging / f"{name}.npy", getattr(self, name))
+        spec = {
+            "format_version": COMPILED_FORMAT_VERSION,
+            "task": self.task,
+            "strict": self.strict,
+            "n_features": self.n_features,
+            "classes": list(self.classes),
+            "members": [asdict(member) for member in self.members],
+            "source": _stat(source) if source is not None else None,
+        }
+        (staging / _SPEC_FILENAME).write_text(json.dumps(spec, indent=2), encoding="utf-8")
+        shutil.rmtree(directory, ignore_errors=True)
+        staging.replace(directory)
+        return directory
+
+    @classmethod
+    def load(cls, directory: Path, *, source: Path | None = None) -> CompiledEnsemble | None:
+        """Memory-map a compiled ensemble written by :meth:`save`.
+
+        Args:
+            directory: Directory holding ``ensemble.json`` and the arrays.
+            source: Artifact the ensemble must have been compiled from.
+                When given and its size or mtime differ from the recorded
+                ones, the compiled copy is stale and ``None`` is returned.
+
+        Returns:
+            The ensemble, or ``None`` when missing, stale, or written by a
+            different format version.
+        """
+        spec_path = directory / _SPEC_FILENAME
+        if not spec_path.exists():
+            return None
+        spec: dict[str, Any] = json.loads(spec_path.read_text(encoding="utf-8"))
+        if spec.get("format_version") != COMPILED_FORMAT_VERSION:
+            return None
+        if source is not None and spec.get("source") != _stat(source):
+            logger.debug("Compiled ensemble at %s is stale; ignoring", directory)
+            return None
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in _ARRAY_NAMES}
+        return cls(
+            task=spec["task"],
+            strict=spec["strict"],
+            n_features=spec["n_features"],
+            members=tuple(EnsembleMember(**member) for member in spec["members"]),
+            classes=spec["classes"],
+            **arrays,
+        )
+
+    def _combine(self, x: Any) -> np.ndarray:  # noqa: ANN401
+        """Evaluate every member on *x* and average their outputs."""
+        rows = np.ascontiguousarray(x, dtype=np.float32)
+        if rows.ndim != 2 or rows.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected input with {self.n_features} features; received shape {rows.shape}."
+            )
+        bounds = np.array(
+            [[m.tree_start, m.tree_stop] for m in self.members], dtype=np.int64
+        ).reshape(-1, 2)
+        sums = _ensemble_sums(
+            rows,
+            self.feature,
+            self.threshold,
+            self.left,
+            self.right,
+            self.missing_left,
+            self.value,
+            self.roots,
+            bounds,
+            self.strict,
+        )
+        outputs = [_apply_member(member, sums[:, i]) for i, member in enumerate(self.members)]
+        return outputs[0] if len(outputs) == 1 else np.mean(outputs, axis=0)
+
+
+def compile_ensemble(model_obj: object) -> CompiledEnsemble | None:
+    """Flatten a fitted tree ensemble, or return ``None`` if unsupported."""
+    try:
+        return _compile(model_obj)
+    except _UnsupportedEnsembleError as e:
+        logger.debug("Not compiling %s: %s", type(model_obj).__name__, e)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Kernel
+# ---------------------------------------------------------------------------
+
+
+@njit(cache=True)
+def _ensemble_sums(  # noqa: PLR0917
+    rows: np.ndarray,
+    feature: np.ndarray,
+    threshold: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    missing_left: np.ndarray,
+    value: np.ndarray,
+    roots: np.ndarray,
+    bounds: np.ndarray,
+    strict: bool,
+) -> np.ndarray:
+    """Sum leaf values per row over each member's trees.
+
+    Args:
+        rows: ``(n_rows, n_features)`` float32 inputs.
+        feature: Split feature per node; negative marks a leaf.
+        threshold: Split threshold per node.
+        left: Left child per node.
+        right: Right child per node.
+        missing_left: Whether NaN goes left at each node.
+        value: Leaf output per node.
+        roots: Root node per tree.
+        bounds: ``(n_members, 2)`` half-open tree ranges.
+        strict: Use ``<`` instead of ``<=`` for the left branch.
+
+    Returns:
+        ``(n_rows, n_members)`` float64 leaf sums.
+    """
+    n_rows = rows.shape[0]
+    n_members = bounds.shape[0]
+    sums = np.zeros((n_rows, n_members))
+    for i in range(n_rows):
+        for m in range(n_members):
+            total = 0.0
+            for t in range(bounds[m, 0], bounds[m, 1]):
+                node = roots[t]
+                while feature[node] >= 0:
+                    x = rows[i, feature[node]]
+                    if np.isnan(x):
+                        go_left = missing_left[node]
+                    elif strict:
+                        go_left = x < threshold[node]
+                    else:
+                        go_left = x <= threshold[node]
+                    node = left[node] if go_left else right[node]
+                total += value[node]
+            sums[i, m] = total
+    return sums
+
+
+def _apply_member(member: EnsembleMember, sums: np.ndarray) -> np.ndarray:
+    """Turn one member's leaf sums into a prediction."""
+    if member.link == "mean":
+        output = sums / (member.tree_stop - member.tree_start)
+    elif member.link == "logistic":
+        output = 1.0 / (1.0 + np.exp(-(sums + member.base)))
+    else:
+        output = sums + member.base
+
+    calibrator = member.calibrator
+    if calibrator is None:
+        return output
+    if calibrator["method"] == "sigmoid":
+        return 1.0 / (1.0 + np.exp(calibrator["a"] * output + calibrator["b"]))
+    xs = np.asarray(calibrator["x"], dtype=float)
+    ys = np.asarray(calibrator["y"], dtype=float)
+    if xs.shape[0] == 1:
+        return np.full_like(output, ys[0])
+    return np.interp(np.clip(output, xs[0], xs[-1]), xs, ys)
+
+
+# ---------------------------------------------------------------------------
+# Flattening
+# ---------------------------------------------------------------------------
+
+
+class _UnsupportedEnsembleError(Exception):
+    """Raised internally when an estimator cannot be compiled."""
+
+
+def _compile(model_obj: object) -> CompiledEnsemble:
+    name = type(model_obj).__name__
+    if name == "CalibratedClassifierCV":
+        return _compile_calibrated(model_obj)
+
+    trees, member, strict, n_features = _flatten_estimator(model_obj)
+    classes = _binary_classes(model_obj) if _is_classifier(model_obj) else []
+    return _assemble(
+        trees,
+        [member],
+        task="classification" if classes else "regression",
+        strict=strict,
+        n_features=n_features,
+        classes=classes,
+    )
+
+
+def _compile_calibrated(calibrated: Any) -> CompiledEnsemble:  # noqa: ANN401
+    classes = _binary_classes(calibrated)
+    trees: list[_Tree] = []
+    members: list[EnsembleMember] = []
+    strict_modes: set[bool] = set()
+    widths: set[int] = set()
+    for fold in calibrated.calibrated_classifiers_:
+        if len(fold.calibrators) != 1:
+            raise _UnsupportedEnsembleError("multiclass calibration")
+        fold_trees, member, strict, n_features = _flatten_estimator(fold.estimator)
+        offset = len(trees)
+        trees.extend(fold_trees)
+        members.append(
+            EnsembleMember(
+                tree_start=offset,
+                tree_stop=offset + len(fold_trees),
+                link=member.link,
+                base=member.base,
+                calibrator=_calibrator_spec(fold.calibrators[0]),
+            )
+        )
+        strict_modes.add(strict)
+        widths.add(n_features)
+    if len(strict_modes) != 1 or len(widths) != 1:
+        raise _UnsupportedEnsembleError("calibration folds disagree on estimator type")
+    return _assemble(
+        trees,
+        members,
+        task="classification",
+        strict=strict_modes.pop(),
+        n_features=widths.pop(),
+        classes=classes,
+    )
+
+
+def _flatten_estimator(
+    estimator: Any,  # noqa: ANN401
+) -> tuple[list[_Tree], EnsembleMember, bool, int]:
+    """Return ``(trees, member, strict, n_features)`` for one ensemble."""
+    name = type(estimator).__name__
+    if name in {"RandomForestClassifier", "RandomForestRegressor"}:
+        classifier = name == "RandomForestClassifier"
+        if classifier:
+            _binary_classes(estimator)
+        if getattr(estimator, "n_outputs_", 1) != 1:
+            raise _UnsupportedEnsembleError("multi-output forest")
+        trees = [_sklearn_tree(tree.tree_, classifier=classifier) for tree in estimator.estimators_]
+        member = EnsembleMember(tree_start=0, tree_stop=len(trees), link="mean")
+        return trees, member, False, int(estimator.n_features_in_)
+    if name in {"XGBClassifier", "XGBRegressor"}:
+        return _xgboost_trees(estimator)
+    raise _UnsupportedEnsembleError(f"unsupported estimator {name}")
+
+
+def _sklearn_tree(tree: Any, *, classifier: bool) -> _Tree:  # noqa: ANN401
+    """Flatten one fitted sklearn ``Tree``."""
+    leaf = tree.children_left < 0
+    if classifier:
+        counts = tree.value[:, 0, :]
+        value = counts[:, 1] / counts.sum(axis=1)
+    else:
+        value = tree.value[:, 0, 0]
+    missing = getattr(tree, "missing_go_to_left", None)
+    return (
+        np.where(leaf, -1, tree.feature).astype(np.int32),
+        np.where(leaf, 0.0, tree.threshold).astype(np.float64),
+        np.where(leaf, -1, tree.children_left).astype(np.int32),
+        np.where(leaf, -1, tree.children_right).astype(np.int32),
+        np.zeros(tree.node_count, dtype=bool) if missing is None else missing.astype(bool),
+        np.where(leaf, value, 0.0).astype(np.float64),
+    )
+
+
+_XGB_LINKS: Final[dict[str, str]] = {
+    "binary:logistic": "logistic",
+    "reg:squarederror": "identity",
+}
+
+
+def _xgboost_trees(estimator: Any) -> tuple[list[_Tree], EnsembleMember, bool, int]:  # noqa: ANN401
+    """Flatten a fitted xgboost sklearn-API model from its JSON dump."""
+    if getattr(estimator, "best_iteration", None) is not None:
+        raise _UnsupportedEnsembleError("early-stopped booster")
+    learner = json.loads(estimator.get_booster().save_raw("json"))["learner"]
+    objective = learner["objective"]["name"]
+    if objective not in _XGB_LINKS:
+        raise _UnsupportedEnsembleError(f"objective {objective}")
+    booster = learner["gradient_booster"]
+    if booster["name"] != "gbtree":
+        raise _UnsupportedEnsembleError(f"booster {booster['name']}")
+    params = learner["learner_model_param"]
+    if int(params.get("num_class", 0)) > 1 or int(params.get("num_target", 1)) != 1:
+        raise _UnsupportedEnsembleError("multi-output booster")
+
+    trees: list[_Tree] = []
+    for tree in booster["model"]["trees"]:
+        if any(tree.get("split_type", [])):
+            raise _UnsupportedEnsembleError("categorical splits")
+        left = np.asarray(tree["left_children"], dtype=np.int32)
+        leaf = left < 0
+        conditions = np.asarray(tree["split_conditions"], dtype=np.float32).astype(np.float64)
+        trees.append(
+            (
+                np.where(leaf, -1, tree["split_indices"]).astype(np.int32),
+                np.where(leaf, 0.0, conditions),
+                left,
+                np.asarray(tree["right_children"], dtype=np.int32),
+                np.asarray(tree["default_left"], dtype=bool),
+                np.where(leaf, conditions, 0.0),
+            )
+        )
+
+    base_score = float(str(params["base_score"]).strip("[]"))
+    link = _XGB_LINKS[objective]
+    base = float(np.log(base_score / (1.0 - base_score))) if link == "logistic" else base_score
+    member = EnsembleMember(tree_start=0, tree_stop=len(trees), link=link, base=base)
+    return trees, member, True, int(params["num_feature"])
+
+
+def _calibrator_spec(calibrator: Any) -> dict[str, Any]:  # noqa: ANN401
+    name = type(calibrator).__name__
+    if name == "IsotonicRegression":
+        if getattr(calibrator, "out_of_bounds", "clip") != "clip":
+            raise _UnsupportedEnsembleError("isotonic calibrator without clipping")
+        return {
+            "method": "isotonic",
+            "x": np.asarray(calibrator.X_thresholds_, dtype=float).tolist(),
+            "y": np.asarray(calibrator.y_thresholds_, dtype=float).tolist(),
+        }
+    if name == "_SigmoidCalibration":
+        return {"method": "sigmoid", "a": float(calibrator.a_), "b": float(calibrator.b_)}
+    raise _UnsupportedEnsembleError(f"calibrator {name}")
+
+
+def _is_classifier(model_obj: object) -> bool:
+    return hasattr(model_obj, "predict_proba")
+
+
+def _binary_classes(model_obj: Any) -> list[Any]:  # noqa: ANN401
+    classes = np.asarray(model_obj.classes_)
+    if classes.shape[0] != 2:
+        raise _UnsupportedEnsembleError("non-binary classifier")
+    return classes.tolist()
+
+
+def _assemble(
+    trees: list[_Tree],
+    members: list[EnsembleMember],
+    *,
+    task: str,
+    strict: bool,
+    n_features: int,
+    classes: list[Any],
+) -> CompiledEnsemble:
+    """Concatenate per-tree arrays, shifting child indices to global ids."""
+    if not trees:
+        raise _UnsupportedEnsembleError("empty ensemble")
+    sizes = np.array([tree[0].shape[0] for tree in trees], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int32)
+    columns = list(zip(*trees, strict=True))
+
+    def _children(parts: tuple[np.ndarray, ...]) -> np.ndarray:
+        shifted = [np.where(p >= 0, p + off, -1) for p, off in zip(parts, offsets, strict=True)]
+        return np.concatenate(shifted).astype(np.int32)
+
+    return CompiledEnsemble(
+        task=task,
+        strict=strict,
+        n_features=n_features,
+        members=tuple(members),
+        classes=classes,
+        feature=np.concatenate(columns[0]).astype(np.int32),
+        threshold=np.concatenate(columns[1]).astype(np.float64),
+        left=_children(columns[2]),
+        right=_children(columns[3]),
+        missing_left=np.concatenate(columns[4]).astype(bool),
+        value=np.concatenate(columns[5]).astype(np.float64),
+        roots=offsets,
+    )
+
+
+def _stat(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
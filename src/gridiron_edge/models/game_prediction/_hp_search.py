@@ -0,0 +1,293 @@
+# src/gridiron_edge/models/game_prediction/_hp_search.py
+
+"""Pooled hyperparameter-search backend for :class:`GamesTrainer`.
+
+Every (candidate, CV fold) fit in the randomized search is independent, so
+the pooled backend dispatches them to a joblib process pool instead of the
+serial per-candidate loop. Feature matrices are shared once per EPA window
+through a :class:`~gridiron_edge.datasets.handles.SharedDatasets` scope, so
+each task carries a small handle and workers read one memory-mapped copy
+instead of receiving a pickled copy per task. Each worker fits
+its estimator with ``n_jobs=1`` so the pool does not oversubscribe the cores.
+
+With successive halving enabled, folds are evaluated rung by rung (smallest
+training fold first). After each rung, candidates outside the best
+``1 / _HALVING_ETA`` fraction whose running mean score also trails the
+leader by more than ``_HALVING_MARGIN`` are dropped from later rungs.
+
+Both modes are deterministic: fold scores do not depend on scheduling,
+results are collected in submission order, and ties resolve to the earliest
+sampled candidate exactly like the serial loop.
+
+Public API
+----------
+SearchCandidate   One sampled parameter combo and its EPA window.
+score_fold        Fit one fold and return its validation score.
+score_candidates  Score every candidate with the pooled backend.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+import logging
+from logging import Logger
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from joblib import Parallel, delayed
+import numpy as np
+import pandas as pd
+
+# pyrefly: ignore [missing-import, untyped-import]
+from tqdm import tqdm
+
+from gridiron_edge.datasets.handles import DatasetHandle, SharedDatasets
+
+if TYPE_CHECKING:
+    from gridiron_edge.models.game_prediction.base import GameModelType
+
+logger: Logger = logging.getLogger(__name__)
+
+#: Fraction of surviving candidates kept after each halving rung (1 / eta).
+_HALVING_ETA: Final[int] = 2
+
+#: Relative gap to the rung leader within which a candidate is never pruned,
+#: even when it falls outside the top ``1 / _HALVING_ETA``.
+_HALVING_MARGIN: Final[float] = 0.002
+
+#: Overrides applied to every pooled fit. The pool already occupies the
+#: cores, so estimators built with ``n_jobs=-1`` run single-threaded.
+_WORKER_PARAMS: Final[dict[str, Any]] = {"n_jobs": 1}
+
+Fold = tuple[np.ndarray, np.ndarray]
+
+
+@dataclass(frozen=True)
+class SearchCandidate:
+    """One sampled hyperparameter combo.
+
+    Attributes:
+        params: Estimator parameters (``epa_window`` removed).
+        window: EPA window whose train split this candidate is scored on.
+    """
+
+    params: dict[str, Any]
+    window: int
+
+
+@dataclass
+class CandidateScore:
+    """Scoring outcome for one candidate.
+
+    Attributes:
+        score: Mean validation score over scored folds, ``inf`` if none.
+        n_folds_scored: Number of folds that contributed to ``score``.
+        pruned: ``True`` when successive halving dropped the candidate
+            before its last fold; ``score`` is then a partial mean and the
+            candidate is not eligible for selection.
+    """
+
+    score: float
+    n_folds_scored: int
+    pruned: bool = False
+
+
+def score_fold(
+    x: np.ndarray,
+    y: np.ndarray,
+    fold: Fold,
+    *,
+    params: dict[str, Any],
+    model_type: GameModelType,
+    task: str,
+) -> float:
+    """Fit one CV fold and score its validation slice.
+
+    Classification scores by Brier, regression by MAE (lower is better).
+    Shared by the serial ``GamesTrainer._cv_score`` loop and the pooled
+    workers so both backends produce identical fold scores.
+
+    Args:
+        x: Feature matrix for the candidate's EPA window.
+        y: Target vector aligned with ``x``.
+        fold: ``(train_idx, val_idx)`` positional indices into ``x``.
+        params: Estimator parameters (without ``epa_window``).
+        model_type: Algorithm to instantiate.
+        task: ``"classification"`` or ``"regression"``.
+
+    Returns:
+        Validation score for the fold.
+    """
+    from gridiron_edge.evaluation.metrics import brier_score
+    from gridiron_edge.models.game_prediction.base import _apply_params, _create_model
+
+    train_idx, val_idx = fold
+    x_tr, y_tr = x[train_idx], y[train_idx]
+    x_val, y_val = x[val_idx], y[val_idx]
+
+    model, scaler = _create_model(model_type, task)
+    _apply_params(model, params)
+    if scaler is not None:
+        x_tr = scaler.fit_transform(x_tr)
+        x_val = scaler.transform(x_val)
+
+    model.fit(x_tr, y_tr)
+
+    if task == "classification":
+        probs = pd.Series(model.predict_proba(x_val)[:, 1])
+        return float(brier_score(probs, pd.Series(np.asarray(y_val, dtype=float))))
+    preds = model.predict(x_val)
+    return float(np.mean(np.abs(preds - np.asarray(y_val))))
+
+
+def _share_arrays(
+    arrays: dict[int, tuple[np.ndarray, np.ndarray]],
+    shared: SharedDatasets,
+) -> dict[int, tuple[DatasetHandle, DatasetHandle]]:
+    """Write each window's arrays to the scope once and return their handles."""
+    return {
+        window: (
+            shared.share_array(f"x_window{window}", x),
+            shared.share_array(f"y_window{window}", y),
+        )
+        for window, (x, y) in arrays.items()
+    }
+
+
+def _score_shared_fold(
+    x: DatasetHandle,
+    y: DatasetHandle,
+    fold: Fold,
+    *,
+    params: dict[str, Any],
+    model_type: GameModelType,
+    task: str,
+) -> float:
+    """Worker entry point: map the window's arrays and score one fold.
+
+    Args:
+        x: Handle to the window's feature matrix.
+        y: Handle to the window's target vector.
+        fold: ``(train_idx, val_idx)`` positional indices.
+        params: Estimator parameters (without ``epa_window``).
+        model_type: Algorithm to instantiate.
+        task: ``"classification"`` or ``"regression"``.
+    """
+    return score_fold(x.array(), y.array(), fold, params=params, model_type=model_type, task=task)
+
+
+def _prune(alive: list[int], means: dict[int, float]) -> list[int]:
+    """Keep the top ``1 / _HALVING_ETA`` plus anything near the leader.
+
+    Ordering is by ``(score, candidate position)`` so ties are broken the
+    same way as final selection.
+    """
+    ranked: list[int] = sorted(alive, key=lambda i: (means[i], i))
+    keep_n: int = max(1, math.ceil(len(ranked) / _HALVING_ETA))
+    leader: float = means[ranked[0]]
+    threshold: float = leader + abs(leader) * _HALVING_MARGIN
+    kept: set[int] = set(ranked[:keep_n]) | {i for i in ranked if means[i] <= threshold}
+    return [i for i in alive if i in kept]
+
+
+def score_candidates(
+    candidates: Sequence[SearchCandidate],
+    *,
+    arrays: dict[int, tuple[np.ndarray, np.ndarray]],
+    folds: dict[int, list[Fold]],
+    model_type: GameModelType,
+    task: str,
+    n_jobs: int,
+    halving: bool,
+    desc: str,
+    repo: Path,
+) -> list[CandidateScore]:
+    """Score every candidate on its window's CV folds in a process pool.
+
+    Args:
+        candidates: Sampled combos in search order.
+        arrays: ``window -> (x, y)`` training arrays.
+        folds: ``window -> folds`` that survived the per-fold row guard.
+        model_type: Algorithm to instantiate.
+        task: ``"classification"`` or ``"regression"``.
+        n_jobs: joblib worker count (``-1`` = all cores).
+        halving: Enable successive-halving pruning between fold rungs.
+        desc: Progress-bar label.
+        repo: Repository root owning the shared-array scope.
+
+    Returns:
+        One :class:`CandidateScore` per candidate, in input order.
+    """
+    sums: list[float] = [0.0] * len(candidates)
+    counts: list[int] = [0] * len(candidates)
+    alive: list[int] = [i for i, c in enumerate(candidates) if folds[c.window]]
+
+    n_rungs: int = max((len(f) for f in folds.values()), default=0)
+    # Halving evaluates one fold per rung; otherwise all folds form a single
+    # rung so the pool sees every task at once.
+    rungs: list[list[int]] = [[r] for r in range(n_rungs)]
+    if not halving and n_rungs:
+        rungs = [list(range(n_rungs))]
+    pruned: set[int] = set()
+    n_tasks_total: int = sum(len(folds[candidates[i].window]) for i in alive)
+
+    with (
+        SharedDatasets(repo) as scope,
+        Parallel(n_jobs=n_jobs, max_nbytes=None, return_as="generator") as parallel,
+    ):
+        shared = _share_arrays(arrays, scope)
+        bar = tqdm(total=n_tasks_total, desc=desc, unit="fit", ncols=100, colour="cyan")
+
+        for rung_idx, rung in enumerate(rungs):
+            tasks: list[tuple[int, int]] = [
+                (i, r) for i in alive for r in rung if r < len(folds[candidates[i].window])
+            ]
+            results: Iterator[float] = parallel(
+                delayed(_score_shared_fold)(
+                    *shared[candidates[i].window],
+                    folds[candidates[i].window][r],
+                    params={**candidates[i].params, **_WORKER_PARAMS},
+                    model_type=model_type,
+                    task=task,
+                )
+                for i, r in tasks
+            )
+            for (i, _), fold_score in zip(tasks, results, strict=True):
+                sums[i] += fold_score
+                counts[i] += 1
+                bar.update(1)
+
+            is_last_rung: bool = rung_idx == len(rungs) - 1
+            if halving and not is_last_rung and len(alive) > 1:
+                means: dict[int, float] = {i: sums[i] / counts[i] for i in alive}
+                survivors: set[int] = set(_prune(alive, means))
+                # Candidates whose window has no folds left keep their full score.
+                dropped: list[int] = [
+                    i
+                    for i in alive
+                    if i not in survivors and counts[i] < len(folds[candidates[i].window])
+                ]
+                pruned.update(dropped)
+                bar.total -= sum(len(folds[candidates[i].window]) - counts[i] for i in dropped)
+                alive = [i for i in alive if i not in pruned]
+                bar.set_postfix(alive=len(alive), refresh=False)
+
+        bar.close()
+
+    if halving:
+        logger.info(
+            "Successive halving kept %d/%d candidates through the final rung",
+            len(candidates) - len(pruned),
+            len(candidates),
+        )
+
+    return [
+        CandidateScore(
+            score=sums[i] / counts[i] if counts[i] else float("inf"),
+            n_folds_scored=counts[i],
+            pruned=i in pruned,
+        )
+        for i in range(len(candidates))
+    ]
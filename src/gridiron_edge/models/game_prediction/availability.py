@@ -10,9 +10,8 @@ import pandas as pd
 from pandas import DataFrame
 
 from gridiron_edge.datasets import loaders
-from gridiron_edge.datasets.accessor import DatasetAccessor
-from gridiron_edge.features.pipeline import CANONICAL_FEATURES
 from gridiron_edge.features.registry import run_features
+from gridiron_edge.features.upcoming import UpcomingFeatureContext
 from gridiron_edge.models.artifact import ArtifactStore
 from gridiron_edge.models.game_prediction.model import GamesModel
 from gridiron_edge.models.game_prediction.prediction_policy import PredictionAvailability
@@ -150,16 +149,17 @@ def inspect_prediction_availability(
     season: str,
     week: int,
     repo: Path,
+    feature_context: UpcomingFeatureContext | None = None,
 ) -> PredictionAvailability:
-    """Inspect exact-model input availability for one complete weekly schedule."""
+    """Inspect exact-model input availability for one complete weekly schedule.
+
+    Pass the run's *feature_context* so the selected models reuse the
+    canonical features built here instead of rebuilding them.
+    """
     scoped = _scope_schedule(schedule, season=season, week=week)
     canonical = _build_elo_schedule(scoped.copy())
-    datasets = DatasetAccessor(repo=repo)
-    enriched = run_features(
-        df=canonical.copy(),
-        feature_names=CANONICAL_FEATURES,
-        datasets=datasets,
-    )
+    context = feature_context or UpcomingFeatureContext(repo, build=run_features)
+    enriched = context.features(canonical)
 
     availability: dict[tuple[str, str], bool] = {}
     for model_name, model_type, task in _MODEL_REQUIREMENTS:
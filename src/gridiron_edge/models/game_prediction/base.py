@@ -9,6 +9,7 @@ artifact.py, game-specific metadata holds both classification metrics
 Public API:
     GameModelMetadata   metadata recorded alongside a trained artifact
     GameModelType       supported algorithms enum
+    HPSearchMode        hyperparameter search execution strategy
     GameModelSpec       describes a game model's identity + feature set
     GamesTrainer        ABC base class for game model trainers
     _create_model       module-level estimator factory
@@ -85,6 +86,21 @@ class GameModelType(StrEnum):
     XGBOOST = "xgboost"
 
 
+class HPSearchMode(StrEnum):
+    """Execution strategy for the randomized hyperparameter search.
+
+    ``SERIAL`` fits candidates and folds one at a time in-process.
+    ``PARALLEL`` fits every (candidate, fold) pair in a joblib process pool
+    over memory-mapped feature arrays and selects the same best params as
+    ``SERIAL``. ``HALVING`` adds successive-halving pruning of candidates
+    whose early-fold score is clearly worse (see ``_hp_search``).
+    """
+
+    SERIAL = "serial"
+    PARALLEL = "parallel"
+    HALVING = "halving"
+
+
 @dataclass(frozen=True)
 class GameModelSpec:
     """Metadata describing a game model's identity.
@@ -97,6 +113,9 @@ class GameModelSpec:
         feature_set: Per-algorithm feature set. Keys define which algorithms
             this spec supports (``TotalTrainer`` excludes ``LOGISTIC``).
         description: Human-readable description.
+        search_mode: Hyperparameter search backend. Defaults to ``SERIAL``.
+        search_n_jobs: Worker count for the pooled backends (``-1`` uses
+            all cores). Ignored by ``SERIAL``.
     """
 
     name: str
@@ -104,6 +123,8 @@ class GameModelSpec:
     target_col: str
     feature_set: dict[GameModelType, FeatureSet]
     description: str = ""
+    search_mode: HPSearchMode = HPSearchMode.SERIAL
+    search_n_jobs: int = -1
 
 
 # ---------------------------------------------------------------------------
@@ -372,6 +393,10 @@ class _SearchResult:
     hold_seasons: list[str]
 
 
+#: ``_prepare_window`` output: (x_train, y_train, x_hold, y_hold, train/hold seasons).
+_WindowSplit = tuple[pd.DataFrame, Series, pd.DataFrame, Series, list[str], list[str]]
+
+
 def _apply_params(model: BaseEstimator, params: dict[str, Any]) -> None:
     """Apply hyperparameters to a model, handling CalibratedClassifierCV wrapping.
 
@@ -391,6 +416,32 @@ def _apply_params(model: BaseEstimator, params: dict[str, Any]) -> None:
         model.set_params(**params)
 
 
+def _no_valid_pipeline_error(
+    spec: GameModelSpec,
+    model_type: GameModelType,
+    *,
+    n_tried: int,
+    n_all_folds_skipped: int,
+    train_pool_size: int,
+    min_cv_train_rows: int,
+) -> RuntimeError:
+    """Build the diagnostic error raised when HP search scores no candidate."""
+    approx_largest_fold: int = int(train_pool_size * _CV_FOLDS / (_CV_FOLDS + 1))
+    msg: str = (
+        f"{spec.name}/{model_type.value}: hyperparameter search produced "
+        f"no valid pipeline. Tried {n_tried} combo(s); "
+        f"{n_all_folds_skipped} had every CV fold skipped by the "
+        f"min_cv_train_rows guard. Diagnostics: "
+        f"training_pool≈{train_pool_size} rows, "
+        f"n_splits={_CV_FOLDS}, "
+        f"approx largest fold≈{approx_largest_fold} rows, "
+        f"min_cv_train_rows={min_cv_train_rows}. "
+        f"If this is walk-forward, lower min_cv_train_rows further or "
+        f"raise _MIN_WALK_FORWARD_TRAIN_SEASONS in evaluation/backfill.py."
+    )
+    return RuntimeError(msg)
+
+
 def _filter_for_walk_forward(
     x_train_orig: pd.DataFrame,
     y_train_orig: Series,
@@ -624,7 +675,8 @@ class GamesTrainer(ABC):
 
         Returns a populated :class:`_SearchResult`. Raises ``RuntimeError`` if
         no valid pipeline was produced (e.g. all CV folds were skipped due to
-        the MIN_CV_TRAIN_ROWS guard).
+        the MIN_CV_TRAIN_ROWS guard). Non-serial ``spec.search_mode`` values
+        dispatch to :meth:`_run_pooled_hp_search`.
 
         Args:
             df: Full modeling DataFrame from ``load_modeling_file``.
@@ -672,6 +724,17 @@ class GamesTrainer(ABC):
 
         sample_indices: list[int] = list(rng.choice(len(grid), size=n_iter, replace=False).tolist())
 
+        if spec.search_mode != HPSearchMode.SERIAL:
+            return self._run_pooled_hp_search(
+                df=df,
+                model_type=model_type,
+                feature_fn=feature_fn,
+                repo=repo,
+                sampled=[dict(grid[idx]) for idx in sample_indices],
+                train_through_season=train_through_season,
+                min_cv_train_rows=min_cv_train_rows,
+            )
+
         bar = tqdm(
             sample_indices,
             desc=f"  {spec.name}/{model_type.value}",
@@ -734,20 +797,14 @@ class GamesTrainer(ABC):
             or best_x_hold is None
             or best_y_hold is None
         ):
-            approx_largest_fold: int = int(last_train_pool_size * _CV_FOLDS / (_CV_FOLDS + 1))
-            msg: str = (
-                f"{spec.name}/{model_type.value}: hyperparameter search produced "
-                f"no valid pipeline. Tried {len(sample_indices)} combo(s); "
-                f"{n_combos_all_folds_skipped} had every CV fold skipped by the "
-                f"min_cv_train_rows guard. Diagnostics: "
-                f"training_pool≈{last_train_pool_size} rows, "
-                f"n_splits={_CV_FOLDS}, "
-                f"approx largest fold≈{approx_largest_fold} rows, "
-                f"min_cv_train_rows={effective_min}. "
-                f"If this is walk-forward, lower min_cv_train_rows further or "
-                f"raise _MIN_WALK_FORWARD_TRAIN_SEASONS in evaluation/backfill.py."
+            raise _no_valid_pipeline_error(
+                spec,
+                model_type,
+                n_tried=len(sample_indices),
+                n_all_folds_skipped=n_combos_all_folds_skipped,
+                train_pool_size=last_train_pool_size,
+                min_cv_train_rows=effective_min,
             )
-            raise RuntimeError(msg)
 
         return _SearchResult(
             model=best_model,
@@ -762,6 +819,121 @@ class GamesTrainer(ABC):
             hold_seasons=best_hold_seasons,
         )
 
+    def _run_pooled_hp_search(
+        self,
+        *,
+        df: pd.DataFrame,
+        model_type: GameModelType,
+        feature_fn: Callable,
+        repo: Path,
+        sampled: list[dict[str, Any]],
+        train_through_season: str | None = None,
+        min_cv_train_rows: int | None = None,
+    ) -> _SearchResult:
+        """Score ``sampled`` combos with the process-pool backend; refit the best.
+
+        Window data and CV folds are prepared once per EPA window in this
+        process; only the independent (candidate, fold) fits are pooled.
+        Selection walks candidates in sample order with a strict ``<`` so the
+        chosen params match the serial loop for the same scores.
+
+        Args:
+            df: Full modeling DataFrame from ``load_modeling_file``.
+            model_type: Algorithm to search over.
+            feature_fn: Feature-construction callable from the spec.
+            repo: Repository root.
+            sampled: Parameter combos in sample order (may include
+                ``epa_window``).
+            train_through_season: Optional walk-forward cutoff.
+            min_cv_train_rows: Override for the per-fold row floor.
+        """
+        from gridiron_edge.models.game_prediction._hp_search import (
+            Fold,
+            SearchCandidate,
+            score_candidates,
+        )
+
+        spec: GameModelSpec = self.spec
+        tscv = TimeSeriesSplit(n_splits=_CV_FOLDS)
+        window_cache: dict[int, WindowData] = {}
+
+        splits: dict[int, _WindowSplit] = {}
+        folds: dict[int, list[Fold]] = {}
+        effective_min: int = 0
+        candidates: list[SearchCandidate] = []
+
+        for combo in sampled:
+            window: int = combo.pop("epa_window", 4)
+            if window not in splits:
+                splits[window] = self._prepare_window(
+                    df=df,
+                    window=window,
+                    window_cache=window_cache,
+                    feature_fn=feature_fn,
+                    repo=repo,
+                    train_through_season=train_through_season,
+                )
+                x_train: pd.DataFrame = splits[window][0]
+                effective_min = _resolve_cv_min_train_rows(
+                    x_train=x_train,
+                    tscv=tscv,
+                    requested=min_cv_train_rows,
+                )
+                folds[window] = [
+                    (train_idx, val_idx)
+                    for train_idx, val_idx in tscv.split(x_train)
+                    if not (spec.task == "classification" and len(train_idx) < effective_min)
+                ]
+            candidates.append(SearchCandidate(params=combo, window=window))
+
+        scores = score_candidates(
+            candidates,
+            arrays={w: (split[0].values, split[1].to_numpy()) for w, split in splits.items()},
+            folds=folds,
+            model_type=model_type,
+            task=spec.task,
+            n_jobs=spec.search_n_jobs,
+            halving=spec.search_mode == HPSearchMode.HALVING,
+            desc=f"  {spec.name}/{model_type.value}",
+            repo=repo,
+        )
+
+        best_idx: int | None = None
+        best_score: float = float("inf")
+        for idx, result in enumerate(scores):
+            if not result.pruned and result.score < best_score:
+                best_idx, best_score = idx, result.score
+
+        if best_idx is None:
+            raise _no_valid_pipeline_error(
+                spec,
+                model_type,
+                n_tried=len(candidates),
+                n_all_folds_skipped=sum(1 for r in scores if r.n_folds_scored == 0),
+                train_pool_size=len(splits[candidates[-1].window][0]) if candidates else 0,
+                min_cv_train_rows=effective_min,
+            )
+
+        best: SearchCandidate = candidates[best_idx]
+        x_train, y_train, x_hold, y_hold, train_szns, hold_szns = splits[best.window]
+        model, scaler = _create_model(model_type, spec.task)
+        _apply_params(model, best.params)
+        x_tr_arr = scaler.fit_transform(x_train) if scaler is not None else x_train.values
+        model.fit(x_tr_arr, y_train)
+
+        return _SearchResult(
+            model=model,
+            scaler=scaler,
+            params={**best.params, "epa_window": best.window},
+            score=best_score,
+            x_train=x_train,
+            y_train=y_train,
+            x_hold=x_hold,
+            y_hold=y_hold,
+            train_seasons=train_szns,
+            hold_seasons=hold_szns,
+        )
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -848,40 +1020,30 @@ class GamesTrainer(ABC):
             from other failure modes.
 
         """
-        from gridiron_edge.evaluation.metrics import brier_score
         from gridiron_edge.models.game_prediction._features import MIN_CV_TRAIN_ROWS
+        from gridiron_edge.models.game_prediction._hp_search import score_fold
 
         spec: GameModelSpec = self.spec
         effective_min: int = (
             min_cv_train_rows if min_cv_train_rows is not None else MIN_CV_TRAIN_ROWS
         )
         fold_scores: list[float] = []
+        x_arr: np.ndarray = x_train.values
+        y_arr: np.ndarray = y_train.to_numpy()
 
         for train_idx, val_idx in tscv.split(x_train):
             if spec.task == "classification" and len(train_idx) < effective_min:
                 continue
-            x_tr = x_train.iloc[train_idx]
-            y_tr = y_train.iloc[train_idx]
-            x_val = x_train.iloc[val_idx]
-            y_val = y_train.iloc[val_idx]
-
-            model, scaler = _create_model(model_type, spec.task)
-            _apply_params(model, params)
-            if scaler is not None:
-                x_tr_arr = scaler.fit_transform(x_tr)
-                x_val_arr = scaler.transform(x_val)
-            else:
-                x_tr_arr = x_tr.values
-                x_val_arr = x_val.values
-
-            model.fit(x_tr_arr, y_tr)
-
-            if spec.task == "classification":
-                probs = pd.Series(model.predict_proba(x_val_arr)[:, 1])
-                fold_scores.append(brier_score(probs, y_val.astype(float).reset_index(drop=True)))
-            else:
-                preds = model.predict(x_val_arr)
-                fold_scores.append(float(np.mean(np.abs(preds - np.asarray(y_val)))))
+            fold_scores.append(
+                score_fold(
+                    x_arr,
+                    y_arr,
+                    (train_idx, val_idx),
+                    params=params,
+                    model_type=model_type,
+                    task=spec.task,
+                )
+            )
 
         if not fold_scores:
             return float("inf"), 0
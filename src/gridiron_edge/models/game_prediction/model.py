@@ -29,12 +29,9 @@ import numpy as np
 import pandas as pd
 
 from gridiron_edge.core.settings import get_settings
-from gridiron_edge.datasets.accessor import DatasetAccessor
 from gridiron_edge.datasets.loaders import load_modeling_file
-from gridiron_edge.features.pipeline import (
-    CANONICAL_FEATURES,
-)
 from gridiron_edge.features.registry import run_features
+from gridiron_edge.features.upcoming import UpcomingFeatureContext
 from gridiron_edge.models.artifact import ArtifactStore
 from gridiron_edge.models.base import ModelSpec
 from gridiron_edge.models.game_prediction._columns import _SCHEMA_VERSION, FeatureSet
@@ -328,21 +325,30 @@ class GamesModel:
         schedule: pd.DataFrame,
         *,
         repo: Path | None = None,
+        feature_context: UpcomingFeatureContext | None = None,
     ) -> pd.DataFrame:
         """Generate predictions for upcoming (unplayed) games.
 
         Args:
             schedule: Canonical upcoming schedule DataFrame.
             repo: Repository root path.
+            feature_context: Run-scoped canonical feature cache. Weekly runs
+                share one across every model pair so features are built
+                once; ``None`` builds them for this call only.
 
         Returns:
             Enriched prediction DataFrame. Empty if the model artifact
             has not been trained or no rows have complete features.
         """
         resolved_repo: Path = repo or get_settings().repo_root
+        context = feature_context or UpcomingFeatureContext(resolved_repo, build=run_features)
         if self._task() == "classification":
-            return self._predict_upcoming_classification(schedule, repo=resolved_repo)
-        return self._predict_upcoming_regression(schedule, repo=resolved_repo)
+            return self._predict_upcoming_classification(
+                schedule, repo=resolved_repo, feature_context=context
+            )
+        return self._predict_upcoming_regression(
+            schedule, repo=resolved_repo, feature_context=context
+        )
 
     # ------------------------------------------------------------------
     # Classification (win_prob) prediction
@@ -375,7 +381,7 @@ class GamesModel:
         if x_feat.empty:
             return pd.DataFrame()
 
-        pipeline = store.load(self.model_name, self.model_type)
+        pipeline = store.load_predictor(self.model_name, self.model_type)
         scaler = store.load_scaler(self.model_name, self.model_type)
         x_feat_arr = scaler.transform(x_feat) if scaler is not None else x_feat.values
         probs = pipeline.predict_proba(x_feat_arr)[:, 1]
@@ -394,12 +400,16 @@ class GamesModel:
         )
 
     def _predict_upcoming_classification(
-        self, schedule: pd.DataFrame, *, repo: Path
+        self,
+        schedule: pd.DataFrame,
+        *,
+        repo: Path,
+        feature_context: UpcomingFeatureContext,
     ) -> pd.DataFrame:
         """Upcoming prediction lifecycle for classification (win_prob).
 
-        Builds features on the schedule, runs ``predict_proba``,
-        attaches totals when available, and enriches.
+        Takes canonical features from *feature_context*, runs
+        ``predict_proba``, attaches totals when available, and enriches.
         """
         store = ArtifactStore(repo)
 
@@ -411,13 +421,7 @@ class GamesModel:
             )
             return pd.DataFrame()
 
-        datasets = DatasetAccessor(repo=repo)
-
-        upcoming_df: DataFrame = run_features(
-            df=schedule,
-            feature_names=CANONICAL_FEATURES,
-            datasets=datasets,
-        )
+        upcoming_df: DataFrame = feature_context.features(schedule)
         feature_fn = self._feature_fn()
         features = feature_fn(upcoming_df)
         valid = features.notna().all(axis=1)
@@ -427,7 +431,7 @@ class GamesModel:
         if x_feat.empty:
             return pd.DataFrame()
 
-        pipeline = store.load(self.model_name, self.model_type)
+        pipeline = store.load_predictor(self.model_name, self.model_type)
         scaler = store.load_scaler(self.model_name, self.model_type)
         x_feat_arr = scaler.transform(x_feat) if scaler is not None else x_feat.values
         probs = pipeline.predict_proba(x_feat_arr)[:, 1]
@@ -495,7 +499,7 @@ class GamesModel:
         if x_feat.empty:
             return pd.DataFrame()
 
-        model = store.load(self.model_name, self.model_type)
+        model = store.load_predictor(self.model_name, self.model_type)
         scaler = store.load_scaler(self.model_name, self.model_type)
         x_feat_arr = scaler.transform(x_feat) if scaler is not None else x_feat.values
         preds: np.ndarray = model.predict(x_feat_arr)
@@ -505,7 +509,13 @@ class GamesModel:
             preds,
         )
 
-    def _predict_upcoming_regression(self, schedule: pd.DataFrame, *, repo: Path) -> pd.DataFrame:
+    def _predict_upcoming_regression(
+        self,
+        schedule: pd.DataFrame,
+        *,
+        repo: Path,
+        feature_context: UpcomingFeatureContext,
+    ) -> pd.DataFrame:
         """Upcoming prediction lifecycle for regression (total)."""
         store = ArtifactStore(repo)
 
@@ -517,14 +527,8 @@ class GamesModel:
             )
             return pd.DataFrame()
 
-        model = store.load(self.model_name, self.model_type)
-        datasets = DatasetAccessor(repo=repo)
-
-        upcoming_df: DataFrame = run_features(
-            df=schedule,
-            feature_names=CANONICAL_FEATURES,
-            datasets=datasets,
-        )
+        model = store.load_predictor(self.model_name, self.model_type)
+        upcoming_df: DataFrame = feature_context.features(schedule)
         feature_fn = self._feature_fn()
         features = feature_fn(upcoming_df)
         valid = features.notna().all(axis=1)
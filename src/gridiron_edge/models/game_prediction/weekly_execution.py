@@ -13,10 +13,12 @@ from pandas import DataFrame
 
 from gridiron_edge.evaluation.forecast_contracts import ForecastRole
 from gridiron_edge.evaluation.forecast_events import build_forecast_events
+from gridiron_edge.features.upcoming import UpcomingFeatureContext
 from gridiron_edge.models.base import GameModel
 from gridiron_edge.models.game_prediction.availability import (
     inspect_prediction_availability,
 )
+from gridiron_edge.models.game_prediction.model import GamesModel
 from gridiron_edge.models.game_prediction.prediction_policy import (
     PredictionModelDecision,
     PredictionModelStatus,
@@ -76,8 +78,13 @@ def _execute_decision(
     canonical_schedule: DataFrame,
     *,
     repo: Path,
+    feature_context: UpcomingFeatureContext,
 ) -> DataFrame | None:
-    """Execute one selected family through its exact registered model."""
+    """Execute one selected family through its exact registered model.
+
+    Feature-based models take their inputs from the run's shared
+    *feature_context*; Elo reads ratings only.
+    """
     if decision.status is PredictionModelStatus.UNAVAILABLE:
         return None
     if decision.model_type is None:
@@ -85,6 +92,10 @@ def _execute_decision(
 
     registry_key = f"{decision.model_name}_{decision.model_type}"
     model = cast(GameModel, ModelRegistry.get(registry_key)())
+    if isinstance(model, GamesModel):
+        return model.predict_upcoming(
+            canonical_schedule.copy(), repo=repo, feature_context=feature_context
+        )
     return model.predict_upcoming(canonical_schedule.copy(), repo=repo)
 
 
@@ -223,11 +234,15 @@ def execute_weekly_prediction_policy(
     import gridiron_edge.models.game_prediction.model  # noqa: F401
 
     scoped = _scope_schedule(schedule, season=season, week=week)
+    # One canonical feature build serves the availability check and every
+    # selected model pair.
+    feature_context = UpcomingFeatureContext(repo)
     availability = inspect_prediction_availability(
         schedule,
         season=season,
         week=week,
         repo=repo,
+        feature_context=feature_context,
     )
     policy = load_prediction_policy(
         availability,
@@ -243,8 +258,12 @@ def execute_weekly_prediction_policy(
 
     canonical_schedule = _build_elo_schedule(scoped.copy())
     expected_ids = scoped["game_id"].astype(str).tolist()
-    win_predictions = _execute_decision(policy.win, canonical_schedule, repo=repo)
-    total_predictions = _execute_decision(policy.total, canonical_schedule, repo=repo)
+    win_predictions = _execute_decision(
+        policy.win, canonical_schedule, repo=repo, feature_context=feature_context
+    )
+    total_predictions = _execute_decision(
+        policy.total, canonical_schedule, repo=repo, feature_context=feature_context
+    )
 
     if win_predictions is not None:
         _validate_coverage(win_predictions, expected_ids, family="Win")
@@ -1,4 +1,5 @@
 # src/gridiron_edge/ratings/elo/__init__.py
+from .core import elo_win_probabilities as elo_win_probabilities
 from .core import elo_win_probability as elo_win_probability
 from .core import update_elo as update_elo
 from .fit import fit_elo as fit_elo
@@ -6,6 +6,8 @@
 # If the Elo formula changes (e.g. a different divisor), update BOTH here
 # AND the numba versions in sim/season.py.
 
+import numpy as np
+
 #: Default Elo divisor. The classic Elo system uses 400; we use 480 to
 #: reduce the sensitivity of win-probability to large rating gaps, which
 #: better reflects parity in the NFL. The flat-K and zone-K tuning use
@@ -34,6 +36,29 @@ def elo_win_probability(
     return p_a, p_b
 
 
+def elo_win_probabilities(
+    ratings_a: np.ndarray,
+    ratings_b: np.ndarray,
+    divisor: float = DEFAULT_ELO_DIVISOR,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`elo_win_probability` over broadcastable arrays.
+
+    Args:
+        ratings_a: Elo ratings for team A (away team by convention).
+        ratings_b: Elo ratings for team B (home team by convention).
+        divisor: Win-probability divisor. Defaults to ``DEFAULT_ELO_DIVISOR``.
+
+    Returns:
+        ``(p_a, p_b)`` float64 arrays of the broadcast shape. NaN ratings
+        give NaN probabilities.
+    """
+    a = np.asarray(ratings_a, dtype=float)
+    b = np.asarray(ratings_b, dtype=float)
+    p_a = 1.0 / (1.0 + 10 ** ((b - a) / divisor))
+    p_b = 1.0 / (1.0 + 10 ** ((a - b) / divisor))
+    return p_a, p_b
+
+
 def update_elo(
     winning_team_elo: float,
     losing_team_elo: float,
@@ -7,6 +7,7 @@ import pandas as pd
 from gridiron_edge.core.paths import repo_root
 from gridiron_edge.datasets import loaders, writers
 from gridiron_edge.datasets.registry import dataset_path
+from gridiron_edge.ratings.elo.matrix import build_elo_matrix, write_elo_matrix
 from gridiron_edge.ratings.elo.table import (
     build_elo_state_table_all_years,
     update_elo_state_incremental,
@@ -42,3 +43,4 @@ def fit_elo(
         )
 
     writers.write_csv(resolved_repo, "elo_state", elo_df)
+    write_elo_matrix(resolved_repo, build_elo_matrix(elo_df))
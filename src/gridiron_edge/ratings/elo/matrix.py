@@ -0,0 +1,142 @@
+# src/gridiron_edge/ratings/elo/matrix.py
+
+"""Pairwise Elo win-probability matrix at the current rating state.
+
+Ad-hoc matchup questions ("what are team A's chances against team B right
+now?") only depend on the latest rating of each team. :func:`build_elo_matrix`
+evaluates every ordered pair once with the vectorized
+:func:`~gridiron_edge.ratings.elo.core.elo_win_probabilities`, and
+:func:`write_elo_matrix` stores the 32x32 table next to the Elo state as an
+uncompressed ``.npz`` so readers answer by index lookup.
+
+``probabilities[i, j]`` is the probability that ``teams[i]`` beats
+``teams[j]`` with ``i`` in the away (team A) slot - the same orientation as
+:func:`~gridiron_edge.ratings.elo.core.elo_win_probability`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from pandas import DataFrame
+
+from gridiron_edge.datasets.registry import dataset_path
+from gridiron_edge.ratings.elo.core import DEFAULT_ELO_DIVISOR, elo_win_probabilities
+
+
+@dataclass(frozen=True)
+class EloMatrix:
+    """Win probabilities for every ordered pair of teams.
+
+    Attributes:
+        season: Season of the rating state, e.g. ``"2026-2027"``.
+        week: Latest week of the rating state within *season*.
+        divisor: Elo divisor used for the probabilities.
+        teams: Long team names, sorted; row/column order.
+        ratings: Rating per team, aligned with *teams*.
+        probabilities: ``(n, n)`` matrix; ``[i, j]`` is P(``teams[i]`` beats
+            ``teams[j]``).
+    """
+
+    season: str
+    week: int
+    divisor: float
+    teams: np.ndarray
+    ratings: np.ndarray
+    probabilities: np.ndarray
+
+    def index(self, team: str) -> int:
+        """Return the row of *team*.
+
+        Raises:
+            KeyError: If *team* has no rating in this state.
+        """
+        position = int(np.searchsorted(self.teams, team))
+        if position >= len(self.teams) or self.teams[position] != team:
+            raise KeyError(team)
+        return position
+
+    def probability(self, team_a: str, team_b: str) -> float:
+        """Return P(*team_a* beats *team_b*) by lookup."""
+        return float(self.probabilities[self.index(team_a), self.index(team_b)])
+
+
+def build_elo_matrix(
+    elo_state: DataFrame,
+    *,
+    season: str | None = None,
+    divisor: float = DEFAULT_ELO_DIVISOR,
+) -> EloMatrix:
+    """Build the matrix from each team's latest rating in *season*.
+
+    Args:
+        elo_state: Elo state keyed by ``NFL_TEAM``, ``NFL_YEAR``,
+            ``NFL_WEEK`` with an ``ELO`` column.
+        season: Season to use. Defaults to the latest in *elo_state*.
+        divisor: Elo divisor.
+
+    Returns:
+        The pairwise matrix.
+
+    Raises:
+        ValueError: If *elo_state* has no rows for the season.
+    """
+    years = elo_state["NFL_YEAR"].astype(str)
+    resolved_season = season if season is not None else str(years.max())
+    rows = elo_state.loc[years == resolved_season, ["NFL_TEAM", "NFL_WEEK", "ELO"]]
+    rows = rows.dropna(subset=["ELO"])
+    if rows.empty:
+        raise ValueError(f"Elo state has no ratings for season {resolved_season!r}.")
+
+    latest = (
+        rows.assign(NFL_WEEK=rows["NFL_WEEK"].astype(int))
+        .sort_values(["NFL_TEAM", "NFL_WEEK"], kind="stable")
+        .drop_duplicates("NFL_TEAM", keep="last")
+    )
+    teams = latest["NFL_TEAM"].astype(str).to_numpy()
+    ratings = latest["ELO"].to_numpy(dtype=float)
+    probabilities, _ = elo_win_probabilities(ratings[:, None], ratings[None, :], divisor)
+    return EloMatrix(
+        season=resolved_season,
+        week=int(latest["NFL_WEEK"].max()),
+        divisor=float(divisor),
+        teams=teams,
+        ratings=ratings,
+        probabilities=probabilities,
+    )
+
+
+def write_elo_matrix(repo: Path, matrix: EloMatrix) -> Path:
+    """Atomically write *matrix* to the registered ``elo_matrix`` path."""
+    path = dataset_path(repo, "elo_matrix")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.tmp.npz")
+    np.savez(
+        temporary,
+        season=np.array(matrix.season),
+        week=np.array(matrix.week),
+        divisor=np.array(matrix.divisor),
+        teams=matrix.teams.astype(str),
+        ratings=matrix.ratings,
+        probabilities=matrix.probabilities,
+    )
+    temporary.replace(path)
+    return path
+
+
+def load_elo_matrix(repo: Path) -> EloMatrix | None:
+    """Load the matrix written by :func:`write_elo_matrix`, if present."""
+    path = dataset_path(repo, "elo_matrix")
+    if not path.exists():
+        return None
+    with np.load(path, allow_pickle=False) as data:
+        return EloMatrix(
+            season=str(data["season"]),
+            week=int(data["week"]),
+            divisor=float(data["divisor"]),
+            teams=data["teams"],
+            ratings=data["ratings"],
+            probabilities=data["probabilities"],
+        )
@@ -8,6 +8,7 @@ from enum import StrEnum
 from pathlib import Path
 from typing import Final
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -16,7 +17,7 @@ from gridiron_edge.datasets.loaders import (
     load_elo_state,
     load_schedule_upcoming_rich,
 )
-from gridiron_edge.ratings.elo.core import elo_win_probability
+from gridiron_edge.ratings.elo.core import elo_win_probabilities
 
 
 class EloPredictionStatus(StrEnum):
@@ -126,10 +127,13 @@ def _validate_elo_identity(
         )
     )
 
-    identities = [
-        (f"{row['NFL_TEAM']}/{row['NFL_YEAR']}/{row['NFL_WEEK']}")
-        for _, row in duplicate_rows.iterrows()
-    ]
+    identities = (
+        duplicate_rows["NFL_TEAM"].astype(str)
+        + "/"
+        + duplicate_rows["NFL_YEAR"].astype(str)
+        + "/"
+        + duplicate_rows["NFL_WEEK"].astype(str)
+    )
 
     raise ValueError("Elo state contains duplicate identities: " + ", ".join(identities))
 
@@ -273,33 +277,17 @@ def predict_schedule_with_elo(
         EloPredictionStatus.MISSING_HOME_ELO.value,
     )
 
-    probabilities = [
-        elo_win_probability(
-            float(away_elo),
-            float(home_elo),
-        )
-        if is_ready
-        else (
-            pd.NA,
-            pd.NA,
-        )
-        for away_elo, home_elo, is_ready in zip(
-            predicted["AWAY_TEAM_ELO"],
-            predicted["HOME_TEAM_ELO"],
-            ready,
-            strict=True,
-        )
-    ]
+    away_probability, home_probability = elo_win_probabilities(
+        predicted["AWAY_TEAM_ELO"].to_numpy(dtype=float, na_value=np.nan),
+        predicted["HOME_TEAM_ELO"].to_numpy(dtype=float, na_value=np.nan),
+    )
+    not_ready = ~ready.to_numpy()
 
-    predicted["AWAY_WIN_PROB"] = pd.Series(
-        [away_probability for away_probability, _ in probabilities],
-        index=predicted.index,
-        dtype="Float64",
+    predicted["AWAY_WIN_PROB"] = (
+        pd.Series(away_probability, index=predicted.index).mask(not_ready).astype("Float64")
     )
-    predicted["HOME_WIN_PROB"] = pd.Series(
-        [home_probability for _, home_probability in probabilities],
-        index=predicted.index,
-        dtype="Float64",
+    predicted["HOME_WIN_PROB"] = (
+        pd.Series(home_probability, index=predicted.index).mask(not_ready).astype("Float64")
     )
     predicted["PREDICTION_STATUS"] = statuses
 
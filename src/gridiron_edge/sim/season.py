@@ -29,6 +29,7 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from gridiron_edge.datasets.columnar import read_table
 from gridiron_edge.sim import playoffs as _playoffs_mod
 from gridiron_edge.sim._engine import (
     apply_actuals_to_matrices,
@@ -95,7 +96,7 @@ def _parse_game_id(game_id: str) -> tuple[str, str]:
 
 def load_long_to_short_mapping(mapping_csv: Path) -> dict[str, str]:
     """Load team name mapping from long names to short codes."""
-    df = pd.read_csv(mapping_csv)
+    df = read_table(mapping_csv)
     required = {"NFL_LONG_NAME", "NFL_SHORT_NAME"}
     if not required.issubset(df.columns):
         raise ValueError(f"Mapping file missing columns: {required - set(df.columns)}")
@@ -420,7 +421,7 @@ def build_conf_div_arrays_from_csv(
     Returns:
         (conf_id, div_id) arrays of shape (32,).
     """
-    df = pd.read_csv(conf_div_path)
+    df = read_table(conf_div_path)
     required: set[str] = {"NFL_LONG_NAME", "conf", "div"}
     if not required.issubset(df.columns):
         raise ValueError(f"team metadata file missing columns: {required - set(df.columns)}")
@@ -656,8 +657,8 @@ def run_full_simulation(
 
     with _log_phase("Load simulation inputs"):
         df_schedule: DataFrame = pd.read_parquet(paths.schedule_file)
-        df_wk_by_wk = pd.read_csv(paths.wk_by_wk_file)
-        df_elo = pd.read_csv(paths.elo_file)
+        df_wk_by_wk = read_table(paths.wk_by_wk_file)
+        df_elo = read_table(paths.elo_file)
 
         if df_schedule.empty:
             raise FileNotFoundError(
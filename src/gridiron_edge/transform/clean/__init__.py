@@ -1,3 +1,5 @@
 # src/gridiron_edge/transform/clean/__init__.py
+from .games_nflverse import GamesCleanResult as GamesCleanResult
 from .games_nflverse import clean_nflverse_games as clean_nflverse_games
+from .games_nflverse import clean_nflverse_games_incremental as clean_nflverse_games_incremental
 from .schedule_nflverse import clean_nflverse_upcoming as clean_nflverse_upcoming
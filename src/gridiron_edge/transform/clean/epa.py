@@ -44,6 +44,11 @@ Output schema (``epa_by_game.parquet``)::
 Note on EPA reliability: nflfastR EPA model is reliable from 2006 onward.
 Seasons before 2006 will have NaN EPA values and are handled gracefully.
 
+Incremental rebuilds: ``epa_by_game.sources.json`` records the PBP content
+hash (from ``data/raw/pbp/manifest.json``) each season was aggregated
+from. ``aggregate_epa(only_changed=True)`` re-aggregates only the seasons
+whose hash has moved since, and does nothing when none has.
+
 Temporal integrity: this module aggregates completed plays only. It does
 not produce future-looking values - rolling window computation happens
 in the feature layer (``features/team/epa.py``).
@@ -61,7 +66,12 @@ from pandas import DataFrame, Series
 from pandas.api.typing import DataFrameGroupBy
 
 from gridiron_edge.core.settings import get_settings
-from gridiron_edge.ingest.nflverse.pbp import load_pbp
+from gridiron_edge.ingest.nflverse.manifest import (
+    changed_seasons,
+    load_source_hashes,
+    write_source_hashes,
+)
+from gridiron_edge.ingest.nflverse.pbp import load_pbp, load_pbp_manifest
 from gridiron_edge.transform.clean._nflverse_common import map_short_to_long
 
 logger: Logger = logging.getLogger(__name__)
@@ -227,10 +237,31 @@ def _agg_side(df: pd.DataFrame, *, is_offense: bool) -> pd.DataFrame:
     return result
 
 
+def _record_sources(
+    out_path: Path,
+    seasons: list[int] | None,
+    *,
+    merged: bool,
+    repo: Path,
+) -> None:
+    """Record the PBP content hashes the EPA table was aggregated from.
+
+    A rebuild replaces the record; a merge into the existing table updates
+    only the re-aggregated seasons.
+    """
+    manifest = load_pbp_manifest(repo=repo)
+    hashes: dict[int, str] = (load_source_hashes(out_path) or {}) if merged else {}
+    for season in manifest if seasons is None else seasons:
+        if season in manifest:
+            hashes[season] = manifest[season].content_sha256
+    write_source_hashes(out_path, hashes)
+
+
 def aggregate_epa(
     seasons: list[int] | None = None,
     *,
     repo: Path | None = None,
+    only_changed: bool = False,
 ) -> Path:
     """Aggregate PBP data to game-level EPA stats and write to Parquet.
 
@@ -242,11 +273,24 @@ def aggregate_epa(
             cached PBP seasons. Incremental updates pass only the current
             season.
         repo: Repository root.
+        only_changed: When ``seasons`` is ``None``, aggregate only seasons
+            whose PBP content hash changed since the last run. Falls back
+            to a full rebuild when the table or its source record is
+            missing.
 
     Returns:
         Absolute path to the written ``epa_by_game.parquet`` file.
     """
     resolved_repo: Path = repo or get_settings().repo_root
+    out_path: Path = resolved_repo / "data" / "cleaned" / "epa_by_game.parquet"
+
+    consumed: dict[int, str] | None = load_source_hashes(out_path) if only_changed else None
+    if seasons is None and consumed is not None and out_path.exists():
+        seasons = changed_seasons(load_pbp_manifest(repo=resolved_repo), consumed)
+        if not seasons:
+            logger.info("EPA by game is up to date - no PBP season changed.")
+            return out_path
+        logger.info("Re-aggregating EPA for changed PBP seasons: %s", seasons)
 
     columns_needed: list[str] = [
         "game_id",
@@ -276,7 +320,6 @@ def aggregate_epa(
 
     if pbp.empty:
         logger.warning("No PBP data found - run 'gridiron ingest pbp' first.")
-        out_path: Path = resolved_repo / "data" / "cleaned" / "epa_by_game.parquet"
         return out_path
 
     # Filter to scrimmage plays with valid EPA
@@ -312,16 +355,17 @@ def aggregate_epa(
     result = result.sort_values(["season", "week", "team"]).reset_index(drop=True)
 
     # Write to cleaned/ - incremental updates merge with existing
-    out_path = resolved_repo / "data" / "cleaned" / "epa_by_game.parquet"
-
-    if seasons is not None and out_path.exists():
+    merged: bool = seasons is not None and out_path.exists()
+    if merged:
         # Incremental: remove old rows for these seasons, append new
         existing: DataFrame = pd.read_parquet(out_path)
         existing = existing.loc[~existing["season"].isin(seasons), :].copy()
         result = pd.concat([existing, result], ignore_index=True)
         result = result.sort_values(["season", "week", "team"]).reset_index(drop=True)
 
+    out_path.parent.mkdir(parents=True, exist_ok=True)
     result.to_parquet(out_path, index=False)
+    _record_sources(out_path, seasons, merged=merged, repo=resolved_repo)
 
     size_kb: float = out_path.stat().st_size / 1024
     logger.info(
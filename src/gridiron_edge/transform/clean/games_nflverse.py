@@ -55,10 +55,20 @@ Notes:
     - nflverse uses short team codes. This module maps them to long names
       using the team_metadata reference dataset (long/short name columns)
     - IS_NEUTRAL_SITE is 1 only when nflverse location is "Neutral".
+
+Incremental cleaning:
+    ``NFL_wk_by_wk_cleaned.sources.json`` records a content hash of each
+    season's raw partition as of the last clean.
+    :func:`clean_nflverse_games_incremental` re-cleans only seasons whose
+    partition hash changed (or that appeared or disappeared), splices them
+    into the existing CSV, validates the full result, and reports the
+    changed seasons so downstream stages can limit their own work. Without
+    a source record it cleans every season.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 import logging
 from logging import Logger
 from pathlib import Path
@@ -68,7 +78,14 @@ import pandas as pd
 from pandas import DataFrame, Series
 
 from gridiron_edge.core.settings import get_settings
+from gridiron_edge.datasets.columnar import refresh_columnar_twin
 from gridiron_edge.datasets.registry import dataset_path
+from gridiron_edge.evaluation.joined import refresh_evaluation_joined
+from gridiron_edge.ingest.nflverse.manifest import (
+    content_sha256,
+    load_source_hashes,
+    write_source_hashes,
+)
 from gridiron_edge.transform.clean._nflverse_common import (
     GAME_TYPE_TO_WEEK,
     gametime_to_hhmmss,
@@ -99,6 +116,26 @@ _GAMES_COLUMNS: list[str] = [
     "DIV_GAME",
 ]
 
+_SORT_COLUMNS: list[str] = ["GAME_DATE", "GAMETIME", "GAME_ID"]
+
+
+@dataclass(frozen=True)
+class GamesCleanResult:
+    """Outcome of one :func:`clean_nflverse_games_incremental` call.
+
+    Attributes:
+        path: Canonical games CSV.
+        changed_seasons: Season years whose raw partition was added,
+            edited, or removed since the last clean, and were re-cleaned.
+            Empty when the canonical dataset was already current.
+        full_rebuild: True when every season was cleaned because the
+            canonical dataset or its source record was missing.
+    """
+
+    path: Path
+    changed_seasons: frozenset[int]
+    full_rebuild: bool = False
+
 
 def _handle_empty_games(out_path: Path) -> Path:
     """Handle the no-completed-games case without clobbering history.
@@ -228,30 +265,9 @@ def _validate_home_away_games(  # noqa: PLR0912
         raise ValueError("IS_NEUTRAL_SITE must contain only 0 or 1.")
 
 
-def clean_nflverse_games(
-    *,
-    repo: Path | None = None,
-) -> Path:
-    """Transform nflverse raw games CSV into the canonical cleaned games CSV.
-
-    Reads the registered nflverse historical schedule, filters to completed
-    regular-season and postseason games, preserves canonical Away/Home
-    identity and scores, and writes the cleaned games dataset.
-
-    Unplayed games (``result = NaN``) are excluded - they belong in the
-    upcoming schedule, not the historical games dataset.
-
-    Args:
-        repo: Absolute path to the repository root. Defaults to the value
-            from ``get_settings()``.
-
-    Returns:
-        Absolute path to the written canonical games CSV.
-    """
-    settings = get_settings()
-    resolved_repo: Path = repo or settings.repo_root
-
-    raw_path: Path = dataset_path(resolved_repo, "games_raw_nflverse")
+def _read_raw_games(repo: Path) -> DataFrame:
+    """Read the registered raw nflverse schedule."""
+    raw_path: Path = dataset_path(repo, "games_raw_nflverse")
     if not raw_path.exists():
         msg: str = (
             f"Raw nflverse games file not found: {raw_path}. "
@@ -260,8 +276,29 @@ def clean_nflverse_games(
         raise FileNotFoundError(msg)
 
     logger.info("Reading raw nflverse games from %s", raw_path)
-    df: DataFrame = pd.read_parquet(raw_path)
+    return pd.read_parquet(raw_path)
+
 
+def _raw_partition_hashes(raw: DataFrame) -> dict[int, str]:
+    """Return a content hash of each season's raw partition.
+
+    Rows are ordered by ``game_id`` before hashing, so a raw rewrite that
+    only reorders games does not count as a change.
+    """
+    return {
+        int(season): content_sha256(
+            partition.sort_values("game_id", kind="stable").reset_index(drop=True)
+        )
+        for season, partition in raw.groupby(raw["season"].astype(int), sort=True)
+    }
+
+
+def _build_canonical_games(df: DataFrame) -> DataFrame:
+    """Map raw nflverse schedule rows to canonical games rows.
+
+    Keeps completed regular-season and postseason games only. The result is
+    neither sorted nor validated.
+    """
     # --- Filter to completed games only ---
     df = df.loc[df["result"].notna(), :].copy()
 
@@ -271,7 +308,7 @@ def clean_nflverse_games(
     logger.info("Processing %d completed games", len(df))
 
     if df.empty:
-        return _handle_empty_games(dataset_path(resolved_repo, "games"))
+        return pd.DataFrame(columns=_GAMES_COLUMNS)
 
     # --- Normalise week numbers ---
     # REG games have integer weeks; postseason game_types map to 19-22.
@@ -334,7 +371,7 @@ def clean_nflverse_games(
     df["VEGAS_LINE"] = df["VEGAS_LINE"].abs() * np.where(away_favored, -1, 1)
 
     # --- Assemble canonical schema ---
-    out = pd.DataFrame(
+    return pd.DataFrame(
         {
             "GAME_ID": df["GAME_ID"],
             "WEEK_NUM": df["WEEK_NUM"].astype(int),
@@ -358,18 +395,123 @@ def clean_nflverse_games(
         }
     )
 
+
+def _write_games(
+    games: DataFrame,
+    *,
+    repo: Path,
+    source_hashes: dict[int, str],
+) -> Path:
+    """Sort, validate, and write the full canonical games table.
+
+    Refreshes the columnar twin and the evaluation store, then records the
+    raw partition hashes the table was cleaned from.
+    """
     # Sort deterministically by scheduled date, time, and game ID.
-    out: DataFrame = out.sort_values(
-        ["GAME_DATE", "GAMETIME", "GAME_ID"],
-        ascending=True,
-        ignore_index=True,
-    )
+    out: DataFrame = games.sort_values(_SORT_COLUMNS, ascending=True, ignore_index=True)
 
     _validate_home_away_games(out)
 
-    out_path = dataset_path(resolved_repo, "games")
+    out_path = dataset_path(repo, "games")
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out.to_csv(out_path, index=False)
+    refresh_columnar_twin(repo, "games")
+    refresh_evaluation_joined(repo)
+    write_source_hashes(out_path, source_hashes)
 
     logger.info("Wrote %d canonical game rows to %s", len(out), out_path)
     return out_path
+
+
+def _clean_all(raw: DataFrame, *, repo: Path) -> Path:
+    """Clean every season of *raw* into the canonical games CSV."""
+    out: DataFrame = _build_canonical_games(raw)
+    if out.empty:
+        return _handle_empty_games(dataset_path(repo, "games"))
+    return _write_games(out, repo=repo, source_hashes=_raw_partition_hashes(raw))
+
+
+def clean_nflverse_games(
+    *,
+    repo: Path | None = None,
+) -> Path:
+    """Transform nflverse raw games CSV into the canonical cleaned games CSV.
+
+    Reads the registered nflverse historical schedule, filters to completed
+    regular-season and postseason games, preserves canonical Away/Home
+    identity and scores, and writes the cleaned games dataset.
+
+    Unplayed games (``result = NaN``) are excluded - they belong in the
+    upcoming schedule, not the historical games dataset.
+
+    Args:
+        repo: Absolute path to the repository root. Defaults to the value
+            from ``get_settings()``.
+
+    Returns:
+        Absolute path to the written canonical games CSV.
+    """
+    settings = get_settings()
+    resolved_repo: Path = repo or settings.repo_root
+    return _clean_all(_read_raw_games(resolved_repo), repo=resolved_repo)
+
+
+def clean_nflverse_games_incremental(
+    *,
+    repo: Path | None = None,
+) -> GamesCleanResult:
+    """Re-clean only the seasons whose raw partition changed.
+
+    Compares per-season raw partition hashes with those recorded at the
+    last clean, cleans the changed seasons, and splices them into the
+    existing canonical CSV in place of their old rows. The spliced table
+    is sorted and validated in full before it is written. Falls back to
+    :func:`clean_nflverse_games` when the CSV, its source record, or its
+    expected columns are missing.
+
+    Args:
+        repo: Absolute path to the repository root. Defaults to the value
+            from ``get_settings()``.
+
+    Returns:
+        The canonical CSV path and the seasons that were re-cleaned.
+    """
+    settings = get_settings()
+    resolved_repo: Path = repo or settings.repo_root
+
+    raw: DataFrame = _read_raw_games(resolved_repo)
+    hashes: dict[int, str] = _raw_partition_hashes(raw)
+    out_path: Path = dataset_path(resolved_repo, "games")
+
+    consumed: dict[int, str] | None = load_source_hashes(out_path) if out_path.exists() else None
+    # Every value is read as text so retained rows are written back verbatim.
+    existing: DataFrame | None = (
+        None if consumed is None else pd.read_csv(out_path, dtype=str, keep_default_na=False)
+    )
+    if consumed is None or existing is None or list(existing.columns) != _GAMES_COLUMNS:
+        logger.info("No usable source record for %s - cleaning every season.", out_path)
+        path: Path = _clean_all(raw, repo=resolved_repo)
+        return GamesCleanResult(path=path, changed_seasons=frozenset(hashes), full_rebuild=True)
+
+    changed = frozenset(
+        season
+        for season in hashes.keys() | consumed.keys()
+        if hashes.get(season) != consumed.get(season)
+    )
+    if not changed:
+        logger.info("Canonical games are up to date - no raw season changed.")
+        return GamesCleanResult(path=out_path, changed_seasons=changed)
+
+    logger.info("Re-cleaning changed nflverse seasons: %s", sorted(changed))
+    fresh: DataFrame = _build_canonical_games(raw.loc[raw["season"].astype(int).isin(changed), :])
+    retained: DataFrame = existing.loc[
+        ~existing["YEAR"].isin([season_label(season) for season in changed]),
+        :,
+    ]
+    parts: list[DataFrame] = [part for part in (retained, fresh) if not part.empty]
+    if not parts:
+        return GamesCleanResult(path=_handle_empty_games(out_path), changed_seasons=changed)
+    games: DataFrame = pd.concat(parts, ignore_index=True)
+
+    path = _write_games(games, repo=resolved_repo, source_hashes=hashes)
+    return GamesCleanResult(path=path, changed_seasons=changed)
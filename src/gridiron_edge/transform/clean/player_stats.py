@@ -6,11 +6,17 @@ Reads cached per-season Parquet files from ``data/raw/player_stats/``,
 normalizes team codes, constructs ``game_id`` via schedule join, tags
 skill positions, and writes a single ``data/cleaned/player_game_logs.parquet``.
 
+``player_game_logs.sources.json`` records the raw content hash (from
+``data/raw/player_stats/manifest.json``) each season was cleaned from, so
+``clean_player_stats(only_changed=True)`` re-cleans only the seasons whose
+hash moved and splices them into the existing output.
+
 Usage::
 
     from gridiron_edge.transform.clean.player_stats import clean_player_stats
 
     path = clean_player_stats()
+    path = clean_player_stats(only_changed=True)  # changed seasons only
 """
 
 from __future__ import annotations
@@ -27,7 +33,15 @@ from pandas import DataFrame
 
 from gridiron_edge.core.constants import TEAM_CODE_NORMALIZATION as _TEAM_CODE_MAP
 from gridiron_edge.core.settings import get_settings
-from gridiron_edge.ingest.nflverse.player_stats import load_player_stats
+from gridiron_edge.ingest.nflverse.manifest import (
+    changed_seasons,
+    load_source_hashes,
+    write_source_hashes,
+)
+from gridiron_edge.ingest.nflverse.player_stats import (
+    load_player_stats,
+    load_player_stats_manifest,
+)
 
 logger: Logger = logging.getLogger(__name__)
 
@@ -43,13 +57,17 @@ def _normalize_team_codes(df: DataFrame) -> DataFrame:
     return df
 
 
-def _build_schedule_lookup() -> DataFrame:
-    """Fetch all nflverse schedules and return a (season, week, home, away, game_id) lookup.
+def _build_schedule_lookup(seasons: list[int] | None = None) -> DataFrame:
+    """Fetch nflverse schedules and return a (season, week, home, away, game_id) lookup.
 
     Normalizes team codes in the schedule to match player stats.
+
+    Args:
+        seasons: Seasons to fetch. Defaults to 1999 through the current year.
     """
-    current_year: int = pd.Timestamp.now().year
-    seasons: list[int] = list(range(1999, current_year + 1))
+    if seasons is None:
+        current_year: int = pd.Timestamp.now().year
+        seasons = list(range(1999, current_year + 1))
 
     try:
         sched: DataFrame = nfl.load_schedules(seasons).to_pandas()
@@ -124,14 +142,48 @@ def _join_game_id(df: DataFrame, schedule: DataFrame) -> DataFrame:
     return df
 
 
+def _write_cleaned(
+    df: DataFrame,
+    out_path: Path,
+    seasons: list[int] | None,
+    *,
+    repo: Path,
+) -> DataFrame:
+    """Write the cleaned logs, splicing re-cleaned *seasons* into the existing file.
+
+    Also records the raw content hash each written season was cleaned from.
+
+    Returns:
+        The full cleaned dataset as written.
+    """
+    manifest = load_player_stats_manifest(repo=repo)
+    hashes: dict[int, str] = {}
+    if seasons is not None:
+        # (player_id, game_id) uniqueness holds per season - game_id embeds
+        # the season - so seasons cleaned separately splice without re-checks.
+        existing: DataFrame = pd.read_parquet(out_path)
+        df = pd.concat([existing.loc[~existing["season"].isin(seasons), :], df], ignore_index=True)
+        df = df.sort_values("season", kind="stable").reset_index(drop=True)
+        hashes = load_source_hashes(out_path) or {}
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(out_path, index=False)
+    for season in manifest if seasons is None else seasons:
+        if season in manifest:
+            hashes[season] = manifest[season].content_sha256
+    write_source_hashes(out_path, hashes)
+    return df
+
+
 def clean_player_stats(
     *,
     repo: Path | None = None,
+    only_changed: bool = False,
 ) -> Path:
     """Clean raw player stats and write to Parquet.
 
     Steps:
-        1. Load all cached raw player stats
+        1. Load all cached raw player stats (or only changed seasons)
         2. Normalize team codes (OAK→LV, SD→LAC, STL→LA, JAC→JAX)
         3. Construct game_id via schedule join
         4. Tag skill positions
@@ -140,14 +192,28 @@ def clean_player_stats(
 
     Args:
         repo: Repository root.
+        only_changed: Re-clean only seasons whose raw content hash changed
+            since the last run and splice them into the existing output.
+            Falls back to a full rebuild when the output or its source
+            record is missing.
 
     Returns:
         Path to the written Parquet file.
     """
     resolved_repo: Path = repo or get_settings().repo_root
+    out_path: Path = resolved_repo / "data" / "cleaned" / "player_game_logs.parquet"
+
+    seasons: list[int] | None = None
+    consumed: dict[int, str] | None = load_source_hashes(out_path) if only_changed else None
+    if consumed is not None and out_path.exists():
+        seasons = changed_seasons(load_player_stats_manifest(repo=resolved_repo), consumed)
+        if not seasons:
+            logger.info("Player game logs are up to date - no raw season changed.")
+            return out_path
+        logger.info("Re-cleaning player stats for changed seasons: %s", seasons)
 
     # 1. Load raw
-    df: DataFrame = load_player_stats(repo=resolved_repo)
+    df: DataFrame = load_player_stats(seasons=seasons, repo=resolved_repo)
     n_raw: int = len(df)
     logger.info("Raw player stats: %d rows", n_raw)
 
@@ -161,7 +227,7 @@ def clean_player_stats(
         logger.warning("Dropped %d row(s) with missing team/opponent_team", n_dropped)
 
     # 3. Construct game_id
-    schedule: DataFrame = _build_schedule_lookup()
+    schedule: DataFrame = _build_schedule_lookup(seasons)
     df = _join_game_id(df, schedule)
     n_null_gid: int = df["game_id"].isna().sum()
     if n_null_gid:
@@ -206,9 +272,7 @@ def clean_player_stats(
     logger.info("Dropped %d rows with zero stats (%d → %d)", n_empty, n_raw, len(df))
 
     # 6. Write
-    out_path: Path = resolved_repo / "data" / "cleaned" / "player_game_logs.parquet"
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(out_path, index=False)
+    df = _write_cleaned(df, out_path, seasons, repo=resolved_repo)
     size_mb: float = out_path.stat().st_size / (1024 * 1024)
     logger.info(
         "Cleaned player stats written to %s (%.1f MB, %d rows, %d players)",
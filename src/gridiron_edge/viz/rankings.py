@@ -8,9 +8,9 @@ versioned CSVs to data/output/rankings/.
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 from pandas import DataFrame
 
+from gridiron_edge.datasets.columnar import read_table
 from gridiron_edge.datasets.registry import dataset_path
 
 
@@ -29,7 +29,7 @@ def write_elo_rankings_csv(*, year: str, week: int, repo: Path | None = None) ->
 
     resolved_repo: Path = repo or _repo_root()
     elo_path: Path = dataset_path(resolved_repo, "elo_state")
-    df_elo: DataFrame = pd.read_csv(elo_path)
+    df_elo: DataFrame = read_table(elo_path)
     df_elo = df_elo.loc[
         (df_elo["NFL_YEAR"] == year) & (df_elo["NFL_WEEK"].isin([week, week + 1])), :
     ].copy()
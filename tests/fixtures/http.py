@@ -0,0 +1,163 @@
+# tests/fixtures/http.py
+
+"""Local stub HTTP server for API-client tests.
+
+Runs a real ``ThreadingHTTPServer`` on ``127.0.0.1`` in a daemon thread, so
+clients exercise their actual session, retry, and concurrency code paths
+against simulated latency and provider responses (``429`` rate limiting,
+server errors) instead of a mocked ``session.get``.
+
+Usage::
+
+    from tests.fixtures.http import StubHTTPServer, StubResponse
+
+
+    def test_client():
+        with StubHTTPServer(lambda request: StubResponse(json={"ok": True})) as server:
+            requests.get(f"{server.url}/anything")
+        assert server.requests[0].path == "/anything"
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+
+@dataclass(frozen=True)
+class StubRequest:
+    """One request received by the stub server.
+
+    Attributes:
+        method: HTTP method.
+        path: URL path without the query string.
+        query: Query parameters (last value wins for repeated keys).
+        headers: Request headers.
+    """
+
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+
+
+@dataclass(frozen=True)
+class StubResponse:
+    """Response returned by a stub handler.
+
+    Attributes:
+        status: HTTP status code.
+        json: Body, serialized as JSON. ``None`` sends an empty body.
+        headers: Extra response headers.
+        latency: Seconds to wait before responding, on top of the server's
+            default latency.
+    """
+
+    status: int = 200
+    json: Any = None
+    headers: dict[str, str] = field(default_factory=dict)
+    latency: float = 0.0
+
+
+Handler = Callable[[StubRequest], StubResponse]
+
+
+class StubHTTPServer:
+    """Threaded local HTTP server answering every request with *handler*.
+
+    Args:
+        handler: Maps each request to a response. Called concurrently from
+            server threads.
+        latency: Seconds every response is delayed, to simulate network and
+            provider latency.
+
+    Attributes:
+        requests: Requests received, in arrival order.
+        peak_in_flight: Most requests inside the handler and its latency at
+            the same time; writing the response is not counted.
+    """
+
+    def __init__(self, handler: Handler, *, latency: float = 0.0) -> None:
+        self.handler = handler
+        self.latency = latency
+        self.requests: list[StubRequest] = []
+        self.peak_in_flight: int = 0
+        self._in_flight: int = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server, without a trailing slash."""
+        if self._server is None:
+            raise RuntimeError("StubHTTPServer is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> StubHTTPServer:
+        """Start serving on an ephemeral port."""
+        stub = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                stub._serve(self)
+
+            def do_POST(self) -> None:
+                stub._serve(self)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _RequestHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the server and wait for its thread."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def _serve(self, raw: BaseHTTPRequestHandler) -> None:
+        """Record *raw*, run the handler, and write its response."""
+        parts = urlsplit(raw.path)
+        request = StubRequest(
+            method=raw.command,
+            path=parts.path,
+            query=dict(parse_qsl(parts.query)),
+            headers=dict(raw.headers.items()),
+        )
+        with self._lock:
+            self.requests.append(request)
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        try:
+            response = self.handler(request)
+            time.sleep(self.latency + response.latency)
+        finally:
+            # Leave the in-flight count before writing: once the body is sent
+            # the client may issue its next request while this thread is
+            # still unwinding, which would overstate concurrency.
+            with self._lock:
+                self._in_flight -= 1
+        body = b"" if response.json is None else json.dumps(response.json).encode()
+        raw.send_response(response.status)
+        raw.send_header("Content-Type", "application/json")
+        raw.send_header("Content-Length", str(len(body)))
+        for name, value in response.headers.items():
+            raw.send_header(name, value)
+        raw.end_headers()
+        raw.wfile.write(body)
@@ -0,0 +1,124 @@
+# tests/fixtures/nflverse.py
+
+"""Local season loaders standing in for nflreadpy in ingest tests.
+
+:class:`FixtureSeasonLoader` satisfies the ``SeasonLoader`` contract
+(``season -> DataFrame``) from in-memory frames, records which seasons were
+requested, and tracks peak concurrency so tests can assert the worker pool
+stays bounded. :func:`pbp_season` builds a small raw play-by-play season
+carrying every stored column plus ones the ingest must prune.
+
+Usage::
+
+    from tests.fixtures.nflverse import FixtureSeasonLoader, pbp_season
+
+    loader = FixtureSeasonLoader({2023: pbp_season(2023), 2024: pbp_season(2024)})
+    fetch_pbp([2023, 2024], repo=tmp_path, loader=loader)
+    assert sorted(loader.calls) == [2023, 2024]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+class FixtureSeasonLoader:
+    """Serve season frames from memory, like a slow remote source.
+
+    Args:
+        frames: Raw frame per season. Seasons not present raise
+            ``LookupError``, as an unpublished season does upstream.
+        latency: Seconds each call sleeps before returning.
+    """
+
+    def __init__(self, frames: Mapping[int, DataFrame], *, latency: float = 0.0) -> None:
+        self.frames: dict[int, DataFrame] = dict(frames)
+        self.latency = latency
+        self.calls: list[int] = []
+        self.peak_concurrency = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, season: int) -> DataFrame:
+        with self._lock:
+            self.calls.append(season)
+            self._in_flight += 1
+            self.peak_concurrency = max(self.peak_concurrency, self._in_flight)
+        try:
+            time.sleep(self.latency)
+            if season not in self.frames:
+                raise LookupError(f"season {season} is not published")
+            return self.frames[season].copy()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+def pbp_season(season: int, *, games: int = 2, plays: int = 40, seed: int = 0) -> DataFrame:
+    """Return a raw PBP season with realistic columns and value ranges.
+
+    Args:
+        season: Season year.
+        games: Games in the season, all in week 1 between distinct teams.
+        plays: Plays per game, alternating possession.
+        seed: Random seed for play outcomes.
+
+    Returns:
+        One row per play, including columns the ingest does not keep.
+    """
+    rng = np.random.default_rng(seed + season)
+    teams = ["KC", "BUF", "PHI", "DAL", "SF", "GB", "DET", "BAL"]
+    n = games * plays
+    game = np.repeat(np.arange(games), plays)
+    offense_home = np.tile(np.arange(plays) % 2 == 0, games)
+    home = np.array(teams)[2 * game % len(teams)]
+    away = np.array(teams)[(2 * game + 1) % len(teams)]
+    is_pass = rng.random(n) < 0.55
+    epa = rng.normal(0.0, 1.2, n)
+    yards = rng.integers(-5, 30, n)
+    return DataFrame(
+        {
+            "play_id": np.arange(n),
+            "game_id": [f"{season}_01_{a}_{h}" for a, h in zip(away, home, strict=True)],
+            "old_game_id": [f"{season}09{g:04d}" for g in game],
+            "season": season,
+            "week": 1,
+            "game_date": f"{season}-09-10",
+            "posteam": np.where(offense_home, home, away),
+            "posteam_type": np.where(offense_home, "home", "away"),
+            "defteam": np.where(offense_home, away, home),
+            "play_type": np.where(is_pass, "pass", "run"),
+            "pass": is_pass.astype(int),
+            "rush": (~is_pass).astype(int),
+            "epa": epa,
+            "success": (epa > 0).astype(float),
+            "qb_epa": np.where(is_pass, epa, np.nan),
+            "cp": np.where(is_pass, rng.random(n), np.nan),
+            "cpoe": np.where(is_pass, rng.normal(0, 10, n), np.nan),
+            "yards_gained": yards.astype(float),
+            "air_yards": np.where(is_pass, yards * 0.6, np.nan),
+            "yards_after_catch": np.where(is_pass, yards * 0.4, np.nan),
+            "first_down": (yards >= 10).astype(float),
+            "touchdown": (rng.random(n) < 0.04).astype(float),
+            "interception": (is_pass & (rng.random(n) < 0.03)).astype(float),
+            "fumble_lost": (rng.random(n) < 0.01).astype(float),
+            "sack": (is_pass & (rng.random(n) < 0.06)).astype(float),
+            "penalty": (rng.random(n) < 0.08).astype(float),
+            "home_team": home,
+            "away_team": away,
+            "score_differential": rng.integers(-14, 15, n).astype(float),
+            "half_seconds_remaining": rng.integers(0, 1800, n).astype(float),
+            "game_seconds_remaining": rng.integers(0, 3600, n).astype(float),
+            "down": rng.integers(1, 5, n).astype(float),
+            "ydstogo": rng.integers(1, 15, n).astype(float),
+            "yardline_100": rng.integers(1, 100, n).astype(float),
+            "desc": pd.Series(["(14:55) play description"] * n),
+            "weather": "Sunny",
+        }
+    )
@@ -0,0 +1,202 @@
+# tests/fixtures/odds.py
+
+"""Payload fixtures shaped like recorded The Odds API v4 NFL responses.
+
+:func:`the_odds_api_week` builds one full current-odds response for a week:
+every game quoted by several US books across moneyline, spread, and total
+markets, plus the noise real responses carry - events from other weeks that
+are missing from the schedule, games already underway, bookmakers without a
+market-level ``last_update``, and markets the parser does not support.
+
+Usage::
+
+    from tests.fixtures.odds import FETCHED_AT, SEASON, WEEK, the_odds_api_week
+
+    payload, schedule = the_odds_api_week(games=16, books=8)
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+from pandas import DataFrame
+
+SEASON = "2026-2027"
+WEEK = 1
+FETCHED_AT = datetime(2026, 9, 9, 12, tzinfo=UTC)
+
+_TEAMS = (
+    "Arizona Cardinals",
+    "Atlanta Falcons",
+    "Baltimore Ravens",
+    "Buffalo Bills",
+    "Carolina Panthers",
+    "Chicago Bears",
+    "Cincinnati Bengals",
+    "Cleveland Browns",
+    "Dallas Cowboys",
+    "Denver Broncos",
+    "Detroit Lions",
+    "Green Bay Packers",
+    "Houston Texans",
+    "Indianapolis Colts",
+    "Jacksonville Jaguars",
+    "Kansas City Chiefs",
+    "Las Vegas Raiders",
+    "Los Angeles Chargers",
+    "Los Angeles Rams",
+    "Miami Dolphins",
+    "Minnesota Vikings",
+    "New England Patriots",
+    "New Orleans Saints",
+    "New York Giants",
+    "New York Jets",
+    "Philadelphia Eagles",
+    "Pittsburgh Steelers",
+    "San Francisco 49ers",
+    "Seattle Seahawks",
+    "Tampa Bay Buccaneers",
+    "Tennessee Titans",
+    "Washington Commanders",
+)
+
+_BOOKS = (
+    "draftkings",
+    "fanduel",
+    "betmgm",
+    "caesars",
+    "espnbet",
+    "betrivers",
+    "fanatics",
+    "bovada",
+    "betonlineag",
+    "mybookieag",
+    "lowvig",
+    "betus",
+)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _american(rng: np.random.Generator) -> int:
+    price = int(rng.integers(100, 400))
+    return price if rng.random() < 0.5 else -price
+
+
+def _markets(
+    rng: np.random.Generator,
+    away: str,
+    home: str,
+    updated: datetime,
+) -> list[dict[str, object]]:
+    spread = float(rng.integers(-20, 21)) / 2
+    total = float(rng.integers(70, 110)) / 2
+    markets: list[dict[str, object]] = [
+        {
+            "key": "h2h",
+            "outcomes": [
+                {"name": away, "price": _american(rng)},
+                {"name": home, "price": _american(rng)},
+            ],
+        },
+        {
+            "key": "spreads",
+            "last_update": _iso(updated + timedelta(seconds=int(rng.integers(0, 60)))),
+            "outcomes": [
+                {"name": away, "price": -110, "point": spread},
+                {"name": home, "price": -110, "point": -spread},
+            ],
+        },
+        {
+            "key": "totals",
+            "last_update": _iso(updated),
+            "outcomes": [
+                {"name": "Over", "price": _american(rng), "point": total},
+                {"name": "Under", "price": _american(rng), "point": total},
+            ],
+        },
+    ]
+    if rng.random() < 0.2:
+        markets.append(
+            {
+                "key": "h2h_lay",
+                "outcomes": [{"name": away, "price": 2.1}, {"name": home, "price": 1.9}],
+            }
+        )
+    return markets
+
+
+def the_odds_api_week(
+    games: int = 16,
+    books: int = 8,
+    *,
+    seed: int = 0,
+) -> tuple[list[dict[str, object]], DataFrame]:
+    """Return one week's current-odds payload and its canonical schedule.
+
+    Args:
+        games: Scheduled games in the week (at most 16).
+        books: Bookmakers quoting each game (at most 12).
+        seed: Random seed for prices and lines.
+
+    Returns:
+        The provider payload and the matching rich schedule for
+        :data:`SEASON` / :data:`WEEK`.
+    """
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(_TEAMS))
+    kickoff = FETCHED_AT + timedelta(days=1)
+    payload: list[dict[str, object]] = []
+    schedule: list[dict[str, object]] = []
+    for game in range(games):
+        away, home = _TEAMS[order[2 * game]], _TEAMS[order[2 * game + 1]]
+        # The first game is underway; the parser must drop it.
+        commence = FETCHED_AT - timedelta(hours=1) if game == 0 else kickoff
+        bookmakers = []
+        for book in _BOOKS[:books]:
+            updated = FETCHED_AT - timedelta(minutes=int(rng.integers(1, 30)))
+            bookmakers.append(
+                {
+                    "key": book,
+                    "title": book.title(),
+                    "last_update": _iso(updated),
+                    "markets": _markets(rng, away, home, updated),
+                }
+            )
+        payload.append(
+            {
+                "id": f"{rng.bytes(16).hex()}",
+                "sport_key": "americanfootball_nfl",
+                "sport_title": "NFL",
+                "commence_time": _iso(commence),
+                "home_team": home,
+                "away_team": away,
+                "bookmakers": bookmakers,
+            }
+        )
+        schedule.append(
+            {
+                "season": SEASON,
+                "week": WEEK,
+                "game_id": f"2026_01_{game:02d}",
+                "game_date": commence.date().isoformat(),
+                "away_team": away,
+                "home_team": home,
+            }
+        )
+    # A next-week event the schedule does not cover.
+    payload.append(
+        {
+            "id": "next-week",
+            "sport_key": "americanfootball_nfl",
+            "sport_title": "NFL",
+            "commence_time": _iso(kickoff + timedelta(days=7)),
+            "home_team": _TEAMS[order[0]],
+            "away_team": _TEAMS[order[3]],
+            "bookmakers": [],
+        }
+    )
+    return payload, DataFrame(schedule)
@@ -100,3 +100,34 @@ def test_build_model_inputs_full_rebuild(
     assert manifest["schema_version"] == CURRENT_SCHEMA_VERSION
     assert manifest["data_version"] == CURRENT_DATA_VERSION
     assert manifest["row_count"] == 2
+
+
+def test_build_model_inputs_profile_records_every_feature(
+    mini_repo: Path,
+) -> None:
+    fit_elo(
+        all_years=True,
+        repo=mini_repo,
+    )
+    profiles = build_model_inputs(
+        all_years=True,
+        repo=mini_repo,
+        profile=True,
+    )
+
+    assert [profile.name for profile in profiles] == list(CANONICAL_FEATURES)
+    assert all(profile.rows_in == profile.rows_out == 2 for profile in profiles)
+
+    manifest = read_manifest(
+        dataset_path(
+            mini_repo,
+            "modeling_full",
+        ).parent
+    )
+    assert [record["name"] for record in manifest["feature_profile"]] == list(CANONICAL_FEATURES)
+    loaded = {
+        load["dataset"]
+        for record in manifest["feature_profile"]
+        for load in record["dataset_loads"]
+    }
+    assert "games" in loaded
@@ -0,0 +1,186 @@
+# tests/unit/api/test_caching.py
+
+"""Unit tests for the API response cache middleware."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+import pytest
+
+from gridiron_edge.api.caching import (
+    CachedResponse,
+    ResponseCache,
+    ResponseCacheMiddleware,
+    canonical_query,
+    etag_matches,
+    strong_etag,
+)
+from gridiron_edge.api.deps import SnapshotDep, settings_dependency
+from gridiron_edge.api.snapshot import snapshot_store
+from gridiron_edge.core.settings import Settings
+
+
+def _settings(root: Path) -> Settings:
+    return Settings(
+        repo_root=root,
+        owm_api_key=None,
+        odds_api_key=None,
+        data_raw=root / "data" / "raw",
+        data_cleaned=root / "data" / "cleaned",
+        data_modeling=root / "data" / "modeling",
+        data_output=root / "data" / "output",
+    )
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> FastAPI:
+    """A tiny app behind the middleware that counts renders per route."""
+    app = FastAPI()
+    app.dependency_overrides[settings_dependency] = lambda: _settings(tmp_path)
+    app.state.renders = 0
+    app.add_middleware(ResponseCacheMiddleware, cache=ResponseCache(max_entries=2))
+
+    @app.get("/items")
+    def items(season: int = 0, week: int = 0) -> dict[str, int]:
+        app.state.renders += 1
+        return {"season": season, "week": week, "render": app.state.renders}
+
+    @app.get("/missing")
+    def missing() -> dict[str, str]:
+        raise HTTPException(status_code=404, detail="nope")
+
+    @app.get("/text", response_class=PlainTextResponse)
+    def text() -> str:
+        app.state.renders += 1
+        return "plain"
+
+    return app
+
+
+def _cache(app: FastAPI) -> ResponseCache:
+    middleware = next(m for m in app.user_middleware if m.cls is ResponseCacheMiddleware)
+    return middleware.kwargs["cache"]
+
+
+class TestHelpers:
+    def test_strong_etag_is_quoted_and_content_addressed(self) -> None:
+        etag = strong_etag(b"{}")
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == strong_etag(b"{}") != strong_etag(b"[]")
+
+    def test_etag_matches_lists_weak_and_wildcard(self) -> None:
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"b"')
+
+    def test_canonical_query_ignores_parameter_order(self) -> None:
+        assert canonical_query(b"week=2&season=2024") == canonical_query(b"season=2024&week=2")
+
+    def test_lru_evicts_by_entries_and_bytes(self) -> None:
+        cache = ResponseCache(max_entries=2, max_bytes=10)
+        for i in range(3):
+            cache.put(("/", str(i), 1), CachedResponse(b"abc", f'"{i}"', "application/json"))
+        assert cache.get(("/", "0", 1)) is None
+        assert cache.get(("/", "2", 1)) is not None
+        cache.put(("/", "big", 1), CachedResponse(b"x" * 9, '"big"', "application/json"))
+        assert cache.stats.entries == 1
+        assert cache.stats.bytes == 9
+        assert cache.stats.evictions == 3
+
+
+class TestResponseCacheMiddleware:
+    def test_repeat_request_is_served_from_cache(self, app: FastAPI) -> None:
+        client = TestClient(app)
+        first = client.get("/items?season=2024&week=2")
+        second = client.get("/items?week=2&season=2024")
+
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.content == first.content
+        assert second.headers["etag"] == first.headers["etag"]
+        assert second.headers["cache-control"] == "no-cache"
+        assert app.state.renders == 1
+        stats = _cache(app).stats
+        assert (stats.hits, stats.misses, stats.hit_rate) == (1, 1, 0.5)
+
+    def test_if_none_match_returns_304_without_body(self, app: FastAPI) -> None:
+        client = TestClient(app)
+        etag = client.get("/items").headers["etag"]
+
+        response = client.get("/items", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert _cache(app).stats.not_modified == 1
+
+    def test_errors_non_json_and_no_store_are_not_cached(self, app: FastAPI) -> None:
+        client = TestClient(app)
+        assert client.get("/missing").status_code == 404
+        assert "etag" not in client.get("/missing").headers
+        client.get("/text")
+        client.get("/text")
+        client.get("/items", headers={"Cache-Control": "no-store"})
+        client.get("/items", headers={"Cache-Control": "no-store"})
+
+        assert app.state.renders == 4
+        assert _cache(app).stats.entries == 0
+        assert _cache(app).stats.bypassed == 2
+
+    def test_data_change_invalidates(self, app: FastAPI, tmp_path: Path) -> None:
+        client = TestClient(app)
+        first = client.get("/items")
+        (tmp_path / "data" / "output" / "temp").mkdir(parents=True)
+        (tmp_path / "data" / "output" / "temp" / "new.csv").write_text("a\n1\n")
+        snapshot_store(tmp_path).refresh()
+
+        second = client.get("/items")
+
+        assert second.headers["x-cache"] == "MISS"
+        assert second.headers["etag"] != first.headers["etag"]
+        assert app.state.renders == 2
+
+    def test_unserved_write_keeps_cache(self, app: FastAPI, tmp_path: Path) -> None:
+        client = TestClient(app)
+        client.get("/items")
+        (tmp_path / "data" / "raw").mkdir(parents=True)
+        (tmp_path / "data" / "raw" / "download.parquet").write_bytes(b"x")
+        snapshot_store(tmp_path).refresh()
+
+        assert client.get("/items").headers["x-cache"] == "HIT"
+
+    def test_route_renders_the_pinned_snapshot(self, app: FastAPI, tmp_path: Path) -> None:
+        @app.get("/version")
+        def version(snapshot: SnapshotDep) -> dict[str, int]:
+            return {"version": snapshot.version}
+
+        client = TestClient(app)
+        store = snapshot_store(tmp_path)
+        store.refresh_interval = 0.0
+        (tmp_path / "data" / "output" / "temp").mkdir(parents=True)
+
+        for n in range(3):
+            (tmp_path / "data" / "output" / "temp" / f"{n}.csv").write_text("a\n")
+            response = client.get("/version")
+            assert response.json()["version"] == store.current().version
+
+
+def test_app_exposes_cache_stats(tmp_path: Path) -> None:
+    from gridiron_edge.api.app import create_app
+
+    app = create_app()
+    app.dependency_overrides[settings_dependency] = lambda: _settings(tmp_path)
+    client = TestClient(app)
+    client.get("/weeks/current")
+    client.get("/weeks/current")
+
+    stats = client.get("/cache/stats").json()
+
+    assert stats["hits"] + stats["misses"] == 2
+    assert set(stats) >= {"hits", "misses", "not_modified", "evictions", "hit_rate"}
@@ -0,0 +1,90 @@
+# tests/unit/api/test_indexes.py
+
+"""Unit tests for api/indexes.py."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gridiron_edge.api.indexes import (
+    GroupIndex,
+    index_player_logs_by_player,
+    index_player_logs_by_season,
+    none_if_nan,
+)
+
+
+def _logs() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "player_id": ["P1", "P2", "P1", "P1", "P2"],
+            "player_name": ["A", "B", "A", "A", "B"],
+            "position": ["RB", "WR", "RB", "RB", "WR"],
+            "team": ["KC", "LV", "KC", "DAL", "LV"],
+            "season": [2024, 2024, 2024, 2023, 2024],
+            "season_type": ["REG", "REG", "REG", "REG", "POST"],
+            "week": [3, 1, 1, 5, 19],
+            "is_skill": [True, True, True, True, True],
+            "opponent_team": ["LV", "KC", "DEN", "NYG", "BUF"],
+            "game_id": ["g3", "g1", "g1b", "g0", "g19"],
+            "is_home": [True, False, False, True, True],
+            "rushing_yards": [50.0, np.nan, 70.0, 10.0, 5.0],
+        }
+    )
+
+
+class TestGroupIndex:
+    def test_groups_rows_in_order_by_key(self) -> None:
+        index = GroupIndex.build(_logs(), "player_id", order_by=["season", "week"])
+
+        assert index.keys() == ["P1", "P2"]
+        assert index.take("P1", ["week"])["week"].tolist() == [5, 1, 3]
+        assert len(index.frame("P2")) == 2
+
+    def test_tuple_keys_and_missing_keys(self) -> None:
+        index = GroupIndex.build(_logs(), ["season", "week"])
+
+        assert (2024, 1) in index
+        assert index.positions((1999, 1)).size == 0
+        assert index.frame((1999, 1)).empty
+
+    def test_columns_are_read_only_copies(self) -> None:
+        logs = _logs()
+        index = GroupIndex.build(logs, "player_id", columns=["week", "absent"])
+
+        assert list(index.columns) == ["week"]
+        with pytest.raises(ValueError, match="read-only"):
+            index.columns["week"][0] = 99
+        logs.loc[0, "week"] = 42
+        assert 42 not in index.columns["week"]
+
+    def test_empty_frame(self) -> None:
+        index = GroupIndex.build(pd.DataFrame({"team_abbr": []}), "team_abbr")
+        assert len(index) == 0
+        assert index.frame("KC").empty
+
+
+class TestPlayerLogIndexes:
+    def test_by_player_keeps_regular_season_in_game_order(self) -> None:
+        index = index_player_logs_by_player(_logs())
+
+        assert index is not None
+        p2 = index.take("P2")
+        assert p2["game_id"].tolist() == ["g1"]
+        assert index.take("P1")["game_id"].tolist() == ["g0", "g1b", "g3"]
+
+    def test_by_season_orders_players_then_weeks(self) -> None:
+        index = index_player_logs_by_season(_logs())
+
+        assert index is not None
+        assert index.take(2024)["team"].tolist() == ["KC", "KC", "LV"]
+
+    def test_missing_logs(self) -> None:
+        assert index_player_logs_by_player(None) is None
+        assert index_player_logs_by_season(None) is None
+
+
+def test_none_if_nan() -> None:
+    assert none_if_nan(np.array([1.0, np.nan, 3])) == [1.0, None, 3.0]
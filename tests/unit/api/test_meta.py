@@ -4,13 +4,15 @@
 Covers:
 - BlockedStatus serialization shape.
 - "pending" literal serialization.
-- ResponseMeta builder methods (with_pending, with_blocked).
+- ResponseMeta builder methods (with_pending, with_blocked, with_snapshot).
 - Frozen / extra=forbid behavior.
 - Blocker registry: completeness and uniqueness.
 """
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
 from pydantic import ValidationError
 import pytest
 
@@ -153,6 +155,25 @@ class TestResponseMetaSerialization:
         assert rebuilt.field_status == meta.field_status
 
 
+class TestResponseMetaWithSnapshot:
+    def test_snapshot_serializes_only_when_set(self) -> None:
+        built_at = datetime(2026, 9, 1, tzinfo=UTC)
+        meta = ResponseMeta().with_pending("network").with_snapshot(3, built_at, 1.5)
+        dumped = meta.model_dump()
+        assert dumped["snapshot"] == {"version": 3, "built_at": built_at, "age_seconds": 1.5}
+        assert "snapshot" not in ResponseMeta().with_pending("network").model_dump()
+
+    def test_later_builders_keep_snapshot(self) -> None:
+        built_at = datetime(2026, 9, 1, tzinfo=UTC)
+        meta = (
+            ResponseMeta()
+            .with_snapshot(2, built_at, 0.0)
+            .with_blocked("injuries", *Blocker.INJURY_DATA)
+        )
+        assert meta.snapshot is not None
+        assert meta.snapshot.version == 2
+
+
 class TestResponseMetaIsFrozen:
     def test_field_status_assignment_rejected(self) -> None:
         meta = ResponseMeta()
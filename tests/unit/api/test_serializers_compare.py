@@ -4,9 +4,15 @@
 
 from __future__ import annotations
 
+import dataclasses
+
+import numpy as np
 import pandas as pd
+import pytest
 
 from gridiron_edge.api.serializers.compare import serialize_compare_teams
+from gridiron_edge.ratings.elo.core import elo_win_probability
+from gridiron_edge.ratings.elo.matrix import build_elo_matrix
 
 LONG_TO_SHORT = {
     "Kansas City Chiefs": "KC",
@@ -312,3 +318,56 @@ class TestCompareTeamsCohortSplits:
         )
         assert result.cohort_splits is None
         assert "cohort_splits" in result.response_meta.field_status
+
+
+class TestCompareTeamsWinProbability:
+    def _serialize(self, **kwargs):
+        return serialize_compare_teams(
+            _make_elo(),
+            _make_games(),
+            LONG_TO_SHORT,
+            team_a_short="KC",
+            team_b_short="LAC",
+            season="2026-2027",
+            as_of_week=1,
+            percentiles=pd.DataFrame(),
+            **kwargs,
+        )
+
+    def test_computed_from_ratings_without_matrix(self) -> None:
+        by_key = {row.key: row for row in self._serialize().stats}
+
+        expected_a, expected_b = elo_win_probability(1620.0, 1520.0)
+        assert by_key["win_prob"].team_a_value == pytest.approx(expected_a)
+        assert by_key["win_prob"].team_b_value == pytest.approx(expected_b)
+
+    def test_looked_up_from_matching_matrix(self) -> None:
+        matrix = build_elo_matrix(_make_elo())
+        # Sentinel values prove the lookup path was taken.
+        matrix = dataclasses.replace(matrix, probabilities=np.full_like(matrix.probabilities, 0.25))
+
+        by_key = {row.key: row for row in self._serialize(elo_matrix=matrix).stats}
+
+        assert by_key["win_prob"].team_a_value == 0.25
+        assert by_key["win_prob"].team_b_value == 0.25
+
+    def test_ignores_matrix_for_other_season(self) -> None:
+        matrix = build_elo_matrix(_make_elo())
+        matrix = dataclasses.replace(
+            matrix, season="2025-2026", probabilities=np.full_like(matrix.probabilities, 0.25)
+        )
+
+        by_key = {row.key: row for row in self._serialize(elo_matrix=matrix).stats}
+
+        expected_a, _ = elo_win_probability(1620.0, 1520.0)
+        assert by_key["win_prob"].team_a_value == pytest.approx(expected_a)
+
+    def test_ignores_matrix_built_from_older_ratings(self) -> None:
+        stale = _make_elo().assign(ELO=[1600.0, 1540.0])
+        matrix = dataclasses.replace(build_elo_matrix(stale), probabilities=np.full((2, 2), 0.25))
+
+        by_key = {row.key: row for row in self._serialize(elo_matrix=matrix).stats}
+
+        expected_a, expected_b = elo_win_probability(1620.0, 1520.0)
+        assert by_key["win_prob"].team_a_value == pytest.approx(expected_a)
+        assert by_key["win_prob"].team_b_value == pytest.approx(expected_b)
@@ -0,0 +1,132 @@
+# tests/unit/api/test_snapshot.py
+
+"""Unit tests for the in-memory API data snapshot."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import time
+
+import pandas as pd
+from tests.fixtures.dataframes import make_elo_state, make_games
+
+from gridiron_edge.api.schemas.players import PlayersListResponse
+from gridiron_edge.api.snapshot import (
+    PLAYER_GAME_LOGS_RELPATH,
+    SnapshotStore,
+    stamp_snapshot,
+)
+from gridiron_edge.datasets.writers import write_csv
+
+
+def _write_logs(repo: Path, n: int) -> None:
+    path = repo / PLAYER_GAME_LOGS_RELPATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"player_id": [f"P{i}" for i in range(n)]}).to_parquet(path, index=False)
+
+
+class TestSnapshotStore:
+    def test_unchanged_sources_keep_the_snapshot(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", make_games(n=3))
+        store = SnapshotStore(tmp_path, refresh_interval=0.0)
+
+        first = store.current()
+        games = first.get("games")
+
+        assert store.current() is first
+        assert first.get("games") is games
+        assert first.version == 1
+
+    def test_changed_source_swaps_and_carries_over_the_rest(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", make_games(n=3))
+        write_csv(tmp_path, "elo_state", make_elo_state())
+        store = SnapshotStore(tmp_path, refresh_interval=0.0)
+        first = store.current()
+        elo = first.get("elo_state")
+        assert len(first.get("games")) == 3
+
+        write_csv(tmp_path, "games", make_games(n=5))
+        second = store.current()
+
+        assert second.version == 2
+        assert len(second.get("games")) == 5
+        assert second.get("elo_state") is elo
+        assert len(first.get("games")) == 3
+
+    def test_indexes_follow_their_sources(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", make_games(n=3))
+        write_csv(tmp_path, "elo_state", make_elo_state())
+        store = SnapshotStore(tmp_path, refresh_interval=0.0)
+        by_season = store.current().get("games_by_season")
+        elo_by_season = store.current().get("elo_by_season")
+
+        write_csv(tmp_path, "games", make_games(n=5))
+        second = store.current()
+
+        assert second.get("elo_by_season") is elo_by_season
+        assert second.get("games_by_season") is not by_season
+        assert sum(rows.size for rows in second.get("games_by_season").groups.values()) == 5
+
+    def test_missing_dataset_loads_once_it_appears(self, tmp_path: Path) -> None:
+        store = SnapshotStore(tmp_path, refresh_interval=0.0)
+        assert store.current().get("player_game_logs") is None
+
+        _write_logs(tmp_path, 2)
+
+        assert len(store.current().get("player_game_logs")) == 2
+
+    def test_unwatched_checks_are_throttled(self, tmp_path: Path) -> None:
+        store = SnapshotStore(tmp_path, refresh_interval=60.0)
+        first = store.current()
+
+        _write_logs(tmp_path, 2)
+
+        assert store.current() is first
+        assert store.refresh()
+        assert store.current().version == 2
+
+    def test_only_served_outputs_bump_the_version(self, tmp_path: Path) -> None:
+        raw = tmp_path / "data" / "raw" / "pbp"
+        responses = tmp_path / "data" / "odds" / "cache" / "responses"
+        raw.mkdir(parents=True)
+        responses.mkdir(parents=True)
+        store = SnapshotStore(tmp_path, refresh_interval=0.0)
+
+        (raw / "play_by_play_2024.parquet").write_bytes(b"x")
+        (responses / "a.json").write_text("{}")
+
+        assert store.current().version == 1
+
+        (tmp_path / "data" / "odds" / "odds_current.parquet").write_bytes(b"x")
+
+        assert store.current().version == 2
+
+    def test_watcher_preloads_and_swaps_in_background(self, tmp_path: Path) -> None:
+        _write_logs(tmp_path, 1)
+        store = SnapshotStore(tmp_path, refresh_interval=0.0)
+        store.start_watching(interval=0.01)
+        try:
+            assert store.watching
+            _write_logs(tmp_path, 4)
+            deadline = time.monotonic() + 5.0
+            while store.current().version == 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            snapshot = store.current()
+            assert snapshot.version >= 2
+            assert "player_game_logs" in snapshot.loaded()
+            assert len(snapshot.get("player_game_logs")) == 4
+        finally:
+            store.stop_watching()
+        assert not store.watching
+
+
+class TestStampSnapshot:
+    def test_sets_version_and_age_on_meta(self, tmp_path: Path) -> None:
+        snapshot = SnapshotStore(tmp_path, refresh_interval=0.0).current()
+
+        stamped = stamp_snapshot(PlayersListResponse(items=[], total=0), snapshot)
+
+        body = stamped.model_dump(by_alias=True)
+        assert body["_meta"]["snapshot"]["version"] == 1
+        assert body["_meta"]["snapshot"]["age_seconds"] >= 0.0
+        assert body["_meta"]["field_status"] == {}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -78,6 +79,7 @@ def test_command_resolves_scope_and_renders_summary(
         week=1,
         repo=tmp_path,
         timeout=7.5,
+        max_age=timedelta(minutes=5),
     )
     assert "96 quotes, 16 games, 4 sportsbooks" in result.output
     assert "Requests remaining: 487" in result.output
@@ -85,6 +87,31 @@ def test_command_resolves_scope_and_renders_summary(
     assert "Request cost: 3" in result.output
 
 
+@patch("gridiron_edge.ingest.odds.the_odds_api.ingest_the_odds_api_current")
+@patch("gridiron_edge.datasets.loaders.load_schedule_upcoming_rich")
+@patch("gridiron_edge.core.settings.get_settings")
+@patch("gridiron_edge.cli.ingest.get_odds_api_key")
+def test_zero_max_age_always_requests(
+    mock_key: MagicMock,
+    mock_settings: MagicMock,
+    mock_schedule: MagicMock,
+    mock_ingest: MagicMock,
+    tmp_path: Path,
+) -> None:
+    mock_key.return_value = "key"
+    mock_settings.return_value = SimpleNamespace(repo_root=tmp_path)
+    mock_schedule.return_value = pd.DataFrame({"game_id": ["game-1"]})
+    mock_ingest.return_value = _result(tmp_path)
+
+    result = runner.invoke(
+        ingest_app,
+        ["odds", "--season", "2026-2027", "--week", "1", "--max-age", "0"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert mock_ingest.call_args.kwargs["max_age"] is None
+
+
 @patch("gridiron_edge.cli.ingest.get_odds_api_key")
 def test_missing_key_stops_before_schedule_load(mock_key: MagicMock) -> None:
     import typer
@@ -158,3 +185,19 @@ def test_help_documents_explicit_network_command() -> None:
     assert "ODDS_API_KEY" in result.output
     assert "--season" in result.output
     assert "--week" in result.output
+
+
+@patch("gridiron_edge.ingest.odds.store.compact_odds_ledger")
+@patch("gridiron_edge.core.settings.get_settings")
+def test_compact_command_forwards_scope(
+    mock_settings: MagicMock,
+    mock_compact: MagicMock,
+    tmp_path: Path,
+) -> None:
+    mock_settings.return_value = SimpleNamespace(repo_root=tmp_path)
+    mock_compact.return_value = []
+
+    result = runner.invoke(ingest_app, ["compact-odds", "--season", "2026-2027"])
+
+    assert result.exit_code == 0, result.output
+    mock_compact.assert_called_once_with(season="2026-2027", week=None, repo=tmp_path)
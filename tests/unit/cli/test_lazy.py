@@ -0,0 +1,78 @@
+"""Tests for lazy subcommand loading and the CLI import-time budget."""
+
+from __future__ import annotations
+
+import pytest
+from typer.testing import CliRunner
+
+from gridiron_edge.cli.debug import parse_importtime, profile_help
+from gridiron_edge.cli.main import _LAZY_COMMANDS, app
+
+runner = CliRunner()
+
+# ``gridiron --help`` measured ~180 ms of module self time locally; the budget
+# leaves headroom for slow CI machines while still catching an eager import
+# of pandas / scikit-learn / XGBoost (each several hundred ms on their own).
+_HELP_IMPORT_BUDGET_MS = 750.0
+_HEAVY_PACKAGES = {"pandas", "numpy", "sklearn", "xgboost", "matplotlib", "numba", "scipy"}
+
+
+class TestLazyRegistry:
+    @pytest.mark.parametrize("lazy", _LAZY_COMMANDS, ids=lambda c: c.name)
+    def test_registry_help_matches_command(self, lazy) -> None:
+        command = lazy.load()
+
+        assert command.name == lazy.name
+        assert (command.help or "").strip().splitlines()[0] == lazy.help
+
+    def test_help_lists_every_command(self) -> None:
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0, result.output
+        for lazy in _LAZY_COMMANDS:
+            assert lazy.name in result.output
+        assert "run-data-pipeline" in result.output
+
+    def test_single_command_sub_app_stays_a_group(self) -> None:
+        result = runner.invoke(app, ["debug", "--help"])
+
+        assert result.exit_code == 0, result.output
+        assert "import-time" in result.output
+
+    def test_unknown_command_is_rejected(self) -> None:
+        result = runner.invoke(app, ["no-such-command"])
+
+        assert result.exit_code != 0
+
+
+class TestImportTime:
+    def test_parse_importtime(self) -> None:
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        150 |   pandas.core\n"
+            "import time:        30 |        180 | pandas\n"
+            "some other line\n"
+        )
+
+        records = parse_importtime(stderr)
+
+        assert [(r.module, r.self_us, r.depth) for r in records] == [
+            ("pandas.core", 120, 1),
+            ("pandas", 30, 0),
+        ]
+        assert {r.package for r in records} == {"pandas"}
+
+    def test_unknown_subcommand_is_rejected(self) -> None:
+        result = runner.invoke(app, ["debug", "import-time", "--command", "nope"])
+
+        assert result.exit_code != 0
+        assert "nope" in result.output
+
+    def test_help_stays_within_import_budget(self) -> None:
+        profile = profile_help()
+
+        assert profile.records, "no -X importtime output captured"
+        assert not profile.packages & _HEAVY_PACKAGES
+        sub_apps = {r.module for r in profile.records if r.module.startswith("gridiron_edge.cli.")}
+        assert sub_apps <= {"gridiron_edge.cli.main", "gridiron_edge.cli._lazy"}
+        assert profile.total_ms < _HELP_IMPORT_BUDGET_MS, profile.heaviest_packages(5)
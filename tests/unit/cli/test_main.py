@@ -11,7 +11,12 @@ import pytest
 import typer
 from typer.testing import CliRunner
 
-from gridiron_edge.cli.main import ALL_STAGES, _check_stage_staleness, run_data_pipeline
+from gridiron_edge.cli.main import (
+    ALL_STAGES,
+    _check_stage_staleness,
+    _run_pipeline_stages,
+    run_data_pipeline,
+)
 from gridiron_edge.datasets.registry import dataset_path
 
 
@@ -24,6 +29,7 @@ class TestPipelineContract:
             "clean-upcoming",
             "fetch-weather",
             "build-epa",
+            "build-player-stats",
             "build-elo",
             "build-features",
         ]
@@ -57,6 +63,35 @@ class TestPipelineContract:
         assert "ingest dk-odds" not in result.output
 
 
+class TestPlayerStatsStage:
+    @pytest.mark.parametrize(("all_years", "only_changed"), [(False, True), (True, False)])
+    @patch("gridiron_edge.transform.clean.player_stats.clean_player_stats")
+    @patch("gridiron_edge.ingest.nflverse.player_stats.fetch_player_stats", return_value=[])
+    def test_weekly_runs_reclean_only_changed_seasons(
+        self,
+        mock_fetch,
+        mock_clean,
+        all_years: bool,
+        only_changed: bool,
+        tmp_path: Path,
+    ) -> None:
+        mock_clean.return_value = tmp_path / "player_game_logs.parquet"
+
+        _run_pipeline_stages(
+            active={"build-player-stats"},
+            all_years=all_years,
+            resolved_season=2026,
+            upcoming_target=2026,
+            season=None,
+            season_year=None,
+            owm_api_key=None,
+            fit_elo_all_years=False,
+        )
+
+        mock_fetch.assert_called_once_with(all_years=all_years)
+        mock_clean.assert_called_once_with(only_changed=only_changed)
+
+
 class TestStageStalenessCheck:
     def _settings(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         from gridiron_edge.core import settings as settings_mod
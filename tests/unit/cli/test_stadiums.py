@@ -127,6 +127,7 @@ def test_prepare_writes_review_only(
     assert not (tmp_path / "data/cleaned/NFL_stadium_reference.csv").exists()
 
 
+@patch("gridiron_edge.cli.stadiums.refresh_venue_geometry", return_value=None)
 @patch("gridiron_edge.cli.stadiums.audit_stadium_coverage", return_value=pd.DataFrame())
 @patch("gridiron_edge.cli.stadiums.apply_approved_stadium_updates")
 @patch("gridiron_edge.cli.stadiums.load_schedule_upcoming_rich")
@@ -138,6 +139,7 @@ def test_apply_calls_atomic_service_and_reaudits(
     _schedule: MagicMock,
     apply: MagicMock,
     _audit_mock: MagicMock,
+    refresh: MagicMock,
     tmp_path: Path,
 ) -> None:
     settings.return_value.repo_root = tmp_path
@@ -174,6 +176,9 @@ def test_apply_calls_atomic_service_and_reaudits(
     assert result.exit_code == 0, result.output
     assert "approved rows applied: 1" in result.output
     apply.assert_called_once()
+    refresh.assert_called_once_with(
+        apply.return_value, tmp_path / "data/cleaned/NFL_venue_geometry.npz"
+    )
 
 
 def test_apply_rejects_missing_review_file(tmp_path: Path) -> None:
@@ -191,6 +196,70 @@ def test_apply_rejects_missing_review_file(tmp_path: Path) -> None:
     assert result.exit_code != 0
 
 
+@patch("gridiron_edge.cli.stadiums.load_stadiums")
+@patch("gridiron_edge.cli.stadiums.get_settings")
+def test_geometry_writes_venue_table(
+    settings: MagicMock,
+    stadiums: MagicMock,
+    tmp_path: Path,
+) -> None:
+    settings.return_value.repo_root = tmp_path
+    stadiums.return_value = pd.DataFrame(
+        {
+            "HOME_TEAM": ["Kansas City Chiefs"],
+            "YEAR": ["2025-2026"],
+            "STADIUM": ["Arrowhead Stadium"],
+            "LATITUDE": [39.0489],
+            "LONGITUDE": [-94.4839],
+            "ALTITUDE": [274.0],
+        }
+    )
+
+    result = runner.invoke(_app(), ["stadiums", "geometry"])
+
+    assert result.exit_code == 0, result.output
+    assert "venues: 1  zones: 1" in result.output
+    assert (tmp_path / "data/cleaned/NFL_venue_geometry.npz").is_file()
+
+
+@patch("gridiron_edge.cli.stadiums.audit_stadium_coverage", return_value=pd.DataFrame())
+@patch("gridiron_edge.cli.stadiums.apply_approved_stadium_updates")
+@patch("gridiron_edge.cli.stadiums.load_schedule_upcoming_rich")
+@patch("gridiron_edge.cli.stadiums.load_stadiums")
+@patch("gridiron_edge.cli.stadiums.get_settings")
+def test_apply_rebuilds_venue_geometry(
+    settings: MagicMock,
+    stadiums: MagicMock,
+    _schedule: MagicMock,
+    apply: MagicMock,
+    _audit_mock: MagicMock,
+    tmp_path: Path,
+) -> None:
+    settings.return_value.repo_root = tmp_path
+    stadiums.return_value = pd.DataFrame(columns=["HOME_TEAM"])
+    apply.return_value = pd.DataFrame(
+        {
+            "HOME_TEAM": ["Kansas City Chiefs"],
+            "YEAR": ["2025-2026"],
+            "STADIUM": ["Arrowhead Stadium"],
+            "LATITUDE": [39.0489],
+            "LONGITUDE": [-94.4839],
+            "ALTITUDE": [274.0],
+        }
+    )
+    update_path = tmp_path / "review.csv"
+    _updates().to_csv(update_path, index=False)
+
+    result = runner.invoke(
+        _app(),
+        ["stadiums", "apply", "--updates", str(update_path), "--season", "2026-2027"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "venue geometry rebuilt: 1 venues" in result.output
+    assert (tmp_path / "data/cleaned/NFL_venue_geometry.npz").is_file()
+
+
 def test_stadiums_group_is_registered_on_main_app() -> None:
     from gridiron_edge.cli.main import app
 
@@ -199,6 +268,7 @@ def test_stadiums_group_is_registered_on_main_app() -> None:
     assert "stadiums" in result.output
 
 
+@patch("gridiron_edge.cli.stadiums.refresh_venue_geometry", return_value=None)
 @patch(
     "gridiron_edge.cli.stadiums.audit_stadium_coverage",
     return_value=pd.DataFrame(),
@@ -221,6 +291,7 @@ def test_apply_reports_zero_for_identical_reapplication(
     _schedule: MagicMock,
     apply: MagicMock,
     _audit_mock: MagicMock,
+    _refresh: MagicMock,
     tmp_path: Path,
 ) -> None:
     settings.return_value.repo_root = tmp_path
@@ -0,0 +1,107 @@
+"""Tests for the token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from gridiron_edge.core.ratelimit import TokenBucket
+
+
+class _FakeClock:
+    """Deterministic clock whose sleep advances time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _bucket(rate: float, capacity: float = 1.0) -> tuple[TokenBucket, _FakeClock]:
+    clock = _FakeClock()
+    return TokenBucket(rate, capacity, clock=clock, sleep=clock.sleep), clock
+
+
+class TestTokenBucket:
+    def test_burst_up_to_capacity_then_waits_for_refill(self) -> None:
+        bucket, clock = _bucket(rate=2.0, capacity=3.0)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3:] == [pytest.approx(0.5), pytest.approx(0.5)]
+        assert clock.now == pytest.approx(1.0)
+
+    def test_idle_time_refills_but_never_past_capacity(self) -> None:
+        bucket, clock = _bucket(rate=1.0, capacity=2.0)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += 100.0
+
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, pytest.approx(1.0)]
+
+    def test_pause_blocks_and_drains(self) -> None:
+        bucket, clock = _bucket(rate=10.0, capacity=5.0)
+
+        bucket.pause(2.0)
+        waited = bucket.acquire()
+
+        assert clock.now >= 2.0
+        assert waited == pytest.approx(2.1)
+
+    def test_shorter_pause_does_not_cut_an_active_one(self) -> None:
+        bucket, clock = _bucket(rate=100.0)
+
+        bucket.pause(5.0)
+        bucket.pause(1.0)
+        bucket.acquire()
+
+        assert clock.now >= 5.0
+
+    def test_per_minute(self) -> None:
+        bucket = TokenBucket.per_minute(600)
+
+        assert bucket.rate == pytest.approx(10.0)
+        assert bucket.capacity == pytest.approx(10.0)
+        assert TokenBucket.per_minute(30).capacity == 1.0
+
+    @pytest.mark.parametrize(("rate", "capacity"), [(0.0, 1.0), (1.0, 0.0), (-1.0, 1.0)])
+    def test_rejects_non_positive_settings(self, rate: float, capacity: float) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            TokenBucket(rate, capacity)
+
+    def test_rejects_requests_larger_than_capacity(self) -> None:
+        bucket, clock = _bucket(rate=10.0, capacity=2.0)
+
+        with pytest.raises(ValueError, match="cannot acquire"):
+            bucket.acquire(3.0)
+        assert bucket.acquire(2.0) == 0.0
+        assert clock.now == 0.0
+
+    def test_shared_across_threads_holds_the_rate(self) -> None:
+        bucket = TokenBucket(rate=200.0, capacity=1.0)
+        per_thread, threads = 10, 4
+
+        def worker() -> None:
+            for _ in range(per_thread):
+                bucket.acquire()
+
+        start = time.perf_counter()
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        # The first token is free; each of the remaining 39 needs 1/200 s.
+        assert elapsed >= (per_thread * threads - 1) / 200.0 * 0.95
@@ -0,0 +1,135 @@
+# tests/unit/datasets/test_columnar.py
+"""Tests for gridiron_edge.datasets.columnar."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+import pytest
+from tests.fixtures.dataframes import make_elo_state, make_games, make_stadiums
+
+from gridiron_edge.datasets.columnar import (
+    SCHEMAS,
+    TableSchema,
+    apply_schema,
+    columnar_path,
+    has_fresh_twin,
+    migrate_columnar,
+    read_table,
+    refresh_columnar_twin,
+    write_columnar_twin,
+)
+from gridiron_edge.datasets.loaders import load_csv, load_typed
+from gridiron_edge.datasets.registry import dataset_path
+from gridiron_edge.datasets.writers import write_csv
+
+
+def _games_with_nulls() -> DataFrame:
+    games = make_games(n=4)
+    games.loc[0, "FAVORITED"] = np.nan
+    games.loc[1, "OVER_UNDER"] = np.nan
+    return games
+
+
+def _age(path: Path, seconds: int) -> None:
+    """Push the modification time of *path* into the past."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 10**9))
+
+
+class TestReadTable:
+    @pytest.mark.parametrize(
+        ("key", "frame"),
+        [("games", _games_with_nulls()), ("elo_state", make_elo_state())],
+    )
+    def test_twin_matches_csv_parse(self, tmp_path: Path, key: str, frame: DataFrame) -> None:
+        write_csv(tmp_path, key, frame)  # type: ignore[arg-type]
+        write_columnar_twin(tmp_path, key)  # type: ignore[arg-type]
+        csv_path = dataset_path(tmp_path, key)  # type: ignore[arg-type]
+        assert has_fresh_twin(csv_path)
+
+        pd.testing.assert_frame_equal(read_table(csv_path), pd.read_csv(csv_path))
+
+    def test_declared_float_columns_are_float(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "stadiums", make_stadiums())
+        write_columnar_twin(tmp_path, "stadiums")
+        loaded = read_table(dataset_path(tmp_path, "stadiums"))
+        assert loaded["ALTITUDE"].dtype == np.float64
+        assert loaded["ALTITUDE"].tolist() == [10.0, 50.0]
+
+    def test_categorical_from_twin_and_csv_agree(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", _games_with_nulls())
+        from_csv = load_typed(tmp_path, "games")
+        write_columnar_twin(tmp_path, "games")
+        from_twin = load_typed(tmp_path, "games")
+
+        pd.testing.assert_frame_equal(from_twin, from_csv)
+        for column in ("HOME_TEAM", "AWAY_TEAM", "YEAR"):
+            assert isinstance(from_twin[column].dtype, pd.CategoricalDtype)
+        assert from_twin["FAVORITED"].isna().sum() == 1
+
+    def test_stale_twin_falls_back_to_csv(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", make_games(n=2))
+        write_columnar_twin(tmp_path, "games")
+        twin = columnar_path(dataset_path(tmp_path, "games"))
+        _age(twin, 60)
+
+        make_games(n=3).to_csv(dataset_path(tmp_path, "games"), index=False)
+
+        assert not has_fresh_twin(dataset_path(tmp_path, "games"))
+        assert len(load_csv(tmp_path, "games")) == 3
+
+    def test_read_kwargs_always_use_csv(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", make_games(n=5))
+        write_columnar_twin(tmp_path, "games")
+        assert len(load_csv(tmp_path, "games", nrows=2)) == 2
+
+    def test_twin_without_csv_is_read(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", make_games(n=2))
+        write_columnar_twin(tmp_path, "games")
+        dataset_path(tmp_path, "games").unlink()
+        assert len(load_csv(tmp_path, "games")) == 2
+
+
+class TestApplySchema:
+    def test_int_with_nulls_becomes_float(self) -> None:
+        schema = TableSchema({"WEEK_NUM": "int"})
+        out = apply_schema(pd.DataFrame({"WEEK_NUM": [1.0, np.nan]}), schema)
+        assert out["WEEK_NUM"].dtype == np.float64
+
+    def test_non_numeric_raises(self) -> None:
+        schema = TableSchema({"ELO": "float"})
+        with pytest.raises(ValueError, match="Unable to parse"):
+            apply_schema(pd.DataFrame({"ELO": ["1500", "high"]}), schema)
+
+    def test_missing_and_undeclared_columns_are_kept(self) -> None:
+        out = apply_schema(pd.DataFrame({"EXTRA": [1]}), SCHEMAS["games"])
+        assert out["EXTRA"].dtype == np.int64
+
+
+class TestMigration:
+    def test_migrates_present_keys_and_skips_missing(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", make_games(n=3))
+        write_csv(tmp_path, "elo_state", make_elo_state())
+
+        results = {result.key: result for result in migrate_columnar(tmp_path)}
+
+        assert set(results) == set(SCHEMAS)
+        assert results["games"].rows == 3
+        assert results["games"].columnar_path == columnar_path(dataset_path(tmp_path, "games"))
+        assert results["stadiums"].columnar_path is None
+
+    def test_write_csv_refreshes_existing_twin(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", make_games(n=2))
+        assert refresh_columnar_twin(tmp_path, "games") is None
+        write_columnar_twin(tmp_path, "games")
+
+        write_csv(tmp_path, "games", make_games(n=4))
+
+        csv_path = dataset_path(tmp_path, "games")
+        assert has_fresh_twin(csv_path)
+        assert len(pd.read_parquet(columnar_path(csv_path))) == 4
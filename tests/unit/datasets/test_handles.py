@@ -0,0 +1,129 @@
+# tests/unit/datasets/test_handles.py
+"""Tests for gridiron_edge.datasets.handles."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from tests.fixtures.dataframes import make_games
+
+from gridiron_edge.datasets.handles import DatasetHandle, SharedDatasets
+from gridiron_edge.datasets.writers import write_csv, write_parquet
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ELO": np.linspace(1400.0, 1600.0, 6),
+            "WEEK": np.arange(6, dtype=np.int64),
+            "TEAM": pd.Categorical(["KC", "LV", "KC", "LV", "KC", "LV"]),
+            "NOTE": ["a", None, "c", "d", "e", "f"],
+        }
+    )
+
+
+def _mean_elo(handle: DatasetHandle) -> tuple[float, bool]:
+    values = handle.column("ELO")
+    return float(values.mean()), bool(values.flags.writeable)
+
+
+class TestDatasetHandle:
+    def test_roundtrip_after_pickling(self, tmp_path: Path) -> None:
+        with SharedDatasets(tmp_path, scratch_root=tmp_path / "scratch") as shared:
+            handle = pickle.loads(pickle.dumps(shared.share("elo", _frame())))
+            pd.testing.assert_frame_equal(handle.to_pandas(), _frame())
+            assert (handle.rows, handle.columns) == (6, ("ELO", "WEEK", "TEAM", "NOTE"))
+
+    def test_fixed_width_columns_are_read_only_views(self, tmp_path: Path) -> None:
+        with SharedDatasets(tmp_path, scratch_root=tmp_path) as shared:
+            handle = shared.share("elo", _frame())
+            assert not handle.column("ELO").flags.writeable
+            assert not handle.to_pandas(["WEEK"])["WEEK"].to_numpy().flags.writeable
+            assert handle.column("NOTE").tolist() == ["a", None, "c", "d", "e", "f"]
+
+    def test_empty_dataset_columns_are_empty_arrays(self, tmp_path: Path) -> None:
+        with SharedDatasets(tmp_path, scratch_root=tmp_path) as shared:
+            handle = shared.share("elo", _frame().iloc[:0])
+            assert handle.column("ELO").shape == (0,)
+            assert handle.column("NOTE").tolist() == []
+
+    def test_arrays_roundtrip_as_read_only_views(self, tmp_path: Path) -> None:
+        matrix = np.arange(12, dtype=np.float64).reshape(4, 3)
+        vector = np.array([1, 0, 1, 1], dtype=np.int64)
+        with SharedDatasets(tmp_path, scratch_root=tmp_path) as shared:
+            x = pickle.loads(pickle.dumps(shared.share_array("x", matrix)))
+            y = shared.share_array("y", vector)
+            np.testing.assert_array_equal(x.array(), matrix)
+            np.testing.assert_array_equal(y.array(), vector)
+            assert not x.array().flags.writeable
+            assert x.array()[np.array([0, 2])].tolist() == [[0.0, 1.0, 2.0], [6.0, 7.0, 8.0]]
+            assert shared.share_array("empty", matrix[:0]).array().shape == (0, 3)
+
+    def test_array_rejects_frames_and_unsupported_shapes(self, tmp_path: Path) -> None:
+        with SharedDatasets(tmp_path, scratch_root=tmp_path) as shared:
+            with pytest.raises(ValueError, match="not a shared array"):
+                shared.share("elo", _frame()).array()
+            with pytest.raises(ValueError, match="Cannot share array"):
+                shared.share_array("cube", np.zeros((2, 2, 2)))
+
+    def test_workers_read_the_shared_file(self, tmp_path: Path) -> None:
+        with (
+            SharedDatasets(tmp_path, scratch_root=tmp_path) as shared,
+            ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn")) as pool,
+        ):
+            handle = shared.share("elo", _frame())
+            results = list(pool.map(_mean_elo, [handle] * 4))
+        assert results == [(1500.0, False)] * 4
+
+
+class TestSharedDatasets:
+    def test_materialize_registered_keys_once(self, tmp_path: Path) -> None:
+        write_csv(tmp_path, "games", make_games(n=3))
+        write_parquet(tmp_path, "modeling_full", _frame())
+        with SharedDatasets(tmp_path, scratch_root=tmp_path / "scratch") as shared:
+            games = shared.materialize("games")
+            assert shared.materialize("games") is games
+            loaded = games.to_pandas()
+            assert len(loaded) == 3
+            assert isinstance(loaded["HOME_TEAM"].dtype, pd.CategoricalDtype)
+            assert shared.materialize("modeling_full").rows == 6
+
+    def test_rejects_non_table_keys_and_duplicates(self, tmp_path: Path) -> None:
+        with SharedDatasets(tmp_path, scratch_root=tmp_path) as shared:
+            with pytest.raises(ValueError, match="not a table"):
+                shared.materialize("venue_geometry")
+            shared.share("elo", _frame())
+            with pytest.raises(ValueError, match="already shared"):
+                shared.share("elo", _frame())
+
+    def test_exit_removes_scratch(self, tmp_path: Path) -> None:
+        with SharedDatasets(tmp_path, scratch_root=tmp_path) as shared:
+            handle = shared.share("elo", _frame())
+            directory = shared.directory
+        assert shared.closed
+        assert not directory.exists()
+        with pytest.raises(FileNotFoundError):
+            handle.table()
+        with pytest.raises(RuntimeError, match="closed"):
+            shared.share("other", _frame())
+
+    def test_removes_scopes_of_dead_owners(self, tmp_path: Path) -> None:
+        finished = subprocess.run(
+            [sys.executable, "-c", "import os; print(os.getpid())"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        orphan = tmp_path / f"gridiron-datasets-{finished.stdout.strip()}-abc"
+        orphan.mkdir()
+        with SharedDatasets(tmp_path, scratch_root=tmp_path) as shared:
+            assert not orphan.exists()
+            assert shared.directory.exists()
@@ -12,8 +12,8 @@ class TestDatasetRegistry:
     def test_datasets_not_empty(self) -> None:
         assert len(DATASETS) > 0
 
-    def test_has_20_keys(self) -> None:
-        assert len(DATASETS) == 20
+    def test_has_23_keys(self) -> None:
+        assert len(DATASETS) == 23
 
     def test_all_values_are_dataset_spec(self) -> None:
         for key, spec in DATASETS.items():
@@ -34,7 +34,9 @@ class TestDatasetRegistry:
             "schedule_upcoming_rich",
             "weather_enriched",
             "elo_state",
+            "elo_matrix",
             "stadiums",
+            "venue_geometry",
             "moneylines",
             "team_metadata",
             "epa_by_game",
@@ -51,6 +53,8 @@ class TestDatasetRegistry:
             "predictions_csv",
             "elo_rankings_csv",
             "weekly_products",
+            # Materialized evaluation join
+            "evaluation_joined",
         }
         assert set(DATASETS.keys()) == expected
         assert DATASETS["schedule_upcoming_rich"].relpath.endswith(".parquet")
@@ -0,0 +1,143 @@
+# tests/unit/evaluation/test_joined.py
+"""Tests for the materialized evaluation_joined store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from tests.fixtures.dataframes import make_games, make_predictions
+
+from gridiron_edge.datasets import loaders
+from gridiron_edge.datasets.writers import write_csv
+from gridiron_edge.evaluation.archive import append_to_prediction_log, load_prediction_log
+from gridiron_edge.evaluation.joined import (
+    join_outcomes,
+    load_evaluation_joined,
+    refresh_evaluation_joined,
+)
+from gridiron_edge.evaluation.metrics import build_evaluation_df
+
+_STORE = "data/output/evaluation/evaluation_joined"
+
+
+def _write_games(repo: Path, *, third_played: bool) -> None:
+    overrides = [
+        {"GAME_ID": "2025_01_KC_LAC", "AWAY_SCORE": 24, "HOME_SCORE": 20},
+        {"GAME_ID": "2025_02_KC_LAC", "AWAY_SCORE": 17, "HOME_SCORE": 17},
+        {
+            "GAME_ID": "2025_03_KC_LAC",
+            "AWAY_SCORE": 10 if third_played else None,
+            "HOME_SCORE": 13 if third_played else None,
+        },
+        {"GAME_ID": "2026_01_KC_LAC", "AWAY_SCORE": 3, "HOME_SCORE": 30},
+    ]
+    write_csv(repo, "games", make_games(overrides))
+
+
+def _archive(
+    repo: Path, model_type: str, *, season: str = "2025-2026", prefix: str = "2025"
+) -> None:
+    append_to_prediction_log(
+        make_predictions(n=3, season=season, game_id_prefix=prefix),
+        model_name="win_prob",
+        model_type=model_type,
+        season=season,
+        week=1,
+        repo=repo,
+    )
+
+
+def _live_join(repo: Path) -> pd.DataFrame:
+    return join_outcomes(load_prediction_log(repo=repo), loaders.load_games(repo))
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _write_games(tmp_path, third_played=False)
+    _archive(tmp_path, "elo")
+    _archive(tmp_path, "logistic")
+    return tmp_path
+
+
+class TestRefreshEvaluationJoined:
+    def test_archive_writes_materialize_partitions(self, repo: Path) -> None:
+        stored = load_evaluation_joined(repo=repo)
+
+        assert stored is not None
+        pd.testing.assert_frame_equal(stored, _live_join(repo))
+        assert len(stored) == 4
+        assert (repo / _STORE / "win_prob/elo/2025-2026.parquet").exists()
+
+    def test_unchanged_inputs_skip(self, repo: Path) -> None:
+        result = refresh_evaluation_joined(repo)
+
+        assert result.skipped
+        assert result.unchanged == 2
+
+    def test_new_predictions_write_only_their_partition(self, repo: Path) -> None:
+        existing = {path: path.stat().st_mtime_ns for path in (repo / _STORE).rglob("*.parquet")}
+
+        _archive(repo, "elo", season="2026-2027", prefix="2026")
+
+        assert {path: path.stat().st_mtime_ns for path in existing} == existing
+        assert (repo / _STORE / "win_prob/elo/2026-2027.parquet").exists()
+        assert refresh_evaluation_joined(repo, force=True).written == []
+        stored = load_evaluation_joined(season="2026-2027", repo=repo)
+        assert stored is not None
+        assert stored["game_id"].tolist() == ["2026_01_KC_LAC"]
+
+    def test_finished_game_rewrites_every_pair_that_predicted_it(self, repo: Path) -> None:
+        _write_games(repo, third_played=True)
+
+        result = refresh_evaluation_joined(repo)
+
+        assert sorted(result.written) == [
+            ("win_prob", "elo", "2025-2026"),
+            ("win_prob", "logistic", "2025-2026"),
+        ]
+        stored = load_evaluation_joined(repo=repo)
+        assert stored is not None
+        pd.testing.assert_frame_equal(stored, _live_join(repo))
+
+    def test_removed_predictions_drop_their_partition(self, repo: Path) -> None:
+        log = load_prediction_log(repo=repo)
+        log.loc[log["model_type"] == "elo", :].to_parquet(
+            repo / "data/output/predictions/predictions_log.parquet", index=False
+        )
+
+        result = refresh_evaluation_joined(repo)
+
+        assert result.removed == [("win_prob", "logistic", "2025-2026")]
+        assert not list((repo / _STORE / "win_prob/logistic").glob("*.parquet"))
+
+
+class TestLoadEvaluationJoined:
+    def test_reads_only_the_requested_slice(self, repo: Path) -> None:
+        stored = load_evaluation_joined(model_name="win_prob", model_type="logistic", repo=repo)
+
+        assert stored is not None
+        assert set(stored["model_type"]) == {"logistic"}
+        assert load_evaluation_joined(season="1999-2000", repo=repo).empty  # type: ignore[union-attr]
+
+    def test_stale_store_is_ignored(self, repo: Path) -> None:
+        # Written directly rather than through the cleaner, so no refresh runs.
+        _write_games(repo, third_played=True)
+
+        assert load_evaluation_joined(repo=repo) is None
+        result = build_evaluation_df(model_type="elo", repo=repo)
+        assert len(result) == 3
+
+    def test_missing_store(self, tmp_path: Path) -> None:
+        assert load_evaluation_joined(repo=tmp_path) is None
+        assert refresh_evaluation_joined(tmp_path).skipped
+        assert not (tmp_path / "data/output/evaluation").exists()
+
+
+def test_build_evaluation_df_reads_the_store(repo: Path) -> None:
+    result = build_evaluation_df(model_type="elo", season="2025-2026", repo=repo)
+
+    expected = _live_join(repo)
+    expected = expected.loc[expected["model_type"] == "elo", :].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
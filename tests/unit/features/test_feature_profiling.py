@@ -0,0 +1,161 @@
+# tests/unit/features/test_feature_profiling.py
+"""Tests for per-feature profiling around run_features."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gridiron_edge.features.base import FeatureSpec
+from gridiron_edge.features.manifest import read_manifest, write_manifest
+from gridiron_edge.features.profiling import FeatureProfiler
+from gridiron_edge.features.registry import FeatureRegistry, run_features
+
+
+class _FakeAccessor:
+    """Accessor stand-in returning fixed frames and counting calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def games(self) -> pd.DataFrame:
+        self.calls.append("games")
+        return pd.DataFrame({"GAME_ID": ["a", "b", "c"]})
+
+    def stadiums(self) -> pd.DataFrame:
+        self.calls.append("stadiums")
+        return pd.DataFrame({"STADIUM": ["x"]})
+
+
+class _LoadsGamesTwice:
+    spec = FeatureSpec(name="test_loads_games", produces=["N_GAMES"])
+
+    def compute(self, *, df: pd.DataFrame, datasets) -> pd.DataFrame:
+        games = datasets.games()
+        datasets.games()
+        return df.assign(N_GAMES=len(games))
+
+
+class _DropsRows:
+    spec = FeatureSpec(name="test_drops_rows", produces=["STADIUMS"])
+
+    def compute(self, *, df: pd.DataFrame, datasets) -> pd.DataFrame:
+        return df.iloc[:1].assign(STADIUMS=len(datasets.stadiums()))
+
+
+@pytest.fixture
+def _fake_features(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(FeatureRegistry._features, "test_loads_games", _LoadsGamesTwice)
+    monkeypatch.setitem(FeatureRegistry._features, "test_drops_rows", _DropsRows)
+
+
+@pytest.mark.usefixtures("_fake_features")
+class TestRunFeaturesProfiling:
+    def test_profiles_each_feature_in_order(self) -> None:
+        accessor = _FakeAccessor()
+        profiler = FeatureProfiler()
+        out = run_features(
+            df=pd.DataFrame({"GAME_ID": ["a", "b"]}),
+            feature_names=["test_loads_games", "test_drops_rows"],
+            datasets=accessor,  # type: ignore[arg-type]
+            profiler=profiler,
+        )
+
+        assert out.to_dict("list") == {"GAME_ID": ["a"], "N_GAMES": [3], "STADIUMS": [1]}
+        assert accessor.calls == ["games", "games", "stadiums"]
+
+        first, second = profiler.profiles
+        assert (first.name, first.rows_in, first.rows_out) == ("test_loads_games", 2, 2)
+        assert (second.name, second.rows_in, second.rows_out) == ("test_drops_rows", 2, 1)
+        assert [(load.dataset, load.rows) for load in first.dataset_loads] == [
+            ("games", 3),
+            ("games", 3),
+        ]
+        assert [load.dataset for load in second.dataset_loads] == ["stadiums"]
+        for profile in profiler.profiles:
+            assert profile.seconds >= profile.dataset_seconds >= 0.0
+            assert profile.peak_memory_bytes >= 0
+
+    def test_output_matches_unprofiled_run(self) -> None:
+        df = pd.DataFrame({"GAME_ID": ["a", "b"]})
+        names = ["test_loads_games", "test_drops_rows"]
+        plain = run_features(df=df, feature_names=names, datasets=_FakeAccessor())  # type: ignore[arg-type]
+        profiled = run_features(
+            df=df,
+            feature_names=names,
+            datasets=_FakeAccessor(),  # type: ignore[arg-type]
+            profiler=FeatureProfiler(),
+        )
+        pd.testing.assert_frame_equal(plain, profiled)
+
+    def test_failed_feature_records_no_profile(self) -> None:
+        class _Broken(_FakeAccessor):
+            def games(self) -> pd.DataFrame:
+                raise FileNotFoundError("games")
+
+        profiler = FeatureProfiler()
+        with pytest.raises(FileNotFoundError):
+            run_features(
+                df=pd.DataFrame({"GAME_ID": ["a"]}),
+                feature_names=["test_loads_games"],
+                datasets=_Broken(),  # type: ignore[arg-type]
+                profiler=profiler,
+            )
+        assert profiler.profiles == []
+
+
+def test_peak_memory_is_measured_per_feature() -> None:
+    def allocates(*, df: pd.DataFrame, datasets) -> pd.DataFrame:
+        block = np.ones(4 * 2**20 // 8)
+        return df.assign(TOTAL=float(block.sum()))
+
+    def small(*, df: pd.DataFrame, datasets) -> pd.DataFrame:
+        return df
+
+    profiler = FeatureProfiler()
+    for name, compute in [("allocates", allocates), ("small", small), ("again", allocates)]:
+        profiler.run(name, compute, df=pd.DataFrame({"GAME_ID": ["a"]}), datasets=_FakeAccessor())  # type: ignore[arg-type]
+
+    first, second, third = (profile.peak_memory_bytes for profile in profiler.profiles)
+    # A later feature is not hidden behind an earlier, larger peak.
+    assert first >= 4 * 2**20
+    assert third >= 4 * 2**20
+    assert second < 2**20
+    assert not tracemalloc.is_tracing()
+
+
+def test_manifest_records_profile(tmp_path: Path) -> None:
+    profiler = FeatureProfiler()
+    profiler.run(
+        "test_loads_games",
+        _LoadsGamesTwice().compute,
+        df=pd.DataFrame({"GAME_ID": ["a"]}),
+        datasets=_FakeAccessor(),  # type: ignore[arg-type]
+    )
+    write_manifest(
+        pd.DataFrame({"GAME_ID": ["a"]}),
+        feature_names=["test_loads_games"],
+        feature_columns=["N_GAMES"],
+        modeling_dir=tmp_path,
+        feature_profile=profiler.to_records(),
+    )
+
+    (record,) = read_manifest(tmp_path)["feature_profile"]
+    assert record["name"] == "test_loads_games"
+    assert [load["dataset"] for load in record["dataset_loads"]] == ["games", "games"]
+    json.dumps(record)
+
+
+def test_manifest_omits_profile_by_default(tmp_path: Path) -> None:
+    write_manifest(
+        pd.DataFrame({"GAME_ID": ["a"]}),
+        feature_names=[],
+        feature_columns=[],
+        modeling_dir=tmp_path,
+    )
+    assert "feature_profile" not in read_manifest(tmp_path)
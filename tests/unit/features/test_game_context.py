@@ -353,6 +353,20 @@ class TestDeriveRestDays:
         assert kc_wk2["rest_days"].iloc[0] == 7
         assert lv_wk3["rest_days"].iloc[0] == 14  # bye week
 
+    def test_teammates_share_team_rest(self) -> None:
+        """Several players on one team in one game all get the team's rest."""
+        df = pd.DataFrame(
+            {
+                "player_id": ["P1", "P2", "P3", "P1", "P2"],
+                "team": ["KC", "KC", "KC", "KC", "KC"],
+                "week": [1, 1, 1, 2, 2],
+                "GAME_DATE": ["2024-09-08"] * 3 + ["2024-09-15"] * 2,
+            }
+        )
+        result: DataFrame = _derive_rest_days(df)
+        assert result.loc[result["week"] == 1, "rest_days"].isna().all()
+        assert result.loc[result["week"] == 2, "rest_days"].tolist() == [7.0, 7.0]
+
 
 class TestDropRawGameColumns:
     """Verify intermediate columns are cleaned up."""
@@ -4,9 +4,11 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 import inspect
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 import pytest
@@ -15,6 +17,7 @@ from gridiron_edge.datasets.accessor import DatasetAccessor
 from gridiron_edge.features.registry import FeatureRegistry
 from gridiron_edge.features.team.rest import (
     HomeAwayRestFeature,
+    days_since_previous_game,
 )
 
 
@@ -281,3 +284,91 @@ def test_canonical_class_has_no_retired_orientation_names() -> None:
     assert "TEAM_A" not in source
     assert "TEAM_B" not in source
     assert "HOME_FIELD" not in source
+
+
+def _reference_days_rest(
+    teams: list[object],
+    dates: pd.Series,
+    games: DataFrame,
+) -> list[float]:
+    """Per-row bisect over per-team sorted dates (the previous implementation)."""
+    team_games = pd.concat(
+        [
+            games.loc[:, ["GAME_DATE", "AWAY_TEAM"]].rename(columns={"AWAY_TEAM": "TEAM"}),
+            games.loc[:, ["GAME_DATE", "HOME_TEAM"]].rename(columns={"HOME_TEAM": "TEAM"}),
+        ],
+        ignore_index=True,
+    )
+    team_games["_DATE"] = pd.to_datetime(team_games["GAME_DATE"], errors="coerce")
+    team_games = team_games.dropna(subset=["TEAM", "_DATE"])
+    history = {
+        str(team): sorted(group["_DATE"].tolist()) for team, group in team_games.groupby("TEAM")
+    }
+
+    values: list[float] = []
+    for team, date in zip(teams, dates, strict=True):
+        if pd.isna(team) or pd.isna(date) or not str(team).strip():
+            values.append(float("nan"))
+            continue
+        team_dates = history.get(str(team).strip(), [])
+        index = bisect_left(team_dates, date)
+        values.append(float((date - team_dates[index - 1]).days) if index else float("nan"))
+    return values
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_columnar_rest_matches_per_row_bisect(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    teams = np.array([f"Team {i:02d}" for i in range(12)], dtype=object)
+    n_games = 300
+    days = rng.integers(0, 900, size=n_games)
+    away_codes = rng.integers(0, len(teams), size=n_games)
+    home_codes = (away_codes + rng.integers(1, len(teams), size=n_games)) % len(teams)
+    games = DataFrame(
+        {
+            "GAME_ID": [f"g{i}" for i in range(n_games)],
+            "GAME_DATE": (pd.Timestamp("2022-09-01") + pd.to_timedelta(days, unit="D")).strftime(
+                "%Y-%m-%d"
+            ),
+            "AWAY_TEAM": teams[away_codes],
+            "HOME_TEAM": teams[home_codes],
+        }
+    )
+    games.loc[rng.random(n_games) < 0.03, "GAME_DATE"] = "not-a-date"
+
+    n_targets = 200
+    target_days = rng.integers(-30, 960, size=n_targets)
+    target = DataFrame(
+        {
+            "GAME_ID": [f"t{i}" for i in range(n_targets)],
+            "GAME_DATE": (
+                pd.Timestamp("2022-09-01") + pd.to_timedelta(target_days, unit="D")
+            ).strftime("%Y-%m-%d"),
+            "AWAY_TEAM": rng.choice(np.r_[teams, [None, " ", "Unknown"]], size=n_targets),
+            "HOME_TEAM": rng.choice(teams, size=n_targets),
+        }
+    )
+    # Targets on a historical game date must look strictly before it.
+    target.loc[:9, "GAME_DATE"] = games["GAME_DATE"].iloc[:10].to_numpy()
+    target.loc[:9, "HOME_TEAM"] = games["HOME_TEAM"].iloc[:10].to_numpy()
+    target.loc[10, "GAME_DATE"] = None
+
+    result = HomeAwayRestFeature().compute(df=target, datasets=_datasets(games))
+
+    dates = pd.to_datetime(target["GAME_DATE"], format="%Y-%m-%d", errors="coerce")
+    for side in ("AWAY", "HOME"):
+        expected = _reference_days_rest(target[f"{side}_TEAM"].tolist(), dates, games)
+        np.testing.assert_array_equal(result[f"{side}_DAYS_REST"].to_numpy(), expected)
+
+
+def test_days_since_previous_game_ignores_same_day_history() -> None:
+    rest = days_since_previous_game(
+        pd.Series(["A", "A", "B"]),
+        pd.to_datetime(pd.Series(["2024-09-15", "2024-09-08", "2024-09-15"])),
+        history_teams=pd.Series(["A", "A", "B"]),
+        history_dates=pd.to_datetime(pd.Series(["2024-09-08", "2024-09-15", "2024-09-15"])),
+    )
+
+    assert rest[0] == 7.0
+    assert np.isnan(rest[1])
+    assert np.isnan(rest[2])
@@ -5,6 +5,8 @@
 from __future__ import annotations
 
 import inspect
+import subprocess
+import sys
 from unittest.mock import MagicMock
 
 import pandas as pd
@@ -14,6 +16,7 @@ import pytest
 from gridiron_edge.datasets.accessor import DatasetAccessor
 from gridiron_edge.features.registry import FeatureRegistry
 from gridiron_edge.features.team.travel import HomeAwayTravelFeature
+from gridiron_edge.metadata.stadium_sync import build_venue_geometry
 
 
 def _datasets(
@@ -27,6 +30,7 @@ def _datasets(
     datasets.games.return_value = games.copy()
     datasets.schedule_upcoming_rich.return_value = upcoming.copy()
     datasets.stadiums.return_value = stadiums.copy()
+    datasets.venue_geometry.return_value = build_venue_geometry(stadiums)
     return datasets
 
 
@@ -341,3 +345,73 @@ def test_canonical_class_has_no_retired_orientation_names() -> None:
     assert "TEAM_A" not in source
     assert "TEAM_B" not in source
     assert "HOME_FIELD" not in source
+
+
+@pytest.mark.parametrize("artifact", ["missing", "stale"])
+def test_missing_or_stale_geometry_is_rebuilt_in_memory(artifact: str) -> None:
+    datasets = _datasets(
+        games=_historical_games(),
+        upcoming=DataFrame(),
+        stadiums=_stadiums(),
+    )
+    if artifact == "missing":
+        datasets.venue_geometry.side_effect = FileNotFoundError
+    else:
+        datasets.venue_geometry.return_value = build_venue_geometry(_stadiums().iloc[:1])
+
+    result = HomeAwayTravelFeature().compute(df=_target(), datasets=datasets)
+
+    pd.testing.assert_frame_equal(result, _compute())
+
+
+def test_timezone_shift_uses_offset_on_game_date() -> None:
+    stadiums = pd.concat(
+        [
+            _stadiums(),
+            DataFrame(
+                [
+                    {
+                        "HOME_TEAM": "Arizona Cardinals",
+                        "YEAR": "2025-2026",
+                        "STADIUM": "State Farm Stadium",
+                        "LATITUDE": 33.5276,
+                        "LONGITUDE": -112.2626,
+                        "ALTITUDE": 331.0,
+                    }
+                ]
+            ),
+        ],
+        ignore_index=True,
+    )
+    target = DataFrame(
+        {
+            "GAME_ID": ["2025_01_ARI_LV", "2025_14_ARI_LV"],
+            "YEAR": ["2025-2026", "2025-2026"],
+            "GAME_DATE": ["2025-09-14", "2025-12-07"],
+            "AWAY_TEAM": ["Arizona Cardinals", "Arizona Cardinals"],
+            "HOME_TEAM": ["Las Vegas Raiders", "Las Vegas Raiders"],
+        }
+    )
+    games = DataFrame(
+        {
+            "GAME_ID": ["2025_01_ARI_LV", "2025_14_ARI_LV"],
+            "STADIUM": ["Allegiant Stadium", "Allegiant Stadium"],
+        }
+    )
+
+    result = _compute(target=target, games=games, stadiums=stadiums)
+
+    # Phoenix stays on UTC-7; Las Vegas is UTC-7 in September and UTC-8 in December.
+    assert result["AWAY_TZ_SHIFT"].tolist() == [0, 1]
+    assert result["HOME_TZ_SHIFT"].tolist() == [0, 0]
+
+
+def test_feature_import_does_not_load_timezone_polygons() -> None:
+    probe = "import sys, gridiron_edge.features.team.travel; print('timezonefinder' in sys.modules)"
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == "False"
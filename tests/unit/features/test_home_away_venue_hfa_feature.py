@@ -7,13 +7,18 @@ from __future__ import annotations
 import inspect
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 import pytest
 
 from gridiron_edge.datasets.accessor import DatasetAccessor
 from gridiron_edge.features.registry import FeatureRegistry
-from gridiron_edge.features.team.venue_hfa import HomeAwayVenueHFAFeature
+from gridiron_edge.features.team.venue_hfa import (
+    _MIN_HOME_GAMES,
+    HomeAwayVenueHFAFeature,
+    _build_home_advantage_history,
+)
 
 
 def _datasets(games: DataFrame) -> MagicMock:
@@ -370,3 +375,84 @@ def test_canonical_class_has_no_retired_orientation_names() -> None:
     assert "WINNER" not in source
     assert "LOSER" not in source
     assert "GAME_LOCATION" not in source
+
+
+def _reference_hfa(history: DataFrame, *, home_team: str, season_start: int, week: int) -> float:
+    """Per-target boolean-filter implementation the cumulative version replaced."""
+    prior = history.loc[
+        (history["_SEASON_START"] < season_start)
+        | (history["_SEASON_START"].eq(season_start) & history["WEEK_NUM"].lt(week)),
+        :,
+    ]
+    if prior.empty:
+        return 0.0
+    team_results = prior.loc[prior["HOME_TEAM"].astype(str).eq(home_team), "_HOME_RESULT"]
+    if len(team_results) < _MIN_HOME_GAMES:
+        return 0.0
+    return float(team_results.mean()) - float(prior["_HOME_RESULT"].mean())
+
+
+def _random_history(seed: int) -> DataFrame:
+    """Several seasons of random results, ties, neutral sites, and unplayed games."""
+    rng = np.random.default_rng(seed)
+    teams = [f"Team {index:02d}" for index in range(8)]
+    rows: list[dict[str, object]] = []
+    for season in range(2015, 2021):
+        for week in range(1, 19):
+            for slot, home in enumerate(rng.choice(teams, size=4, replace=False)):
+                home_score: int | None = None
+                away_score: int | None = None
+                if season < 2020 or week < 10:
+                    home_score = int(rng.integers(10, 35))
+                    tie = rng.random() < 0.05
+                    away_score = home_score if tie else int(rng.integers(10, 35))
+                rows.append(
+                    _game(
+                        game_id=f"{season}-{week}-{slot}",
+                        year=f"{season}-{season + 1}",
+                        week=week,
+                        home_team=str(home),
+                        away_score=away_score,
+                        home_score=home_score,
+                        neutral=int(rng.random() < 0.03),
+                    )
+                )
+    return DataFrame(rows)
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_cumulative_hfa_matches_per_target_filters(seed: int) -> None:
+    games = _random_history(seed)
+    history = _build_home_advantage_history(games)
+    targets = DataFrame(
+        {
+            "GAME_ID": [f"t{index}" for index in range(120)],
+            "YEAR": [f"{season}-{season + 1}" for season in np.repeat(range(2014, 2022), 15)],
+            "WEEK_NUM": np.tile(range(1, 16), 8) + 3,
+            "AWAY_TEAM": "Away",
+            "HOME_TEAM": [f"Team {index % 10:02d}" for index in range(120)],
+            "IS_NEUTRAL_SITE": [int(index % 17 == 0) for index in range(120)],
+        }
+    )
+
+    result = _compute(target=targets, games=games)
+
+    expected = [
+        0.0
+        if neutral
+        else _reference_hfa(
+            history,
+            home_team=team,
+            season_start=int(year.split("-")[0]),
+            week=int(week),
+        )
+        for team, year, week, neutral in zip(
+            targets["HOME_TEAM"],
+            targets["YEAR"],
+            targets["WEEK_NUM"],
+            targets["IS_NEUTRAL_SITE"],
+            strict=True,
+        )
+    ]
+    assert any(value != 0.0 for value in expected)
+    assert result["HOME_FRANCHISE_HFA"].tolist() == expected
@@ -213,3 +213,43 @@ class TestVectorizedEquivalence:
             prior_3 = player[player["week"].isin([1, 2, 3])]["passing_yards"].values
             w4_mean = player[player["week"] == 4]["passing_yards_L3_mean"].iloc[0]
             assert w4_mean == pytest.approx(prior_3.mean()), f"player {pid} mismatch"
+
+
+def _reference_rolling(df: DataFrame, windows: list[int], cross_season: bool) -> DataFrame:
+    """Pre-kernel pandas implementation (groupby shift + rolling per window)."""
+    group_cols = ["player_id"] if cross_season else ["player_id", "season"]
+    df = df.sort_values(["player_id", "season", "week"]).copy()
+    stats = [c for c in ROLLING_STAT_COLS if c in df.columns]
+    shifted = df.groupby(group_cols, sort=False)[stats].shift(1)
+    for window in windows:
+        grouped = shifted.groupby([df[c] for c in group_cols], sort=False)
+        means = grouped.rolling(window=window, min_periods=1).mean()
+        stds = grouped.rolling(window=window, min_periods=1).std()
+        levels = list(range(len(group_cols)))
+        means = means.reset_index(level=levels, drop=True).sort_index()
+        stds = stds.reset_index(level=levels, drop=True).sort_index()
+        for stat in stats:
+            df[f"{stat}_L{window}_mean"] = means[stat]
+            df[f"{stat}_L{window}_std"] = stds[stat]
+    return df
+
+
+class TestKernelParity:
+    """The single-pass kernel must reproduce the pandas rolling output."""
+
+    @pytest.mark.parametrize("cross_season", [False, True])
+    def test_matches_pandas_reference(self, cross_season: bool) -> None:
+        frames = [
+            _make_player_season(player_id=pid, season=season, n_weeks=n)
+            for pid, season, n in [("P2", 2023, 7), ("P1", 2023, 4), ("P1", 2024, 9)]
+        ]
+        df = pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=7)
+        # Sparse stats exercise NaN-skipping and the min_periods=1 / std<2 paths.
+        df.loc[df.index[::3], "passing_cpoe"] = np.nan
+        df.loc[df.index[::2], "receiving_yards"] = np.nan
+
+        expected = _reference_rolling(df, [3, 6], cross_season)
+        result = _compute_rolling(df, windows=[3, 6], cross_season=cross_season)
+
+        assert list(result.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-9)
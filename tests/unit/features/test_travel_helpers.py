@@ -7,7 +7,7 @@ import numpy as np
 from numpy import ndarray
 import pytest
 
-from gridiron_edge.features.team.travel import _haversine_km
+from gridiron_edge.metadata.stadium_sync import _haversine_km
 
 
 class TestHaversineKm:
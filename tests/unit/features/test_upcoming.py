@@ -0,0 +1,63 @@
+# tests/unit/features/test_upcoming.py
+"""Tests for the shared upcoming-schedule feature context."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+from tests.fixtures.dataframes import make_games
+
+from gridiron_edge.datasets.writers import write_csv
+from gridiron_edge.features.pipeline import CANONICAL_FEATURES
+from gridiron_edge.features.upcoming import UpcomingFeatureContext
+
+
+def _schedule() -> pd.DataFrame:
+    return pd.DataFrame({"GAME_ID": ["g1", "g2"], "AWAY_TEAM": ["A", "B"], "HOME_TEAM": ["C", "D"]})
+
+
+class _Builder:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(self, *, df: pd.DataFrame, feature_names: Any, datasets: Any) -> pd.DataFrame:
+        self.calls.append({"feature_names": feature_names, "repo": datasets.repo})
+        return df.assign(FEATURE=range(len(df)))
+
+
+def test_features_are_built_once_per_schedule(tmp_path: Path) -> None:
+    build = _Builder()
+    context = UpcomingFeatureContext(tmp_path, build=build)
+
+    first = context.features(_schedule())
+    second = context.features(_schedule())
+
+    pd.testing.assert_frame_equal(first, second)
+    assert first is not second
+    assert (context.hits, context.misses) == (1, 1)
+    assert build.calls == [{"feature_names": CANONICAL_FEATURES, "repo": tmp_path}]
+
+
+def test_returned_frames_are_independent_copies(tmp_path: Path) -> None:
+    context = UpcomingFeatureContext(tmp_path, build=_Builder())
+    schedule = _schedule()
+
+    context.features(schedule)["FEATURE"] = -1
+
+    assert context.features(schedule)["FEATURE"].tolist() == [0, 1]
+    assert "FEATURE" not in schedule.columns
+
+
+def test_schedule_or_input_changes_rebuild(tmp_path: Path) -> None:
+    build = _Builder()
+    context = UpcomingFeatureContext(tmp_path, build=build)
+    context.features(_schedule())
+
+    context.features(_schedule().iloc[:1])
+    write_csv(tmp_path, "games", make_games(n=2))
+    context.features(_schedule())
+
+    assert context.misses == 3
+    assert context.hits == 0
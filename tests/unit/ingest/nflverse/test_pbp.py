@@ -0,0 +1,146 @@
+# tests/unit/ingest/nflverse/test_pbp.py
+
+"""Tests for parallel per-season PBP ingestion and its integrity manifest."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from tests.fixtures.nflverse import FixtureSeasonLoader, pbp_season
+
+from gridiron_edge.ingest.nflverse.manifest import (
+    changed_seasons,
+    content_sha256,
+    load_manifest,
+    load_source_hashes,
+    manifest_path,
+    write_source_hashes,
+)
+from gridiron_edge.ingest.nflverse.pbp import (
+    _KEEP_COLUMNS,
+    fetch_pbp,
+    load_pbp,
+    load_pbp_manifest,
+)
+
+SEASONS = [2019, 2020, 2021, 2022, 2023, 2024]
+
+
+def _pbp_dir(repo: Path) -> Path:
+    return repo / "data" / "raw" / "pbp"
+
+
+@pytest.fixture
+def loader() -> FixtureSeasonLoader:
+    return FixtureSeasonLoader({season: pbp_season(season) for season in SEASONS})
+
+
+class TestContentHash:
+    def test_ignores_index_and_copies(self) -> None:
+        df = pbp_season(2024)
+
+        assert content_sha256(df) == content_sha256(df.copy().set_index(df.index + 100))
+
+    def test_tracks_values_and_dtypes(self) -> None:
+        df = pbp_season(2024)
+        edited = df.copy()
+        edited.loc[3, "epa"] += 0.01
+
+        assert content_sha256(edited) != content_sha256(df)
+        assert content_sha256(df.astype({"week": "int32"})) != content_sha256(df)
+
+
+class TestFetchPbp:
+    def test_writes_pruned_seasons_and_manifest(
+        self, loader: FixtureSeasonLoader, tmp_path: Path
+    ) -> None:
+        paths = fetch_pbp(SEASONS, repo=tmp_path, loader=loader)
+
+        assert [p.name for p in paths] == [f"play_by_play_{s}.parquet" for s in SEASONS]
+        stored = pd.read_parquet(paths[0])
+        assert list(stored.columns) == _KEEP_COLUMNS
+        manifest = load_pbp_manifest(repo=tmp_path)
+        assert sorted(manifest) == SEASONS
+        entry = manifest[2019]
+        assert entry.rows == len(stored)
+        assert [name for name, _ in entry.columns] == _KEEP_COLUMNS
+        assert entry.content_sha256 == content_sha256(stored)
+
+    def test_pool_is_bounded(self, tmp_path: Path) -> None:
+        loader = FixtureSeasonLoader(
+            {season: pbp_season(season) for season in SEASONS}, latency=0.05
+        )
+
+        fetch_pbp(SEASONS, repo=tmp_path, loader=loader, max_workers=2)
+
+        assert sorted(loader.calls) == SEASONS
+        assert loader.peak_concurrency == 2
+
+    def test_complete_cached_seasons_are_not_fetched(
+        self, loader: FixtureSeasonLoader, tmp_path: Path
+    ) -> None:
+        fetch_pbp(SEASONS, repo=tmp_path, loader=loader)
+        loader.calls.clear()
+
+        assert fetch_pbp(SEASONS, repo=tmp_path, loader=loader) == []
+        assert loader.calls == []
+
+    def test_refresh_skips_unchanged_seasons(
+        self, loader: FixtureSeasonLoader, tmp_path: Path
+    ) -> None:
+        fetch_pbp(SEASONS, repo=tmp_path, loader=loader)
+        before = {p.name: p.stat().st_mtime_ns for p in _pbp_dir(tmp_path).glob("*.parquet")}
+        old_hash = load_pbp_manifest(repo=tmp_path)[2024].content_sha256
+        loader.frames[2024] = pbp_season(2024, games=3)
+
+        paths = fetch_pbp(SEASONS, repo=tmp_path, loader=loader, force=True)
+
+        assert [p.name for p in paths] == ["play_by_play_2024.parquet"]
+        after = {p.name: p.stat().st_mtime_ns for p in _pbp_dir(tmp_path).glob("*.parquet")}
+        del before["play_by_play_2024.parquet"], after["play_by_play_2024.parquet"]
+        assert after == before
+        assert load_pbp_manifest(repo=tmp_path)[2024].content_sha256 != old_hash
+        assert len(load_pbp([2024], repo=tmp_path)) == 3 * 40
+
+    def test_failed_season_keeps_previous_state(
+        self, loader: FixtureSeasonLoader, tmp_path: Path
+    ) -> None:
+        fetch_pbp([2023], repo=tmp_path, loader=loader)
+        del loader.frames[2023]
+
+        paths = fetch_pbp([2023, 2099], repo=tmp_path, loader=loader, force=True)
+
+        assert paths == []
+        assert sorted(load_pbp_manifest(repo=tmp_path)) == [2023]
+        assert (_pbp_dir(tmp_path) / "play_by_play_2023.parquet").exists()
+        assert not (_pbp_dir(tmp_path) / "play_by_play_2099.parquet").exists()
+
+
+class TestManifestRecords:
+    def test_corrupt_manifest_loads_empty(self, tmp_path: Path) -> None:
+        manifest_path(tmp_path).write_text("{not json")
+
+        assert load_manifest(tmp_path) == {}
+
+    def test_unknown_schema_version_loads_empty(self, tmp_path: Path) -> None:
+        manifest_path(tmp_path).write_text(json.dumps({"schema_version": 99, "seasons": {}}))
+
+        assert load_manifest(tmp_path) == {}
+
+    def test_changed_seasons_compares_consumed_hashes(
+        self, loader: FixtureSeasonLoader, tmp_path: Path
+    ) -> None:
+        fetch_pbp([2023, 2024], repo=tmp_path, loader=loader)
+        manifest = load_pbp_manifest(repo=tmp_path)
+        artifact = tmp_path / "epa_by_game.parquet"
+        write_source_hashes(artifact, {2023: manifest[2023].content_sha256, 2024: "stale"})
+
+        consumed = load_source_hashes(artifact)
+
+        assert consumed is not None
+        assert changed_seasons(manifest, consumed) == [2024]
+        assert changed_seasons(manifest, {}) == [2023, 2024]
+        assert load_source_hashes(tmp_path / "missing.parquet") is None
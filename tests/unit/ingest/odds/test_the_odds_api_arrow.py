@@ -0,0 +1,165 @@
+"""Tests for the columnar The Odds API payload parser.
+
+The columnar parser must accept exactly the payloads the row parser accepts,
+return an equal frame, and raise the same error otherwise.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import copy
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+import pyarrow as pa
+import pytest
+from tests.fixtures.odds import FETCHED_AT, SEASON, WEEK, the_odds_api_week
+
+from gridiron_edge.ingest.odds import the_odds_api_arrow
+from gridiron_edge.ingest.odds.the_odds_api import parse_the_odds_api_payload
+from gridiron_edge.ingest.odds.the_odds_api_arrow import parse_the_odds_api_payload_arrow
+
+
+def _parse_both(payload: object, schedule: DataFrame) -> None:
+    """Assert both parsers agree on *payload*: equal frames or equal errors."""
+    kwargs: dict[str, Any] = {"season": SEASON, "week": WEEK, "fetched_at": FETCHED_AT}
+    try:
+        expected = parse_the_odds_api_payload(copy.deepcopy(payload), schedule, **kwargs)
+    except Exception as exc:
+        with pytest.raises(type(exc)) as raised:
+            parse_the_odds_api_payload_arrow(payload, schedule, **kwargs)
+        assert str(raised.value) == str(exc)
+        return
+    actual = parse_the_odds_api_payload_arrow(payload, schedule, **kwargs)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.fixture
+def no_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: object, **kwargs: object) -> DataFrame:
+        raise AssertionError("columnar parser fell back to the row parser")
+
+    monkeypatch.setattr(the_odds_api_arrow, "parse_the_odds_api_payload", fail)
+
+
+def _first_market(payload: list[dict[str, Any]], key: str) -> dict[str, Any]:
+    event = next(e for e in payload if e["commence_time"] > "2026-09-10")
+    return next(m for m in event["bookmakers"][0]["markets"] if m["key"] == key)
+
+
+class TestParity:
+    @pytest.mark.parametrize(("games", "books"), [(16, 12), (3, 1), (1, 4)])
+    def test_full_week_matches_row_parser(self, games: int, books: int) -> None:
+        payload, schedule = the_odds_api_week(games, books, seed=games)
+
+        _parse_both(payload, schedule)
+
+    @pytest.mark.usefixtures("no_fallback")
+    def test_recorded_shapes_take_the_columnar_path(self) -> None:
+        payload, schedule = the_odds_api_week()
+
+        quotes = parse_the_odds_api_payload_arrow(
+            payload, schedule, season=SEASON, week=WEEK, fetched_at=FETCHED_AT
+        )
+
+        # 15 pregame games x 8 books x (2 + 2 + 2) outcomes.
+        assert len(quotes) == 15 * 8 * 6
+        assert set(quotes["market"]) == {"moneyline", "spread", "total"}
+
+    @pytest.mark.usefixtures("no_fallback")
+    def test_empty_payload(self) -> None:
+        _, schedule = the_odds_api_week()
+
+        _parse_both([], schedule)
+
+    def test_timestamp_schedule_dates(self) -> None:
+        payload, schedule = the_odds_api_week(4, 2)
+        schedule["game_date"] = pd.to_datetime(schedule["game_date"])
+
+        _parse_both(payload, schedule)
+
+
+def _edit(edit: Callable[[list[dict[str, Any]]], object]) -> list[dict[str, Any]]:
+    payload, _ = the_odds_api_week(4, 3)
+    edit(payload)
+    return payload
+
+
+_EVENT = 1  # A pregame, scheduled event in the four-game week.
+
+EDITS: dict[str, Callable[[list[dict[str, Any]]], object]] = {
+    "missing event id": lambda p: p[_EVENT].pop("id"),
+    "numeric event id": lambda p: p[_EVENT].update(id=7),
+    "blank event id": lambda p: p[_EVENT].update(id="  "),
+    "padded event id": lambda p: p[_EVENT].update(id="  event-1 "),
+    "naive commence time": lambda p: p[_EVENT].update(commence_time="2026-09-10T17:00:00"),
+    "offset commence time": lambda p: p[_EVENT].update(commence_time="2026-09-10T17:00:00-04:00"),
+    "explicit zero offset": lambda p: p[_EVENT].update(commence_time="2026-09-10T17:00:00+00:00"),
+    "unparseable commence time": lambda p: p[_EVENT].update(commence_time="next sunday"),
+    "other sport with junk": lambda p: p.append({"sport_key": "basketball_nba", "id": 3}),
+    "missing bookmakers": lambda p: p[_EVENT].pop("bookmakers"),
+    "bookmaker not an object": lambda p: p[_EVENT]["bookmakers"].append("fanduel"),
+    "bookmaker missing update": lambda p: p[_EVENT]["bookmakers"][0].pop("last_update"),
+    "padded team names": lambda p: p[_EVENT].update(
+        away_team=f"  {p[_EVENT]['away_team'].upper()}  ",
+    ),
+    "non-ascii outcome": lambda p: _first_market(p, "h2h")["outcomes"][0].update(name="Ünder"),
+    "unknown team outcome": lambda p: _first_market(p, "h2h")["outcomes"][0].update(
+        name="Chicago Bears"
+    ),
+    "bad total outcome": lambda p: _first_market(p, "totals")["outcomes"][0].update(name="Above"),
+    "zero price": lambda p: _first_market(p, "h2h")["outcomes"][0].update(price=0),
+    "price beyond int64": lambda p: _first_market(p, "h2h")["outcomes"][0].update(price=2**64),
+    "price below int64": lambda p: _first_market(p, "h2h")["outcomes"][0].update(
+        price=-(2**63) - 1
+    ),
+    "sport key beyond int64": lambda p: p[_EVENT].update(sport_key=2**64),
+    "other sport key beyond int64": lambda p: p.append({"sport_key": 2**70, "id": 3}),
+    "boolean price": lambda p: _first_market(p, "h2h")["outcomes"][0].update(price=True),
+    "string price": lambda p: _first_market(p, "h2h")["outcomes"][0].update(price="-110"),
+    "boolean spread point": lambda p: _first_market(p, "spreads")["outcomes"][0].update(point=True),
+    "pick'em spread": lambda p: [
+        outcome.update(point=0) for outcome in _first_market(p, "spreads")["outcomes"]
+    ],
+    "missing spread point": lambda p: _first_market(p, "spreads")["outcomes"][0].pop("point"),
+    "moneyline point ignored": lambda p: _first_market(p, "h2h")["outcomes"][0].update(point=3),
+    "bad market update": lambda p: _first_market(p, "totals").update(last_update="soon"),
+    "unsupported market junk": lambda p: p[_EVENT]["bookmakers"][0]["markets"].append(
+        {"key": "player_props", "outcomes": "n/a"}
+    ),
+    "event not an object": lambda p: p.append(["not", "an", "event"]),
+}
+
+
+class TestValidationParity:
+    @pytest.mark.parametrize("name", sorted(EDITS))
+    def test_edited_payload_matches_row_parser(self, name: str) -> None:
+        _, schedule = the_odds_api_week(4, 3)
+
+        _parse_both(_edit(EDITS[name]), schedule)
+
+    def test_payload_not_an_array(self) -> None:
+        _, schedule = the_odds_api_week(1, 1)
+
+        _parse_both({"events": []}, schedule)
+
+    @pytest.mark.parametrize("error", [OverflowError("int too big"), pa.ArrowInvalid("overflow")])
+    def test_conversion_errors_after_arrow_array_fall_back(
+        self, error: Exception, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        payload, schedule = the_odds_api_week(4, 3)
+
+        def fail(values: pa.Array) -> np.ndarray:
+            raise error
+
+        monkeypatch.setattr(the_odds_api_arrow, "_numbers", fail)
+
+        _parse_both(payload, schedule)
+
+    def test_blank_schedule_game_id(self) -> None:
+        payload, schedule = the_odds_api_week(2, 1)
+        schedule.loc[1, "game_id"] = " "
+
+        _parse_both(payload, schedule)
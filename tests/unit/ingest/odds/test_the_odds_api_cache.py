@@ -0,0 +1,388 @@
+"""Tests for The Odds API response caching and request coalescing.
+
+The ingestion tests run against a local stub provider and count the requests
+it receives, so each scenario states how much quota the cache saved.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+import itertools
+import os
+from pathlib import Path
+import threading
+import time
+
+from pandas import DataFrame
+import pytest
+from tests.fixtures.http import StubHTTPServer, StubRequest, StubResponse
+
+from gridiron_edge.ingest.odds import the_odds_api, the_odds_api_arrow
+from gridiron_edge.ingest.odds.cache import (
+    CachedResponse,
+    OddsResponseCache,
+    RequestCoalescer,
+    payload_sha256,
+    request_key,
+)
+from gridiron_edge.ingest.odds.store import load_current_odds
+from gridiron_edge.ingest.odds.the_odds_api import (
+    OddsIngestError,
+    OddsIngestResult,
+    ingest_the_odds_api_current,
+)
+from gridiron_edge.market.edge_diagnostics import (
+    EdgeProvenance,
+    _market_is_stale,
+    _market_timestamps,
+)
+
+SEASON = "2026-2027"
+WEEK = 1
+FETCHED_AT = datetime(2026, 9, 1, 12, tzinfo=UTC)
+KICKOFF = datetime(2026, 9, 10, 0, 20, tzinfo=UTC)
+API_KEY = "secret-key"
+
+
+def _schedule() -> DataFrame:
+    return DataFrame(
+        [
+            {
+                "season": SEASON,
+                "week": WEEK,
+                "game_id": "2026_01_KC_LAC",
+                "game_date": "2026-09-10",
+                "away_team": "Kansas City Chiefs",
+                "home_team": "Los Angeles Chargers",
+            }
+        ]
+    )
+
+
+def _payload(away_price: int = 125) -> list[dict[str, object]]:
+    return [
+        {
+            "id": "event-1",
+            "sport_key": "americanfootball_nfl",
+            "commence_time": "2026-09-10T00:20:00Z",
+            "away_team": "Kansas City Chiefs",
+            "home_team": "Los Angeles Chargers",
+            "bookmakers": [
+                {
+                    "key": "fanduel",
+                    "last_update": "2026-09-01T11:59:00Z",
+                    "markets": [
+                        {
+                            "key": "h2h",
+                            "outcomes": [
+                                {"name": "Kansas City Chiefs", "price": away_price},
+                                {"name": "Los Angeles Chargers", "price": -145},
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    ]
+
+
+class _Provider:
+    """Stub provider handler that charges one credit per request."""
+
+    def __init__(self, payload: list[dict[str, object]]) -> None:
+        self.payload = payload
+        self._used = itertools.count(1)
+
+    def __call__(self, request: StubRequest) -> StubResponse:
+        used = next(self._used)
+        return StubResponse(
+            json=self.payload,
+            headers={
+                "x-requests-remaining": str(500 - used),
+                "x-requests-used": str(used),
+                "x-requests-last": "1",
+            },
+        )
+
+
+@pytest.fixture
+def provider(monkeypatch: pytest.MonkeyPatch):
+    handler = _Provider(_payload())
+    with StubHTTPServer(handler, latency=0.05) as server:
+        monkeypatch.setattr(the_odds_api, "THE_ODDS_API_BASE_URL", server.url)
+        yield handler, server
+
+
+def _ingest(tmp_path: Path, **overrides: object) -> OddsIngestResult:
+    values: dict[str, object] = {
+        "api_key": API_KEY,
+        "schedule": _schedule(),
+        "season": SEASON,
+        "week": WEEK,
+        "repo": tmp_path,
+        "fetched_at": FETCHED_AT,
+    }
+    values.update(overrides)
+    return ingest_the_odds_api_current(**values)  # type: ignore[arg-type]
+
+
+def _ledger_files(tmp_path: Path) -> list[Path]:
+    partition = tmp_path / "data" / "odds" / "history" / f"season={SEASON}" / "week=01"
+    return sorted(partition.rglob("*.parquet"))
+
+
+class TestKeys:
+    def test_request_key_ignores_api_key_and_param_order(self) -> None:
+        url = "https://example.test/odds"
+
+        key = request_key(url, {"apiKey": "a", "regions": "us", "markets": "h2h"})
+
+        assert key == request_key(url, {"markets": "h2h", "regions": "us", "apiKey": "b"})
+        assert key != request_key(url, {"markets": "spreads", "regions": "us"})
+        assert key != request_key("https://example.test/scores", {"regions": "us"})
+
+    def test_payload_hash_ignores_object_key_order(self) -> None:
+        assert payload_sha256([{"a": 1, "b": 2}]) == payload_sha256([{"b": 2, "a": 1}])
+        assert payload_sha256([{"a": 1}]) != payload_sha256([{"a": 2}])
+
+
+class TestRequestCoalescer:
+    def test_concurrent_callers_share_one_call(self) -> None:
+        coalescer: RequestCoalescer[int] = RequestCoalescer()
+        started = threading.Event()
+        release = threading.Event()
+        calls = itertools.count()
+
+        def call() -> int:
+            next(calls)
+            started.set()
+            release.wait(5)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(coalescer.run, "week-1", call)
+            started.wait(5)
+            followers = [pool.submit(coalescer.run, "week-1", call) for _ in range(3)]
+            release.set()
+            results = [leader.result(), *(f.result() for f in followers)]
+
+        assert results == [42, 42, 42, 42]
+        assert next(calls) == 1
+
+    def test_exception_reaches_every_caller_and_releases_key(self) -> None:
+        coalescer: RequestCoalescer[int] = RequestCoalescer()
+
+        def fail() -> int:
+            raise RuntimeError("provider down")
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            coalescer.run("week-1", fail)
+        assert coalescer.run("week-1", lambda: 7) == 7
+
+
+class TestIngestQuotaSavings:
+    def test_overlapping_jobs_share_one_request(self, provider, tmp_path: Path) -> None:
+        _, server = provider
+        jobs = 4
+        barrier = threading.Barrier(jobs)
+
+        def job() -> OddsIngestResult:
+            barrier.wait(5)
+            return _ingest(tmp_path)
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(lambda _: job(), range(jobs)))
+
+        assert len(server.requests) == 1, f"quota saved: {jobs - len(server.requests)}"
+        assert sum(not result.unchanged for result in results) == 1
+        assert {result.quote_count for result in results} == {2}
+        assert len(_ledger_files(tmp_path)) == 1
+
+    def test_identical_payload_skips_ledger(self, provider, tmp_path: Path) -> None:
+        _, server = provider
+        first = _ingest(tmp_path)
+        before = _ledger_files(tmp_path)
+
+        second = _ingest(tmp_path, fetched_at=FETCHED_AT + timedelta(minutes=30))
+
+        assert len(server.requests) == 2
+        assert not first.unchanged
+        assert second.unchanged
+        assert second.quote_count == first.quote_count
+        assert second.ledger_path == first.ledger_path
+        assert second.usage.requests_used == 2
+        assert _ledger_files(tmp_path) == before
+
+    def test_identical_payload_keeps_snapshot_fresh(self, provider, tmp_path: Path) -> None:
+        confirmed_at = FETCHED_AT + timedelta(minutes=30)
+        _ingest(tmp_path)
+
+        assert _ingest(tmp_path, fetched_at=confirmed_at).unchanged
+
+        snapshot = load_current_odds(repo=tmp_path)
+        assert snapshot is not None
+        assert set(snapshot["fetched_at"]) == {confirmed_at}
+        provenance = EdgeProvenance(market_fetched_at=_market_timestamps(snapshot))
+        assert not _market_is_stale(
+            provenance,
+            as_of=confirmed_at + timedelta(minutes=5),
+            max_market_age=timedelta(minutes=10),
+        )
+
+    def test_identical_payload_is_not_reparsed(
+        self, provider, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _ingest(tmp_path)
+        parsed: list[object] = []
+        real_parse = the_odds_api_arrow.parse_the_odds_api_payload_arrow
+
+        def spy(payload: object, *args: object, **kwargs: object) -> DataFrame:
+            parsed.append(payload)
+            return real_parse(payload, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(the_odds_api_arrow, "parse_the_odds_api_payload_arrow", spy)
+
+        assert _ingest(tmp_path, fetched_at=FETCHED_AT + timedelta(minutes=30)).unchanged
+        assert parsed == []
+
+    def test_missing_stored_quotes_fall_back_to_parsing(self, provider, tmp_path: Path) -> None:
+        _ingest(tmp_path)
+        for path in (tmp_path / "data" / "odds" / "cache").rglob("*.parquet"):
+            path.unlink()
+
+        result = _ingest(tmp_path, fetched_at=FETCHED_AT + timedelta(minutes=30))
+
+        assert not result.unchanged
+        assert result.quote_count == 2
+
+    def test_changed_payload_is_ingested(self, provider, tmp_path: Path) -> None:
+        handler, _ = provider
+        _ingest(tmp_path)
+        handler.payload = _payload(away_price=130)
+
+        result = _ingest(tmp_path, fetched_at=FETCHED_AT + timedelta(minutes=30))
+
+        assert not result.unchanged
+        assert len(_ledger_files(tmp_path)) == 2
+
+    def test_changed_schedule_is_ingested(self, provider, tmp_path: Path) -> None:
+        _ingest(tmp_path)
+        schedule = _schedule().assign(game_id="2026_01_KC_LAC_R")
+
+        result = _ingest(
+            tmp_path,
+            schedule=schedule,
+            fetched_at=FETCHED_AT + timedelta(minutes=30),
+        )
+
+        assert not result.unchanged
+
+    def test_fresh_cached_response_avoids_request(self, provider, tmp_path: Path) -> None:
+        _, server = provider
+        _ingest(tmp_path)
+
+        result = _ingest(
+            tmp_path,
+            fetched_at=FETCHED_AT + timedelta(minutes=5),
+            max_age=timedelta(minutes=10),
+        )
+
+        assert len(server.requests) == 1
+        assert result.cache_hit
+        assert result.unchanged
+        assert result.usage.request_cost == 0
+        assert result.usage.requests_used == 1
+        snapshot = load_current_odds(repo=tmp_path)
+        assert snapshot is not None
+        assert set(snapshot["fetched_at"]) == {FETCHED_AT}
+
+    def test_cached_response_keeps_its_fetch_time(self, provider, tmp_path: Path) -> None:
+        _ingest(tmp_path)
+
+        result = _ingest(
+            tmp_path,
+            schedule=_schedule().assign(game_id="2026_01_KC_LAC_R"),
+            fetched_at=FETCHED_AT + timedelta(minutes=5),
+            max_age=timedelta(minutes=10),
+        )
+
+        assert result.cache_hit
+        assert not result.unchanged
+        snapshot = load_current_odds(repo=tmp_path)
+        assert snapshot is not None
+        assert set(snapshot["fetched_at"]) == {FETCHED_AT}
+
+    def test_stale_cached_response_is_refetched(self, provider, tmp_path: Path) -> None:
+        _, server = provider
+        _ingest(tmp_path)
+
+        result = _ingest(
+            tmp_path,
+            fetched_at=FETCHED_AT + timedelta(minutes=15),
+            max_age=timedelta(minutes=10),
+        )
+
+        assert len(server.requests) == 2
+        assert not result.cache_hit
+
+    def test_kickoff_invalidates_ingest_record(self, provider, tmp_path: Path) -> None:
+        _ingest(tmp_path)
+
+        with pytest.raises(OddsIngestError, match="no usable matched pregame quotes"):
+            _ingest(tmp_path, fetched_at=KICKOFF)
+
+    def test_waits_for_a_request_claimed_by_another_process(self, provider, tmp_path: Path) -> None:
+        _, server = provider
+        cache = OddsResponseCache(tmp_path)
+        key = request_key(*the_odds_api._odds_request(API_KEY))
+        claim = cache.root / "claims" / f"{key}.claim"
+        claim.parent.mkdir(parents=True)
+        claim.touch()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            job = pool.submit(_ingest, tmp_path)
+            time.sleep(0.2)
+            assert not job.done()
+            # The claim owner stores its response and releases the claim.
+            cache.store_response(
+                key,
+                CachedResponse(
+                    fetched_at=FETCHED_AT,
+                    payload_sha256=payload_sha256(_payload()),
+                    payload=_payload(),
+                    usage={"requests_remaining": 499, "requests_used": 1, "request_cost": 1},
+                ),
+            )
+            claim.unlink()
+            result = job.result(timeout=5)
+
+        assert server.requests == []
+        assert result.cache_hit
+        assert result.usage.request_cost == 0
+        assert result.quote_count == 2
+
+    def test_stale_claim_is_taken_over(self, provider, tmp_path: Path) -> None:
+        _, server = provider
+        cache = OddsResponseCache(tmp_path)
+        key = request_key(*the_odds_api._odds_request(API_KEY))
+        claim = cache.root / "claims" / f"{key}.claim"
+        claim.parent.mkdir(parents=True)
+        claim.touch()
+        abandoned = time.time() - 3600
+        os.utime(claim, (abandoned, abandoned))
+
+        result = _ingest(tmp_path)
+
+        assert len(server.requests) == 1
+        assert not result.cache_hit
+        assert not claim.exists()
+
+    def test_api_key_never_reaches_cache_files(self, provider, tmp_path: Path) -> None:
+        _, server = provider
+        _ingest(tmp_path)
+
+        cache_files = list((tmp_path / "data" / "odds" / "cache").rglob("*.json"))
+        assert len(cache_files) == 2
+        assert all(API_KEY not in path.read_text() for path in cache_files)
+        assert server.requests[0].query["apiKey"] == API_KEY
@@ -13,6 +13,7 @@ from gridiron_edge.ingest.odds.store import (
     OBSERVATION_SORT_COLUMNS,
     QUOTE_COLUMNS,
     append_to_odds_ledger,
+    compact_odds_ledger,
     load_current_odds,
     load_odds_ledger,
     odds_history_partition_path,
@@ -105,11 +106,11 @@ def test_exact_rerun_is_idempotent_and_multiple_books_survive(tmp_path: Path) ->
 
 def test_later_local_observation_is_retained(tmp_path: Path) -> None:
     append_to_odds_ledger(_quotes(), repo=tmp_path)
-    path = append_to_odds_ledger(
+    append_to_odds_ledger(
         _quotes(fetched_at="2026-09-10T13:00:00Z"),
         repo=tmp_path,
     )
-    assert len(pd.read_parquet(path)) == 4
+    assert len(load_odds_ledger(repo=tmp_path)) == 4
 
 
 def test_later_changed_price_is_retained(tmp_path: Path) -> None:
@@ -117,9 +118,9 @@ def test_later_changed_price_is_retained(tmp_path: Path) -> None:
     append_to_odds_ledger(DataFrame(_quotes().iloc[[0]]), repo=tmp_path)
     changed: DataFrame = DataFrame(_quotes(fetched_at="2026-09-10T13:00:00Z").iloc[[0]].copy())
     changed["odds"] = -140.0
-    path = append_to_odds_ledger(changed, repo=tmp_path)
+    append_to_odds_ledger(changed, repo=tmp_path)
 
-    loaded = pd.read_parquet(path)
+    loaded = load_odds_ledger(repo=tmp_path)
     assert loaded["odds"].tolist() == [-150.0, -140.0]
 
 
@@ -133,9 +134,9 @@ def test_later_changed_line_is_retained(tmp_path: Path) -> None:
     later["fetched_at"] = pd.Timestamp("2026-09-10T13:00:00Z")
     later["line"] = 4.0
     append_to_odds_ledger(first, repo=tmp_path)
-    path = append_to_odds_ledger(later, repo=tmp_path)
+    append_to_odds_ledger(later, repo=tmp_path)
 
-    loaded = pd.read_parquet(path)
+    loaded = load_odds_ledger(repo=tmp_path)
     assert loaded["line"].tolist() == [3.5, 4.0]
 
 
@@ -317,3 +318,73 @@ def test_current_snapshot_is_separate_from_history(tmp_path: Path) -> None:
     assert history_path.name == "observations.parquet"
     assert snapshot_path.name == "odds_current.parquet"
     assert snapshot_path.parent == tmp_path / "data" / "odds"
+
+
+def test_later_fetch_writes_segment_without_rewriting_base(tmp_path: Path) -> None:
+    """Each later fetch is one new immutable segment beside the base file."""
+    base = append_to_odds_ledger(_quotes(), repo=tmp_path)
+    before = base.read_bytes()
+    segment = append_to_odds_ledger(_quotes(fetched_at="2026-09-10T13:00:00Z"), repo=tmp_path)
+
+    assert segment.parent == base.parent / "segments"
+    assert len(pd.read_parquet(segment)) == 2
+    assert base.read_bytes() == before
+
+
+def test_segment_rerun_is_idempotent_and_conflicts_are_rejected(tmp_path: Path) -> None:
+    """Dedup and conflict checks see rows that live in a segment."""
+    append_to_odds_ledger(_quotes(), repo=tmp_path)
+    later = _quotes(fetched_at="2026-09-10T13:00:00Z")
+    segment = append_to_odds_ledger(later, repo=tmp_path)
+    append_to_odds_ledger(later, repo=tmp_path)
+    assert list(segment.parent.iterdir()) == [segment]
+
+    conflict: DataFrame = DataFrame(later.iloc[[0]].copy())
+    conflict["odds"] = -120.0
+    with pytest.raises(ValueError, match="conflict within one local fetch"):
+        append_to_odds_ledger(conflict, repo=tmp_path)
+    assert len(load_odds_ledger(repo=tmp_path)) == 4
+
+
+def test_unindexed_segment_is_still_checked(tmp_path: Path) -> None:
+    """A segment missing from the fetch index is indexed from its rows."""
+    append_to_odds_ledger(_quotes(), repo=tmp_path)
+    later = _quotes(fetched_at="2026-09-10T13:00:00Z")
+    segment = append_to_odds_ledger(later, repo=tmp_path)
+    (segment.parent.parent / "fetch_index.json").unlink()
+
+    conflict: DataFrame = DataFrame(later.iloc[[0]].copy())
+    conflict["odds"] = -120.0
+    with pytest.raises(ValueError, match="conflict within one local fetch"):
+        append_to_odds_ledger(conflict, repo=tmp_path)
+
+
+def test_compaction_folds_segments_into_base(tmp_path: Path) -> None:
+    """Compaction preserves the loaded ledger and removes segments."""
+    base = append_to_odds_ledger(_quotes(), repo=tmp_path)
+    append_to_odds_ledger(_quotes(fetched_at="2026-09-10T13:00:00Z"), repo=tmp_path)
+    append_to_odds_ledger(_quotes(fetched_at="2026-09-10T14:00:00Z"), repo=tmp_path)
+    before = load_odds_ledger(repo=tmp_path)
+
+    assert compact_odds_ledger(repo=tmp_path) == [base]
+
+    assert not list((base.parent / "segments").glob("*.parquet"))
+    pd.testing.assert_frame_equal(load_odds_ledger(repo=tmp_path), before)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(base),
+        before.loc[:, list(QUOTE_COLUMNS)],
+        check_dtype=False,
+    )
+    assert len(before) == 6
+
+
+def test_interrupted_compaction_does_not_duplicate_rows(tmp_path: Path) -> None:
+    """A segment left beside an already compacted base collapses on load."""
+    base = append_to_odds_ledger(_quotes(), repo=tmp_path)
+    segment = append_to_odds_ledger(_quotes(fetched_at="2026-09-10T13:00:00Z"), repo=tmp_path)
+    saved = segment.read_bytes()
+    compact_odds_ledger(season="2026-2027", week=1, repo=tmp_path)
+    segment.write_bytes(saved)
+
+    assert len(load_odds_ledger(repo=tmp_path)) == 4
+    assert base.is_file()
@@ -9,12 +9,14 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 from pandas import DataFrame
 import pytest
+from tests.fixtures.nflverse import FixtureSeasonLoader
 
 from gridiron_edge.ingest.nflverse.player_stats import (
     _KEEP_COLUMNS,
     _STATS_RELIABLE_FROM,
     fetch_player_stats,
     load_player_stats,
+    load_player_stats_manifest,
 )
 
 
@@ -113,6 +115,17 @@ class TestFetchPlayerStats:
 
         assert len(paths) == 0
 
+    @patch("gridiron_edge.ingest.nflverse.player_stats.nfl")
+    def test_cached_season_is_not_returned(self, mock_nfl: MagicMock, tmp_path: Path) -> None:
+        raw = _make_raw_player_stats(season=2024)
+        mock_nfl.load_player_stats.return_value = MagicMock(to_pandas=MagicMock(return_value=raw))
+        fetch_player_stats(seasons=[2024], repo=tmp_path)
+
+        paths = fetch_player_stats(seasons=[2024], repo=tmp_path)
+
+        assert paths == []
+        mock_nfl.load_player_stats.assert_called_once()
+
 
 class TestLoadPlayerStats:
     def test_raises_when_no_files(self, tmp_path: Path) -> None:
@@ -132,3 +145,22 @@ class TestLoadPlayerStats:
         combined = load_player_stats(repo=tmp_path)
         assert len(combined) == 10
         assert set(combined["season"].unique()) == {2023, 2024}
+
+
+class TestFetchWithLoader:
+    def test_unchanged_content_is_not_rewritten(self, tmp_path: Path) -> None:
+        loader = FixtureSeasonLoader({s: _make_raw_player_stats(season=s) for s in [2023, 2024]})
+        fetch_player_stats(all_years=True, seasons=[2023, 2024], repo=tmp_path, loader=loader)
+        path_2023 = tmp_path / "data" / "raw" / "player_stats" / "player_stats_2023.parquet"
+        mtime = path_2023.stat().st_mtime_ns
+        loader.frames[2024] = _make_raw_player_stats(n=12, season=2024)
+
+        paths = fetch_player_stats(
+            all_years=True, seasons=[2023, 2024], repo=tmp_path, loader=loader
+        )
+
+        assert [p.name for p in paths] == ["player_stats_2024.parquet"]
+        assert path_2023.stat().st_mtime_ns == mtime
+        manifest = load_player_stats_manifest(repo=tmp_path)
+        assert {season: entry.rows for season, entry in manifest.items()} == {2023: 10, 2024: 12}
+        assert [name for name, _ in manifest[2024].columns] == _KEEP_COLUMNS
@@ -4,11 +4,20 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+import threading
+from typing import Any
+
 import pandas as pd
 import pytest
+from tests.fixtures.http import StubHTTPServer, StubRequest, StubResponse
 
+from gridiron_edge.datasets.registry import dataset_path
+from gridiron_edge.datasets.writers import write_csv
+from gridiron_edge.ingest.weather import backfill
 from gridiron_edge.ingest.weather.backfill import (
     _completed_games,
+    backfill_weather,
 )
 
 
@@ -93,3 +102,189 @@ def test_completed_games_does_not_mutate_input() -> None:
         games,
         expected,
     )
+
+
+# ---------------------------------------------------------------------------
+# Concurrent fetch against a stub OWM server
+# ---------------------------------------------------------------------------
+
+_N_GAMES = 12
+_OWM_PATH = "/data/3.0/onecall/timemachine"
+
+
+def _owm_payload(temp: float = 290.0) -> dict:
+    return {
+        "data": [
+            {
+                "temp": temp,
+                "feels_like": temp - 1,
+                "pressure": 1012,
+                "humidity": 40,
+                "dew_point": 275.0,
+                "clouds": 0,
+                "visibility": 10000,
+                "wind_speed": 3.1,
+                "wind_deg": 180,
+                "weather": [{"main": "Clear", "description": "clear sky"}],
+            }
+        ]
+    }
+
+
+@pytest.fixture
+def backfill_repo(tmp_path: Path) -> Path:
+    """Repo with completed games at one outdoor stadium and no weather yet."""
+    games = pd.DataFrame(
+        {
+            "GAME_ID": [f"2024_{i + 1:02d}_LV_KC" for i in range(_N_GAMES)],
+            "YEAR": "2024-2025",
+            "GAME_DATE": [f"2024-09-{i + 1:02d}" for i in range(_N_GAMES)],
+            "GAMETIME": "20:20:00",
+            "STADIUM": "Arrowhead Stadium",
+            "AWAY_SCORE": 20,
+            "HOME_SCORE": 27,
+        }
+    )
+    stadiums = pd.DataFrame(
+        {
+            "HOME_TEAM": ["Kansas City Chiefs"],
+            "YEAR": ["2024-2025"],
+            "STADIUM": ["Arrowhead Stadium"],
+            "LATITUDE": [39.0489],
+            "LONGITUDE": [-94.4839],
+        }
+    )
+    write_csv(tmp_path, "games", games)
+    write_csv(tmp_path, "stadiums", stadiums)
+    return tmp_path
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, server: StubHTTPServer) -> None:
+    monkeypatch.setattr(backfill, "_OWM_URL", f"{server.url}{_OWM_PATH}")
+
+
+def _run(repo: Path, **kwargs: Any) -> tuple[int, int]:
+    return backfill_weather(
+        owm_api_key="test-key",
+        repo=repo,
+        calls_per_minute=60_000,
+        **kwargs,
+    )
+
+
+def _weather(repo: Path) -> pd.DataFrame:
+    return pd.read_csv(dataset_path(repo, "weather_enriched"))
+
+
+def _checkpoint_parts(repo: Path) -> list[Path]:
+    directory = dataset_path(repo, "weather_enriched").parent / "weather_backfill_checkpoint"
+    return sorted(directory.glob("*.parquet"))
+
+
+class TestConcurrentBackfill:
+    def test_fetches_concurrently_within_worker_bound(
+        self,
+        backfill_repo: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        with StubHTTPServer(lambda _: StubResponse(json=_owm_payload()), latency=0.05) as server:
+            _serve(monkeypatch, server)
+            counts = _run(backfill_repo, max_workers=4)
+
+        assert counts == (_N_GAMES, 0)
+        assert 1 < server.peak_in_flight <= 4
+        assert {r.query["appid"] for r in server.requests} == {"test-key"}
+        weather = _weather(backfill_repo)
+        assert sorted(weather["GAME_ID"]) == [f"2024_{i + 1:02d}_LV_KC" for i in range(_N_GAMES)]
+        assert weather["WEATHER_MAIN"].eq("Clear").all()
+        assert _checkpoint_parts(backfill_repo) == []
+
+    def test_rate_limited_requests_are_retried(
+        self,
+        backfill_repo: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        seen: set[str] = set()
+        lock = threading.Lock()
+
+        def handler(request: StubRequest) -> StubResponse:
+            with lock:
+                first = request.query["dt"] not in seen
+                seen.add(request.query["dt"])
+            if first:
+                return StubResponse(status=429, headers={"Retry-After": "0"})
+            return StubResponse(json=_owm_payload())
+
+        with StubHTTPServer(handler, latency=0.01) as server:
+            _serve(monkeypatch, server)
+            counts = _run(backfill_repo, max_workers=4)
+
+        assert counts == (_N_GAMES, 0)
+        assert len(server.requests) == 2 * _N_GAMES
+        assert len(_weather(backfill_repo)) == _N_GAMES
+
+    def test_persistent_rate_limit_fails_the_game(
+        self,
+        backfill_repo: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        blocked: dict[str, str] = {}
+
+        def handler(request: StubRequest) -> StubResponse:
+            blocked.setdefault("dt", request.query["dt"])
+            if request.query["dt"] == blocked["dt"]:
+                return StubResponse(status=429, headers={"Retry-After": "0"})
+            return StubResponse(json=_owm_payload())
+
+        with StubHTTPServer(handler) as server:
+            _serve(monkeypatch, server)
+            counts = _run(backfill_repo, max_workers=1)
+
+        assert counts == (_N_GAMES - 1, 1)
+        assert (
+            sum(r.query["dt"] == blocked["dt"] for r in server.requests) == backfill._MAX_ATTEMPTS
+        )
+        failed = pd.read_csv(backfill_repo / "data" / "cleaned" / "weather_backfill_failed.csv")
+        assert len(failed) == 1
+        assert len(_weather(backfill_repo)) == _N_GAMES - 1
+
+    def test_resumes_from_checkpoint_without_refetching(
+        self,
+        backfill_repo: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        def interrupted_commit(*_: Any) -> int:
+            raise KeyboardInterrupt
+
+        with StubHTTPServer(lambda _: StubResponse(json=_owm_payload())) as server:
+            _serve(monkeypatch, server)
+            with monkeypatch.context() as patch:
+                patch.setattr(backfill, "_commit_checkpoint", interrupted_commit)
+                with pytest.raises(KeyboardInterrupt):
+                    _run(backfill_repo, max_calls=5)
+
+            assert len(_checkpoint_parts(backfill_repo)) == 1
+            assert not dataset_path(backfill_repo, "weather_enriched").exists()
+            first_run = {r.query["dt"] for r in server.requests}
+
+            counts = _run(backfill_repo)
+
+        second_run = {r.query["dt"] for r in server.requests[5:]}
+        assert counts == (_N_GAMES - 5, 0)
+        assert len(server.requests) == _N_GAMES
+        assert not first_run & second_run
+        weather = _weather(backfill_repo)
+        assert len(weather) == _N_GAMES
+        assert weather["GAME_ID"].is_unique
+        assert _checkpoint_parts(backfill_repo) == []
+
+    def test_checkpoint_parts_hold_batches(self, tmp_path: Path) -> None:
+        rows = [{"GAME_ID": f"g{i}", "TEMP": float(i)} for i in range(3)]
+
+        first = backfill._write_checkpoint_part(rows[:2], tmp_path)
+        second = backfill._write_checkpoint_part(rows[2:], tmp_path)
+        combined = backfill._read_checkpoint(tmp_path)
+
+        assert [first.name, second.name] == ["part-00000.parquet", "part-00001.parquet"]
+        assert list(combined.columns) == backfill._OUTPUT_COLS
+        assert combined["GAME_ID"].tolist() == ["g0", "g1", "g2"]
@@ -102,6 +102,32 @@ def test_success_executes_provider_once(mock_ingest: MagicMock, tmp_path: Path)
     )
 
 
+@patch("gridiron_edge.market.collection_execution.ingest_the_odds_api_current")
+def test_max_age_reaches_ingest(mock_ingest: MagicMock, tmp_path: Path) -> None:
+    plan = _plan()
+    poll = plan.polls[0]
+    mock_ingest.return_value = OddsIngestResult(
+        quote_count=10,
+        game_count=2,
+        sportsbook_count=3,
+        ledger_path=tmp_path / "history.parquet",
+        snapshot_path=tmp_path / "current.parquet",
+        usage=OddsApiUsage(requests_remaining=97, requests_used=3, request_cost=0),
+        cache_hit=True,
+    )
+
+    execute_due_collection(
+        plan,
+        schedule=DataFrame(),
+        api_key="secret",
+        evaluated_at=poll.scheduled_at,
+        repo=tmp_path,
+        max_age=timedelta(minutes=5),
+    )
+
+    assert mock_ingest.call_args.kwargs["max_age"] == timedelta(minutes=5)
+
+
 @patch("gridiron_edge.market.collection_execution.ingest_the_odds_api_current")
 def test_missed_poll_never_calls_provider(mock_ingest: MagicMock, tmp_path: Path) -> None:
     plan = _plan()
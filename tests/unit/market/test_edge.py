@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from scipy.stats import norm
 
@@ -13,11 +14,15 @@ from gridiron_edge.market.edge import (
     SpreadEdge,
     TotalEdge,
     classify_edge_strength,
+    classify_edge_strength_array,
     expected_value,
+    expected_value_array,
     moneyline_edge,
     spread_cover_prob,
+    spread_cover_prob_array,
     spread_edge,
     total_cover_prob,
+    total_cover_prob_array,
     total_edge,
 )
 from gridiron_edge.market.odds_math import american_to_decimal
@@ -313,3 +318,42 @@ class TestClassifyEdgeStrength:
     def test_zero_is_no_edge(self) -> None:
         """EV of exactly 0.0 -> no_edge (not lean)."""
         assert classify_edge_strength(0.0) == "no_edge"
+
+
+# ---------------------------------------------------------------------------
+# TestArrayVariants
+# ---------------------------------------------------------------------------
+
+
+class TestArrayVariants:
+    """Array functions must match their scalar counterparts elementwise."""
+
+    def test_expected_value_matches_scalar(self) -> None:
+        probs = np.array([0.55, 0.40, 0.70, 0.52])
+        odds = np.array([-110, 150, -200, 100])
+        expected = [expected_value(float(p), int(o)) for p, o in zip(probs, odds, strict=True)]
+        assert expected_value_array(probs, odds).tolist() == expected
+
+    def test_cover_probs_match_scalar(self) -> None:
+        model = np.array([-4.5, 3.0, 47.5, 41.0])
+        market = np.array([-3.0, 3.0, 45.0, 44.5])
+        spread = spread_cover_prob_array(model, market, 13.5)
+        total = total_cover_prob_array(model, market, 10.0)
+        for i in range(len(model)):
+            assert spread[i] == spread_cover_prob(model[i], market[i], 13.5)
+            assert total[i] == total_cover_prob(model[i], market[i], 10.0)
+
+    def test_nonpositive_std_raises(self) -> None:
+        with pytest.raises(ValueError, match="margin_std"):
+            spread_cover_prob_array(np.array([0.0]), np.array([0.0]), 0.0)
+        with pytest.raises(ValueError, match="total_std"):
+            total_cover_prob_array(np.array([0.0]), np.array([0.0]), -1.0)
+
+    def test_classify_matches_scalar(self) -> None:
+        evs = [0.10, _STRONG_THRESHOLD, 0.03, _MODERATE_THRESHOLD, 0.01, 0.0, -0.02]
+        expected = [classify_edge_strength(ev) for ev in evs]
+        assert classify_edge_strength_array(np.array(evs)).tolist() == expected
+
+    def test_expected_value_invalid_prob_raises(self) -> None:
+        with pytest.raises(ValueError, match="Probability"):
+            expected_value_array(np.array([0.5, 0.0]), np.array([100, 100]))
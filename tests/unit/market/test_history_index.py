@@ -0,0 +1,141 @@
+"""Tests for the sorted as-of index over canonical quote history."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+import pytest
+
+from gridiron_edge.ingest.odds.store import QUOTE_COLUMNS, empty_quote_frame
+from gridiron_edge.market.history_coverage import HISTORY_IDENTITY_COLUMNS
+from gridiron_edge.market.history_index import (
+    IDENTITY_CODE_COLUMN,
+    build_quote_history_index,
+)
+
+
+def _observations(seed: int = 0, n: int = 400) -> DataFrame:
+    """Random multi-book history with repeated fetch times and live rows."""
+    rng = np.random.default_rng(seed)
+    fetch_hours = rng.integers(0, 48, size=n)
+    books = rng.choice(np.array(["fanduel", "draftkings", None], dtype=object), size=n)
+    sides = rng.choice(["home", "away"], size=n)
+    games = rng.choice(["2026_01_KC_LAC", "2026_01_BUF_MIA"], size=n)
+    rows = DataFrame(
+        {
+            "fetched_at": pd.Timestamp("2026-09-08T00:00:00Z")
+            + pd.to_timedelta(fetch_hours, unit="h"),
+            "provider": "the_odds_api",
+            "provider_event_id": [f"event-{game}" for game in games],
+            "sportsbook": books,
+            "sportsbook_updated_at": pd.NaT,
+            "commence_time": pd.Timestamp("2026-09-09T12:00:00Z"),
+            "is_live": rng.random(n) < 0.2,
+            "season": "2026-2027",
+            "week": 1,
+            "game_id": games,
+            "game_date": "2026-09-09",
+            "away_team": "Away",
+            "home_team": "Home",
+            "market": "spread",
+            "side": sides,
+            "odds": rng.choice([-115.0, -110.0, -105.0], size=n),
+            "line": rng.choice([2.5, 3.0, 3.5], size=n),
+        },
+        columns=list(QUOTE_COLUMNS),
+    )
+    return rows
+
+
+def _brute_latest(
+    rows: DataFrame,
+    code: int,
+    when: pd.Timestamp,
+    *,
+    strict: bool,
+    exclude_live: bool,
+) -> int:
+    """Reference scan: last qualifying row position for one identity."""
+    mask = rows[IDENTITY_CODE_COLUMN].eq(code)
+    mask &= rows["fetched_at"].lt(when) if strict else rows["fetched_at"].le(when)
+    if exclude_live:
+        mask &= ~rows["is_live"]
+    positions = np.flatnonzero(mask.to_numpy())
+    return int(positions[-1]) if len(positions) else -1
+
+
+def test_identity_slices_are_contiguous_and_ordered() -> None:
+    index = build_quote_history_index(_observations())
+    rows = index.rows
+    for code, (start, stop) in enumerate(zip(index.starts, index.stops, strict=True)):
+        block = rows.iloc[start:stop]
+        assert block[IDENTITY_CODE_COLUMN].eq(code).all()
+        assert block["fetched_at"].is_monotonic_increasing
+    groups = list(rows.groupby(list(HISTORY_IDENTITY_COLUMNS), dropna=False, sort=True).groups)
+    assert len(groups) == len(index.starts)
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("exclude_live", [False, True])
+def test_batch_latest_matches_scan(strict: bool, exclude_live: bool) -> None:
+    index = build_quote_history_index(_observations(seed=1))
+    rng = np.random.default_rng(2)
+    codes = rng.integers(-1, len(index.starts), size=200)
+    times = pd.Series(
+        pd.Timestamp("2026-09-07T12:00:00Z")
+        + pd.to_timedelta(rng.integers(0, 60, size=200), unit="h")
+    )
+    result = index.latest_positions(codes, times, strict=strict, exclude_live=exclude_live)
+    expected = [
+        -1
+        if code < 0
+        else _brute_latest(index.rows, code, when, strict=strict, exclude_live=exclude_live)
+        for code, when in zip(codes, times, strict=True)
+    ]
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_scalar_latest_matches_batch(strict: bool) -> None:
+    index = build_quote_history_index(_observations(seed=3))
+    when = pd.Timestamp("2026-09-08T20:00:00Z")
+    codes = np.arange(len(index.starts))
+    batch = index.latest_positions(codes, pd.Series([when] * len(codes)), strict=strict)
+    scalar = [index.latest_at_or_before(int(code), when, strict=strict) for code in codes]
+    assert [-1 if value is None else value for value in scalar] == batch.tolist()
+
+
+def test_exact_matches_count_every_row_at_one_fetch() -> None:
+    index = build_quote_history_index(_observations(seed=4))
+    rows = index.rows
+    probe = rows.iloc[[0, len(rows) // 2, len(rows) - 1]]
+    codes = probe[IDENTITY_CODE_COLUMN].to_numpy()
+    first, counts = index.exact_matches(
+        np.r_[codes, -1],
+        pd.concat([probe["fetched_at"], probe["fetched_at"].iloc[:1]], ignore_index=True),
+    )
+    for i, (code, fetched_at) in enumerate(zip(codes, probe["fetched_at"], strict=True)):
+        matches = np.flatnonzero(
+            (rows[IDENTITY_CODE_COLUMN].eq(code) & rows["fetched_at"].eq(fetched_at)).to_numpy()
+        )
+        assert counts[i] == len(matches)
+        assert first[i] == matches[0]
+    assert (first[-1], counts[-1]) == (-1, 0)
+
+
+def test_codes_for_normalizes_null_identity_fields() -> None:
+    index = build_quote_history_index(_observations(seed=5))
+    keys = index.identities.copy()
+    keys["sportsbook"] = keys["sportsbook"].astype(object).where(keys["sportsbook"].notna(), None)
+    assert index.codes_for(keys).tolist() == list(range(len(keys)))
+    unseen = keys.iloc[[0]].assign(game_id="2026_01_NYJ_NE")
+    assert index.codes_for(unseen).tolist() == [-1]
+
+
+def test_empty_history_builds_empty_index() -> None:
+    index = build_quote_history_index(empty_quote_frame())
+    assert index.rows.empty
+    assert index.latest_positions(
+        np.array([0]), pd.Series([pd.Timestamp.now(tz="UTC")])
+    ).tolist() == [-1]
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-from gridiron_edge.market.kelly import kelly_fraction, kelly_stake
+from gridiron_edge.market.kelly import kelly_fraction, kelly_fraction_array, kelly_stake
 
 # ── kelly_fraction ────────────────────────────────────────────────────────────
 
@@ -103,3 +104,18 @@ class TestKellyStake:
     def test_prob_invalid_raises(self) -> None:
         with pytest.raises(ValueError, match="Probability"):
             kelly_stake(0.0, 100, bankroll=1000.0)
+
+
+# ── kelly_fraction_array ──────────────────────────────────────────────────────
+
+
+class TestKellyFractionArray:
+    def test_matches_scalar(self) -> None:
+        probs = np.array([0.55, 0.40, 0.70, 0.52, 0.30])
+        odds = np.array([-110, 150, -200, 100, 120])
+        expected = [kelly_fraction(float(p), int(o)) for p, o in zip(probs, odds, strict=True)]
+        assert kelly_fraction_array(probs, odds).tolist() == expected
+
+    def test_prob_invalid_raises(self) -> None:
+        with pytest.raises(ValueError, match="Probability"):
+            kelly_fraction_array(np.array([0.5, 1.0]), np.array([100, 100]))
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from gridiron_edge.market.odds_math import (
     american_to_decimal,
+    american_to_decimal_array,
     american_to_implied_prob,
+    american_to_implied_prob_array,
     decimal_to_american,
     hold_pct,
     no_vig,
+    no_vig_array,
 )
 
 # ── american_to_decimal ───────────────────────────────────────────────────────
@@ -229,3 +233,35 @@ class TestNoVig:
         p_a, p_b = no_vig(odds_a, odds_b, method="power")
         assert p_a <= raw_a + 1e-9
         assert p_b <= raw_b + 1e-9
+
+
+# ── array variants ────────────────────────────────────────────────────────────
+
+
+_ODDS_A: list[int] = [-110, -150, -200, -10000, 110, 150, -105, 100]
+_ODDS_B: list[int] = [-110, 130, 170, 10000, 110, -180, -115, -120]
+
+
+class TestArrayVariants:
+    """Array functions must match their scalar counterparts elementwise."""
+
+    def test_decimal_matches_scalar(self) -> None:
+        result = american_to_decimal_array(np.array(_ODDS_A))
+        expected = [american_to_decimal(o) for o in _ODDS_A]
+        assert result.tolist() == expected
+
+    def test_implied_prob_matches_scalar(self) -> None:
+        result = american_to_implied_prob_array(np.array(_ODDS_A))
+        expected = [american_to_implied_prob(o) for o in _ODDS_A]
+        assert result.tolist() == expected
+
+    @pytest.mark.parametrize("method", ["power", "additive"])
+    def test_no_vig_matches_scalar(self, method: str) -> None:
+        fair_a, fair_b = no_vig_array(np.array(_ODDS_A), np.array(_ODDS_B), method=method)
+        expected = [no_vig(a, b, method=method) for a, b in zip(_ODDS_A, _ODDS_B, strict=True)]
+        assert fair_a.tolist() == [pair[0] for pair in expected]
+        assert fair_b.tolist() == [pair[1] for pair in expected]
+
+    def test_zero_odds_raises(self) -> None:
+        with pytest.raises(ValueError, match="zero"):
+            american_to_decimal_array(np.array([-110, 0]))
@@ -10,7 +10,12 @@ import pandas as pd
 from pandas import DataFrame, Series, Timestamp
 import pytest
 
-from gridiron_edge.market.edge import MoneylineEdge, SpreadEdge, TotalEdge
+from gridiron_edge.market.edge import (
+    MoneylineEdge,
+    SpreadEdge,
+    TotalEdge,
+    classify_edge_strength,
+)
 from gridiron_edge.market.recommendations import (
     _REPORT_COLUMNS,
     build_edge_report,
@@ -943,3 +948,162 @@ class TestComputeGameEdgesHomeProbDerivation:
         edges = compute_game_edges(row, margin_std=10.0, total_std=10.0)
         ml_edges = [e for e in edges if hasattr(e, "model_prob")]
         assert len(ml_edges) == 0
+
+
+# ---------------------------------------------------------------------------
+# TestColumnarReportParity
+# ---------------------------------------------------------------------------
+
+
+def _reference_report(
+    joined: DataFrame,
+    *,
+    margin_std: float | None,
+    total_std: float | None,
+    bankroll: float | None,
+    kelly_multiplier: float,
+) -> DataFrame:
+    """Per-row report built from :func:`compute_game_edges` (the scalar path)."""
+    rows: list[dict[str, Any]] = []
+    for _, row in joined.iterrows():
+        base: dict[str, Any] = {
+            column: (None if source not in row.index or pd.isna(row[source]) else row[source])
+            for column, source in (
+                ("provider", "provider"),
+                ("provider_event_id", "provider_event_id"),
+                ("sportsbook", "sportsbook"),
+                ("market_fetched_at", "fetched_at"),
+                ("sportsbook_updated_at", "sportsbook_updated_at"),
+                ("commence_time", "commence_time"),
+            )
+        }
+        for column in ("game_id", "game_date", "season", "week", "away_team", "home_team"):
+            base[column] = row.get(column, "")
+        base["model_key"] = f"{row.get('model_name', '')}_{row.get('model_type', '')}"
+        base["confidence_tier"] = row.get("confidence_tier", "")
+
+        for edge in compute_game_edges(row, margin_std=margin_std, total_std=total_std):
+            out: dict[str, Any] = {**base, "side": edge.side}
+            if isinstance(edge, MoneylineEdge):
+                out |= {
+                    "market_type": "moneyline",
+                    "model_value": edge.model_prob,
+                    "market_value": edge.market_prob,
+                    "point_edge": float("nan"),
+                    "cover_prob": float("nan"),
+                }
+            elif isinstance(edge, SpreadEdge):
+                out |= {
+                    "market_type": "spread",
+                    "model_value": edge.model_spread,
+                    "market_value": edge.market_spread,
+                    "point_edge": edge.point_edge,
+                    "cover_prob": edge.cover_prob,
+                }
+            else:
+                assert isinstance(edge, TotalEdge)
+                out |= {
+                    "market_type": "total",
+                    "model_value": edge.model_total,
+                    "market_value": edge.market_total,
+                    "point_edge": edge.point_edge,
+                    "cover_prob": edge.cover_prob,
+                }
+            out["american_odds"] = edge.odds
+            out["ev"] = edge.ev
+            out["edge_strength"] = classify_edge_strength(edge.ev)
+            out["kelly_frac"] = edge.kelly_frac
+            out["kelly_stake"] = (
+                None
+                if bankroll is None
+                else min(bankroll * kelly_multiplier * edge.kelly_frac, bankroll * kelly_multiplier)
+            )
+            rows.append(out)
+    return pd.DataFrame(rows, columns=_REPORT_COLUMNS)
+
+
+def _random_slate(seed: int, n_games: int = 40) -> tuple[DataFrame, DataFrame]:
+    """Random predictions plus multi-book current odds with gaps in every market."""
+    rng = np.random.default_rng(seed)
+    predictions: list[DataFrame] = []
+    odds: list[DataFrame] = []
+    for i in range(n_games):
+        game_id = f"2026_01_G{i:02d}_H{i:02d}"
+        pred = _make_predictions(
+            game_id=game_id,
+            home_win_prob=float(rng.uniform(0.2, 0.8)),
+            model_spread=float(rng.normal(0.0, 6.0)),
+            model_total=float(rng.normal(45.0, 5.0)),
+        )
+        pred["model_name"] = "random_forest"
+        pred["model_type"] = "win_prob"
+        if i % 7 == 0:
+            pred["model_total"] = np.nan
+        if i % 11 == 0:
+            pred["home_win_prob"] = np.nan
+        predictions.append(pred)
+        for book in ("draftkings", "fanduel", "betmgm"):
+            rows = _make_long_odds(
+                game_id=game_id,
+                ml_home=float(rng.choice([-250, -180, -130, -110, 105, 140, 200])),
+                ml_away=float(rng.choice([-240, -160, -120, 100, 115, 150, 210])),
+                spread_home=float(rng.choice([-7.5, -3.0, -1.5, 2.5, 6.5])),
+                spread_odds_home=float(rng.choice([-115, -110, -105])),
+                spread_odds_away=float(rng.choice([-115, -110, -105])),
+                total_line=float(rng.choice([41.5, 44.0, 47.5])),
+                over_odds=float(rng.choice([-112, -110, -108])),
+                under_odds=float(rng.choice([-112, -110, -108])),
+            )
+            rows["provider"] = "the_odds_api"
+            rows["provider_event_id"] = f"event-{i}"
+            rows["sportsbook"] = book
+            rows["sportsbook_updated_at"] = pd.Timestamp("2026-09-05 11:59:00", tz="UTC")
+            rows["commence_time"] = pd.Timestamp("2026-09-06 00:20:00", tz="UTC")
+            rows["is_live"] = False
+            rows["fetched_at"] = pd.Timestamp("2026-09-05 12:00:00", tz="UTC")
+            if (i + len(book)) % 5 == 0:
+                rows = rows.loc[rows["market"] != "spread"]
+            odds.append(rows)
+    return (
+        pd.concat(predictions, ignore_index=True),
+        pd.concat(odds, ignore_index=True),
+    )
+
+
+class TestColumnarReportParity:
+    """The columnar builder must reproduce the per-row report exactly."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    @pytest.mark.parametrize("bankroll", [None, 1000.0])
+    def test_matches_per_row_report(self, seed: int, bankroll: float | None) -> None:
+        predictions, odds = _random_slate(seed)
+        report = build_edge_report(
+            predictions,
+            odds,
+            margin_std=13.5,
+            total_std=10.0,
+            current_snapshot=True,
+            bankroll=bankroll,
+        )
+        expected = _reference_report(
+            join_predictions_to_current_odds(predictions, odds),
+            margin_std=13.5,
+            total_std=10.0,
+            bankroll=bankroll,
+            kelly_multiplier=0.25,
+        )
+        assert len(report) > 0
+        pd.testing.assert_frame_equal(report, expected)
+
+    def test_disabled_markets_match_per_row_report(self) -> None:
+        predictions, odds = _random_slate(3)
+        report = build_edge_report(predictions, odds, margin_std=None, total_std=None)
+        expected = _reference_report(
+            join_predictions_to_odds(predictions, odds),
+            margin_std=None,
+            total_std=None,
+            bankroll=None,
+            kelly_multiplier=0.25,
+        )
+        assert set(report["market_type"]) == {"moneyline"}
+        pd.testing.assert_frame_equal(report, expected)
@@ -4,16 +4,23 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 import pytest
 
 from gridiron_edge.metadata.stadium_sync import (
+    _haversine_km,
     apply_approved_stadium_updates,
     audit_stadium_coverage,
+    build_venue_geometry,
     load_stadium_aliases,
+    load_venue_geometry,
     prepare_stadium_updates,
+    refresh_venue_geometry,
+    stadium_reference_fingerprint,
     validate_stadium_reference,
+    write_venue_geometry,
 )
 
 
@@ -305,3 +312,89 @@ def test_reapplying_conflicting_origin_is_rejected(
             conflicting,
             path=path,
         )
+
+
+def _noon_ns(*dates: str) -> np.ndarray:
+    return pd.DatetimeIndex([f"{date} 12:00" for date in dates], tz="UTC").asi8
+
+
+def test_venue_geometry_resolves_zones_and_offsets_per_date() -> None:
+    geometry = build_venue_geometry(_stadiums(), through_year=2026)
+    venues = geometry.venue_positions(
+        pd.Series(["Arrowhead Stadium", "Wembley Stadium", "Wembley Stadium", "Unknown"])
+    )
+
+    assert [str(geometry.zones[geometry.zone[v]]) for v in venues[:2]] == [
+        "America/Chicago",
+        "Europe/London",
+    ]
+    offsets = geometry.utc_offsets(
+        venues, _noon_ns("2025-12-07", "2025-10-12", "2025-11-09", "2025-10-12")
+    )
+    assert offsets[:3].tolist() == [-6.0, 1.0, 0.0]
+    assert np.isnan(offsets[3])
+
+
+def test_venue_geometry_distance_matrix_and_origins() -> None:
+    stadiums = _stadiums()
+    geometry = build_venue_geometry(stadiums, through_year=2026)
+
+    assert np.allclose(np.diag(geometry.distance_km), 0.0)
+    assert np.allclose(geometry.distance_km, geometry.distance_km.T)
+
+    origins = geometry.origin_positions(
+        pd.Series(["Kansas City Chiefs", "Buffalo Bills", "International"]),
+        pd.Series(["2025-2026", "2025-2026", "2025-2026"]),
+    )
+    assert origins[2] == -1
+    sites = geometry.venue_positions(pd.Series(["New Era Field", "New Era Field", "New Era Field"]))
+    expected = _haversine_km(
+        stadiums["LATITUDE"].iloc[:2].to_numpy(),
+        stadiums["LONGITUDE"].iloc[:2].to_numpy(),
+        np.repeat(stadiums["LATITUDE"].iloc[1], 2),
+        np.repeat(stadiums["LONGITUDE"].iloc[1], 2),
+    )
+    distances = geometry.distances(origins, sites)
+    assert np.allclose(distances[:2], expected)
+    assert np.isnan(distances[2])
+
+
+def test_venue_geometry_round_trips_through_npz(tmp_path: Path) -> None:
+    geometry = build_venue_geometry(_stadiums(), through_year=2026)
+    path = write_venue_geometry(geometry, tmp_path / "venue_geometry.npz")
+
+    loaded = load_venue_geometry(path)
+
+    assert loaded.fingerprint == stadium_reference_fingerprint(_stadiums())
+    for name in ("stadiums", "zones", "offset_from_ns", "origin_venue", "distance_km"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(geometry, name))
+    assert not list(tmp_path.glob("*.tmp*"))
+
+
+def test_refresh_venue_geometry_rebuilds_only_when_stale(tmp_path: Path) -> None:
+    path = tmp_path / "venue_geometry.npz"
+
+    assert refresh_venue_geometry(_stadiums(), path) is not None
+    written = path.stat().st_mtime_ns
+    assert refresh_venue_geometry(_stadiums(), path) is None
+    assert path.stat().st_mtime_ns == written
+
+    moved = _stadiums()
+    moved.loc[0, "LATITUDE"] = 39.5
+    assert refresh_venue_geometry(moved, path) is not None
+    assert load_venue_geometry(path).fingerprint == stadium_reference_fingerprint(moved)
+
+
+def test_venue_geometry_fingerprint_tracks_coordinates() -> None:
+    moved = _stadiums()
+    moved.loc[0, "LATITUDE"] = 39.5
+    assert stadium_reference_fingerprint(moved) != stadium_reference_fingerprint(_stadiums())
+
+
+def test_venue_geometry_rejects_conflicting_site_coordinates() -> None:
+    conflict = pd.concat(
+        [_stadiums(), _stadiums().iloc[[0]].assign(HOME_TEAM="Alternate", LATITUDE=40.0)],
+        ignore_index=True,
+    )
+    with pytest.raises(ValueError, match="conflicting coordinate identities"):
+        build_venue_geometry(conflict)
@@ -2,8 +2,9 @@
 
 """Tests for gridiron_edge.models.artifact - ArtifactStore.
 
-Covers the (model_name, model_type) API and nested path scheme, plus the
-metadata-subclass discrimination on read.
+Covers the (model_name, model_type) API and nested path scheme, the
+metadata-subclass discrimination on read, and the process-wide artifact
+cache.
 """
 
 from __future__ import annotations
@@ -15,7 +16,13 @@ from pathlib import Path
 
 import pytest
 
-from gridiron_edge.models.artifact import ArtifactStore, BaseModelMetadata
+from gridiron_edge.core.console import console
+from gridiron_edge.models.artifact import (
+    ArtifactCache,
+    ArtifactStore,
+    BaseModelMetadata,
+    artifact_cache,
+)
 from gridiron_edge.models.game_prediction.base import GameModelMetadata
 from gridiron_edge.models.prop_prediction.base import PropModelMetadata
 
@@ -239,6 +246,92 @@ class TestOverwrite:
         assert loaded == {"v": 2}
 
 
+# ---------------------------------------------------------------------------
+# Artifact cache
+# ---------------------------------------------------------------------------
+
+
+class TestArtifactCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self) -> None:
+        artifact_cache().clear()
+
+    def test_repeat_loads_are_served_from_memory(self, tmp_path: Path) -> None:
+        import numpy as np
+
+        store = ArtifactStore(tmp_path)
+        store.save(metadata=_make_prop_meta(), model_obj={"w": np.arange(4.0)}, scaler={"s": 1})
+
+        first = store.load("qb_pass_yards", "elasticnet")
+        second = ArtifactStore(tmp_path).load("qb_pass_yards", "elasticnet")
+        store.load_scaler("qb_pass_yards", "elasticnet")
+
+        assert second is first
+        assert isinstance(first["w"], np.memmap)
+        stats = artifact_cache().stats
+        assert (stats.hits, stats.misses) == (1, 2)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+
+    def test_overwrite_invalidates(self, tmp_path: Path) -> None:
+        store = ArtifactStore(tmp_path)
+        store.save(metadata=_make_game_meta(), model_obj={"v": 1})
+        assert store.load("win_prob", "random_forest") == {"v": 1}
+
+        store.save(metadata=_make_game_meta(), model_obj={"v": 2}, overwrite=True)
+
+        assert store.load("win_prob", "random_forest") == {"v": 2}
+        assert artifact_cache().stats.invalidations == 1
+        assert len(artifact_cache()) == 1
+
+    def test_overwrite_leaves_loaded_memmap_intact(self, tmp_path: Path) -> None:
+        import numpy as np
+
+        store = ArtifactStore(tmp_path)
+        store.save(metadata=_make_game_meta(), model_obj={"w": np.arange(4.0)})
+        loaded = store.load("win_prob", "random_forest")
+
+        store.save(metadata=_make_game_meta(), model_obj={"w": np.full(8, 9.0)}, overwrite=True)
+
+        np.testing.assert_array_equal(loaded["w"], np.arange(4.0))
+        np.testing.assert_array_equal(store.load("win_prob", "random_forest")["w"], np.full(8, 9.0))
+        assert not list(store.artifact_dir("win_prob", "random_forest").glob("*.tmp"))
+
+    def test_metadata_change_misses(self, tmp_path: Path) -> None:
+        store = ArtifactStore(tmp_path)
+        store.save(metadata=_make_game_meta(), model_obj={"v": 1})
+        store.load("win_prob", "random_forest")
+
+        meta = _make_game_meta()
+        meta.notes = "recalibrated"
+        store.save_metadata(meta)
+        store.load("win_prob", "random_forest")
+
+        assert artifact_cache().stats.misses == 2
+        assert len(artifact_cache()) == 1
+
+    def test_lru_bound(self) -> None:
+        cache = ArtifactCache(max_entries=2)
+        for i in range(3):
+            cache.get_or_load(("root", "m", str(i), "f", ()), lambda i=i: i)
+
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        assert cache.get_or_load(("root", "m", "2", "f", ()), lambda: -1) == 2
+
+    def test_verbose_summary_reports_counters(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = ArtifactStore(tmp_path)
+        store.save(metadata=_make_game_meta(), model_obj={"v": 1})
+        store.load("win_prob", "random_forest")
+        store.load("win_prob", "random_forest")
+
+        monkeypatch.setattr(console, "verbose", True)
+        console.print_stats()
+
+        assert "artifact cache: 1 hits / 1 loads (50% hit rate)" in capsys.readouterr().out
+
+
 # ---------------------------------------------------------------------------
 # Errors
 # ---------------------------------------------------------------------------
@@ -0,0 +1,159 @@
+# tests/unit/models/test_compiled.py
+"""Tests for compiled tree-ensemble inference."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import TimeSeriesSplit
+from xgboost import XGBClassifier, XGBRegressor
+
+from gridiron_edge.models.artifact import ArtifactStore
+from gridiron_edge.models.compiled import CompiledEnsemble, compile_ensemble
+from gridiron_edge.models.game_prediction.base import GameModelMetadata
+
+
+def _data(n: int = 240, seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(n, 5))
+    logits = x[:, 0] - 0.5 * x[:, 1] + 0.25 * rng.normal(size=n)
+    y_clf = (logits > 0).astype(int)
+    y_reg = 45.0 + 6.0 * x[:, 2] + rng.normal(size=n)
+    return x, y_clf, y_reg
+
+
+def _metadata(model_type: str) -> GameModelMetadata:
+    return GameModelMetadata(
+        model_name="win_prob",
+        model_type=model_type,
+        task="classification",
+        trained_at="2026-01-01T00:00:00+00:00",
+    )
+
+
+_CLASSIFIERS = [
+    RandomForestClassifier(n_estimators=15, max_depth=5, random_state=0),
+    XGBClassifier(n_estimators=20, max_depth=3, verbosity=0, random_state=0),
+    CalibratedClassifierCV(
+        RandomForestClassifier(n_estimators=10, random_state=0),
+        method="isotonic",
+        cv=TimeSeriesSplit(n_splits=3),
+    ),
+    CalibratedClassifierCV(
+        XGBClassifier(n_estimators=10, max_depth=2, verbosity=0, random_state=0),
+        method="sigmoid",
+        cv=3,
+    ),
+]
+
+
+@pytest.mark.parametrize("estimator", _CLASSIFIERS, ids=lambda e: type(e).__name__)
+def test_classifier_probabilities_match(estimator: object) -> None:
+    x, y, _ = _data()
+    estimator.fit(x, y)  # type: ignore[attr-defined]
+    compiled = compile_ensemble(estimator)
+
+    assert compiled is not None
+    x_new = _data(seed=1)[0]
+    np.testing.assert_allclose(
+        compiled.predict_proba(x_new),
+        estimator.predict_proba(x_new),  # type: ignore[attr-defined]
+        atol=1e-6,
+    )
+    np.testing.assert_array_equal(compiled.predict(x_new), estimator.predict(x_new))  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        RandomForestRegressor(n_estimators=12, max_depth=6, random_state=0),
+        XGBRegressor(n_estimators=25, max_depth=3, verbosity=0, random_state=0),
+    ],
+    ids=lambda e: type(e).__name__,
+)
+def test_regressor_predictions_match(estimator: object) -> None:
+    x, _, y = _data()
+    estimator.fit(x, y)  # type: ignore[attr-defined]
+    compiled = compile_ensemble(estimator)
+
+    assert compiled is not None
+    x_new = _data(seed=2)[0]
+    np.testing.assert_allclose(
+        compiled.predict(x_new),
+        estimator.predict(x_new),  # type: ignore[attr-defined]
+        rtol=1e-5,
+    )
+
+
+def test_missing_values_follow_the_recorded_direction() -> None:
+    x, y, _ = _data()
+    x[::7, 1] = np.nan
+    model = XGBClassifier(n_estimators=10, max_depth=3, verbosity=0).fit(x, y)
+    compiled = compile_ensemble(model)
+
+    assert compiled is not None
+    np.testing.assert_allclose(compiled.predict_proba(x), model.predict_proba(x), atol=1e-6)
+
+
+def test_unsupported_models_do_not_compile() -> None:
+    x, y, _ = _data()
+    assert compile_ensemble(LogisticRegression().fit(x, y)) is None
+    assert compile_ensemble(object()) is None
+
+
+def test_wrong_width_is_rejected() -> None:
+    x, y, _ = _data()
+    compiled = compile_ensemble(RandomForestClassifier(n_estimators=2).fit(x, y))
+
+    assert compiled is not None
+    with pytest.raises(ValueError, match="5 features"):
+        compiled.predict_proba(x[:, :3])
+
+
+class TestArtifactStore:
+    def test_save_writes_a_memory_mapped_predictor(self, tmp_path: Path) -> None:
+        x, y, _ = _data()
+        model = RandomForestClassifier(n_estimators=8, random_state=0).fit(x, y)
+        store = ArtifactStore(tmp_path)
+        store.save(metadata=_metadata("random_forest"), model_obj=model)
+
+        predictor = store.load_predictor("win_prob", "random_forest")
+
+        assert isinstance(predictor, CompiledEnsemble)
+        assert isinstance(predictor.value, np.memmap)
+        np.testing.assert_allclose(predictor.predict_proba(x), model.predict_proba(x), atol=1e-6)
+
+    def test_unsupported_overwrite_removes_compiled_copy(self, tmp_path: Path) -> None:
+        x, y, _ = _data()
+        store = ArtifactStore(tmp_path)
+        rf = RandomForestClassifier(n_estimators=4).fit(x, y)
+        store.save(metadata=_metadata("random_forest"), model_obj=rf)
+
+        logistic = LogisticRegression().fit(x, y)
+        store.save(metadata=_metadata("random_forest"), model_obj=logistic, overwrite=True)
+
+        assert not (store.artifact_dir("win_prob", "random_forest") / "compiled").exists()
+        assert isinstance(store.load_predictor("win_prob", "random_forest"), LogisticRegression)
+
+    def test_stale_compiled_copy_falls_back_and_compile_backfills(self, tmp_path: Path) -> None:
+        import joblib
+
+        x, y, _ = _data()
+        store = ArtifactStore(tmp_path)
+        store.save(
+            metadata=_metadata("xgboost"),
+            model_obj=XGBClassifier(n_estimators=3, verbosity=0).fit(x, y),
+        )
+        replacement = XGBClassifier(n_estimators=6, verbosity=0).fit(x, y)
+        joblib.dump(replacement, store.artifact_dir("win_prob", "xgboost") / "model.joblib")
+
+        assert isinstance(store.load_predictor("win_prob", "xgboost"), XGBClassifier)
+        assert store.compile("win_prob", "xgboost")
+        predictor = store.load_predictor("win_prob", "xgboost")
+        assert isinstance(predictor, CompiledEnsemble)
+        assert predictor.n_trees == 6
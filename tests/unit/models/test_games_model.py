@@ -555,7 +555,7 @@ class TestUpcomingClassificationLifecycle:
 
         model = MagicMock()
         model.predict_proba.return_value = np.array([[0.35, 0.65]])
-        store.load.return_value = model
+        store.load_predictor.return_value = model
 
         enriched = self._enriched_schedule()
         run_features_mock.return_value = enriched
@@ -705,7 +705,7 @@ class TestUpcomingRegressionLifecycle:
 
         estimator = MagicMock()
         estimator.predict.return_value = np.array([47.5])
-        store.load.return_value = estimator
+        store.load_predictor.return_value = estimator
 
         run_features_mock.return_value = self._enriched_schedule()
 
@@ -11,6 +11,7 @@ Covers the static surface of the new trainer infrastructure:
     - _n_iter_for returns the expected counts.
     - WinProbTrainer.spec / TotalTrainer.spec correctness.
     - GamesTrainer.train() rejects unsupported model_type for its spec.
+    - Pooled HP search parity with the serial loop and halving pruning.
 
 End-to-end fit-and-save smoke tests against real modeling data are
 deferred to slow integration tests; this unit-test file exercises the
@@ -29,6 +30,8 @@ from gridiron_edge.models.game_prediction.base import (
     GameModelMetadata,
     GameModelSpec,
     GameModelType,
+    GamesTrainer,
+    HPSearchMode,
     _create_model,
     _get_param_grid,
     _n_iter_for,
@@ -237,6 +240,9 @@ class TestWinProbSpec:
             GameModelType.XGBOOST,
         }
 
+    def test_uses_serial_search_by_default(self) -> None:
+        assert WinProbTrainer().spec.search_mode == HPSearchMode.SERIAL
+
 
 class TestTotalSpec:
     """TotalTrainer.spec contract."""
@@ -250,6 +256,9 @@ class TestTotalSpec:
     def test_target_col(self) -> None:
         assert TotalTrainer().spec.target_col == ACTUAL_TOTAL_TARGET
 
+    def test_uses_serial_search_by_default(self) -> None:
+        assert TotalTrainer().spec.search_mode == HPSearchMode.SERIAL
+
     def test_excludes_logistic(self) -> None:
         spec = TotalTrainer().spec
         assert GameModelType.LOGISTIC not in spec.feature_set
@@ -481,3 +490,102 @@ class TestInnerCVTemporalAwareness:
         the calibration curve fit is a simpler problem than HP selection)."""
         model, _ = _create_model(GameModelType.RANDOM_FOREST, "classification")
         assert model.cv.n_splits == 3
+
+
+# ---------------------------------------------------------------------------
+# Pooled hyperparameter search backends
+# ---------------------------------------------------------------------------
+
+
+class _SyntheticTotalTrainer(GamesTrainer):
+    """Regression trainer over an in-memory split, parameterized by search mode."""
+
+    def __init__(self, mode: HPSearchMode, n_jobs: int = 2) -> None:
+        self._mode = mode
+        self._n_jobs = n_jobs
+
+    @property
+    def spec(self) -> GameModelSpec:
+        return GameModelSpec(
+            name="total",
+            task="regression",
+            target_col=ACTUAL_TOTAL_TARGET,
+            feature_set={GameModelType.XGBOOST: object()},
+            search_mode=self._mode,
+            search_n_jobs=self._n_jobs,
+        )
+
+    def _prepare_window(self, **kwargs: Any) -> tuple:
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        x = pd.DataFrame(rng.normal(size=(240, 4)), columns=list("abcd"))
+        y = pd.Series(44.0 + 3.0 * x["a"] - 2.0 * x["b"] + rng.normal(scale=4.0, size=240))
+        return x.iloc[:200], y.iloc[:200], x.iloc[200:], y.iloc[200:], ["s1"], ["s2"]
+
+
+class TestPooledHpSearch:
+    """PARALLEL must pick exactly what SERIAL picks; HALVING must be deterministic."""
+
+    @pytest.fixture(autouse=True)
+    def _small_search(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from gridiron_edge.models.game_prediction import base
+
+        monkeypatch.setattr(base, "_n_iter_for", lambda *_: 6)
+
+    def _search(self, mode: HPSearchMode, tmp_path: Any) -> Any:
+        return _SyntheticTotalTrainer(mode)._run_hp_search(
+            df=pd.DataFrame(),
+            model_type=GameModelType.XGBOOST,
+            feature_fn=lambda *_: None,
+            repo=tmp_path,
+        )
+
+    def test_parallel_matches_serial(self, tmp_path: Any) -> None:
+        serial = self._search(HPSearchMode.SERIAL, tmp_path)
+        parallel = self._search(HPSearchMode.PARALLEL, tmp_path)
+
+        assert parallel.params == serial.params
+        assert parallel.score == pytest.approx(serial.score, rel=1e-12)
+
+    def test_pooled_fits_are_single_threaded(
+        self, tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from gridiron_edge.models.game_prediction import _hp_search
+
+        seen: list[dict[str, Any]] = []
+        real_score_fold = _hp_search.score_fold
+
+        def spy(*args: Any, params: dict[str, Any], **kwargs: Any) -> float:
+            seen.append(params)
+            return real_score_fold(*args, params=params, **kwargs)
+
+        # One worker keeps joblib in-process so the spy sees every fit.
+        monkeypatch.setattr(_hp_search, "score_fold", spy)
+        _SyntheticTotalTrainer(HPSearchMode.PARALLEL, n_jobs=1)._run_hp_search(
+            df=pd.DataFrame(),
+            model_type=GameModelType.XGBOOST,
+            feature_fn=lambda *_: None,
+            repo=tmp_path,
+        )
+
+        assert seen
+        assert all(params["n_jobs"] == 1 for params in seen)
+
+    def test_halving_is_deterministic(self, tmp_path: Any) -> None:
+        first = self._search(HPSearchMode.HALVING, tmp_path)
+        second = self._search(HPSearchMode.HALVING, tmp_path)
+
+        assert first.params == second.params
+        assert first.score == second.score
+        assert first.model is not None
+
+    def test_prune_keeps_top_fraction_and_near_leader(self) -> None:
+        from gridiron_edge.models.game_prediction._hp_search import _prune
+
+        means = {0: 10.0, 1: 10.01, 2: 12.0, 3: 13.0, 4: 14.0, 5: 15.0}
+        # Top ceil(6 / 2) = 3 survive; 3 is outside the margin and dropped.
+        assert _prune(list(means), means) == [0, 1, 2]
+        # Near-leader candidates survive even past the top fraction.
+        tight = {0: 10.0, 1: 10.0, 2: 10.0, 3: 10.001, 4: 11.0}
+        assert _prune(list(tight), tight) == [0, 1, 2, 3]
@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 
 from gridiron_edge.ratings.elo.core import (
+    elo_win_probabilities,
     elo_win_probability,
     update_elo,
 )
@@ -18,6 +19,20 @@ def test_elo_win_probability_symmetric() -> None:
     assert p_a + p_b == pytest.approx(1.0, abs=1e-6)
 
 
+def test_elo_win_probabilities_match_scalar_form() -> None:
+    rng = np.random.default_rng(0)
+    ratings_a = rng.normal(1500.0, 120.0, size=64)
+    ratings_b = rng.normal(1500.0, 120.0, size=64)
+
+    p_a, p_b = elo_win_probabilities(ratings_a, ratings_b, divisor=400.0)
+
+    expected = [
+        elo_win_probability(a, b, divisor=400.0) for a, b in zip(ratings_a, ratings_b, strict=True)
+    ]
+    np.testing.assert_allclose(p_a, [e[0] for e in expected], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(p_b, [e[1] for e in expected], rtol=0, atol=1e-12)
+
+
 def test_update_elo_win() -> None:
     winner_elo, loser_elo = update_elo(1500.0, 1500.0, win_or_tie=1.0)
     assert winner_elo > 1500.0
@@ -0,0 +1,106 @@
+# tests/unit/ratings/test_elo_matrix.py
+
+"""Tests for the precomputed pairwise Elo win-probability matrix."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+import pytest
+
+from gridiron_edge.ratings.elo.core import elo_win_probability
+from gridiron_edge.ratings.elo.matrix import (
+    build_elo_matrix,
+    load_elo_matrix,
+    write_elo_matrix,
+)
+
+
+def _elo_state() -> DataFrame:
+    return DataFrame(
+        {
+            "NFL_TEAM": [
+                "Kansas City Chiefs",
+                "Kansas City Chiefs",
+                "Buffalo Bills",
+                "Buffalo Bills",
+                "Green Bay Packers",
+                "Green Bay Packers",
+            ],
+            "NFL_YEAR": [
+                "2025-2026",
+                "2026-2027",
+                "2026-2027",
+                "2026-2027",
+                "2026-2027",
+                "2025-2026",
+            ],
+            "NFL_WEEK": [18, 1, 1, 2, 1, 18],
+            "ELO": [1700.0, 1620.0, 1540.0, 1565.0, 1480.0, 1400.0],
+        }
+    )
+
+
+class TestBuildEloMatrix:
+    def test_uses_latest_week_per_team_in_latest_season(self) -> None:
+        matrix = build_elo_matrix(_elo_state())
+
+        assert matrix.season == "2026-2027"
+        assert matrix.week == 2
+        assert list(matrix.teams) == ["Buffalo Bills", "Green Bay Packers", "Kansas City Chiefs"]
+        np.testing.assert_array_equal(matrix.ratings, [1565.0, 1480.0, 1620.0])
+
+    def test_probabilities_match_scalar_elo(self) -> None:
+        matrix = build_elo_matrix(_elo_state(), divisor=400.0)
+
+        expected, _ = elo_win_probability(1620.0, 1565.0, divisor=400.0)
+        assert matrix.probability("Kansas City Chiefs", "Buffalo Bills") == pytest.approx(expected)
+        np.testing.assert_allclose(matrix.probabilities + matrix.probabilities.T, 1.0)
+        np.testing.assert_allclose(np.diag(matrix.probabilities), 0.5)
+
+    def test_explicit_season(self) -> None:
+        matrix = build_elo_matrix(_elo_state(), season="2025-2026")
+
+        assert matrix.week == 18
+        assert list(matrix.teams) == ["Green Bay Packers", "Kansas City Chiefs"]
+
+    def test_unknown_team_raises_key_error(self) -> None:
+        matrix = build_elo_matrix(_elo_state())
+
+        with pytest.raises(KeyError):
+            matrix.probability("Kansas City Chiefs", "Chicago Bears")
+
+    def test_empty_season_raises(self) -> None:
+        with pytest.raises(ValueError, match="no ratings"):
+            build_elo_matrix(_elo_state(), season="1999-2000")
+
+    def test_ignores_missing_ratings(self) -> None:
+        state = _elo_state()
+        state.loc[3, "ELO"] = pd.NA
+
+        matrix = build_elo_matrix(state)
+
+        assert matrix.ratings[list(matrix.teams).index("Buffalo Bills")] == 1540.0
+
+
+class TestEloMatrixPersistence:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        matrix = build_elo_matrix(_elo_state())
+
+        path = write_elo_matrix(tmp_path, matrix)
+        loaded = load_elo_matrix(tmp_path)
+
+        assert path.exists()
+        assert not list(path.parent.glob("*.tmp.npz"))
+        assert loaded is not None
+        assert loaded.season == matrix.season
+        assert loaded.week == matrix.week
+        assert loaded.divisor == matrix.divisor
+        np.testing.assert_array_equal(loaded.teams, matrix.teams)
+        np.testing.assert_array_equal(loaded.probabilities, matrix.probabilities)
+
+    def test_missing_file_returns_none(self, tmp_path: Path) -> None:
+        assert load_elo_matrix(tmp_path) is None
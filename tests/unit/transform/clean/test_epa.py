@@ -0,0 +1,85 @@
+# tests/unit/transform/clean/test_epa.py
+
+"""Tests for incremental game-level EPA aggregation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from tests.fixtures.nflverse import FixtureSeasonLoader, pbp_season
+
+from gridiron_edge.ingest.nflverse.manifest import load_source_hashes
+from gridiron_edge.ingest.nflverse.pbp import fetch_pbp, load_pbp_manifest
+from gridiron_edge.transform.clean import epa
+from gridiron_edge.transform.clean.epa import aggregate_epa
+
+SEASONS = [2022, 2023, 2024]
+
+
+@pytest.fixture
+def loader(tmp_path: Path) -> FixtureSeasonLoader:
+    loader = FixtureSeasonLoader({season: pbp_season(season) for season in SEASONS})
+    fetch_pbp(SEASONS, repo=tmp_path, loader=loader)
+    return loader
+
+
+@pytest.fixture
+def loaded_seasons(monkeypatch: pytest.MonkeyPatch) -> list[list[int] | None]:
+    """Record the ``seasons`` argument of every PBP load."""
+    calls: list[list[int] | None] = []
+    real_load_pbp = epa.load_pbp
+
+    def spy(seasons: list[int] | None = None, **kwargs: object) -> pd.DataFrame:
+        calls.append(seasons)
+        return real_load_pbp(seasons, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(epa, "load_pbp", spy)
+    return calls
+
+
+@pytest.mark.usefixtures("loader")
+class TestOnlyChanged:
+    def test_first_run_is_a_full_rebuild(
+        self, tmp_path: Path, loaded_seasons: list[list[int] | None]
+    ) -> None:
+        out_path = aggregate_epa(repo=tmp_path, only_changed=True)
+
+        assert loaded_seasons == [None]
+        assert sorted(pd.read_parquet(out_path)["season"].unique()) == SEASONS
+        manifest = load_pbp_manifest(repo=tmp_path)
+        assert load_source_hashes(out_path) == {
+            season: entry.content_sha256 for season, entry in manifest.items()
+        }
+
+    def test_no_change_skips_aggregation(
+        self, tmp_path: Path, loaded_seasons: list[list[int] | None]
+    ) -> None:
+        out_path = aggregate_epa(repo=tmp_path)
+        mtime = out_path.stat().st_mtime_ns
+
+        aggregate_epa(repo=tmp_path, only_changed=True)
+
+        assert loaded_seasons == [None]
+        assert out_path.stat().st_mtime_ns == mtime
+
+    def test_changed_season_matches_full_rebuild(
+        self,
+        loader: FixtureSeasonLoader,
+        tmp_path: Path,
+        loaded_seasons: list[list[int] | None],
+    ) -> None:
+        aggregate_epa(repo=tmp_path)
+        loader.frames[2023] = pbp_season(2023, seed=7)
+        fetch_pbp([2023], repo=tmp_path, loader=loader, force=True)
+
+        out_path = aggregate_epa(repo=tmp_path, only_changed=True)
+        incremental = pd.read_parquet(out_path)
+        aggregate_epa(repo=tmp_path)
+
+        assert loaded_seasons == [None, [2023], None]
+        pd.testing.assert_frame_equal(incremental, pd.read_parquet(out_path))
+        assert load_source_hashes(out_path)[2023] == (  # type: ignore[index]
+            load_pbp_manifest(repo=tmp_path)[2023].content_sha256
+        )
@@ -0,0 +1,118 @@
+# tests/unit/transform/clean/test_player_stats.py
+
+"""Tests for incremental player game-log cleaning."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+from pandas import DataFrame
+import pytest
+from tests.fixtures.nflverse import FixtureSeasonLoader
+
+from gridiron_edge.ingest.nflverse.manifest import load_source_hashes
+from gridiron_edge.ingest.nflverse.player_stats import (
+    _KEEP_COLUMNS,
+    fetch_player_stats,
+    load_player_stats_manifest,
+)
+from gridiron_edge.transform.clean import player_stats
+from gridiron_edge.transform.clean.player_stats import clean_player_stats
+
+SEASONS = [2022, 2023, 2024]
+
+
+def _raw_season(season: int, *, yards: int = 50) -> DataFrame:
+    """Five KC players at LV in week 1, one of them without any stats."""
+    rows = []
+    for i in range(5):
+        row: dict = dict.fromkeys(_KEEP_COLUMNS, 0)
+        row.update(
+            player_id=f"00-000{i:04d}",
+            player_display_name=f"Player {i}",
+            position="QB" if i == 0 else "WR",
+            team="KC",
+            opponent_team="OAK",
+            game_id=None,
+            season=season,
+            season_type="REG",
+            week=1,
+            receiving_yards=0 if i == 4 else yards + i,
+        )
+        rows.append(row)
+    return DataFrame(rows)
+
+
+def _schedule(seasons: list[int] | None = None) -> DataFrame:
+    return DataFrame(
+        [
+            {
+                "game_id": f"{season}_01_KC_LV",
+                "season": season,
+                "week": 1,
+                "home_team": "LV",
+                "away_team": "KC",
+            }
+            for season in seasons or SEASONS
+        ]
+    )
+
+
+@pytest.fixture
+def loader(tmp_path: Path) -> FixtureSeasonLoader:
+    loader = FixtureSeasonLoader({season: _raw_season(season) for season in SEASONS})
+    fetch_player_stats(seasons=SEASONS, repo=tmp_path, loader=loader)
+    return loader
+
+
+@pytest.fixture
+def schedule_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[int] | None]:
+    """Serve the schedule locally and record the seasons requested."""
+    calls: list[list[int] | None] = []
+
+    def lookup(seasons: list[int] | None = None) -> DataFrame:
+        calls.append(seasons)
+        return _schedule(seasons)
+
+    monkeypatch.setattr(player_stats, "_build_schedule_lookup", lookup)
+    return calls
+
+
+class TestOnlyChanged:
+    def test_no_change_skips_cleaning(
+        self,
+        loader: FixtureSeasonLoader,
+        tmp_path: Path,
+        schedule_calls: list[list[int] | None],
+    ) -> None:
+        out_path = clean_player_stats(repo=tmp_path, only_changed=True)
+        mtime = out_path.stat().st_mtime_ns
+
+        clean_player_stats(repo=tmp_path, only_changed=True)
+
+        assert schedule_calls == [None]
+        assert out_path.stat().st_mtime_ns == mtime
+        assert len(pd.read_parquet(out_path)) == 4 * len(SEASONS)
+
+    def test_changed_season_is_spliced(
+        self,
+        loader: FixtureSeasonLoader,
+        tmp_path: Path,
+        schedule_calls: list[list[int] | None],
+    ) -> None:
+        clean_player_stats(repo=tmp_path)
+        loader.frames[2023] = _raw_season(2023, yards=90)
+        fetch_player_stats(all_years=True, seasons=SEASONS, repo=tmp_path, loader=loader)
+
+        out_path = clean_player_stats(repo=tmp_path, only_changed=True)
+        incremental = pd.read_parquet(out_path)
+        clean_player_stats(repo=tmp_path)
+
+        assert schedule_calls == [None, [2023], None]
+        pd.testing.assert_frame_equal(incremental, pd.read_parquet(out_path))
+        assert incremental.loc[incremental["season"] == 2023, "receiving_yards"].min() == 90
+        manifest = load_player_stats_manifest(repo=tmp_path)
+        assert load_source_hashes(out_path) == {
+            season: entry.content_sha256 for season, entry in manifest.items()
+        }
@@ -12,6 +12,7 @@ from gridiron_edge.datasets.registry import dataset_path
 from gridiron_edge.transform.clean.games_nflverse import (
     _validate_home_away_games,
     clean_nflverse_games,
+    clean_nflverse_games_incremental,
 )
 
 _SYNTHETIC_COMPATIBILITY_COLUMNS: set[str] = {
@@ -416,3 +417,106 @@ def test_empty_schema_excludes_result_oriented_columns(
 
     assert games.empty
     assert _RETIRED_RESULT_COLUMNS.isdisjoint(games.columns)
+
+
+def _season_games(season: int, *, home_score: int = 17) -> list[dict[str, object]]:
+    """Return three completed games for *season*, one of them unlined."""
+    matchups = [("PHI", "GB"), ("KC", "BUF"), ("DAL", "NYG")]
+    rows = []
+    for week, (away, home) in enumerate(matchups, start=1):
+        rows.append(
+            {
+                **_raw_game(
+                    game_id=f"{season}_{week:02d}_{away}_{home}",
+                    away_team=away,
+                    home_team=home,
+                    home_score=home_score + week,
+                ),
+                "season": season,
+                "week": week,
+                "gameday": f"{season}-09-{week + 10}",
+                "spread_line": None if week == 3 else -2.5 * week,
+            }
+        )
+    return rows
+
+
+def _games_text(repo: Path) -> str:
+    return dataset_path(repo, "games").read_text()
+
+
+def test_incremental_first_run_cleans_every_season(
+    tmp_path: Path,
+) -> None:
+    _write_raw_games(tmp_path, _season_games(2023) + _season_games(2024))
+
+    result = clean_nflverse_games_incremental(repo=tmp_path)
+
+    assert result.full_rebuild
+    assert result.changed_seasons == {2023, 2024}
+    assert len(pd.read_csv(result.path)) == 6
+
+
+def test_incremental_unchanged_raw_skips_writing(
+    tmp_path: Path,
+) -> None:
+    rows = _season_games(2023) + _season_games(2024)
+    _write_raw_games(tmp_path, rows)
+    clean_nflverse_games(repo=tmp_path)
+    mtime = dataset_path(tmp_path, "games").stat().st_mtime_ns
+    # A raw rewrite that only reorders games is not a change.
+    _write_raw_games(tmp_path, rows[::-1])
+
+    result = clean_nflverse_games_incremental(repo=tmp_path)
+
+    assert result.changed_seasons == frozenset()
+    assert not result.full_rebuild
+    assert dataset_path(tmp_path, "games").stat().st_mtime_ns == mtime
+
+
+def test_incremental_splice_matches_full_clean(
+    tmp_path: Path,
+) -> None:
+    _write_raw_games(tmp_path, _season_games(2022) + _season_games(2023) + _season_games(2024))
+    clean_nflverse_games(repo=tmp_path)
+    _write_raw_games(
+        tmp_path,
+        _season_games(2022) + _season_games(2023) + _season_games(2024, home_score=30),
+    )
+
+    result = clean_nflverse_games_incremental(repo=tmp_path)
+    incremental = _games_text(tmp_path)
+    clean_nflverse_games(repo=tmp_path)
+
+    assert result.changed_seasons == {2024}
+    assert incremental == _games_text(tmp_path)
+    games = pd.read_csv(result.path)
+    assert games.loc[games["YEAR"] == "2024-2025", "HOME_SCORE"].tolist() == [31, 32, 33]
+
+
+def test_incremental_drops_removed_seasons(
+    tmp_path: Path,
+) -> None:
+    _write_raw_games(tmp_path, _season_games(2023) + _season_games(2024))
+    clean_nflverse_games(repo=tmp_path)
+    _write_raw_games(tmp_path, _season_games(2024))
+
+    result = clean_nflverse_games_incremental(repo=tmp_path)
+
+    assert result.changed_seasons == {2023}
+    assert set(pd.read_csv(result.path)["YEAR"]) == {"2024-2025"}
+
+
+def test_incremental_validates_the_spliced_result(
+    tmp_path: Path,
+) -> None:
+    _write_raw_games(tmp_path, _season_games(2023) + _season_games(2024))
+    clean_nflverse_games(repo=tmp_path)
+    before = _games_text(tmp_path)
+    clashing = _season_games(2024)
+    clashing[0]["game_id"] = "2023_01_PHI_GB"
+    _write_raw_games(tmp_path, _season_games(2023) + clashing)
+
+    with pytest.raises(ValueError, match="duplicate game IDs: 2023_01_PHI_GB"):
+        clean_nflverse_games_incremental(repo=tmp_path)
+    assert _games_text(tmp_path) == before